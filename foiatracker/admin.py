@@ -1,6 +1,14 @@
 from django.contrib import admin
+from django.db.models import Count
+from django.http import HttpResponseRedirect
+from django.urls import reverse
+from django.utils.html import format_html, format_html_join
+
+from foiatracker.jobs import start_job
 
 from foiatracker.models import (
+    Agency,
+    BackgroundJob,
     EmailAttachment,
     Event,
     Foia,
@@ -12,50 +20,80 @@ from foiatracker.models import (
 )
 
 
+def background_action(name, short_description):
+    """Build an admin action that runs the named job action over the
+    selected objects in the background and shows the job's status page"""
+    def action(modeladmin, request, queryset):
+        job = start_job(name, queryset, request.user)
+        modeladmin.message_user(
+            request, 'Started "%s" for %s objects.' % (
+                job.description, job.total))
+        return HttpResponseRedirect(reverse(
+            'admin:foiatracker_backgroundjob_change', args=(job.pk,)))
+    action.__name__ = name
+    action.short_description = short_description
+    return action
+
+
 class EmailAttachmentInline(admin.TabularInline):
     model = EmailAttachment
 
 
 @admin.register(InboundEmail)
 class InboundEmailAdmin(admin.ModelAdmin):
-    readonly_fields = ('raw', 'html', 'uuid',)
-    list_display = ('__str__', 'recipients_str', 'sender', 'sent')
-    list_filter = ('sender', 'sent')
-    search_fields = ('subject', 'text',)
+    readonly_fields = ('raw', 'html', 'uuid', 'message_id', 'in_reply_to',
+                       'references',)
+    list_display = ('__str__', 'recipients_str', 'sender', 'sent',
+                    'processed')
+    list_select_related = ('sender',)
+    list_filter = ('processed',)
+    date_hierarchy = 'sent'
+    search_fields = ('subject', 'text', 'sender__email',)
+    show_full_result_count = False
     fieldsets = (
         (None, {
             'fields': ('subject', 'sender', 'recipients', 'text', 'sent',)
         }),
         ('Debugging information', {
             'classes': ('collapse',),
-            'fields': ('uuid', 'html', 'raw',),
+            'fields': ('uuid', 'message_id', 'in_reply_to', 'references',
+                       'html', 'raw',),
         }),
     )
     inlines = [
         EmailAttachmentInline,
     ]
-    filter_horizontal = (
-        'recipients',
-    )
+    raw_id_fields = ('sender', 'recipients',)
+    actions = [
+        background_action('suggest_matches',
+                          'Suggest requests for selected e-mails'),
+    ]
 
     def get_queryset(self, request):
-        return InboundEmail.objects.prefetch_related('recipients')
+        # The raw message and HTML body are only loaded if they're shown
+        return super(InboundEmailAdmin, self).get_queryset(request).defer(
+            'raw', 'html').prefetch_related('recipients')
 
 
 @admin.register(Foia)
 class FoiaAdmin(admin.ModelAdmin):
     list_display = ('request_subject', 'sent', 'project',)
-    list_filter = ('email__sender', 'email__sent', 'project',)
-    list_select_related = ('email__sender', 'project',)
+    list_filter = ('project',)
+    list_select_related = ('project',)
+    date_hierarchy = 'sent'
     search_fields = (
         'email__subject',
         'email__text',
         'request_subject',
         'project__name',
+        'sender__email',
     )
-    filter_horizontal = (
-        'recipients',
-    )
+    raw_id_fields = ('email', 'recipients',)
+    show_full_result_count = False
+    actions = [
+        background_action('renotify_slack',
+                          'Post selected requests to Slack again'),
+    ]
 
 
 @admin.register(Event)
@@ -63,6 +101,8 @@ class EventAdmin(admin.ModelAdmin):
     list_display = ('status', 'foia', 'email', 'created_at',)
     list_filter = ('status', 'created_at',)
     list_select_related = ('email', 'foia',)
+    raw_id_fields = ('email', 'foia',)
+    show_full_result_count = False
     search_fields = (
         'foia__request_subject',
         'email__subject',
@@ -80,10 +120,20 @@ class EventAdmin(admin.ModelAdmin):
         })
     )
 
+    def get_queryset(self, request):
+        return super(EventAdmin, self).get_queryset(request).defer(
+            'email__raw', 'email__html', 'email__text')
+
 
 @admin.register(Reminder)
 class ReminderAdmin(admin.ModelAdmin):
-    pass
+    list_display = ('foia', 'scheduled_time', 'sent_time',)
+    list_select_related = ('foia',)
+    raw_id_fields = ('foia',)
+    actions = [
+        background_action('resend_reminder',
+                          'Resend selected reminders on Slack'),
+    ]
 
 
 @admin.register(Sender)
@@ -94,10 +144,11 @@ class SenderAdmin(admin.ModelAdmin):
     search_fields = ('first_name', 'last_name', 'email',)
 
 
-def sync_with_rolodex(modeladmin, request, queryset):
-    for obj in queryset:
-        obj.save()
-sync_with_rolodex.short_description = "Sync selected recipients with Rolodex"
+@admin.register(Agency)
+class AgencyAdmin(admin.ModelAdmin):
+    list_display = ('name', 'rolodex_organization_id',)
+    search_fields = ('name',)
+    readonly_fields = ('rolodex_organization_id',)
 
 
 @admin.register(Recipient)
@@ -109,24 +160,66 @@ class RecipientAdmin(admin.ModelAdmin):
         ('Debugging information', {
             'classes': ('collapse',),
             'fields': ('rolodex_contact_id', 'rolodex_person_id',
-                       'rolodex_organization_id',),
+                       'rolodex_organization_id', 'agency',),
         }),
     )
     readonly_fields = ('name', 'organization', 'rolodex_contact_id',
-                       'rolodex_person_id', 'rolodex_organization_id',)
+                       'rolodex_person_id', 'rolodex_organization_id',
+                       'agency',)
     list_display = ('name', 'email', 'organization', 'has_rolodex_match',
                     'foias_received_count')
     search_fields = ('name', 'email', 'organization',)
-    list_filter = ('organization',)
+    list_filter = ('agency',)
     list_display_links = ('email',)
-    actions = [sync_with_rolodex]
+    show_full_result_count = False
+    actions = [
+        background_action('rolodex_sync',
+                          'Sync selected recipients with Rolodex'),
+    ]
+
+    def get_queryset(self, request):
+        return super(RecipientAdmin, self).get_queryset(request).annotate(
+            foias_received=Count('foia'))
 
     def foias_received_count(self, obj):
-        return obj.foia_set.count()
+        return obj.foias_received
     foias_received_count.short_description = 'Requests received'
+    foias_received_count.admin_order_field = 'foias_received'
 
 
 @admin.register(Project)
 class ProjectAdmin(admin.ModelAdmin):
     list_display = ('name', 'slug',)
     search_fields = ('name', 'slug', 'description',)
+
+
+@admin.register(BackgroundJob)
+class BackgroundJobAdmin(admin.ModelAdmin):
+    list_display = ('description', 'status', 'progress_bar', 'failed',
+                    'elapsed', 'created_by', 'created_at',)
+    list_filter = ('status', 'action',)
+    list_select_related = ('created_by',)
+    fields = ('description', 'status', 'progress_bar', 'total', 'processed',
+              'failed', 'elapsed', 'error_list', 'created_by', 'created_at',
+              'started_at', 'finished_at',)
+    readonly_fields = fields
+
+    def get_queryset(self, request):
+        # The ID list can be long, and only the runner needs it
+        return super(BackgroundJobAdmin, self).get_queryset(request).defer(
+            'object_ids')
+
+    def has_add_permission(self, request):
+        return False
+
+    def progress_bar(self, obj):
+        return format_html(
+            '<progress max="100" value="{0}">{0}%</progress> {1} of {2}',
+            obj.progress(), obj.processed, obj.total)
+    progress_bar.short_description = 'Progress'
+
+    def error_list(self, obj):
+        if not obj.errors:
+            return '-'
+        return format_html_join('<br>', '#{}: {}', obj.errors)
+    error_list.short_description = 'Errors'
@@ -1,4 +1,5 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.core.exceptions import ImproperlyConfigured
 
 
 class FoiaTrackerConfig(AppConfig):
@@ -6,4 +7,11 @@ class FoiaTrackerConfig(AppConfig):
     verbose_name = 'FOIA tracker'
 
     def ready(self):
+        # Searches use trigram lookups that Django only registers when the
+        # postgres app is installed; without it they fail at query time
+        if not apps.is_installed('django.contrib.postgres'):
+            raise ImproperlyConfigured(
+                'foiatracker requires django.contrib.postgres in '
+                'INSTALLED_APPS')
+
         import foiatracker.signals  # noqa
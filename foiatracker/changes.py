@@ -0,0 +1,106 @@
+import json
+import time
+
+from django.core.cache import cache
+from django.db import connection
+
+
+# The latest change's number, and each change under its number. Open request
+# lists poll these rather than the database, so a tab costs one cache read
+# every few seconds however busy the tracker is.
+#
+# Every process has to see the same changes, so this needs a cache backend
+# shared between them, like memcached or Redis; with the per-process
+# LocMemCache a list only hears about changes made by whichever process
+# serves its stream. Each open stream also holds a worker for up to
+# STREAM_SECONDS, so serve the feed from async (gevent or eventlet) workers
+# rather than a small pool of sync ones.
+CHANGE_SEQ_KEY = 'foiatracker_change_seq'
+CHANGE_KEY = 'foiatracker_change_%s'
+
+# Changes older than this are dropped; a page that's been disconnected for
+# longer is better off reloading
+CHANGE_TIMEOUT = 60 * 10
+
+# Most changes handed to one stream at a time
+MAX_CHANGES = 200
+
+# How often a stream checks for changes, and how long it stays open. Streams
+# end rather than hold a worker forever; the browser reconnects after
+# STREAM_RETRY milliseconds and picks up from its Last-Event-ID.
+POLL_SECONDS = 2
+STREAM_SECONDS = 60
+STREAM_RETRY = 3000
+
+
+def publish(foia_id, created=False, deleted=False):
+    """Record that a request changed and return the change's number"""
+    cache.add(CHANGE_SEQ_KEY, 0, None)
+    try:
+        seq = cache.incr(CHANGE_SEQ_KEY)
+    except ValueError:
+        # The counter was evicted between add() and incr()
+        cache.set(CHANGE_SEQ_KEY, 1, None)
+        seq = 1
+
+    cache.set(CHANGE_KEY % seq, {
+        'foia': foia_id,
+        'created': created,
+        'deleted': deleted,
+    }, CHANGE_TIMEOUT)
+    return seq
+
+
+def latest_change():
+    return cache.get(CHANGE_SEQ_KEY, 0)
+
+
+def changes_since(after):
+    """Return the latest change number and a list of the changes after
+    @after that haven't expired, oldest first, each with its number in
+    'id'"""
+    latest = latest_change()
+    if latest <= after:
+        return latest, []
+
+    first = max(after + 1, latest - MAX_CHANGES + 1)
+    keys = [CHANGE_KEY % seq for seq in range(first, latest + 1)]
+    found = cache.get_many(keys)
+    return latest, [
+        dict(found[key], id=seq)
+        for seq, key in zip(range(first, latest + 1), keys)
+        if key in found
+    ]
+
+
+def stream_changes(after):
+    """Yield server-sent events for the changes after @after until
+    STREAM_SECONDS have passed"""
+    # Streams only read the cache, so hand back the connection the request
+    # opened rather than hold it open until the stream ends. One inside a
+    # transaction, as in tests, is left alone.
+    if not connection.in_atomic_block:
+        connection.close()
+
+    ends = time.time() + STREAM_SECONDS
+    yield 'retry: %s\n\n' % STREAM_RETRY
+
+    while True:
+        latest, found = changes_since(after)
+        if latest < after:
+            # The counter was evicted and started over
+            after = 0
+            latest, found = changes_since(after)
+
+        for change in found:
+            yield 'id: %s\nevent: change\ndata: %s\n\n' % (
+                change['id'], json.dumps(change))
+
+        # Moves the browser's Last-Event-ID past changes that expired, and
+        # keeps proxies from closing an idle connection
+        after = latest
+        yield 'id: %s\n\n' % after
+
+        if time.time() >= ends:
+            return
+        time.sleep(POLL_SECONDS)
@@ -0,0 +1,216 @@
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Q
+
+from foiatracker.models import Foia, InboundEmail, Recipient
+from foiatracker import reports
+
+
+RECIPIENT_FIELDS = (
+    'pk', 'email', 'name', 'organization', 'agency_id',
+    'rolodex_person_id', 'rolodex_contact_id', 'rolodex_organization_id',
+)
+
+# Filled in on the recipient that's kept from its duplicates when it's
+# missing them
+MERGED_FIELDS = RECIPIENT_FIELDS[2:]
+
+# How sure we are that two recipients are the same mailbox, by the
+# strongest thing they have in common
+SAME_ADDRESS = 1.0
+SAME_CONTACT = 1.0
+SAME_PERSON = 0.9
+SAME_ORGANIZATION_MAILBOX = 0.8
+
+DEFAULT_THRESHOLD = 0.8
+
+# Weaker matches can be one person's mailboxes at two agencies or an
+# organization's records@ at two of its domains, so only these are merged.
+# The rest are listed for someone to check.
+MERGE_THRESHOLD = SAME_CONTACT
+
+# Blocks bigger than this are mostly coincidences rather than duplicates,
+# and would cost more comparisons than the rest put together. Address
+# blocks are the exception: everything in one shares a normalized address.
+MAX_BLOCK_SIZE = 50
+
+
+def domain_aliases():
+    """Map alias domains onto the domain they forward to, from the
+    FOIATRACKER_DOMAIN_ALIASES setting"""
+    aliases = getattr(settings, 'FOIATRACKER_DOMAIN_ALIASES', {})
+    return dict((alias.lower(), domain.lower())
+                for alias, domain in aliases.items())
+
+
+def normalize_address(email, aliases):
+    """Lowercase an address, drop any +tag from its local part and swap an
+    alias domain for the one it forwards to"""
+    local, _, domain = email.lower().rpartition('@')
+    local = local.split('+')[0]
+    return '%s@%s' % (local, aliases.get(domain, domain))
+
+
+def blocking_keys(recipient, aliases):
+    """Keys that a recipient's likely duplicates share with it"""
+    address = normalize_address(recipient['email'], aliases)
+    keys = [('address', address)]
+    if recipient['rolodex_contact_id'] is not None:
+        keys.append(('contact', recipient['rolodex_contact_id']))
+    if recipient['rolodex_person_id'] is not None:
+        keys.append(('person', recipient['rolodex_person_id']))
+    if recipient['rolodex_organization_id'] is not None:
+        keys.append(('organization', recipient['rolodex_organization_id'],
+                     address.split('@')[0]))
+    return keys
+
+
+def score(a, b, aliases):
+    """How likely two recipient dicts are to be the same mailbox, from 0
+    to 1"""
+    address_a = normalize_address(a['email'], aliases)
+    address_b = normalize_address(b['email'], aliases)
+    if address_a == address_b:
+        return SAME_ADDRESS
+
+    def shared(field):
+        return a[field] is not None and a[field] == b[field]
+
+    if shared('rolodex_contact_id'):
+        return SAME_CONTACT
+    if shared('rolodex_person_id'):
+        return SAME_PERSON
+    if shared('rolodex_organization_id') and \
+            address_a.split('@')[0] == address_b.split('@')[0]:
+        return SAME_ORGANIZATION_MAILBOX
+    return 0
+
+
+def find_duplicates(threshold=DEFAULT_THRESHOLD):
+    """Group recipients that look like the same mailbox, scoring only the
+    pairs that share a blocking key. Returns a list of groups, each a list
+    of recipient dicts, with the one to keep first."""
+    aliases = domain_aliases()
+    recipients = dict(
+        (r['pk'], r) for r in Recipient.objects.values(*RECIPIENT_FIELDS))
+
+    blocks = {}
+    for recipient in recipients.values():
+        for key in blocking_keys(recipient, aliases):
+            blocks.setdefault(key, []).append(recipient['pk'])
+
+    # Union-find over matching pairs, so chains of matches (a plus-address
+    # variant of a contact with two addresses) end up in one group
+    parents = {}
+
+    def find(pk):
+        while parents.get(pk, pk) != pk:
+            pk = parents[pk]
+        return pk
+
+    def union(a, b):
+        parents.setdefault(a, a)
+        parents[find(b)] = find(a)
+
+    scored = set()
+    for key, pks in blocks.items():
+        if len(pks) < 2:
+            continue
+        pks = sorted(pks)
+        if len(pks) > MAX_BLOCK_SIZE:
+            # Every pair in an address block would score SAME_ADDRESS, so
+            # there's no need to compare them
+            if key[0] == 'address' and SAME_ADDRESS >= threshold:
+                for b in pks[1:]:
+                    union(pks[0], b)
+            continue
+        for i, a in enumerate(pks):
+            for b in pks[i + 1:]:
+                if (a, b) in scored:
+                    continue
+                scored.add((a, b))
+                if score(recipients[a], recipients[b], aliases) >= threshold:
+                    union(a, b)
+
+    groups = {}
+    for pk in parents:
+        groups.setdefault(find(pk), []).append(pk)
+
+    # Keep the recipient on the most requests, then the oldest
+    request_counts = dict(
+        Foia.recipients.through.objects.filter(
+            recipient__in=list(parents),
+        ).values('recipient_id').annotate(
+            count=Count('pk')).values_list('recipient_id', 'count'))
+    return sorted([
+        sorted((recipients[pk] for pk in members), key=lambda r: (
+            -request_counts.get(r['pk'], 0), r['pk']))
+        for members in groups.values()
+    ], key=lambda group: group[0]['email'])
+
+
+def merge_links(through, owner_field, keep_pk, duplicate_pks):
+    """Point the rows of an M2M through table at the recipient being kept,
+    dropping ones that would link the same object twice. Returns the IDs
+    of the objects whose rows changed."""
+    linked = set(through.objects.filter(recipient=keep_pk).values_list(
+        owner_field, flat=True))
+    moved = set(through.objects.filter(
+        recipient__in=duplicate_pks).values_list(owner_field, flat=True))
+
+    through.objects.filter(recipient__in=duplicate_pks).delete()
+    through.objects.bulk_create([
+        through(**{owner_field: owner_id, 'recipient_id': keep_pk})
+        for owner_id in sorted(moved - linked)
+    ])
+    return moved
+
+
+def merge_group(group):
+    """Merge the duplicate recipients in a group from find_duplicates()
+    into its first one and delete them. Returns the IDs of the requests
+    whose recipients changed."""
+    keep, duplicates = group[0], group[1:]
+    duplicate_pks = [r['pk'] for r in duplicates]
+
+    with transaction.atomic():
+        foia_ids = merge_links(Foia.recipients.through, 'foia_id',
+                               keep['pk'], duplicate_pks)
+        email_ids = merge_links(InboundEmail.recipients.through,
+                                'inboundemail_id', keep['pk'], duplicate_pks)
+
+        # Hold on to Rolodex details only a duplicate had. Updating rather
+        # than saving skips another Rolodex lookup.
+        changes = {}
+        for field in MERGED_FIELDS:
+            if keep[field] in (None, ''):
+                for duplicate in duplicates:
+                    if duplicate[field] not in (None, ''):
+                        changes[field] = duplicate[field]
+                        break
+        if changes:
+            Recipient.objects.filter(pk=keep['pk']).update(**changes)
+
+        Recipient.objects.filter(pk__in=duplicate_pks).delete()
+
+    # Requests without recipients of their own show their e-mail's
+    foia_ids |= set(Foia.objects.filter(
+        email__in=email_ids).values_list('pk', flat=True))
+
+    # Updating skipped recipient_changed, so every request showing the
+    # kept recipient needs its new details too
+    if changes:
+        foia_ids |= set(Foia.objects.filter(
+            Q(recipients=keep['pk']) | Q(email__recipients=keep['pk']),
+        ).values_list('pk', flat=True))
+    return foia_ids
+
+
+def refresh_requests(foia_ids):
+    """Rebuild the stored recipients and search vectors of requests whose
+    recipients were merged, since the bulk rewrites skip m2m_changed"""
+    for foia in Foia.objects.filter(pk__in=foia_ids).select_related(
+            'email__sender').prefetch_related('recipients'):
+        foia.refresh_recipients_display()
+        foia.update_search_vector()
+    reports.refresh_requests(foia_ids)
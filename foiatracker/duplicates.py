@@ -0,0 +1,136 @@
+import hashlib
+import random
+import re
+import struct
+import zlib
+
+from django.conf import settings
+
+from foiatracker.matching import strip_subject
+from foiatracker.models import Foia, RequestSignature
+
+
+# Near-duplicate requests are found with MinHash and locality-sensitive
+# hashing. Each request's text gets a signature whose matching positions
+# estimate the Jaccard similarity of two requests' word shingles, split
+# into bands; only requests sharing a band key with a new one are compared.
+
+# 16 bands of 4 rows puts the point where requests are as likely as not to
+# become candidates at a similarity of about (1/16) ** (1/4) = 0.5
+NUM_BANDS = 16
+ROWS_PER_BAND = 4
+NUM_PERMUTATIONS = NUM_BANDS * ROWS_PER_BAND
+
+SHINGLE_SIZE = 3
+
+# Candidates estimated to be less similar than this aren't reported
+DEFAULT_THRESHOLD = 0.6
+
+MAX_DUPLICATES = 5
+
+# A Mersenne prime larger than any shingle hash, and a fixed seed so
+# signatures stay comparable between processes
+PRIME = (1 << 61) - 1
+_random = random.Random(20161128)
+PERMUTATIONS = [
+    (_random.randint(1, PRIME - 1), _random.randint(0, PRIME - 1))
+    for _ in range(NUM_PERMUTATIONS)
+]
+
+WORD_RE = re.compile(r'\w+', flags=re.UNICODE)
+
+
+def duplicate_threshold():
+    return getattr(settings, 'FOIATRACKER_DUPLICATE_THRESHOLD',
+                   DEFAULT_THRESHOLD)
+
+
+def shingles(text):
+    """The set of overlapping SHINGLE_SIZE-word phrases in @text"""
+    words = WORD_RE.findall(text.lower())
+    if len(words) < SHINGLE_SIZE:
+        return set([' '.join(words)]) if words else set()
+    return set(
+        ' '.join(words[i:i + SHINGLE_SIZE])
+        for i in range(len(words) - SHINGLE_SIZE + 1)
+    )
+
+
+def minhash(shingle_set):
+    """The minimum of each permuted shingle hash, or None for no text"""
+    if not shingle_set:
+        return None
+
+    hashes = [zlib.crc32(s.encode('utf-8')) & 0xffffffff
+              for s in shingle_set]
+    return [min((a * h + b) % PRIME for h in hashes)
+            for a, b in PERMUTATIONS]
+
+
+def band_keys(signature):
+    """Hash each band of a signature, along with its position, into a
+    signed 64-bit key"""
+    keys = []
+    for band in range(NUM_BANDS):
+        rows = signature[band * ROWS_PER_BAND:(band + 1) * ROWS_PER_BAND]
+        digest = hashlib.md5(
+            ('%s:%s' % (band, ','.join(str(r) for r in rows))).encode('ascii')
+        ).digest()
+        keys.append(struct.unpack('<q', digest[:8])[0])
+    return keys
+
+
+def similarity(signature, other):
+    """Estimate the Jaccard similarity of two signatures"""
+    return sum(1 for a, b in zip(signature, other) if a == b) / \
+        float(NUM_PERMUTATIONS)
+
+
+def request_text(foia):
+    return '%s %s' % (strip_subject(foia.request_subject), foia.email.text)
+
+
+def index_request(foia):
+    """Store the signature and band keys for a request. Returns the
+    signature, or None if the request has no text to compare."""
+    signature = minhash(shingles(request_text(foia)))
+    if signature is None:
+        RequestSignature.objects.filter(foia=foia).delete()
+        return None
+
+    RequestSignature.objects.update_or_create(foia=foia, defaults={
+        'minhash': signature,
+        'bands': band_keys(signature),
+    })
+    return signature
+
+
+def find_duplicates(foia, threshold=None):
+    """Return (request, estimated similarity) pairs for the requests most
+    like @foia, most similar first. Only requests sharing a band key with
+    it are compared."""
+    if threshold is None:
+        threshold = duplicate_threshold()
+
+    stored = RequestSignature.objects.filter(foia=foia).first()
+    if stored is not None:
+        signature = stored.minhash
+    else:
+        signature = minhash(shingles(request_text(foia)))
+    if signature is None:
+        return []
+
+    candidates = RequestSignature.objects.filter(
+        bands__overlap=band_keys(signature),
+    ).exclude(foia=foia.pk).values_list('foia_id', 'minhash')
+
+    scores = dict(
+        (foia_id, similarity(signature, other))
+        for foia_id, other in candidates
+    )
+    best = sorted(
+        (pk for pk, score in scores.items() if score >= threshold),
+        key=lambda pk: -scores[pk])[:MAX_DUPLICATES]
+
+    foias = Foia.objects.select_related('sender').in_bulk(best)
+    return [(foias[pk], scores[pk]) for pk in best if pk in foias]
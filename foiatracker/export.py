@@ -0,0 +1,90 @@
+import csv
+import json
+
+from django.db.models import Min
+from django.utils.timezone import datetime
+
+from foiatracker.models import Event, Foia
+from foiatracker.utils import (add_business_days_to_date,
+                               business_days_between, texas_holidays)
+
+
+EXPORT_COLUMNS = (
+    'id', 'subject', 'sent', 'due', 'status', 'status_date',
+    'business_days_elapsed', 'first_response_days', 'resolution_days',
+    'project', 'sender', 'recipients', 'agency_id',
+)
+
+EXPORT_FIELDS = (
+    'pk', 'request_subject', 'sent', 'latest_status', 'latest_update_date',
+    'completed', 'first_response_days', 'resolution_days', 'agency_id',
+    'project__name', 'recipients_display',
+    'sender__email', 'sender__first_name',
+    'sender__last_name',
+)
+
+
+class Echo(object):
+    """A file-like object that hands back whatever's written to it, so the
+    csv module can feed a streaming response"""
+    def write(self, value):
+        return value
+
+
+def sender_name(row):
+    if row['sender__first_name'] and row['sender__last_name']:
+        return '%s %s' % (row['sender__first_name'],
+                          row['sender__last_name'])
+    return row['sender__email']
+
+
+def export_rows(foias, today=None):
+    """Yield a dict of EXPORT_COLUMNS for each request in @foias, reading
+    them through a server-side cursor so memory use stays flat"""
+    if today is None:
+        today = datetime.now().date()
+
+    first_sent = foias.aggregate(first_sent=Min('sent'))['first_sent']
+    if first_sent is None:
+        return
+    holiday_dates = texas_holidays(first_sent.year, today.year + 1)
+    holiday_set = set(holiday_dates)
+    statuses = dict(Event.STATUS_CHOICES)
+
+    for row in foias.values(*EXPORT_FIELDS).iterator():
+        # Stop counting once a request has been resolved
+        until = today
+        if row['completed'] and row['latest_update_date']:
+            until = row['latest_update_date']
+
+        yield {
+            'id': row['pk'],
+            'subject': row['request_subject'],
+            'sent': row['sent'].isoformat(),
+            'due': add_business_days_to_date(
+                Foia.RESPONSE_BUSINESS_DAYS, row['sent'],
+                holiday_set).isoformat(),
+            'status': statuses[row['latest_status']],
+            'status_date': row['latest_update_date'].isoformat()
+            if row['latest_update_date'] else '',
+            'business_days_elapsed': business_days_between(
+                row['sent'], until, holiday_dates),
+            'first_response_days': row['first_response_days'],
+            'resolution_days': row['resolution_days'],
+            'project': row['project__name'] or '',
+            'sender': sender_name(row),
+            'recipients': row['recipients_display'],
+            'agency_id': row['agency_id'],
+        }
+
+
+def stream_csv(foias):
+    writer = csv.writer(Echo())
+    yield writer.writerow(EXPORT_COLUMNS)
+    for row in export_rows(foias):
+        yield writer.writerow([row[column] for column in EXPORT_COLUMNS])
+
+
+def stream_ndjson(foias):
+    for row in export_rows(foias):
+        yield json.dumps(row) + '\n'
@@ -1,22 +1,43 @@
-from django.forms import ModelMultipleChoiceField
+from django.forms import ModelChoiceField, ModelMultipleChoiceField
 from django.core.exceptions import ValidationError
 from django.core.validators import validate_email
+from django.db.models import Q
+from django.utils.encoding import force_text
 
 from foiatracker.models import Recipient
 from foiatracker.utils import get_model_by_email
 
 
-class RecipientsChoiceField(ModelMultipleChoiceField):
-    def pks_from_emails(self, val):
-        key = self.to_field_name or 'pk'
+class RemoteChoicesMixin(object):
+    """Render options only for the selected value(s) of a model choice
+    field; the front end loads everything else from @search_url as the user
+    types"""
+    def __init__(self, search_url, *args, **kwargs):
+        # widget_attrs() is called during Field.__init__, so this needs to be
+        # set first
+        self.search_url = search_url
+        super(RemoteChoicesMixin, self).__init__(*args, **kwargs)
+
+    def widget_attrs(self, widget):
+        attrs = super(RemoteChoicesMixin, self).widget_attrs(widget)
+        attrs['data-search-url'] = self.search_url
+        return attrs
+
+    def limit_choices(self, selected):
+        """Only render the passed model instances as options"""
+        self.widget.choices = [
+            (obj.pk, self.label_from_instance(obj)) for obj in selected
+        ]
+
+
+class FoiaChoiceField(RemoteChoicesMixin, ModelChoiceField):
+    def label_from_instance(self, obj):
+        if obj.sender.last_name:
+            return '%s: %s' % (obj.sender.last_name, obj)
+        return str(obj)
 
-        try:
-            self.queryset.filter(**{key: val})
-            return val
-        except (ValueError, TypeError):
-            validate_email(val)
-            return get_model_by_email(Recipient, val).pk
 
+class RecipientsChoiceField(RemoteChoicesMixin, ModelMultipleChoiceField):
     def clean(self, value):
         if self.required and not value:
             raise ValidationError(self.error_messages['required'],
@@ -26,10 +47,42 @@ class RecipientsChoiceField(ModelMultipleChoiceField):
         if not isinstance(value, (list, tuple)):
             raise ValidationError(self.error_messages['list'], code='list')
 
+        key = self.to_field_name or 'pk'
+        values = [force_text(v) for v in value]
+        pks = [v for v in values if v.isdigit()]
+        emails = [v for v in values if not v.isdigit()]
+        for email in emails:
+            validate_email(email)
+
+        # Check the submitted PKs and look up the submitted e-mails in a
+        # single query
+        lookup = Q(**{'%s__in' % key: pks})
+        for email in emails:
+            lookup |= Q(email__iexact=email)
+        found = self.queryset.filter(lookup).values_list(key, 'email')
+
+        found_keys = set()
+        found_emails = {}
+        for found_key, found_email in found:
+            found_keys.add(force_text(found_key))
+            found_emails[found_email.lower()] = found_key
+
+        for pk in pks:
+            if pk not in found_keys:
+                raise ValidationError(
+                    self.error_messages['invalid_choice'],
+                    code='invalid_choice',
+                    params={'value': pk},
+                )
+
         # Use our custom logic to create Recipient models for e-mails that
         # don't exist and sync them with Rolodex
-        value = [self.pks_from_emails(v) for v in value]
+        selected = pks
+        for email in emails:
+            if email.lower() not in found_emails:
+                found_emails[email.lower()] = getattr(
+                    get_model_by_email(Recipient, email), key)
+            selected.append(found_emails[email.lower()])
 
-        qs = self._check_values(value)
         self.run_validators(value)
-        return qs
+        return self.queryset.filter(**{'%s__in' % key: selected})
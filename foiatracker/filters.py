@@ -1,62 +1,134 @@
+import hashlib
+
 from django.contrib.postgres.search import SearchQuery
 from django.contrib.postgres.search import SearchRank
-from django.contrib.postgres.search import SearchVector
-from django.db.models import OuterRef
-from django.db.models import Subquery
+from django.core.cache import cache
+from django.db.models import Count
+from django.db.models import F
+from django.db.models import FloatField
+from django.db.models.functions import Cast
+from django.utils.http import urlencode
 
 from django_filters import CharFilter
 from django_filters import FilterSet
+from django_filters import NumberFilter
+
+from foiatracker.models import Foia, Sender
+from foiatracker.utils import count_if, overdue_cutoff
 
-from foiatracker.models import Event
-from foiatracker.models import Foia
+
+# How long facet counts are cached for each set of filters, in seconds
+FACET_CACHE_TIMEOUT = 60
 
 
 class FoiaFilter(FilterSet):
-    sender = CharFilter(name='email__sender__email')
+    sender = CharFilter(method='sender_filter')
+    project = CharFilter(name='project__slug')
     search = CharFilter(method='search_filter')
     status = CharFilter(method='status_filter')
+    first_response_days = NumberFilter(name='first_response_days',
+                                       lookup_expr='gte')
+    resolution_days = NumberFilter(name='resolution_days', lookup_expr='gte')
+
+    def sender_filter(self, queryset, field, email):
+        """Look up the sender first so the filter itself is a range scan on
+        the (sender, -sent) index"""
+        sender_id = Sender.objects.filter(email=email).values_list(
+            'pk', flat=True).first()
+        if sender_id is None:
+            return queryset.none()
+        return queryset.filter(sender_id=sender_id)
 
     def search_filter(self, queryset, field, search_term):
         """Use Django's Postgres full-text search integration to search
-        the subject, notes fields and original e-mail"""
-        vector = (
-            SearchVector('request_subject',
-                         'agency_id',
-                         'notes', weight='A') +
-            SearchVector('recipients__name',
-                         'recipients__organization',
-                         'email__sender__first_name',
-                         'email__sender__last_name', weight='B') +
-            SearchVector('email__text',
-                         'email__sender__email',
-                         'recipients__email', weight='C')
-        )
+        the subject, notes fields and original e-mail, which are stored in
+        Foia.search_vector. The rank is cast from Postgres' real to double
+        precision so it round-trips through a page cursor exactly."""
+        query = SearchQuery(search_term)
         return queryset.annotate(
-            rank=SearchRank(vector, SearchQuery(search_term))
+            rank=Cast(SearchRank(F('search_vector'), query), FloatField())
         ).filter(
-            rank__gte=0.1
+            search_vector=query
         ).order_by('-rank')
 
     def status_filter(self, queryset, field, status):
         """Filter requests by whether they have been resolved (denied,
         no responsive records, etc.)"""
-        qs = queryset.annotate(
-            latest_status=Subquery(
-                Event.objects.filter(
-                    foia=OuterRef('pk')
-                ).order_by(
-                    '-update_date'
-                ).values(
-                    'status'
-                )[:1]
-            )
-        )
-
         if status == 'pending':
-            return qs.exclude(latest_status__in=Event.COMPLETE)
+            return queryset.filter(completed=False)
         elif status == 'complete':
-            return qs.filter(latest_status__in=Event.COMPLETE)
-        return qs.none()
+            return queryset.filter(completed=True)
+        return queryset.none()
+
+    def facet_counts(self):
+        """Count pending, complete and overdue requests plus requests per
+        project and per sender under the current filters, using a single
+        aggregate query. Status is left out of that query's filters and
+        counted conditionally instead, so every status gets a count."""
+        data = dict(
+            (name, self.data.get(name)) for name in self.filters
+            if name != 'status' and self.data.get(name)
+        )
+        signature = urlencode(sorted(data.items()))
+        cache_key = 'foiatracker_facets_%s' % hashlib.md5(
+            signature.encode('utf-8')).hexdigest()
+
+        groups = cache.get(cache_key)
+        if groups is None:
+            queryset = FoiaFilter(data, queryset=Foia.objects.all()).qs
+            groups = list(queryset.order_by().values(
+                'project__slug', 'project__name', 'sender__email',
+                'sender__first_name', 'sender__last_name',
+            ).annotate(
+                total=Count('pk'),
+                pending=count_if(completed=False),
+                complete=count_if(completed=True),
+                overdue=count_if(
+                    completed=False,
+                    sent__lte=overdue_cutoff(Foia.RESPONSE_BUSINESS_DAYS)),
+            ))
+            cache.set(cache_key, groups, FACET_CACHE_TIMEOUT)
+
+        # The per-project and per-sender counts follow the status filter
+        count_field = self.data.get('status')
+        if count_field not in ('pending', 'complete'):
+            count_field = 'total'
+
+        facets = {
+            'total': 0, 'pending': 0, 'complete': 0, 'overdue': 0,
+        }
+        projects = {}
+        senders = {}
+        for group in groups:
+            for field in ('total', 'pending', 'complete', 'overdue'):
+                facets[field] += group[field]
+
+            if group['project__slug']:
+                project = projects.setdefault(group['project__slug'], {
+                    'slug': group['project__slug'],
+                    'name': group['project__name'],
+                    'count': 0,
+                })
+                project['count'] += group[count_field]
+
+            sender = senders.setdefault(group['sender__email'], {
+                'email': group['sender__email'],
+                'name': ' '.join(filter(None, (
+                    group['sender__first_name'],
+                    group['sender__last_name'],
+                ))) or group['sender__email'],
+                'count': 0,
+            })
+            sender['count'] += group[count_field]
+
+        def by_count(items):
+            return sorted(
+                (i for i in items if i['count']),
+                key=lambda i: (-i['count'], i['name']))
+
+        facets['projects'] = by_count(projects.values())
+        facets['senders'] = by_count(senders.values())
+        return facets
 
     class Meta:
         model = Foia
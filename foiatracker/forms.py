@@ -1,26 +1,28 @@
-import re
-
-from fuzzywuzzy import fuzz
-
+from django.db import transaction
 from django.forms import (
+    CharField,
+    ChoiceField,
     DateTimeField,
+    Form,
     ModelChoiceField,
     ModelForm,
+    ModelMultipleChoiceField,
     RadioSelect
 )
 from django.forms import inlineformset_factory
 from django.forms import widgets
-from django.forms.fields import TypedChoiceField
+from django.urls import reverse_lazy
 
+from foiatracker import changes, reports
 from foiatracker.models import (
     Event,
     Foia,
     InboundEmail,
-    Project,
+    MatchSuggestion,
     Recipient,
     Reminder,
 )
-from foiatracker.fields import RecipientsChoiceField
+from foiatracker.fields import FoiaChoiceField, RecipientsChoiceField
 
 
 DATE_FORMAT = '%A, %b %d, %Y'
@@ -43,8 +45,29 @@ class FoiaForm(ModelForm):
         input_formats=(DATE_FORMAT,),
         widget=widgets.DateTimeInput(format=DATE_FORMAT))
     recipients = RecipientsChoiceField(
+        search_url=reverse_lazy('recipient-search'),
         queryset=Recipient.objects.all())
 
+    def __init__(self, *args, **kwargs):
+        super(FoiaForm, self).__init__(*args, **kwargs)
+
+        # Only render the selected recipients; the widget searches for the
+        # rest
+        recipients = self.fields['recipients']
+        if self.is_bound:
+            values = recipients.widget.value_from_datadict(
+                self.data, self.files, self.add_prefix('recipients')) or []
+            recipients.limit_choices(Recipient.objects.filter(
+                pk__in=[v for v in values if v.isdigit()]))
+            # Keep new e-mail addresses around if the form is re-rendered
+            recipients.widget.choices += [
+                (v, v) for v in values if not v.isdigit()
+            ]
+        elif self.instance.pk:
+            recipients.limit_choices(self.instance.recipients.all())
+        else:
+            recipients.limit_choices([])
+
     def clean_recipients(self):
         return self.cleaned_data['recipients']
 
@@ -65,9 +88,9 @@ class EventModelForm(ModelForm):
     update_date = DateTimeField(
         input_formats=(DATE_FORMAT,),
         widget=widgets.DateTimeInput(format=DATE_FORMAT))
-    foia = TypedChoiceField(
-        empty_value=None, initial=None,
-        coerce=lambda pk: Foia.objects.get(pk=pk))
+    foia = FoiaChoiceField(
+        search_url=reverse_lazy('foia-search'),
+        queryset=Foia.objects.select_related('sender'))
     email = ModelChoiceField(
         queryset=InboundEmail.objects.all(), required=False,
         widget=widgets.HiddenInput)
@@ -75,75 +98,25 @@ class EventModelForm(ModelForm):
     def __init__(self, *args, **kwargs):
         super(EventModelForm, self).__init__(*args, **kwargs)
 
+        # Only the selected request is rendered; the rest are searched for
+        # by the picker, ranked against the e-mail when there is one
+        if self.is_bound:
+            selected = self.data.get(self.add_prefix('foia'))
+        else:
+            selected = self.initial.get('foia')
+
+        if selected and str(selected).isdigit():
+            self.fields['foia'].limit_choices(
+                self.fields['foia'].queryset.filter(pk=selected))
+        else:
+            self.fields['foia'].limit_choices([])
+
         if 'initial' in kwargs and 'email' in kwargs['initial']:
             email = InboundEmail.objects.filter(
                 pk=kwargs['initial']['email']
-            ).select_related('sender').first()
-
-            sender_projects = Project.objects.filter(
-                collaborators=email.sender).values_list('pk', flat=True)
-
-            prefix_re = re.compile('(re|fwd):', flags=re.IGNORECASE)
-            generic_language_re = re.compile(
-                r'((?:tpia|record(?:s)*|foia|public\s+information)\s+request)(?!\s+log(?:s)*)',
-                flags=re.IGNORECASE | re.VERBOSE)
-
-            def strip_subject(subject):
-                prefix_removed = prefix_re.sub('', subject)
-                generics_removed = generic_language_re.sub('', prefix_removed)
-                return ''.join(
-                    _ for _ in generics_removed if _.isalpha() or _ == ' ')
-
-            cleaned_email_subject = strip_subject(email.subject)
-
-            def match_email_to_foia(foia):
-                score = fuzz.ratio(
-                    strip_subject(foia['request_subject']),
-                    cleaned_email_subject,
-                )
-
-                # Boost the score if the sender is the same and for requests
-                # that are in one of the sender's projects
-                if foia['email__sender__pk'] == email.sender.pk:
-                    score += 25
-                elif foia['project__pk'] is not None and \
-                        foia['project__pk'] in sender_projects:
-                    score += 20
-
-                days_apart = (email.sent.date() - foia['sent']).days
-
-                # Penalize requests that are older than 30 days, but max out
-                # the penalty at the 180-day mark
-                min_days = 30
-                max_days = 180
-                normalized_days_apart = min(
-                    max(min_days, days_apart), max_days) - min_days
-                score *= (1 - float(normalized_days_apart) / float(max_days))
-
-                return score
-
-            all_foias = Foia.objects.all().select_related(
-                'email', 'email__sender'
-            ).values(
-                'pk', 'sent', 'request_subject', 'email__sender__pk',
-                'email__sender__last_name', 'project__pk',
-            )
-
-            for foia in all_foias:
-                foia['label'] = '%s: %s' % (
-                    foia['email__sender__last_name'], foia['request_subject'],
-                )
-
-            ranked_foias = sorted(
-                all_foias, key=match_email_to_foia, reverse=True)
-
-            self.fields['foia'].choices = [
-                (f['pk'], f['label'],) for f in ranked_foias
-            ]
-        else:
-            self.fields['foia'].choices = Foia.objects.all().select_related(
-                'email__sender'
-            ).values_list('pk', 'request_subject')
+            ).first()
+            if email is not None:
+                self.fields['foia'].widget.attrs['data-email'] = email.uuid
 
     class Meta:
         model = Event
@@ -154,6 +127,57 @@ class EventModelForm(ModelForm):
         }
 
 
+class BulkEventForm(Form):
+    """Record the same status update on many requests at once, like when an
+    agency answers several of them in one letter"""
+    foias = ModelMultipleChoiceField(
+        queryset=Foia.objects.all(),
+        widget=widgets.MultipleHiddenInput,
+        error_messages={'required': 'Select at least one request.'})
+    status = ChoiceField(choices=Event.STATUS_CHOICES)
+    update_date = DateTimeField(
+        input_formats=(DATE_FORMAT,),
+        widget=widgets.DateTimeInput(format=DATE_FORMAT))
+    notes = CharField(required=False)
+    email = ModelChoiceField(
+        queryset=InboundEmail.objects.all(), required=False,
+        widget=widgets.HiddenInput)
+
+    def save(self):
+        """Create every Event in one INSERT and bring the requests' stored
+        status up to date in the same transaction"""
+        foias = list(self.cleaned_data['foias'])
+        email = self.cleaned_data['email']
+
+        with transaction.atomic():
+            events = Event.objects.bulk_create([
+                Event(
+                    foia=foia,
+                    email=email,
+                    status=self.cleaned_data['status'],
+                    update_date=self.cleaned_data['update_date'].date(),
+                    notes=self.cleaned_data['notes'],
+                ) for foia in foias
+            ])
+
+            # bulk_create() skips Event.save(), so do its work here. The
+            # Events don't have fees, so status changes are all the project
+            # stats need.
+            for foia in foias:
+                foia.refresh_status()
+                transaction.on_commit(
+                    lambda pk=foia.pk: reports.refresh_request(pk))
+                transaction.on_commit(
+                    lambda pk=foia.pk: changes.publish(pk))
+
+            if email is not None:
+                InboundEmail.objects.filter(pk=email.pk).update(
+                    processed=True)
+                MatchSuggestion.objects.filter(email=email).delete()
+
+        return events
+
+
 class InlineReminderForm(ModelForm):
     scheduled_time = DateTimeField(
         input_formats=(DATETIME_FORMAT,),
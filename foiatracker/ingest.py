@@ -0,0 +1,222 @@
+from email.header import decode_header, make_header
+from email.utils import getaddresses, mktime_tz, parseaddr, parsedate_tz
+
+from django.conf import settings
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import transaction
+from django.db.models.functions import Upper
+from django.utils.timezone import datetime
+
+from foiatracker import tasks
+from foiatracker.matching import find_threaded_foia, pair_email_with_foia
+from foiatracker.models import EmailAttachment, InboundEmail, Recipient, Sender
+from foiatracker.utils import get_model_by_email, tz_aware_date
+
+
+# Mailgun payloads without these can't be turned into an InboundEmail
+REQUIRED_FIELDS = ('sender', 'To', 'Date',)
+
+
+class MissingFields(Exception):
+    pass
+
+
+class UnauthorizedSender(Exception):
+    pass
+
+
+def is_staff_address(address):
+    """Whether @address is at one of the domains allowed to use
+    FOIAtracker"""
+    return address.split('@')[-1] in settings.FOIATRACKER_ALLOWED_DOMAINS
+
+
+def sender_address(from_field):
+    return parseaddr(from_field)[1]
+
+
+def recipient_addresses(to_field):
+    """The addresses in a To field that should become Recipients, skipping
+    staff and ones that aren't e-mails, like 'undisclosed-recipients'"""
+    addresses = []
+    for name, address in getaddresses(to_field.split(',')):
+        if '@' not in address or is_staff_address(address):
+            continue
+        if address not in addresses:
+            addresses.append(address)
+    return addresses
+
+
+def parse_sent(date_field):
+    """Make a timezone-aware datetime from a Date field, falling back to
+    now when it can't be parsed"""
+    parsed_from_email = parsedate_tz(date_field or '')
+    if parsed_from_email is not None:
+        parsed_datetime = datetime.fromtimestamp(
+            mktime_tz(parsed_from_email))
+    else:
+        parsed_datetime = datetime.now()
+    return tz_aware_date(parsed_datetime)
+
+
+def decode_header_value(value):
+    """Decode a raw, possibly RFC 2047-encoded header into text"""
+    if value is None:
+        return ''
+    try:
+        return str(make_header(decode_header(value)))
+    except (LookupError, UnicodeError, ValueError):
+        return str(value)
+
+
+def decode_part(part):
+    charset = part.get_content_charset() or 'utf-8'
+    payload = part.get_payload(decode=True) or b''
+    try:
+        return payload.decode(charset, 'replace')
+    except LookupError:
+        return payload.decode('utf-8', 'replace')
+
+
+def message_contents(message):
+    """Split a stdlib e-mail message into its plain text body, its HTML body
+    and a list of attached files"""
+    text = html = None
+    attachments = []
+
+    for part in message.walk():
+        if part.is_multipart():
+            continue
+
+        filename = part.get_filename()
+        content_type = part.get_content_type()
+        if filename or part.get_content_disposition() == 'attachment':
+            content = part.get_payload(decode=True)
+            if content is None:
+                continue
+            attachments.append(SimpleUploadedFile(
+                decode_header_value(filename) or 'attachment', content,
+                content_type))
+        elif content_type == 'text/plain' and text is None:
+            text = decode_part(part)
+        elif content_type == 'text/html' and html is None:
+            html = decode_part(part)
+
+    return text or '', html or '', attachments
+
+
+def get_recipients(addresses):
+    """Map each of @addresses to its Recipient in one query, bulk-creating
+    the ones that don't exist yet. Returns the map and the new Recipients,
+    which skip the Rolodex lookup made when a Recipient is saved."""
+    addresses = set(address.lower() for address in addresses)
+    # Compare in upper case so the lookup can use the UPPER(email) index
+    # added for prefix searches
+    recipients = dict(
+        (recipient.email.lower(), recipient)
+        for recipient in Recipient.objects.annotate(
+            upper_email=Upper('email')).filter(
+                upper_email__in=[address.upper() for address in addresses]))
+
+    created = Recipient.objects.bulk_create([
+        Recipient(email=address)
+        for address in sorted(addresses - set(recipients))
+    ])
+    for recipient in created:
+        recipients[recipient.email] = recipient
+    return recipients, created
+
+
+def upload_attachment(attached_file, email=None, storage=None):
+    """Upload an attached file and return an unsaved EmailAttachment for it.
+    Pass @storage to upload through a connection other than the field's
+    own, like one per thread."""
+    field = EmailAttachment._meta.get_field('stored_file')
+    attachment = EmailAttachment(
+        email=email,
+        content_type=attached_file.content_type,
+        size=attached_file.size,
+    )
+    name = field.generate_filename(attachment, attached_file.name)
+    attachment.stored_file = (storage or field.storage).save(
+        name, attached_file)
+    return attachment
+
+
+def mailgun_fields(data):
+    """The InboundEmail fields for a Mailgun POST payload
+    (https://documentation.mailgun.com/quickstart-receiving.html)"""
+    return {
+        'raw': data.get('body-plain', ''),
+        'text': data.get('stripped-text', ''),
+        'html': data.get('body-html', ''),
+        'sent': parse_sent(data.get('Date')),
+        'subject': data.get('subject', ''),
+        'message_id': data.get('Message-Id', '')[:255],
+        'in_reply_to': data.get('In-Reply-To', '')[:255],
+        'references': data.get('References', ''),
+    }
+
+
+def receive_mailgun_post(data, files=None, notify=True):
+    """Save a Mailgun POST payload as an InboundEmail with its recipients
+    and attachments, pair it with the request it replies to and prompt its
+    sender. Raises MissingFields or UnauthorizedSender for payloads the
+    hook refuses."""
+    if any(field not in data for field in REQUIRED_FIELDS):
+        raise MissingFields()
+
+    # Parse the out sender/recipient fields
+    sender = sender_address(data.get('sender'))
+
+    if not is_staff_address(sender):
+        raise UnauthorizedSender(
+            '"%s" is not authorized to use FOIAtracker.' % sender)
+
+    # Create a model for the email
+    email = InboundEmail.objects.create(
+        sender=get_model_by_email(Sender, sender), **mailgun_fields(data))
+
+    # Setup M2M relationships for email recipeints
+    for address in recipient_addresses(data.get('To')):
+        recipient = get_model_by_email(
+            Recipient,
+            address
+        )
+        email.recipients.add(recipient)
+
+    email.save()
+
+    # Replies to a request we're already tracking are paired with it
+    # straight away; everything else needs the user to classify it
+    threaded_foia = find_threaded_foia(email)
+    if threaded_foia is not None:
+        event = pair_email_with_foia(email, threaded_foia)
+        if notify:
+            tasks.email_paired(event.pk)
+    else:
+        # Rank requests for the triage inbox off the request/response cycle
+        transaction.on_commit(
+            lambda: tasks.suggest_email_matches.delay(email.pk))
+        if notify:
+            tasks.email_prompt(email.pk)
+
+    # Save file attachments to S3 and attach them to the message
+    attachment_count = data.get('attachment-count')
+
+    if attachment_count is not None and files is not None:
+        try:
+            num_attachments = int(attachment_count)
+
+            for attachment_num in range(1, num_attachments + 1):
+                attachment_key = 'attachment-%s' % attachment_num
+                attached_file = files.get(attachment_key)
+
+                if attached_file is None:
+                    continue
+
+                upload_attachment(attached_file, email=email).save()
+        except ValueError:
+            pass
+
+    return email
@@ -0,0 +1,99 @@
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from foiatracker.models import BackgroundJob
+
+
+# Objects handled by each Celery task before it hands the rest of the job to
+# the next one
+JOB_CHUNK_SIZE = 25
+
+# Errors stored on a job past this many are only counted
+MAX_JOB_ERRORS = 100
+
+# Action name: (model, function called with each object, description)
+JOB_ACTIONS = {}
+
+
+def job_action(name, model, description):
+    """Register a function that takes one @model instance as an action that
+    can be run in the background with start_job()"""
+    def register(func):
+        JOB_ACTIONS[name] = (model, func, description)
+        return func
+    return register
+
+
+def start_job(name, queryset, user=None):
+    """Record a job to run the named action over every object in
+    @queryset and queue its first chunk once the job has been committed"""
+    from foiatracker.tasks import run_job_chunk
+
+    model, func, description = JOB_ACTIONS[name]
+    object_ids = list(queryset.values_list('pk', flat=True))
+    if user is not None and not user.is_authenticated:
+        user = None
+
+    job = BackgroundJob.objects.create(
+        action=name,
+        description=description,
+        object_ids=object_ids,
+        total=len(object_ids),
+        created_by=user,
+    )
+    transaction.on_commit(lambda: run_job_chunk.delay(job.pk, 0))
+    return job
+
+
+def run_chunk(job_id, offset):
+    """Run a job's action over the chunk of its objects starting at
+    @offset. Returns the offset of the next chunk, or None once the job is
+    done."""
+    job = BackgroundJob.objects.get(pk=job_id)
+    if job.status in (BackgroundJob.FINISHED, BackgroundJob.FAILED):
+        return None
+
+    if job.started_at is None:
+        job.started_at = timezone.now()
+        job.status = BackgroundJob.RUNNING
+        job.save(update_fields=['started_at', 'status'])
+
+    try:
+        model, func, description = JOB_ACTIONS[job.action]
+    except KeyError:
+        job.status = BackgroundJob.FAILED
+        job.finished_at = timezone.now()
+        job.errors = [[None, 'Unknown action "%s"' % job.action]]
+        job.save(update_fields=['status', 'finished_at', 'errors'])
+        return None
+
+    chunk = job.object_ids[offset:offset + JOB_CHUNK_SIZE]
+    # Objects deleted since the job started count as processed
+    objects = model.objects.in_bulk(chunk)
+
+    errors = []
+    for pk in chunk:
+        obj = objects.get(pk)
+        if obj is None:
+            continue
+        try:
+            func(obj)
+        except Exception as e:
+            errors.append([pk, '%s: %s' % (e.__class__.__name__, e)])
+
+    if errors and len(job.errors) < MAX_JOB_ERRORS:
+        job.errors = (job.errors + errors)[:MAX_JOB_ERRORS]
+        job.save(update_fields=['errors'])
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        processed=F('processed') + len(chunk),
+        failed=F('failed') + len(errors),
+    )
+
+    next_offset = offset + JOB_CHUNK_SIZE
+    if next_offset < job.total:
+        return next_offset
+
+    BackgroundJob.objects.filter(pk=job.pk).update(
+        status=BackgroundJob.FINISHED, finished_at=timezone.now())
+    return None
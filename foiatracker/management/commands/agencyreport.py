@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from foiatracker.reports import (
+    agency_report,
+    cached_request_rows,
+    clear_report_cache,
+)
+
+
+class Command(BaseCommand):
+    help = ('Rebuilds the cached agency response-time report and prints '
+            'it')
+
+    def handle(self, *args, **options):
+        clear_report_cache()
+        report = agency_report(cached_request_rows())
+
+        for agency in report:
+            first_response = agency['first_response'] or {}
+            resolution = agency['resolution'] or {}
+            self.stdout.write(
+                '%s: %s requests, median %s business days to first '
+                'response, %s to resolution, $%s asked, $%s paid' % (
+                    agency['name'], agency['requests'],
+                    first_response.get('median', '-'),
+                    resolution.get('median', '-'),
+                    agency['amount_asked'], agency['amount_paid'],
+                ))
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished rebuilding the report for %s agencies.' % len(report)))
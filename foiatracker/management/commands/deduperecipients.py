@@ -0,0 +1,51 @@
+import time as timer
+
+from django.core.management.base import BaseCommand
+
+from foiatracker.dedupe import (DEFAULT_THRESHOLD, MERGE_THRESHOLD,
+                                find_duplicates, merge_group,
+                                refresh_requests)
+
+
+class Command(BaseCommand):
+    help = ('Finds recipients that look like the same mailbox, like case and '
+            'plus-address variants, alias domains and addresses of the same '
+            'Rolodex contact. Only lists them unless --merge is passed, and '
+            'only merges variants of one address and addresses of one '
+            'Rolodex contact.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--threshold', type=float, default=DEFAULT_THRESHOLD,
+            help='How sure a match has to be, from 0 to 1')
+        parser.add_argument(
+            '--merge', action='store_true', default=False,
+            help='Merge each group of sure matches into its first '
+                 'recipient')
+
+    def handle(self, *args, **options):
+        started = timer.time()
+        groups = find_duplicates(options['threshold'])
+
+        for group in groups:
+            self.stdout.write('%s <- %s' % (
+                group[0]['email'],
+                ', '.join(r['email'] for r in group[1:])))
+
+        merged = 0
+        if options['merge']:
+            # Weaker matches chain groups together, so group sure matches
+            # again rather than merge part of the listed groups
+            sure_groups = groups
+            if options['threshold'] < MERGE_THRESHOLD:
+                sure_groups = find_duplicates(MERGE_THRESHOLD)
+            foia_ids = set()
+            for group in sure_groups:
+                foia_ids.update(merge_group(group))
+                merged += len(group) - 1
+            refresh_requests(foia_ids)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Found %s groups of duplicate recipients and merged %s '
+            'recipients in %.1fs.' % (
+                len(groups), merged, timer.time() - started)))
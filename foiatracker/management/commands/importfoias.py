@@ -0,0 +1,245 @@
+import csv
+from datetime import datetime, time
+import time as timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.validators import validate_email
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from foiatracker.duplicates import index_request
+from foiatracker.ingest import get_recipients
+from foiatracker.jobs import start_job
+from foiatracker.models import (
+    Foia,
+    InboundEmail,
+    Project,
+    ProjectStats,
+    Recipient,
+    Reminder,
+    Sender,
+)
+from foiatracker.reports import clear_report_cache
+from foiatracker.utils import (add_business_days_to_date, get_model_by_email,
+                               texas_holidays, tz_aware_date)
+
+
+COLUMNS = ('sender', 'subject', 'sent', 'recipients', 'project',
+           'agency_id', 'notes',)
+
+SENT_FORMAT = '%Y-%m-%d'
+
+
+class RowError(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = ('Imports historical requests from a CSV with the columns %s. '
+            'recipients is a semicolon-separated list of e-mail addresses, '
+            'sent is YYYY-MM-DD and project is a project slug. Requests are '
+            'inserted in batches without Slack notifications.' %
+            ', '.join(COLUMNS))
+
+    def add_arguments(self, parser):
+        parser.add_argument('csv_path')
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of requests to insert at a time')
+        parser.add_argument(
+            '--dry-run', action='store_true', default=False,
+            help='Check and insert every row, then roll everything back')
+
+    def handle(self, *args, **options):
+        self.senders = {}
+        self.recipients = {}
+        self.projects = dict(Project.objects.values_list('slug', 'pk'))
+        self.new_recipient_ids = []
+        self.project_ids = set()
+        self.holiday_set = set(texas_holidays(1990, datetime.now().year + 1))
+
+        started = timer.time()
+        self.imported = self.skipped = 0
+
+        # Each batch commits on its own, so a bad batch late in a big file
+        # doesn't undo the rest or hold locks for the whole run. Dry runs
+        # need everything in one transaction to roll back.
+        try:
+            if options['dry_run']:
+                with transaction.atomic():
+                    self.import_file(options)
+                    transaction.set_rollback(True)
+            else:
+                try:
+                    self.import_file(options)
+                finally:
+                    self.finish_import()
+        except IOError as e:
+            raise CommandError(str(e))
+
+        elapsed = timer.time() - started
+        self.stdout.write(self.style.SUCCESS(
+            '%s %s requests (%s new recipients), skipped %s rows, in %.1fs '
+            '(%.0f requests/s).' % (
+                'Checked' if options['dry_run'] else 'Imported',
+                self.imported, len(self.new_recipient_ids), self.skipped,
+                elapsed, self.imported / elapsed if elapsed else 0,
+            )))
+
+    def parse_row(self, row):
+        sender = (row['sender'] or '').strip().lower()
+        recipients = [
+            email.strip().lower()
+            for email in (row['recipients'] or '').split(';')
+            if email.strip()
+        ]
+        for email in [sender] + recipients:
+            try:
+                validate_email(email)
+            except ValidationError:
+                raise RowError('"%s" isn\'t a valid e-mail address' % email)
+
+        try:
+            sent = datetime.strptime(row['sent'].strip(), SENT_FORMAT).date()
+        except (AttributeError, ValueError):
+            raise RowError('"%s" isn\'t a YYYY-MM-DD date' % row['sent'])
+
+        subject = (row['subject'] or '').strip()
+        if not subject:
+            raise RowError('Missing subject')
+
+        project = (row['project'] or '').strip()
+        if project and project not in self.projects:
+            raise RowError('No project with the slug "%s"' % project)
+
+        return {
+            'sender': sender,
+            'recipients': recipients,
+            'sent': sent,
+            'subject': subject[:255],
+            'project_id': self.projects.get(project),
+            'agency_id': (row['agency_id'] or '').strip()[:20],
+            'notes': row['notes'] or '',
+        }
+
+    def resolve_recipients(self, emails):
+        """Look up a batch's recipients in one query and insert the ones we
+        haven't seen. New recipients are synced with Rolodex afterwards in
+        a background job rather than one HTTP call per row."""
+        emails = set(emails) - set(self.recipients)
+        if not emails:
+            return
+
+        recipients, created = get_recipients(emails)
+        self.recipients.update(recipients)
+        self.new_recipient_ids.extend(r.pk for r in created)
+
+    def import_file(self, options):
+        with open(options['csv_path']) as f:
+            reader = csv.DictReader(f)
+            missing = set(COLUMNS) - set(reader.fieldnames or [])
+            if missing:
+                raise CommandError('Missing columns: %s' % ', '.join(
+                    sorted(missing)))
+
+            batch = []
+            # Line 1 is the header
+            for line, row in enumerate(reader, start=2):
+                try:
+                    batch.append(self.parse_row(row))
+                except RowError as e:
+                    self.stderr.write('Line %s: %s' % (line, e))
+                    self.skipped += 1
+                    continue
+
+                if len(batch) == options['batch_size']:
+                    self.imported += self.import_batch(batch)
+                    batch = []
+                    self.stdout.write('Imported %s requests' % self.imported)
+            if batch:
+                self.imported += self.import_batch(batch)
+
+    def finish_import(self):
+        """Catch up on what the committed batches skipped, even if a later
+        one failed"""
+        if not self.imported:
+            return
+
+        for project_id in self.project_ids:
+            ProjectStats(project_id=project_id).refresh()
+        clear_report_cache()
+        if self.new_recipient_ids:
+            start_job('rolodex_sync', Recipient.objects.filter(
+                pk__in=self.new_recipient_ids))
+
+    def import_batch(self, batch):
+        with transaction.atomic():
+            for row in batch:
+                if row['sender'] not in self.senders:
+                    # Few distinct senders, and new ones pick up their
+                    # names from the staff API on save
+                    self.senders[row['sender']] = get_model_by_email(
+                        Sender, row['sender']).pk
+            self.resolve_recipients(
+                email for row in batch for email in row['recipients'])
+
+            # Every request needs an e-mail; historical ones get a stand-in
+            emails = InboundEmail.objects.bulk_create([
+                InboundEmail(
+                    sender_id=self.senders[row['sender']],
+                    subject=row['subject'],
+                    sent=tz_aware_date(datetime.combine(row['sent'], time())),
+                    text=row['notes'], html='', raw='',
+                    processed=True,
+                ) for row in batch
+            ])
+
+            foias = Foia.objects.bulk_create([
+                Foia(
+                    email=email,
+                    sender_id=email.sender_id,
+                    sent=row['sent'],
+                    request_subject=row['subject'],
+                    notes=row['notes'],
+                    project_id=row['project_id'],
+                    agency_id=row['agency_id'],
+                    notified=True,
+                    recipients_display=', '.join(
+                        str(self.recipients[r]) for r in sorted(
+                            set(row['recipients']))),
+                ) for email, row in zip(emails, batch)
+            ])
+
+            Foia.recipients.through.objects.bulk_create([
+                Foia.recipients.through(
+                    foia_id=foia.pk, recipient_id=self.recipients[email].pk)
+                for foia, row in zip(foias, batch)
+                for email in sorted(set(row['recipients']))
+            ])
+
+            # The same reminder Foia.save() schedules; ones that would have
+            # gone out already are marked sent
+            now = datetime.now()
+            reminders = []
+            for foia in foias:
+                scheduled = datetime.combine(add_business_days_to_date(
+                    Foia.RESPONSE_BUSINESS_DAYS, foia.sent, self.holiday_set),
+                    time(hour=10))
+                reminders.append(Reminder(
+                    foia=foia,
+                    scheduled_time=tz_aware_date(scheduled),
+                    sent_time=tz_aware_date(scheduled)
+                    if scheduled < now else None,
+                ))
+            Reminder.objects.bulk_create(reminders)
+
+            for foia in Foia.objects.filter(
+                    pk__in=[foia.pk for foia in foias]).select_related(
+                    'email__sender').prefetch_related('recipients'):
+                foia.update_search_vector()
+                index_request(foia)
+
+            self.project_ids.update(
+                row['project_id'] for row in batch if row['project_id'])
+
+        return len(foias)
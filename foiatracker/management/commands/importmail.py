@@ -0,0 +1,250 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+import json
+import mailbox
+import os
+import threading
+import time as timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from foiatracker.custom_storages import FoiatrackerAttachmentStorage
+from foiatracker.ingest import (decode_header_value, get_recipients,
+                                is_staff_address, message_contents,
+                                parse_sent, recipient_addresses,
+                                sender_address, upload_attachment)
+from foiatracker.jobs import start_job
+from foiatracker.models import EmailAttachment, InboundEmail, Recipient, Sender
+from foiatracker.utils import get_model_by_email
+
+
+# S3 connections aren't safe to share between threads, so each upload worker
+# gets its own
+local = threading.local()
+
+
+def thread_storage():
+    if not hasattr(local, 'storage'):
+        local.storage = FoiatrackerAttachmentStorage()
+    return local.storage
+
+
+def upload(attached_file):
+    return upload_attachment(attached_file, storage=thread_storage())
+
+
+class Command(BaseCommand):
+    help = ('Imports archived correspondence from an mbox file or a Maildir '
+            'as unprocessed e-mails, using the same sender, recipient and '
+            'attachment rules as the Mailgun hook. Progress is saved after '
+            'each batch, so running it again resumes an interrupted import.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='An mbox file or Maildir directory')
+        parser.add_argument(
+            '--batch-size', type=int, default=200,
+            help='Number of messages to insert at a time')
+        parser.add_argument(
+            '--workers', type=int, default=8,
+            help='Number of attachments to upload at once')
+        parser.add_argument(
+            '--checkpoint',
+            help='File to save progress to. Defaults to the path with '
+                 '.checkpoint on the end.')
+        parser.add_argument(
+            '--restart', action='store_true', default=False,
+            help='Ignore any saved progress and start from the first message')
+
+    def handle(self, *args, **options):
+        path = os.path.abspath(options['path'])
+        if os.path.isdir(path):
+            box = mailbox.Maildir(path, factory=None, create=False)
+            # Maildir keys aren't ordered, so sort them to resume reliably
+            keys = sorted(box.iterkeys())
+        elif os.path.isfile(path):
+            box = mailbox.mbox(path, factory=None, create=False)
+            keys = list(box.iterkeys())
+        else:
+            raise CommandError('"%s" isn\'t an mbox file or Maildir' % path)
+
+        checkpoint_path = options['checkpoint'] or \
+            path.rstrip(os.sep) + '.checkpoint'
+        position = 0
+        if not options['restart']:
+            position = self.read_checkpoint(checkpoint_path, path)
+            if position:
+                self.stdout.write('Resuming after message %s' % position)
+
+        self.senders = {}
+        self.new_recipient_ids = []
+        self.imported = self.skipped = self.attachments = 0
+        started = timer.time()
+
+        with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+            while position < len(keys):
+                batch_keys = keys[position:position + options['batch_size']]
+                # Only one batch of messages is held in memory at a time
+                messages = [self.parse_message(box.get_message(key))
+                            for key in batch_keys]
+                self.import_batch([m for m in messages if m], pool)
+                self.skipped += messages.count(None)
+
+                position += len(batch_keys)
+                self.write_checkpoint(checkpoint_path, path, position)
+                self.stdout.write('%s of %s messages read' % (
+                    position, len(keys)))
+
+        box.close()
+
+        # Recipients found in the archive pick up their Rolodex details
+        # afterwards rather than one lookup at a time
+        if self.new_recipient_ids:
+            start_job('rolodex_sync', Recipient.objects.filter(
+                pk__in=self.new_recipient_ids))
+
+        elapsed = timer.time() - started
+        self.stdout.write(self.style.SUCCESS(
+            'Imported %s e-mails with %s attachments, skipped %s, in %.1fs '
+            '(%.0f messages/s).' % (
+                self.imported, self.attachments, self.skipped, elapsed,
+                (self.imported + self.skipped) / elapsed if elapsed else 0,
+            )))
+
+    def read_checkpoint(self, checkpoint_path, path):
+        try:
+            with open(checkpoint_path) as f:
+                checkpoint = json.load(f)
+        except (IOError, ValueError):
+            return 0
+
+        if checkpoint.get('path') != path:
+            return 0
+        return checkpoint.get('position', 0)
+
+    def write_checkpoint(self, checkpoint_path, path, position):
+        # Write to a temporary file first so an interruption can't leave a
+        # half-written checkpoint behind
+        temp_path = checkpoint_path + '.tmp'
+        with open(temp_path, 'w') as f:
+            json.dump({'path': path, 'position': position}, f)
+        os.rename(temp_path, checkpoint_path)
+
+    def parse_message(self, message):
+        """Pull the fields the Mailgun hook would have posted out of a
+        message, or return None if the hook would have rejected it"""
+        required_fields = ('From', 'To', 'Date',)
+        if any(message[field] is None for field in required_fields):
+            return None
+
+        sender = sender_address(decode_header_value(message['From']))
+        if '@' not in sender or not is_staff_address(sender):
+            return None
+
+        text, html, attachments = message_contents(message)
+        return {
+            'sender': sender.lower(),
+            'recipients': recipient_addresses(
+                decode_header_value(message['To'])),
+            'sent': parse_sent(message['Date']),
+            'subject': decode_header_value(message['Subject'])[:255],
+            'message_id': (message['Message-Id'] or '').strip()[:255],
+            'in_reply_to': (message['In-Reply-To'] or '').strip()[:255],
+            'references': (message['References'] or '').strip(),
+            'raw': text,
+            'text': text,
+            'html': html,
+            'attachments': attachments,
+        }
+
+    def import_batch(self, messages, pool):
+        # Messages already imported by an earlier run, or the hook, are
+        # matched on their Message-Id
+        message_ids = set(m['message_id'] for m in messages
+                          if m['message_id'])
+        seen = set(InboundEmail.objects.filter(
+            message_id__in=message_ids).values_list('message_id', flat=True))
+        new = []
+        for message in messages:
+            if message['message_id'] in seen:
+                self.skipped += 1
+                continue
+            if message['message_id']:
+                seen.add(message['message_id'])
+            new.append(message)
+        if not new:
+            return
+
+        # Upload everything before inserting anything, so the transaction
+        # isn't held open while waiting on S3
+        futures = [pool.submit(upload, attached_file) for message in new
+                   for attached_file in message['attachments']]
+        uploaded, errors = [], []
+        for future in futures:
+            try:
+                uploaded.append(future.result())
+            except Exception as e:
+                errors.append(e)
+        if errors:
+            self.discard(uploaded)
+            raise errors[0]
+
+        try:
+            self.insert_batch(new, uploaded)
+        except Exception:
+            # Nothing points at the uploaded files if the insert failed
+            self.discard(uploaded)
+            raise
+
+        self.imported += len(new)
+        self.attachments += len(uploaded)
+
+    def discard(self, uploaded):
+        """Delete uploaded attachments that won't be saved"""
+        for attachment in uploaded:
+            try:
+                attachment.stored_file.delete(save=False)
+            except Exception as e:
+                self.stderr.write('Couldn\'t delete %s: %s' % (
+                    attachment.stored_file.name, e))
+
+    def insert_batch(self, new, uploaded):
+        with transaction.atomic():
+            for message in new:
+                if message['sender'] not in self.senders:
+                    self.senders[message['sender']] = get_model_by_email(
+                        Sender, message['sender']).pk
+
+            recipients, created = get_recipients(
+                address for message in new
+                for address in message['recipients'])
+            self.new_recipient_ids.extend(r.pk for r in created)
+
+            emails = InboundEmail.objects.bulk_create([
+                InboundEmail(
+                    sender_id=self.senders[message['sender']],
+                    sent=message['sent'],
+                    subject=message['subject'],
+                    message_id=message['message_id'],
+                    in_reply_to=message['in_reply_to'],
+                    references=message['references'],
+                    raw=message['raw'],
+                    text=message['text'],
+                    html=message['html'],
+                ) for message in new
+            ])
+
+            InboundEmail.recipients.through.objects.bulk_create([
+                InboundEmail.recipients.through(
+                    inboundemail_id=email.pk,
+                    recipient_id=recipients[address.lower()].pk)
+                for email, message in zip(emails, new)
+                for address in set(a.lower() for a in message['recipients'])
+            ])
+
+            attachments = iter(uploaded)
+            for email, message in zip(emails, new):
+                for attachment in islice(attachments,
+                                         len(message['attachments'])):
+                    attachment.email = email
+            EmailAttachment.objects.bulk_create(uploaded)
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand
+
+from foiatracker.duplicates import index_request
+from foiatracker.models import Foia
+
+
+class Command(BaseCommand):
+    help = ('Rebuilds the MinHash signature every request is looked up by '
+            'when checking new requests for near-duplicates')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of requests to load at a time')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        foias = Foia.objects.order_by('pk').select_related('email').only(
+            'request_subject', 'email', 'email__text')
+
+        rebuilt = 0
+        last_pk = 0
+        while True:
+            batch = list(foias.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+
+            for foia in batch:
+                index_request(foia)
+            rebuilt += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write('Indexed %s requests' % rebuilt)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished rebuilding the duplicate index for %s requests.' %
+            rebuilt))
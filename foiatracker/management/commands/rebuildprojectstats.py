@@ -0,0 +1,17 @@
+from django.core.management.base import BaseCommand
+
+from foiatracker.models import Project, ProjectStats
+
+
+class Command(BaseCommand):
+    help = ('Recalculates the stats for every project. Run nightly so '
+            'overdue counts keep up with the calendar.')
+
+    def handle(self, *args, **options):
+        rebuilt = 0
+        for project_id in Project.objects.values_list('pk', flat=True):
+            ProjectStats(project_id=project_id).refresh()
+            rebuilt += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished rebuilding stats for %s projects.' % rebuilt))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+
+from foiatracker.models import Foia
+
+
+class Command(BaseCommand):
+    help = 'Rebuilds the stored full-text search vector for every request'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=500,
+            help='Number of requests to load at a time')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        foias = Foia.objects.order_by('pk').select_related(
+            'email__sender').prefetch_related('recipients')
+
+        rebuilt = 0
+        last_pk = 0
+        while True:
+            batch = list(foias.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+
+            for foia in batch:
+                foia.update_search_vector()
+            rebuilt += len(batch)
+            last_pk = batch[-1].pk
+            self.stdout.write('Rebuilt %s search vectors' % rebuilt)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished rebuilding search vectors for %s requests.' % rebuilt))
@@ -0,0 +1,45 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from foiatracker.models import Event, Foia
+
+
+class Command(BaseCommand):
+    help = ('Repairs the latest status stored on each request from its '
+            'Events')
+
+    def handle(self, *args, **options):
+        # The latest Event for every request in one query
+        latest_events = Event.objects.order_by(
+            'foia_id', '-update_date', '-created_at'
+        ).distinct(
+            'foia_id'
+        ).values_list('foia_id', 'status', 'update_date')
+        expected = {
+            foia_id: (status, update_date)
+            for foia_id, status, update_date in latest_events
+        }
+
+        stored = Foia.objects.values_list(
+            'pk', 'latest_status', 'latest_update_date', 'completed')
+
+        drifted = []
+        for pk, status, update_date, completed in stored.iterator():
+            expected_status, expected_date = expected.get(
+                pk, (Event.PENDING, None))
+            expected_completed = expected_status in Event.COMPLETE
+
+            if (status, update_date, completed) != (
+                    expected_status, expected_date, expected_completed):
+                drifted.append(pk)
+
+        # Refreshing rather than updating the columns also fixes the
+        # response times, the project's stats and the cached list row
+        with transaction.atomic():
+            for foia in Foia.objects.filter(pk__in=drifted):
+                self.stdout.write('Repairing status for request %s' % foia.pk)
+                foia.refresh_status()
+        repaired = len(drifted)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished repairing status for %s requests.' % repaired))
@@ -0,0 +1,208 @@
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from email.utils import parsedate_tz
+import json
+import os
+import time as timer
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from foiatracker.ingest import (MissingFields, UnauthorizedSender,
+                                mailgun_fields, parse_sent,
+                                receive_mailgun_post, sender_address)
+from foiatracker.models import InboundEmail
+
+
+def read_payloads(paths):
+    """Yield each stored payload in @paths, which can be JSON files holding
+    one payload or a list of them, newline-delimited JSON files or
+    directories of either"""
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(('.json', '.jsonl', '.ndjson')):
+                    for payload in read_payloads([os.path.join(path, name)]):
+                        yield payload
+            continue
+
+        with open(path) as f:
+            if path.endswith(('.jsonl', '.ndjson')):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+                continue
+
+            payload = json.load(f)
+            if isinstance(payload, list):
+                for item in payload:
+                    yield item
+            else:
+                yield payload
+
+
+def payload_key(payload):
+    """What identifies a payload's message: its Message-Id, or its sender,
+    Date and subject when it doesn't have one. None when neither can be
+    relied on."""
+    message_id = payload.get('Message-Id', '')[:255]
+    if message_id:
+        return message_id
+    if parsedate_tz(payload.get('Date') or '') is None:
+        return None
+    return (sender_address(payload.get('sender')).lower(),
+            payload.get('Date'), payload.get('subject', ''))
+
+
+def received_emails(payload):
+    """The e-mails already saved from a payload's message"""
+    message_id = payload.get('Message-Id', '')[:255]
+    if message_id:
+        return InboundEmail.objects.filter(message_id=message_id)
+    return InboundEmail.objects.filter(
+        message_id='',
+        sender__email__iexact=sender_address(payload.get('sender')),
+        sent=parse_sent(payload.get('Date')),
+        subject=payload.get('subject', ''),
+    )
+
+
+def percentile(durations, p):
+    return durations[min(len(durations) - 1,
+                         int(round(p * (len(durations) - 1))))]
+
+
+class Command(BaseCommand):
+    help = ('Replays stored Mailgun webhook payloads through the same '
+            'pipeline as the hook. Payloads already received, matched on '
+            'their Message-Id or else their sender, Date and subject, are '
+            'skipped, or re-parsed with --update. Payloads with neither a '
+            'Message-Id nor a valid Date are rejected.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='+')
+        parser.add_argument(
+            '--workers', type=int, default=4,
+            help='Number of payloads to process at once')
+        parser.add_argument(
+            '--update', action='store_true', default=False,
+            help='Re-parse the fields of e-mails that were already received')
+        parser.add_argument(
+            '--no-notify', action='store_false', dest='notify', default=True,
+            help='Don\'t send Slack prompts for replayed e-mails')
+
+    def handle(self, *args, **options):
+        self.update = options['update']
+        self.notify = options['notify']
+        self.counts = {
+            'received': 0, 'updated': 0, 'skipped': 0, 'rejected': 0,
+            'failed': 0,
+        }
+        durations = []
+        seen = set()
+        started = timer.time()
+
+        # Hold at most two payloads per worker in memory, however many are
+        # waiting to be read
+        max_pending = options['workers'] * 2
+        pending = set()
+
+        try:
+            with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+                for payload in read_payloads(options['paths']):
+                    # Copies of a message in the same run would race each
+                    # other past the check for ones already received
+                    key = payload_key(payload)
+                    if key is not None and key in seen:
+                        self.counts['skipped'] += 1
+                        continue
+                    seen.add(key)
+
+                    if options['workers'] == 1:
+                        # Stay on this thread and its database connection
+                        self.record(self.replay(payload), durations)
+                        continue
+
+                    if len(pending) >= max_pending:
+                        done, pending = wait(
+                            pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            self.record(future.result(), durations)
+                    pending.add(pool.submit(self.replay_in_thread, payload))
+
+                for future in wait(pending).done:
+                    self.record(future.result(), durations)
+        except (IOError, ValueError) as e:
+            raise CommandError(str(e))
+
+        elapsed = timer.time() - started
+        total = sum(self.counts.values())
+        durations.sort()
+        self.stdout.write(self.style.SUCCESS(
+            'Replayed %s payloads in %.1fs (%.0f/s): %s received, '
+            '%s updated, %s already received, %s rejected, %s failed.' % (
+                total, elapsed, total / elapsed if elapsed else 0,
+                self.counts['received'], self.counts['updated'],
+                self.counts['skipped'], self.counts['rejected'],
+                self.counts['failed'],
+            )))
+        if durations:
+            self.stdout.write('Per payload: median %.0fms, p95 %.0fms, '
+                              'max %.0fms' % (
+                                  percentile(durations, 0.5) * 1000,
+                                  percentile(durations, 0.95) * 1000,
+                                  durations[-1] * 1000))
+
+    def record(self, result, durations):
+        outcome, duration = result
+        self.counts[outcome] += 1
+        durations.append(duration)
+
+    def replay(self, payload):
+        """Run one payload through the pipeline, returning what happened to
+        it and how long it took. A payload that raises is reported and
+        counted as failed rather than ending the replay."""
+        started = timer.time()
+        try:
+            outcome = self.replay_payload(payload)
+        except Exception as e:
+            self.stderr.write('Failed %s: %r' % (
+                payload.get('Message-Id') or 'payload without a Message-Id',
+                e))
+            outcome = 'failed'
+        return outcome, timer.time() - started
+
+    def replay_in_thread(self, payload):
+        """replay() on a worker thread, closing the connection Django opens
+        for the thread since nothing else will"""
+        try:
+            return self.replay(payload)
+        finally:
+            connection.close()
+
+    def replay_payload(self, payload):
+        message_id = payload.get('Message-Id', '')[:255]
+        if payload_key(payload) is None:
+            self.stderr.write('Rejected a payload without a Message-Id or a '
+                              'valid Date, which can\'t be replayed safely')
+            return 'rejected'
+
+        existing = list(received_emails(payload))
+        if existing and not self.update:
+            return 'skipped'
+        elif existing:
+            # Leave the sender, recipients and pairing alone. Saving
+            # rebuilds the search vectors of requests made with it.
+            for email in existing:
+                for field, value in mailgun_fields(payload).items():
+                    setattr(email, field, value)
+                email.save()
+            return 'updated'
+
+        try:
+            receive_mailgun_post(payload, notify=self.notify)
+        except (MissingFields, UnauthorizedSender) as e:
+            self.stderr.write('Rejected %s: %s' % (
+                message_id or 'payload without a Message-Id',
+                str(e) or 'Missing a required field'))
+            return 'rejected'
+        return 'received'
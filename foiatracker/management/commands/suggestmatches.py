@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from foiatracker.matching import suggest_matches
+from foiatracker.models import InboundEmail
+
+
+class Command(BaseCommand):
+    help = ('Ranks requests for every unprocessed e-mail that doesn\'t have '
+            'suggestions yet, like ones brought in by importmail')
+
+    def handle(self, *args, **options):
+        emails = InboundEmail.objects.filter(
+            processed=False, suggestions__isnull=True,
+        ).only('pk', 'subject', 'sender', 'sent').order_by('-sent')
+
+        suggested = 0
+        for email in emails.iterator():
+            suggest_matches(email)
+            suggested += 1
+            if suggested % 100 == 0:
+                self.stdout.write('Suggested requests for %s e-mails' %
+                                  suggested)
+
+        self.stdout.write(self.style.SUCCESS(
+            'Finished suggesting requests for %s e-mails.' % suggested))
@@ -0,0 +1,189 @@
+import heapq
+import re
+
+from fuzzywuzzy import fuzz
+
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import transaction
+from django.db.models import Q
+
+from foiatracker.models import (Event, Foia, InboundEmail, MatchSuggestion,
+                                Project)
+
+
+PREFIX_RE = re.compile('(re|fwd):', flags=re.IGNORECASE)
+
+GENERIC_LANGUAGE_RE = re.compile(
+    r'((?:tpia|record(?:s)*|foia|public\s+information)\s+request)(?!\s+log(?:s)*)',
+    flags=re.IGNORECASE | re.VERBOSE)
+
+# Requests stored for each e-mail waiting in the triage inbox
+MAX_SUGGESTIONS = 5
+
+# Most requests picked in SQL from each source of likely matches before
+# they're fuzzy-ranked against an e-mail in Python
+MAX_CANDIDATES = 200
+
+# The fields pulled for each Foia when ranking and labeling matches
+FOIA_MATCH_FIELDS = (
+    'pk', 'sent', 'request_subject', 'sender__pk', 'sender__last_name',
+    'project__pk',
+)
+
+
+def strip_subject(subject):
+    """Remove reply/forward prefixes, generic "records request" language and
+    anything that isn't a letter or space from a subject line"""
+    prefix_removed = PREFIX_RE.sub('', subject)
+    generics_removed = GENERIC_LANGUAGE_RE.sub('', prefix_removed)
+    return ''.join(
+        _ for _ in generics_removed if _.isalpha() or _ == ' ')
+
+
+def foia_label(foia):
+    """Build a picker label from a dict of FOIA_MATCH_FIELDS values"""
+    if foia['sender__last_name']:
+        return '%s: %s' % (
+            foia['sender__last_name'], foia['request_subject'],
+        )
+    return foia['request_subject']
+
+
+def match_scorer(email):
+    """Build a function that scores a dict of FOIA_MATCH_FIELDS values by
+    how likely the passed InboundEmail is to be an update on it"""
+    sender_projects = set(Project.objects.filter(
+        collaborators=email.sender_id).values_list('pk', flat=True))
+
+    cleaned_email_subject = strip_subject(email.subject)
+
+    def match_email_to_foia(foia):
+        score = fuzz.ratio(
+            strip_subject(foia['request_subject']),
+            cleaned_email_subject,
+        )
+
+        # Boost the score if the sender is the same and for requests
+        # that are in one of the sender's projects
+        if foia['sender__pk'] == email.sender_id:
+            score += 25
+        elif foia['project__pk'] is not None and \
+                foia['project__pk'] in sender_projects:
+            score += 20
+
+        days_apart = (email.sent.date() - foia['sent']).days
+
+        # Penalize requests that are older than 30 days, but max out
+        # the penalty at the 180-day mark
+        min_days = 30
+        max_days = 180
+        normalized_days_apart = min(
+            max(min_days, days_apart), max_days) - min_days
+        score *= (1 - float(normalized_days_apart) / float(max_days))
+
+        return score
+
+    return match_email_to_foia
+
+
+def rank_foias_for_email(email, foias):
+    """Sort dicts of FOIA_MATCH_FIELDS values from the most to the least
+    likely match for the passed InboundEmail"""
+    return sorted(foias, key=match_scorer(email), reverse=True)
+
+
+def suggest_matches(email):
+    """Store the requests an unpaired e-mail is most likely an update on,
+    replacing any suggested before. Only the requests match_candidates()
+    picks are ranked, and ones that don't score at all aren't kept."""
+    score = match_scorer(email)
+    candidates = match_candidates(email, Foia.objects.all()).values(
+        *FOIA_MATCH_FIELDS)
+    scored = ((score(foia), foia['pk']) for foia in candidates)
+    best = heapq.nlargest(
+        MAX_SUGGESTIONS, (match for match in scored if match[0] > 0))
+
+    with transaction.atomic():
+        MatchSuggestion.objects.filter(email=email).delete()
+        return MatchSuggestion.objects.bulk_create([
+            MatchSuggestion(email=email, foia_id=foia_id, score=foia_score)
+            for foia_score, foia_id in best
+        ])
+
+
+def match_candidates(email, foias):
+    """Narrow a Foia queryset to the requests worth ranking against
+    @email: the ones with the most similar subjects, and the most recent
+    ones from its sender and the sender's projects"""
+    pks = set(foias.filter(sender=email.sender_id).order_by(
+        '-sent').values_list('pk', flat=True)[:MAX_CANDIDATES])
+    pks.update(foias.filter(project__collaborators=email.sender_id).order_by(
+        '-sent').values_list('pk', flat=True)[:MAX_CANDIDATES])
+
+    cleaned_email_subject = strip_subject(email.subject).strip()
+    if cleaned_email_subject:
+        pks.update(foias.filter(
+            request_subject__trigram_similar=cleaned_email_subject,
+        ).annotate(
+            similarity=TrigramSimilarity('request_subject',
+                                         cleaned_email_subject),
+        ).order_by('-similarity').values_list(
+            'pk', flat=True)[:MAX_CANDIDATES])
+
+    return foias.filter(pk__in=pks)
+
+
+def search_foias(query='', email=None):
+    """Return dicts of FOIA_MATCH_FIELDS values for requests whose subject
+    contains @query, ranked against @email when one is passed and most
+    recent first otherwise"""
+    foias = Foia.objects.all()
+    if query:
+        foias = foias.filter(request_subject__icontains=query)
+
+    if email is not None:
+        return rank_foias_for_email(
+            email, match_candidates(email, foias).values(*FOIA_MATCH_FIELDS))
+    return foias.values(*FOIA_MATCH_FIELDS)
+
+
+def find_threaded_foia(email):
+    """Return the Foia that an e-mail's reply headers point to, either
+    through the request's own e-mail or an e-mail attached to one of its
+    Events, or None if the e-mail can't be threaded to a single request"""
+    message_ids = email.thread_message_ids()
+    if not message_ids:
+        return None
+
+    thread = InboundEmail.objects.filter(
+        message_id__in=message_ids).exclude(pk=email.pk)
+
+    foia_ids = set(Foia.objects.filter(
+        email__in=thread).values_list('pk', flat=True))
+    foia_ids.update(Event.objects.filter(
+        email__in=thread).values_list('foia_id', flat=True))
+
+    # An e-mail in the thread was filed on several requests, so only keep
+    # the ones sent to someone the reply went to
+    if len(foia_ids) > 1:
+        recipients = email.recipients.all()
+        foia_ids = set(Foia.objects.filter(pk__in=foia_ids).filter(
+            Q(recipients__in=recipients) |
+            Q(email__recipients__in=recipients),
+        ).values_list('pk', flat=True))
+
+    # Still ambiguous replies are left for the sender to file
+    if len(foia_ids) != 1:
+        return None
+    return Foia.objects.get(pk=foia_ids.pop())
+
+
+def pair_email_with_foia(email, foia):
+    """Record an e-mail as an update on @foia, carrying the request's
+    current status forward"""
+    return Event.objects.create(
+        email=email,
+        foia=foia,
+        update_date=email.sent.date(),
+        status=foia.status()[0],
+    )
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 09:12
+from __future__ import unicode_literals
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+SEARCH_FIELDS = ('email', 'name', 'organization')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0036_auto_20181009_1714'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Trigram indexes back the similarity lookups; the UPPER()
+        # expression indexes back Django's istartswith prefix matches
+        migrations.RunSQL(
+            sql=[
+                'CREATE INDEX foiatracker_recipient_%s_trgm '
+                'ON foiatracker_recipient USING gin (%s gin_trgm_ops);' % (
+                    field, field)
+                for field in SEARCH_FIELDS
+            ] + [
+                'CREATE INDEX foiatracker_recipient_%s_prefix '
+                'ON foiatracker_recipient '
+                '(UPPER(%s::text) text_pattern_ops);' % (field, field)
+                for field in SEARCH_FIELDS
+            ],
+            reverse_sql=[
+                'DROP INDEX foiatracker_recipient_%s_trgm;' % field
+                for field in SEARCH_FIELDS
+            ] + [
+                'DROP INDEX foiatracker_recipient_%s_prefix;' % field
+                for field in SEARCH_FIELDS
+            ],
+        ),
+    ]
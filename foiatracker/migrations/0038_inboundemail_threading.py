@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 10:04
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0037_recipient_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='inboundemail',
+            name='in_reply_to',
+            field=models.CharField(blank=True, max_length=255, verbose_name='In-Reply-To'),
+        ),
+        migrations.AddField(
+            model_name='inboundemail',
+            name='message_id',
+            field=models.CharField(blank=True, db_index=True, max_length=255, verbose_name='Message-Id'),
+        ),
+        migrations.AddField(
+            model_name='inboundemail',
+            name='references',
+            field=models.TextField(blank=True),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 11:20
+from __future__ import unicode_literals
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+
+# Mirrors Foia.update_search_vector() so existing requests are searchable
+# as soon as the column exists
+POPULATE_SEARCH_VECTOR = """
+UPDATE foiatracker_foia AS foia SET search_vector = (
+    SELECT
+        setweight(to_tsvector(concat_ws(' ',
+            foia.request_subject, foia.agency_id, foia.notes)), 'A') ||
+        setweight(to_tsvector(concat_ws(' ',
+            (SELECT string_agg(concat_ws(' ', r.name, r.organization), ' ')
+             FROM foiatracker_foia_recipients AS fr
+             JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+             WHERE fr.foia_id = foia.id),
+            sender.first_name, sender.last_name)), 'B') ||
+        setweight(to_tsvector(concat_ws(' ',
+            email.text, sender.email,
+            (SELECT string_agg(r.email, ' ')
+             FROM foiatracker_foia_recipients AS fr
+             JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+             WHERE fr.foia_id = foia.id))), 'C')
+    FROM foiatracker_inboundemail AS email
+    JOIN foiatracker_sender AS sender ON sender.id = email.sender_id
+    WHERE email.id = foia.email_id
+);
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0038_inboundemail_threading'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='foiatracker_search_vector_gin'),
+        ),
+        migrations.RunSQL(POPULATE_SEARCH_VECTOR, migrations.RunSQL.noop),
+    ]
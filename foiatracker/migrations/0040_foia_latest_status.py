@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 13:02
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+# Copy the most recent Event's status onto each request
+POPULATE_LATEST_STATUS = """
+UPDATE foiatracker_foia AS foia SET
+    latest_status = latest.status,
+    latest_update_date = latest.update_date,
+    completed = latest.status IN ('denied', 'relagc', 'wthdrwn', 'norecs')
+FROM (
+    SELECT DISTINCT ON (foia_id) foia_id, status, update_date
+    FROM foiatracker_event
+    ORDER BY foia_id, update_date DESC, created_at DESC
+) AS latest
+WHERE latest.foia_id = foia.id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0039_foia_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='completed',
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name='foia',
+            name='latest_status',
+            field=models.CharField(db_index=True, default='pending', editable=False, max_length=7),
+        ),
+        migrations.AddField(
+            model_name='foia',
+            name='latest_update_date',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['completed', '-sent'], name='foiatracker_completed_sent'),
+        ),
+        migrations.RunSQL(POPULATE_LATEST_STATUS, migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,20 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 13:40
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0040_foia_latest_status'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='version',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 14:05
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+# Mirrors Recipient.__str__()
+RECIPIENT_DISPLAY = """
+CASE
+    WHEN r.name <> '' AND r.organization <> ''
+        THEN r.organization || ' (' || r.name || ')'
+    WHEN r.name <> '' THEN r.name
+    WHEN r.organization <> '' THEN r.organization
+    ELSE r.email
+END
+"""
+
+POPULATE_RECIPIENTS_DISPLAY = """
+UPDATE foiatracker_foia AS foia SET recipients_display = COALESCE(
+    (
+        SELECT string_agg({display}, ', ' ORDER BY r.email)
+        FROM foiatracker_foia_recipients AS fr
+        JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+        WHERE fr.foia_id = foia.id
+    ),
+    (
+        SELECT string_agg({display}, ', ' ORDER BY r.email)
+        FROM foiatracker_inboundemail_recipients AS er
+        JOIN foiatracker_recipient AS r ON r.id = er.recipient_id
+        WHERE er.inboundemail_id = foia.email_id
+    ),
+    ''
+);
+""".format(display=RECIPIENT_DISPLAY)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0041_foia_version'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='recipients_display',
+            field=models.TextField(blank=True, editable=False),
+        ),
+        migrations.RunSQL(POPULATE_RECIPIENTS_DISPLAY,
+                          reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 14:30
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+POPULATE_SENDER = """
+UPDATE foiatracker_foia AS foia SET sender_id = email.sender_id
+FROM foiatracker_inboundemail AS email
+WHERE email.id = foia.email_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0042_foia_recipients_display'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='sender',
+            field=models.ForeignKey(db_index=False, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, to='foiatracker.Sender'),
+        ),
+        migrations.RunSQL(POPULATE_SENDER,
+                          reverse_sql=migrations.RunSQL.noop),
+        migrations.AlterField(
+            model_name='foia',
+            name='sender',
+            field=models.ForeignKey(db_index=False, editable=False, on_delete=django.db.models.deletion.PROTECT, to='foiatracker.Sender'),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['sender', '-sent'], name='foiatracker_sender_sent'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 15:10
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Give every existing project an empty stats row; the rebuildprojectstats
+# command fills them in
+CREATE_EMPTY_STATS = """
+INSERT INTO foiatracker_projectstats (
+    project_id, total, pending, complete, overdue, status_counts,
+    amount_asked, amount_paid, updated_at
+)
+SELECT id, 0, 0, 0, 0, '{}', 0, 0, now() FROM foiatracker_project;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0043_foia_sender'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProjectStats',
+            fields=[
+                ('project', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='stats', serialize=False, to='foiatracker.Project')),
+                ('total', models.PositiveIntegerField(default=0)),
+                ('pending', models.PositiveIntegerField(default=0)),
+                ('complete', models.PositiveIntegerField(default=0)),
+                ('overdue', models.PositiveIntegerField(default=0)),
+                ('status_counts', django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+                ('amount_asked', models.PositiveIntegerField(default=0)),
+                ('amount_paid', models.PositiveIntegerField(default=0)),
+                ('median_days_to_resolution', models.FloatField(null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'project stats',
+            },
+        ),
+        migrations.RunSQL(CREATE_EMPTY_STATS,
+                          reverse_sql=migrations.RunSQL.noop),
+    ]
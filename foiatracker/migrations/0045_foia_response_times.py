@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 15:45
+from __future__ import unicode_literals
+
+from bisect import bisect_right
+
+import holidays
+
+from django.db import migrations, models
+
+
+# Frozen copies of foiatracker.utils.texas_holidays() and
+# business_days_between(), so later changes to them don't change what this
+# migration does
+def texas_holidays(first_year, last_year):
+    tx_holidays = holidays.US(state='TX',
+                              years=range(first_year, last_year + 1))
+    return sorted(day for day in tx_holidays if day.weekday() < 5)
+
+
+def business_days_between(start, end, holiday_dates):
+    if end <= start:
+        return 0
+
+    weeks, extra_days = divmod((end - start).days, 7)
+    days = weeks * 5
+    for offset in range(1, extra_days + 1):
+        if (start.weekday() + offset) % 7 < 5:
+            days += 1
+
+    return days - (bisect_right(holiday_dates, end) -
+                   bisect_right(holiday_dates, start))
+
+
+# First response is the earliest Event that isn't "awaiting response";
+# resolution is the earliest resolving Event, for requests still resolved
+POPULATE_RESPONSE_DATES = """
+UPDATE foiatracker_foia AS foia SET
+    first_response_date = dates.first_response,
+    resolved_date = CASE WHEN foia.completed THEN dates.resolved END
+FROM (
+    SELECT
+        foia_id,
+        MIN(CASE WHEN status <> 'pending' THEN update_date END)
+            AS first_response,
+        MIN(CASE WHEN status IN ('denied', 'relagc', 'wthdrwn', 'norecs')
+            THEN update_date END) AS resolved
+    FROM foiatracker_event
+    GROUP BY foia_id
+) AS dates
+WHERE dates.foia_id = foia.id;
+"""
+
+
+def populate_response_days(apps, schema_editor):
+    Foia = apps.get_model('foiatracker', 'Foia')
+    foias = Foia.objects.filter(first_response_date__isnull=False)
+    first_sent = foias.aggregate(models.Min('sent'))['sent__min']
+    if first_sent is None:
+        return
+
+    last_dates = foias.aggregate(
+        models.Max('first_response_date'), models.Max('resolved_date'))
+    last_year = max(d.year for d in last_dates.values() if d is not None)
+    holiday_dates = texas_holidays(first_sent.year, last_year)
+
+    def days(sent, date):
+        if date is None:
+            return None
+        return business_days_between(sent, date, holiday_dates)
+
+    rows = foias.values_list(
+        'pk', 'sent', 'first_response_date', 'resolved_date')
+    for pk, sent, first_response_date, resolved_date in rows.iterator():
+        Foia.objects.filter(pk=pk).update(
+            first_response_days=days(sent, first_response_date),
+            resolution_days=days(sent, resolved_date),
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0044_projectstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='foia',
+            name='first_response_date',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='foia',
+            name='first_response_days',
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='foia',
+            name='resolved_date',
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='foia',
+            name='resolution_days',
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['first_response_days'], name='foiatracker_first_response'),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['resolution_days'], name='foiatracker_resolution_days'),
+        ),
+        migrations.RunSQL(POPULATE_RESPONSE_DATES,
+                          reverse_sql=migrations.RunSQL.noop),
+        migrations.RunPython(populate_response_days,
+                             migrations.RunPython.noop),
+    ]
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 16:20
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# One Agency per Rolodex organization, named after the most common
+# spelling among its recipients
+POPULATE_AGENCIES = """
+INSERT INTO foiatracker_agency (name, rolodex_organization_id)
+SELECT DISTINCT ON (rolodex_organization_id)
+    organization, rolodex_organization_id
+FROM foiatracker_recipient
+WHERE rolodex_organization_id IS NOT NULL AND organization <> ''
+GROUP BY rolodex_organization_id, organization
+ORDER BY rolodex_organization_id, COUNT(*) DESC, organization;
+
+UPDATE foiatracker_recipient AS recipient SET agency_id = agency.id
+FROM foiatracker_agency AS agency
+WHERE agency.rolodex_organization_id = recipient.rolodex_organization_id;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0045_foia_response_times'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Agency',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('rolodex_organization_id', models.PositiveSmallIntegerField(null=True, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+                'verbose_name_plural': 'agencies',
+            },
+        ),
+        migrations.AddField(
+            model_name='recipient',
+            name='agency',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='recipients', to='foiatracker.Agency'),
+        ),
+        migrations.RunSQL(POPULATE_AGENCIES,
+                          reverse_sql=migrations.RunSQL.noop),
+    ]
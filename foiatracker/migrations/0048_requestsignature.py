@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 17:40
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0047_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestSignature',
+            fields=[
+                ('foia', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='signature', serialize=False, to='foiatracker.Foia')),
+                ('minhash', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), size=None)),
+                ('bands', django.contrib.postgres.fields.ArrayField(base_field=models.BigIntegerField(), size=None)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name='requestsignature',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['bands'], name='foiatracker_signature_bands'),
+        ),
+    ]
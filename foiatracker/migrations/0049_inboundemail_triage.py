@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 18:25
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+# Nothing kept processed up to date before, so work it out from the
+# requests and Events each e-mail is linked to
+BACKFILL_PROCESSED = """
+UPDATE foiatracker_inboundemail AS email SET processed = (
+    EXISTS (SELECT 1 FROM foiatracker_foia WHERE email_id = email.id) OR
+    EXISTS (SELECT 1 FROM foiatracker_event WHERE email_id = email.id)
+);
+"""
+
+# The triage inbox only ever reads unprocessed e-mails, a small slice of
+# the table, so only they're indexed
+CREATE_UNPROCESSED_INDEX = """
+CREATE INDEX foiatracker_email_unprocessed
+ON foiatracker_inboundemail (sender_id, sent DESC)
+WHERE NOT processed;
+"""
+
+DROP_UNPROCESSED_INDEX = """
+DROP INDEX IF EXISTS foiatracker_email_unprocessed;
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0048_requestsignature'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MatchSuggestion',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.FloatField()),
+                ('email', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='suggestions', to='foiatracker.InboundEmail')),
+                ('foia', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='foiatracker.Foia')),
+            ],
+            options={
+                'ordering': ['-score'],
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='matchsuggestion',
+            unique_together=set([('email', 'foia')]),
+        ),
+        migrations.RunSQL(BACKFILL_PROCESSED, migrations.RunSQL.noop),
+        migrations.RunSQL(CREATE_UNPROCESSED_INDEX, DROP_UNPROCESSED_INDEX),
+    ]
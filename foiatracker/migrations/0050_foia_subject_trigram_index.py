@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 21:05
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0049_inboundemail_triage'),
+    ]
+
+    operations = [
+        # Backs the trigram lookup that picks requests to rank against an
+        # e-mail, and the picker's icontains subject search
+        migrations.RunSQL(
+            sql='CREATE INDEX foiatracker_foia_subject_trgm '
+                'ON foiatracker_foia USING gin '
+                '(request_subject gin_trgm_ops);',
+            reverse_sql='DROP INDEX foiatracker_foia_subject_trgm;',
+        ),
+    ]
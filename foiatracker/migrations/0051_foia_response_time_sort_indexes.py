@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# Generated by Django 1.11.16 on 2026-10-19 21:40
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('foiatracker', '0050_foia_subject_trigram_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='foia',
+            name='foiatracker_first_response',
+        ),
+        migrations.RemoveIndex(
+            model_name='foia',
+            name='foiatracker_resolution_days',
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['first_response_days', 'id'], name='foiatracker_first_response'),
+        ),
+        migrations.AddIndex(
+            model_name='foia',
+            index=models.Index(fields=['resolution_days', 'id'], name='foiatracker_resolution_days'),
+        ),
+    ]
@@ -2,12 +2,19 @@ from datetime import time, timedelta, datetime
 from os import path
 import uuid
 
-from holidays import US
 import requests
 
-from django.db import models
+from django.contrib.postgres.fields import ArrayField, JSONField
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import connection, models, transaction
+from django.db.models import (Aggregate, Case, Count, F, FloatField, Min,
+                              Sum, Value, When)
+from django.db.models.functions import Greatest
 from django.conf import settings
+from django.core.cache import cache
 from django.urls import reverse
+from django.utils import timezone
 from django.utils.text import slugify
 
 from foiatracker import utils
@@ -48,10 +55,33 @@ class Sender(models.Model):
         ordering = ('last_name', 'first_name',)
 
 
+class Agency(models.Model):
+    """An organization from the Rolodex, shared by all of the recipients
+    that work there"""
+    name = models.CharField(max_length=255)
+    rolodex_organization_id = models.PositiveSmallIntegerField(
+        unique=True, null=True)
+
+    def __str__(self):
+        return self.name
+
+    class Meta:
+        ordering = ['name', ]
+        verbose_name_plural = 'agencies'
+
+
 class Recipient(models.Model):
     email = models.EmailField(unique=True)
     name = models.CharField(max_length=255, blank=True)
     organization = models.CharField(max_length=255, blank=True)
+    agency = models.ForeignKey(
+        Agency,
+        null=True,
+        blank=True,
+        editable=False,
+        on_delete=models.SET_NULL,
+        related_name='recipients'
+    )
 
     rolodex_person_id = models.PositiveSmallIntegerField(null=True)
     rolodex_contact_id = models.PositiveSmallIntegerField(null=True)
@@ -137,6 +167,23 @@ class Recipient(models.Model):
         if organization is not None:
             self.organization = organization['orgName']
 
+    def link_agency(self):
+        """Point the recipient at the Agency for its Rolodex organization,
+        creating or renaming the Agency to match what Rolodex returned"""
+        if self.rolodex_organization_id is None:
+            self.agency = None
+            return
+
+        agency, created = Agency.objects.get_or_create(
+            rolodex_organization_id=self.rolodex_organization_id,
+            defaults={'name': self.organization},
+        )
+        if not created and self.organization and \
+                agency.name != self.organization:
+            agency.name = self.organization
+            agency.save()
+        self.agency = agency
+
     class Meta:
         ordering = ['email', ]
 
@@ -155,6 +202,12 @@ class InboundEmail(models.Model):
 
     subject = models.CharField(max_length=255)
 
+    message_id = models.CharField(max_length=255, blank=True, db_index=True,
+                                  verbose_name='Message-Id')
+    in_reply_to = models.CharField(max_length=255, blank=True,
+                                   verbose_name='In-Reply-To')
+    references = models.TextField(blank=True)
+
     def create_foia_url(self):
         """A route that will create a FOIA from this email object"""
         return reverse('foia-from-email', kwargs={'uuid': self.uuid})
@@ -173,6 +226,15 @@ class InboundEmail(models.Model):
         return ', '.join(strs)
     recipients_str.short_description = 'Recipients'
 
+    def thread_message_ids(self):
+        """The Message-Ids of earlier e-mails in this e-mail's thread, taken
+        from its In-Reply-To and References headers"""
+        message_ids = []
+        for message_id in self.references.split() + self.in_reply_to.split():
+            if message_id not in message_ids:
+                message_ids.append(message_id)
+        return message_ids
+
 
 class EmailAttachment(models.Model):
     email = models.ForeignKey(
@@ -218,8 +280,86 @@ class EmailAttachment(models.Model):
             return 'file-o'
 
 
+# Set-based versions of Foia.refresh_recipients_display() and
+# Foia.update_search_vector(), for rebuilding many requests at once
+RECIPIENT_DISPLAY_SQL = """
+CASE
+    WHEN r.name <> '' AND r.organization <> ''
+        THEN r.organization || ' (' || r.name || ')'
+    WHEN r.name <> '' THEN r.name
+    WHEN r.organization <> '' THEN r.organization
+    ELSE r.email
+END
+"""
+
+REFRESH_RECIPIENTS_DISPLAY_SQL = """
+UPDATE foiatracker_foia AS foia SET version = foia.version + 1,
+    recipients_display = COALESCE(
+        (
+            SELECT string_agg({display}, ', ' ORDER BY r.email)
+            FROM foiatracker_foia_recipients AS fr
+            JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+            WHERE fr.foia_id = foia.id
+        ),
+        (
+            SELECT string_agg({display}, ', ' ORDER BY r.email)
+            FROM foiatracker_inboundemail_recipients AS er
+            JOIN foiatracker_recipient AS r ON r.id = er.recipient_id
+            WHERE er.inboundemail_id = foia.email_id
+        ),
+        ''
+    )
+WHERE foia.id = ANY(%s);
+""".format(display=RECIPIENT_DISPLAY_SQL)
+
+UPDATE_SEARCH_VECTORS_SQL = """
+UPDATE foiatracker_foia AS foia SET search_vector = (
+    SELECT
+        setweight(to_tsvector(concat_ws(' ',
+            foia.request_subject, foia.agency_id, foia.notes)), 'A') ||
+        setweight(to_tsvector(concat_ws(' ',
+            (SELECT string_agg(concat_ws(' ', r.name, r.organization), ' ')
+             FROM foiatracker_foia_recipients AS fr
+             JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+             WHERE fr.foia_id = foia.id),
+            sender.first_name, sender.last_name)), 'B') ||
+        setweight(to_tsvector(concat_ws(' ',
+            email.text, sender.email,
+            (SELECT string_agg(r.email, ' ')
+             FROM foiatracker_foia_recipients AS fr
+             JOIN foiatracker_recipient AS r ON r.id = fr.recipient_id
+             WHERE fr.foia_id = foia.id))), 'C')
+    FROM foiatracker_inboundemail AS email
+    JOIN foiatracker_sender AS sender ON sender.id = email.sender_id
+    WHERE email.id = foia.email_id
+)
+WHERE foia.id = ANY(%s);
+"""
+
+
 class Foia(models.Model):
+    # Business days an agency has to respond before a request is overdue
+    RESPONSE_BUSINESS_DAYS = 11
+
+    # What a request contributes to its project's stats
+    STATS_FIELDS = ('project_id', 'latest_status', 'completed', 'sent',
+                    'latest_update_date')
+
+    # Kept current with update() by refresh_status(),
+    # refresh_recipients_display() and the search vector and version
+    # signals, so saves of an existing request leave them alone rather than
+    # write back a copy that may be stale
+    DENORMALIZED_FIELDS = (
+        'latest_status', 'latest_update_date', 'completed',
+        'first_response_date', 'first_response_days', 'resolved_date',
+        'resolution_days', 'recipients_display', 'version', 'search_vector',
+    )
+
     email = models.ForeignKey(InboundEmail, on_delete=models.CASCADE)
+    # Copied from the e-mail so "My requests" doesn't need to join through
+    # it. The (sender, -sent) index covers lookups on the column alone.
+    sender = models.ForeignKey(Sender, on_delete=models.PROTECT,
+                               editable=False, db_index=False)
     sent = models.DateField()
     recipients = models.ManyToManyField(Recipient)
     request_subject = models.CharField(
@@ -245,11 +385,49 @@ class Foia(models.Model):
         max_length=20,
         verbose_name='agency ID'
     )
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    # Copied from the most recent Event by refresh_status() so lists can
+    # filter and display status without querying Events
+    latest_status = models.CharField(max_length=7, default='pending',
+                                     editable=False, db_index=True)
+    latest_update_date = models.DateField(null=True, editable=False)
+    completed = models.BooleanField(default=False, editable=False)
+
+    # When the agency first responded and when the request was resolved,
+    # plus how many business days after it was sent. Also kept up to date
+    # by refresh_status().
+    first_response_date = models.DateField(null=True, editable=False)
+    first_response_days = models.PositiveSmallIntegerField(
+        null=True, editable=False)
+    resolved_date = models.DateField(null=True, editable=False)
+    resolution_days = models.PositiveSmallIntegerField(
+        null=True, editable=False)
+
+    # Who the request went to, falling back to the original e-mail's
+    # recipients. Kept up to date by refresh_recipients_display().
+    recipients_display = models.TextField(blank=True, editable=False)
+
+    # Bumped whenever anything shown in a request's list row changes; used
+    # as part of the row's cache key
+    version = models.PositiveIntegerField(default=1, editable=False)
 
     class Meta:
         verbose_name = 'FOIA'
         verbose_name_plural = 'FOIAs'
         ordering = ['-sent', '-created_at', ]
+        indexes = [
+            GinIndex(fields=['search_vector'],
+                     name='foiatracker_search_vector_gin'),
+            models.Index(fields=['completed', '-sent'],
+                         name='foiatracker_completed_sent'),
+            models.Index(fields=['sender', '-sent'],
+                         name='foiatracker_sender_sent'),
+            models.Index(fields=['first_response_days', 'id'],
+                         name='foiatracker_first_response'),
+            models.Index(fields=['resolution_days', 'id'],
+                         name='foiatracker_resolution_days'),
+        ]
 
     def __str__(self):
         return self.request_subject
@@ -258,33 +436,190 @@ class Foia(models.Model):
         return '%s?foia=%s' % (reverse('event-add'), self.id)
 
     def status(self):
-        recent_event = self.event_set.first()
-        if recent_event:
-            return recent_event.status, recent_event.get_status_display()
+        return (self.latest_status,
+                dict(Event.STATUS_CHOICES)[self.latest_status])
+
+    def stats_state(self):
+        """The STATS_FIELDS values of the request as it is in memory"""
+        sent = self.sent.date() if hasattr(self.sent, 'date') else self.sent
+        return (self.project_id, self.latest_status, self.completed, sent,
+                self.latest_update_date)
+
+    def refresh_status(self):
+        """Copy the status and date of the most recent Event onto the
+        request, along with its response times, and refresh its project's
+        stats"""
+        before = Foia.objects.filter(pk=self.pk).values_list(
+            *Foia.STATS_FIELDS).first()
+
+        events = Event.objects.filter(foia=self)
+        latest = events.values('status', 'update_date').first()
+
+        if latest is not None:
+            self.latest_status = latest['status']
+            self.latest_update_date = latest['update_date']
         else:
-            return (Event.PENDING, 'Awaiting agency response')
+            self.latest_status = Event.PENDING
+            self.latest_update_date = None
+        self.completed = self.latest_status in Event.COMPLETE
+
+        dates = events.order_by().aggregate(
+            first_response=Min(Case(When(
+                status__in=Event.RESPONDED, then=F('update_date')))),
+            resolved=Min(Case(When(
+                status__in=Event.COMPLETE, then=F('update_date')))),
+        )
+        self.first_response_date = dates['first_response']
+        # Requests that were reopened aren't resolved
+        self.resolved_date = dates['resolved'] if self.completed else None
+
+        sent = self.sent.date() if hasattr(self.sent, 'date') else self.sent
+        self.first_response_days = self.resolution_days = None
+        if self.first_response_date is not None:
+            self.first_response_days = utils.business_days_between(
+                sent, self.first_response_date)
+        if self.resolved_date is not None:
+            self.resolution_days = utils.business_days_between(
+                sent, self.resolved_date)
+
+        Foia.objects.filter(pk=self.pk).update(
+            latest_status=self.latest_status,
+            latest_update_date=self.latest_update_date,
+            completed=self.completed,
+            first_response_date=self.first_response_date,
+            first_response_days=self.first_response_days,
+            resolved_date=self.resolved_date,
+            resolution_days=self.resolution_days,
+            version=F('version') + 1,
+        )
+
+        if before is not None:
+            # The stored project, in case this copy of the request is stale
+            ProjectStats.apply_change(
+                before, (before[0],) + self.stats_state()[1:])
 
     def due(self):
-        return utils.add_business_days(11, from_datetime=self.sent)
+        return utils.add_business_days(self.RESPONSE_BUSINESS_DAYS,
+                                       from_datetime=self.sent)
 
     def recipients_str(self):
-        if self.recipients.count():
-            strs = [str(x) for x in self.recipients.all()]
-            return ', '.join(strs)
-        else:
-            return self.email.recipients_str()
+        return self.recipients_display
     recipients_str.short_description = 'Recipients'
 
+    def refresh_recipients_display(self):
+        """Store the display string for the request's recipients, or the
+        original e-mail's recipients if it doesn't have any"""
+        recipients = list(self.recipients.all())
+        if not recipients:
+            recipients = list(self.email.recipients.all())
+
+        self.recipients_display = ', '.join(str(r) for r in recipients)
+        Foia.objects.filter(pk=self.pk).update(
+            recipients_display=self.recipients_display,
+            version=F('version') + 1,
+        )
+
+    def update_search_vector(self):
+        """Store a full-text search vector built from the request, its
+        recipients, its sender and the original e-mail"""
+        recipients = list(self.recipients.all())
+        sender = self.email.sender
+
+        def document(*values):
+            return Value(' '.join(v for v in values if v),
+                         output_field=models.TextField())
+
+        vector = (
+            SearchVector(
+                document(self.request_subject, self.agency_id, self.notes),
+                weight='A') +
+            SearchVector(
+                document(*[r.name for r in recipients] +
+                         [r.organization for r in recipients] +
+                         [sender.first_name, sender.last_name]),
+                weight='B') +
+            SearchVector(
+                document(*[self.email.text, sender.email] +
+                         [r.email for r in recipients]),
+                weight='C')
+        )
+        Foia.objects.filter(pk=self.pk).update(search_vector=vector)
+
+    @staticmethod
+    def refresh_recipient_details(foia_ids):
+        """Rebuild the recipient display strings and search vectors of many
+        requests in two queries, invalidating their cached rows"""
+        foia_ids = list(foia_ids)
+        if not foia_ids:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(REFRESH_RECIPIENTS_DISPLAY_SQL, [foia_ids])
+        Foia.update_search_vectors(foia_ids)
+
+    @staticmethod
+    def update_search_vectors(foia_ids):
+        """Rebuild the search vectors of many requests in one query, the
+        same way update_search_vector() does for one"""
+        foia_ids = list(foia_ids)
+        if not foia_ids:
+            return
+
+        with connection.cursor() as cursor:
+            cursor.execute(UPDATE_SEARCH_VECTORS_SQL, [foia_ids])
+
     def save(self, slack_notify=True, *args, **kwargs):
         # Store this here so post_save signals can pick it up
         self.slack_notify = slack_notify
 
+        # The stored row, if there is one; a request saved with a PK that
+        # isn't in the table yet is new too
+        previous = None
+        if self.pk is not None:
+            previous = Foia.objects.filter(pk=self.pk).values(
+                'email_id', 'request_subject',
+                *set(Foia.STATS_FIELDS + Foia.DENORMALIZED_FIELDS)).first()
+
         # Add a default reminder to each FOIA that's 10 business days in the
         # future at 10 a.m. on the first save
-        new = (self.pk is None)
+        new = (previous is None)
+        previous_email_id = previous_subject = before = None
+        if not new:
+            previous_email_id = previous['email_id']
+            previous_subject = previous['request_subject']
+            before = tuple(previous[field] for field in Foia.STATS_FIELDS)
+
+            # Pick up the stored values and don't write them back
+            for field in Foia.DENORMALIZED_FIELDS:
+                setattr(self, field, previous[field])
+            if not kwargs.get('force_insert') and \
+                    kwargs.get('update_fields') is None:
+                kwargs['update_fields'] = [
+                    f.name for f in self._meta.concrete_fields
+                    if not f.primary_key and
+                    f.name not in Foia.DENORMALIZED_FIELDS
+                ]
+
+        # Only a new subject or e-mail changes the near-duplicate signature
+        self.text_changed = (self.email_id != previous_email_id or
+                             self.request_subject != previous_subject)
+
+        # Keep the copy of the e-mail's sender current when the request is
+        # moved to another e-mail
+        if self.sender_id is None or self.email_id != previous_email_id:
+            self.sender_id = self.email.sender_id
 
         super(Foia, self).save(*args, **kwargs)
 
+        # Count the request in the project it's in, and out of the one it
+        # was moved out of
+        after = self.stats_state()
+        ProjectStats.apply_change(before, after)
+
+        # Response times are counted from the sent date
+        if not new and before[3] != after[3]:
+            self.refresh_status()
+
         if new:
             morning = time(hour=10, minute=00)
             reminder_time = utils.tz_aware_date(datetime.combine(
@@ -313,6 +648,10 @@ class Event(models.Model):
     )
 
     COMPLETE = (DENIED, RELEASED_BY_AGENCY, WITHDRAWN, NO_RECORDS)
+    # Anything other than "awaiting response" means the agency responded
+    RESPONDED = (KICKED, DENIED, RELEASED_BY_ATG,
+                 PARTIALLY_RELEASED_BY_AGENCY, RELEASED_BY_AGENCY, NO_RECORDS,
+                 WITHDRAWN)
 
     email = models.ForeignKey(InboundEmail, null=True,
                               on_delete=models.CASCADE)
@@ -328,22 +667,53 @@ class Event(models.Model):
     def __str__(self):
         return self.get_status_display()
 
+    def save(self, *args, **kwargs):
+        """Keep the denormalized status on the request(s) this Event belongs
+        to in step with the Event in the same transaction"""
+        with transaction.atomic():
+            previous = None
+            if self.pk is not None:
+                previous = Event.objects.filter(pk=self.pk).values_list(
+                    'foia_id', 'foia__project_id', 'amount_asked',
+                    'amount_paid').first()
+
+            super(Event, self).save(*args, **kwargs)
+
+            self.foia.refresh_status()
+            if previous is not None:
+                previous_foia_id, project_id, asked, paid = previous
+                ProjectStats.add_fees(project_id, -(asked or 0),
+                                      -(paid or 0))
+                if previous_foia_id != self.foia_id:
+                    for foia in Foia.objects.filter(pk=previous_foia_id):
+                        foia.refresh_status()
+            ProjectStats.add_fees(self.foia.project_id,
+                                  self.amount_asked or 0,
+                                  self.amount_paid or 0)
+
     @property
     def business_days_since_request(self):
-        days_since = self.update_date - self.foia.sent
-        work_days_since = 0
+        """Counted the same way as the request's stored response times"""
+        return timedelta(days=utils.business_days_between(
+            self.foia.sent, self.update_date))
 
-        tx_holidays = US(state='TX')
+    class Meta:
+        ordering = ['-update_date', '-created_at', ]
 
-        for day_num in range(days_since.days):
-            day = self.foia.sent + timedelta(days=day_num)
-            if day not in tx_holidays and day.weekday() < 5:
-                work_days_since += 1
 
-        return timedelta(days=work_days_since)
+class MatchSuggestion(models.Model):
+    """A request an unprocessed e-mail might be an update on, ranked ahead
+    of time so the triage inbox doesn't have to score every request for
+    every e-mail it lists"""
+    email = models.ForeignKey(InboundEmail, on_delete=models.CASCADE,
+                              related_name='suggestions')
+    foia = models.ForeignKey(Foia, on_delete=models.CASCADE,
+                             related_name='+')
+    score = models.FloatField()
 
     class Meta:
-        ordering = ['-update_date', '-created_at', ]
+        ordering = ['-score', ]
+        unique_together = ('email', 'foia',)
 
 
 class Reminder(models.Model):
@@ -383,7 +753,228 @@ class Project(models.Model):
 
         self.slug = slug
 
+        new = (self.pk is None)
+
         super(Project, self).save(*args, **kwargs)
 
+        if new:
+            ProjectStats.objects.create(project=self)
+
     class Meta:
         ordering = ['-created_at', ]
+
+
+class Median(Aggregate):
+    """The interpolated median of a column, computed by Postgres"""
+    function = 'PERCENTILE_CONT'
+    name = 'Median'
+    template = '%(function)s(0.5) WITHIN GROUP (ORDER BY %(expressions)s)'
+
+    def __init__(self, expression, **extra):
+        super(Median, self).__init__(
+            expression, output_field=FloatField(), **extra)
+
+
+class ProjectStats(models.Model):
+    """Counts and response times for a project's requests. Counts are
+    adjusted by apply_change() and add_fees() as requests and their Events
+    change, and the median is recalculated in the background after
+    resolved requests change. Everything is recalculated by refresh()
+    nightly by the rebuildprojectstats command, so overdue counts keep up
+    with the calendar."""
+    # Set while a median recalculation is queued for a project, so a batch
+    # of changes queues it once
+    MEDIAN_QUEUED_KEY = 'foiatracker_median_queued_%s'
+    MEDIAN_QUEUED_TIMEOUT = 60 * 5
+
+    project = models.OneToOneField(Project, on_delete=models.CASCADE,
+                                   primary_key=True, related_name='stats')
+    total = models.PositiveIntegerField(default=0)
+    pending = models.PositiveIntegerField(default=0)
+    complete = models.PositiveIntegerField(default=0)
+    overdue = models.PositiveIntegerField(default=0)
+    # Request counts keyed on each Event status
+    status_counts = JSONField(default=dict)
+    amount_asked = models.PositiveIntegerField(default=0)
+    amount_paid = models.PositiveIntegerField(default=0)
+    median_days_to_resolution = models.FloatField(null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = 'project stats'
+
+    def refresh(self):
+        """Recalculate and save the stats for one project"""
+        requests = Foia.objects.filter(project=self.project_id).order_by()
+
+        totals = requests.aggregate(
+            total=Count('pk'),
+            complete=utils.count_if(completed=True),
+            overdue=utils.count_if(
+                completed=False,
+                sent__lte=utils.overdue_cutoff(Foia.RESPONSE_BUSINESS_DAYS)),
+        )
+        self.total = totals['total']
+        self.complete = totals['complete'] or 0
+        self.pending = self.total - self.complete
+        self.overdue = totals['overdue'] or 0
+
+        self.status_counts = dict(
+            (row['latest_status'], row['count']) for row in
+            requests.values('latest_status').annotate(count=Count('pk'))
+        )
+
+        fees = Event.objects.filter(foia__project=self.project_id).aggregate(
+            asked=Sum('amount_asked'), paid=Sum('amount_paid'))
+        self.amount_asked = fees['asked'] or 0
+        self.amount_paid = fees['paid'] or 0
+
+        self.median_days_to_resolution = self.calculate_median()
+        self.save()
+
+    def calculate_median(self):
+        """The median business days the project's resolved requests took,
+        from the resolution times stored on each request"""
+        return Foia.objects.filter(
+            project=self.project_id, resolution_days__isnull=False,
+        ).aggregate(median=Median('resolution_days'))['median']
+
+    @classmethod
+    def refresh_median(cls, project_id):
+        """Recalculate and store one project's median"""
+        cache.delete(cls.MEDIAN_QUEUED_KEY % project_id)
+        cls.objects.filter(project_id=project_id).update(
+            median_days_to_resolution=cls(
+                project_id=project_id).calculate_median(),
+            updated_at=timezone.now(),
+        )
+
+    @classmethod
+    def queue_median(cls, project_id):
+        """Recalculate a project's median in the background once the
+        current transaction commits"""
+        from foiatracker.tasks import refresh_project_median
+
+        def queue():
+            if cache.add(cls.MEDIAN_QUEUED_KEY % project_id, True,
+                         cls.MEDIAN_QUEUED_TIMEOUT):
+                refresh_project_median.delay(project_id)
+        transaction.on_commit(queue)
+
+    @classmethod
+    def apply_change(cls, before, after):
+        """Move one request's counts from its @before to its @after
+        Foia.STATS_FIELDS values, either of which is None for a request
+        that didn't or doesn't exist"""
+        if before == after:
+            return
+
+        cutoff = utils.overdue_cutoff(Foia.RESPONSE_BUSINESS_DAYS)
+        changes = {}
+        for state, sign in ((before, -1), (after, 1)):
+            if state is not None and state[0] is not None:
+                changes.setdefault(state[0], []).append((state, sign))
+
+        for project_id, states in changes.items():
+            with transaction.atomic():
+                stats = cls.objects.select_for_update().filter(
+                    project_id=project_id).first()
+                if stats is None:
+                    continue
+
+                for (_, status, completed, sent, _), sign in states:
+                    stats.total += sign
+                    if completed:
+                        stats.complete += sign
+                    else:
+                        stats.pending += sign
+                        if sent <= cutoff:
+                            stats.overdue += sign
+                    count = stats.status_counts.get(status, 0) + sign
+                    if count > 0:
+                        stats.status_counts[status] = count
+                    else:
+                        stats.status_counts.pop(status, None)
+
+                # Drift from requests changed outside these hooks is fixed
+                # by the nightly refresh; don't let it go negative
+                for field in ('total', 'complete', 'pending', 'overdue'):
+                    setattr(stats, field, max(0, getattr(stats, field)))
+                stats.save()
+
+            # Only resolved requests count toward the median
+            if any(state[2] for state, _ in states):
+                cls.queue_median(project_id)
+
+    @classmethod
+    def add_fees(cls, project_id, asked, paid):
+        """Add to (or take away from) a project's fee totals"""
+        if project_id is None or (not asked and not paid):
+            return
+
+        cls.objects.filter(project_id=project_id).update(
+            amount_asked=Greatest(F('amount_asked') + asked, 0),
+            amount_paid=Greatest(F('amount_paid') + paid, 0),
+        )
+
+
+class BackgroundJob(models.Model):
+    """An admin action running in the background over a list of IDs. See
+    foiatracker.jobs."""
+    PENDING = 'pending'
+    RUNNING = 'running'
+    FINISHED = 'finished'
+    FAILED = 'failed'
+    STATUS_CHOICES = (
+        (PENDING, 'Waiting to start'),
+        (RUNNING, 'Running'),
+        (FINISHED, 'Finished'),
+        (FAILED, 'Failed'),
+    )
+
+    action = models.CharField(max_length=50)
+    description = models.CharField(max_length=255)
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES,
+                              default=PENDING)
+    object_ids = JSONField(default=list)
+    total = models.PositiveIntegerField(default=0)
+    processed = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    # [object ID, message] pairs for each object the action failed on
+    errors = JSONField(default=list)
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, null=True,
+                                   blank=True, on_delete=models.SET_NULL)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return '%s (%s of %s)' % (self.description, self.processed,
+                                  self.total)
+
+    def progress(self):
+        if not self.total:
+            return 100
+        return int(100 * self.processed / self.total)
+
+    def elapsed(self):
+        if self.started_at is None:
+            return None
+        return (self.finished_at or timezone.now()) - self.started_at
+
+    class Meta:
+        ordering = ['-created_at', ]
+
+
+class RequestSignature(models.Model):
+    """A MinHash signature of a request's subject and e-mail text and the
+    LSH band keys it's looked up by. See foiatracker.duplicates."""
+    foia = models.OneToOneField(Foia, on_delete=models.CASCADE,
+                                primary_key=True, related_name='signature')
+    minhash = ArrayField(models.BigIntegerField())
+    bands = ArrayField(models.BigIntegerField())
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=['bands'], name='foiatracker_signature_bands'),
+        ]
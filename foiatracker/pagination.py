@@ -0,0 +1,129 @@
+import base64
+import binascii
+from datetime import date
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+def encode_cursor(values, backwards=False):
+    """Pack the ordering values of a row into an opaque URL-safe token"""
+    values = [v.isoformat() if isinstance(v, date) else v for v in values]
+    payload = json.dumps({'v': values, 'b': backwards})
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii')
+
+
+def decode_cursor(cursor):
+    """Unpack a token from encode_cursor(), raising ValueError if it's been
+    mangled"""
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8'))
+        return payload['v'], bool(payload['b'])
+    except (binascii.Error, KeyError, TypeError, UnicodeError) as e:
+        raise ValueError(str(e))
+
+
+class CursorPage(object):
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator(object):
+    """Keyset pagination: each page is fetched with a WHERE clause on the
+    ordering values of the row before it instead of an OFFSET, so every
+    page costs the same and no COUNT(*) is needed. The last field in
+    @ordering must be unique."""
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = ordering
+        self.per_page = per_page
+
+    def _fields(self, backwards):
+        """Pairs of (field name, descending?) in fetch order"""
+        fields = []
+        for field in self.ordering:
+            descending = field.startswith('-')
+            fields.append((field.lstrip('-'), descending != backwards))
+        return fields
+
+    def _after(self, values, backwards):
+        """A filter for the rows that come after @values"""
+        fields = self._fields(backwards)
+        condition = Q()
+        for i, (name, descending) in enumerate(fields):
+            # Ties on every earlier field, then past this one
+            lookup = '%s__%s' % (name, 'lt' if descending else 'gt')
+            row = Q(**{lookup: values[i]})
+            for j in range(i):
+                row &= Q(**{fields[j][0]: values[j]})
+            condition |= row
+        return condition
+
+    def _key(self, obj):
+        return [getattr(obj, field.lstrip('-')) for field in self.ordering]
+
+    def page(self, cursor=None):
+        values, backwards = None, False
+        if cursor:
+            try:
+                values, backwards = decode_cursor(cursor)
+            except ValueError:
+                pass
+            if not isinstance(values, list) or \
+                    len(values) != len(self.ordering):
+                values, backwards = None, False
+
+        if values is not None:
+            try:
+                queryset = self.queryset.filter(
+                    self._after(values, backwards))
+            except (TypeError, ValidationError, ValueError):
+                # A cursor that decodes but whose values don't fit the
+                # ordering fields, like a mangled date
+                values, backwards = None, False
+        if values is None:
+            queryset = self.queryset
+
+        queryset = queryset.order_by(*[
+            '%s%s' % ('-' if descending else '', name)
+            for name, descending in self._fields(backwards)
+        ])
+
+        # Grab one extra row to find out if there's another page
+        rows = list(queryset[:self.per_page + 1])
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = previous_cursor = None
+        if rows and has_next:
+            next_cursor = encode_cursor(self._key(rows[-1]))
+        if rows and has_previous:
+            previous_cursor = encode_cursor(self._key(rows[0]),
+                                            backwards=True)
+
+        return CursorPage(rows, next_cursor, previous_cursor)
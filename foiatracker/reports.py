@@ -0,0 +1,157 @@
+from django.core.cache import cache
+from django.db.models import Max, Q, Sum
+
+from foiatracker.models import Foia
+
+
+# Per-request rows are cached in chunks of ROWS_PER_CHUNK consecutive PKs,
+# each under its own key so no cache item gets too big. A changed request
+# drops its chunk rather than patching it, so concurrent changes can't
+# overwrite each other, and the next read rebuilds only that chunk.
+REPORT_CACHE_KEY = 'foiatracker_agency_report_rows_%s'
+REPORT_CACHE_TIMEOUT = 60 * 60 * 24
+ROWS_PER_CHUNK = 1000
+
+UNKNOWN_AGENCY = 'Unknown agency'
+
+
+def request_rows(foias):
+    """Map the PK of each request in @foias to the agencies it went to,
+    its stored response times and the fees asked and paid. Takes two
+    queries however many requests are passed."""
+    rows = foias.order_by().values(
+        'pk', 'first_response_days', 'resolution_days',
+    ).annotate(
+        asked=Sum('event__amount_asked'),
+        paid=Sum('event__amount_paid'),
+    )
+
+    # Group on the Agency where a recipient has one, falling back to the
+    # organization name Rolodex gave without an ID
+    agencies = {}
+    for foia_id, agency, organization in \
+            Foia.recipients.through.objects.filter(foia__in=foias).\
+            values_list('foia_id', 'recipient__agency__name',
+                        'recipient__organization'):
+        agencies.setdefault(foia_id, set()).add(
+            agency or organization or UNKNOWN_AGENCY)
+
+    return dict((row['pk'], {
+        'agencies': sorted(agencies.get(row['pk'], [UNKNOWN_AGENCY])),
+        'first_response_days': row['first_response_days'],
+        'resolution_days': row['resolution_days'],
+        'amount_asked': row['asked'] or 0,
+        'amount_paid': row['paid'] or 0,
+    }) for row in rows)
+
+
+def chunk_keys():
+    """The cache key of every chunk that could hold a request's row"""
+    last = Foia.objects.aggregate(last=Max('pk'))['last']
+    if last is None:
+        return []
+    return [REPORT_CACHE_KEY % chunk
+            for chunk in range(last // ROWS_PER_CHUNK + 1)]
+
+
+def cached_request_rows():
+    keys = chunk_keys()
+    cached = cache.get_many(keys)
+
+    rows = {}
+    for chunk_rows in cached.values():
+        rows.update(chunk_rows)
+
+    missing = [chunk for chunk, key in enumerate(keys) if key not in cached]
+    if missing:
+        ranges = Q()
+        for chunk in missing:
+            ranges |= Q(pk__gte=chunk * ROWS_PER_CHUNK,
+                        pk__lt=(chunk + 1) * ROWS_PER_CHUNK)
+        built = request_rows(Foia.objects.filter(ranges))
+        rows.update(built)
+
+        chunks = dict((REPORT_CACHE_KEY % chunk, {}) for chunk in missing)
+        for foia_id, row in built.items():
+            chunks[REPORT_CACHE_KEY % (foia_id // ROWS_PER_CHUNK)][
+                foia_id] = row
+        cache.set_many(chunks, REPORT_CACHE_TIMEOUT)
+
+    return rows
+
+
+def refresh_requests(foia_ids):
+    """Drop the cached rows of the chunks holding these requests"""
+    cache.delete_many(set(
+        REPORT_CACHE_KEY % (foia_id // ROWS_PER_CHUNK)
+        for foia_id in foia_ids))
+
+
+def refresh_request(foia_id):
+    refresh_requests([foia_id])
+
+
+def clear_report_cache():
+    cache.delete_many(chunk_keys())
+
+
+def distribution(days):
+    """Summarize a list of business-day counts"""
+    if not days:
+        return None
+
+    days = sorted(days)
+
+    def percentile(p):
+        return days[min(len(days) - 1, int(round(p * (len(days) - 1))))]
+
+    return {
+        'count': len(days),
+        'min': days[0],
+        'median': percentile(0.5),
+        'p90': percentile(0.9),
+        'max': days[-1],
+        'mean': float(sum(days)) / len(days),
+    }
+
+
+def agency_report(rows=None):
+    """Response times and fees for each agency, slowest to respond first.
+    A request sent to several agencies counts toward each of them."""
+    if rows is None:
+        rows = cached_request_rows()
+
+    grouped = {}
+    for row in rows.values():
+        for name in row['agencies']:
+            agency = grouped.setdefault(name, {
+                'name': name,
+                'requests': 0,
+                'first_response_days': [],
+                'resolution_days': [],
+                'amount_asked': 0,
+                'amount_paid': 0,
+            })
+            agency['requests'] += 1
+            if row['first_response_days'] is not None:
+                agency['first_response_days'].append(
+                    row['first_response_days'])
+            if row['resolution_days'] is not None:
+                agency['resolution_days'].append(row['resolution_days'])
+            agency['amount_asked'] += row['amount_asked']
+            agency['amount_paid'] += row['amount_paid']
+
+    report = []
+    for agency in grouped.values():
+        agency['first_response'] = distribution(
+            agency.pop('first_response_days'))
+        agency['resolution'] = distribution(agency.pop('resolution_days'))
+        report.append(agency)
+
+    def slowest_first(agency):
+        median = -1
+        if agency['first_response'] is not None:
+            median = agency['first_response']['median']
+        return (-median, agency['name'])
+
+    return sorted(report, key=slowest_first)
@@ -1,10 +1,34 @@
+from django.db import transaction
 from django.dispatch import receiver
-from django.db.models.signals import pre_save, post_save
+from django.db.models import F, Q
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+    pre_save,
+)
 
-from foiatracker.models import Foia, Recipient, Sender
+from foiatracker.models import (
+    Event,
+    Foia,
+    InboundEmail,
+    MatchSuggestion,
+    Project,
+    ProjectStats,
+    Recipient,
+    Sender,
+)
+from foiatracker import changes, duplicates, reports
 from foiatracker.tasks import post_new_foia_slack
 
 
+# The recipient fields shown on, searched with or reported by its requests
+RECIPIENT_DETAILS = ('email', 'name', 'organization', 'agency_id')
+
+# The sender fields its requests are searched with
+SENDER_DETAILS = ('email', 'first_name', 'last_name')
+
+
 @receiver(post_save, dispatch_uid="foiatracker_slack", sender=Foia)
 def foia_to_slack(sender, instance, **kwargs):
     # Dump out here if the save method has been told not to send a Slack
@@ -20,6 +44,7 @@ def hydrate_from_rolodex(sender, instance, **kwargs):
     """Before saving our Recipient instance for the first time, get all
     the info we can from the Rolodex API"""
     instance.sync_with_rolodex()
+    instance.link_agency()
 
 
 @receiver(pre_save, dispatch_uid="hydrate_from_staff_api", sender=Sender)
@@ -29,3 +54,270 @@ def hydrate_from_staff_api(sender, instance, **kwargs):
         return
 
     instance.sync_with_staff_api()
+
+
+def bump_versions(foias):
+    """Invalidate the cached list rows for a queryset of requests"""
+    foias.update(version=F('version') + 1)
+
+
+@receiver(post_save, dispatch_uid="foia_search_vector", sender=Foia)
+def foia_search_vector(sender, instance, **kwargs):
+    """Rebuild the stored search vector whenever a request is saved"""
+    instance.update_search_vector()
+
+
+@receiver(post_save, dispatch_uid="foia_signature", sender=Foia)
+def foia_signature(sender, instance, **kwargs):
+    """Keep the request's entry in the near-duplicate index current,
+    skipping saves that leave its subject and e-mail alone"""
+    if getattr(instance, 'text_changed', True):
+        duplicates.index_request(instance)
+
+
+@receiver(post_save, dispatch_uid="foia_version", sender=Foia)
+def foia_version(sender, instance, created, **kwargs):
+    """Invalidate a request's cached list row when it's edited, and fill in
+    the recipients of new requests from their e-mail"""
+    if created:
+        instance.refresh_recipients_display()
+        return
+
+    bump_versions(Foia.objects.filter(pk=instance.pk))
+
+
+@receiver(m2m_changed, dispatch_uid="foia_recipients_changed",
+          sender=Foia.recipients.through)
+def foia_recipients_changed(sender, instance, action, reverse, pk_set,
+                            **kwargs):
+    """Rebuild search vectors and recipient display strings when
+    recipients are added to or removed from a request"""
+    if not reverse:
+        if action not in ('post_add', 'post_remove', 'post_clear'):
+            return
+        foias = [instance]
+    else:
+        # Changed from the Recipient side, so pk_set holds Foia PKs.
+        # Clearing doesn't pass a pk_set, so remember which requests are
+        # affected first.
+        if action == 'pre_clear':
+            instance._cleared_foia_pks = list(
+                instance.foia_set.values_list('pk', flat=True))
+            return
+        elif action == 'post_clear':
+            pk_set = getattr(instance, '_cleared_foia_pks', [])
+        elif action not in ('post_add', 'post_remove'):
+            return
+        foias = Foia.objects.filter(pk__in=pk_set)
+
+    for foia in foias:
+        foia.update_search_vector()
+        foia.refresh_recipients_display()
+        reports.refresh_request(foia.pk)
+
+
+@receiver(m2m_changed, dispatch_uid="email_recipients_changed",
+          sender=InboundEmail.recipients.through)
+def email_recipients_changed(sender, instance, action, reverse, pk_set,
+                             **kwargs):
+    """Rebuild display strings for requests that fall back to their
+    e-mail's recipients"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        foias = Foia.objects.filter(email=instance)
+    elif pk_set:
+        foias = Foia.objects.filter(email__in=pk_set)
+    else:
+        return
+
+    for foia in foias.select_related('email'):
+        foia.refresh_recipients_display()
+
+
+@receiver(pre_save, dispatch_uid="email_previous_text", sender=InboundEmail)
+def email_previous_text(sender, instance, **kwargs):
+    """Remember the stored text of an existing e-mail so
+    email_search_vector can tell whether its requests need new
+    near-duplicate signatures"""
+    instance._previous_text = None
+    if instance.pk is not None:
+        instance._previous_text = InboundEmail.objects.filter(
+            pk=instance.pk).values_list('text', flat=True).first()
+
+
+@receiver(post_save, dispatch_uid="email_search_vector", sender=InboundEmail)
+def email_search_vector(sender, instance, created, **kwargs):
+    """Rebuild search vectors for requests made with an edited e-mail and
+    keep their copy of its sender current"""
+    if created:
+        return
+
+    instance.foia_set.exclude(sender=instance.sender_id).update(
+        sender=instance.sender_id, version=F('version') + 1)
+
+    text_changed = getattr(instance, '_previous_text', None) != instance.text
+    for foia in instance.foia_set.all():
+        foia.update_search_vector()
+        if text_changed:
+            duplicates.index_request(foia)
+
+
+@receiver(pre_save, dispatch_uid="recipient_previous_details",
+          sender=Recipient)
+def recipient_previous_details(sender, instance, **kwargs):
+    """Remember the stored details of an existing recipient so
+    recipient_changed can tell whether anything shown on its requests
+    changed"""
+    instance._previous_details = None
+    if instance.pk is not None:
+        instance._previous_details = Recipient.objects.filter(
+            pk=instance.pk).values_list(*RECIPIENT_DETAILS).first()
+
+
+@receiver(post_save, dispatch_uid="recipient_changed", sender=Recipient)
+def recipient_changed(sender, instance, created, **kwargs):
+    """Rebuild search vectors and display strings for requests sent to an
+    edited recipient"""
+    if created:
+        return
+
+    # Most saves come from Rolodex syncs that don't change anything
+    details = tuple(getattr(instance, field) for field in RECIPIENT_DETAILS)
+    if getattr(instance, '_previous_details', None) == details:
+        return
+
+    # Display strings fall back to the e-mail's recipients when a request
+    # has none
+    Foia.refresh_recipient_details(Foia.objects.filter(
+        Q(recipients=instance) | Q(email__recipients=instance),
+    ).order_by().values_list('pk', flat=True).distinct())
+
+    # The agency report groups requests on their recipients' organizations
+    foia_ids = list(instance.foia_set.values_list('pk', flat=True))
+    transaction.on_commit(lambda: reports.refresh_requests(foia_ids))
+
+
+@receiver(pre_save, dispatch_uid="sender_previous_details", sender=Sender)
+def sender_previous_details(sender, instance, **kwargs):
+    """Remember the stored details of an existing sender so
+    sender_search_vector can tell whether its requests need rebuilding"""
+    instance._previous_details = None
+    if instance.pk is not None:
+        instance._previous_details = Sender.objects.filter(
+            pk=instance.pk).values_list(*SENDER_DETAILS).first()
+
+
+@receiver(post_save, dispatch_uid="sender_search_vector", sender=Sender)
+def sender_search_vector(sender, instance, created, **kwargs):
+    """Rebuild search vectors for requests made by an edited sender"""
+    if created:
+        return
+
+    # Staff API lookups save senders often without changing anything
+    details = tuple(getattr(instance, field) for field in SENDER_DETAILS)
+    if getattr(instance, '_previous_details', None) == details:
+        return
+
+    foias = Foia.objects.filter(sender=instance)
+    Foia.update_search_vectors(foias.values_list('pk', flat=True))
+    bump_versions(foias)
+
+
+@receiver(post_save, dispatch_uid="project_version", sender=Project)
+def project_version(sender, instance, created, **kwargs):
+    """Invalidate cached list rows showing a renamed project"""
+    if created:
+        return
+
+    bump_versions(instance.requests.all())
+
+
+@receiver(post_save, dispatch_uid="foia_email_processed", sender=Foia)
+@receiver(post_save, dispatch_uid="event_email_processed", sender=Event)
+def email_processed(sender, instance, **kwargs):
+    """Take an e-mail out of the triage inbox once a request or Event is
+    made from it"""
+    if instance.email_id is None:
+        return
+
+    InboundEmail.objects.filter(pk=instance.email_id, processed=False).\
+        update(processed=True)
+    MatchSuggestion.objects.filter(email=instance.email_id).delete()
+
+
+@receiver(post_delete, dispatch_uid="foia_email_unprocessed", sender=Foia)
+@receiver(post_delete, dispatch_uid="event_email_unprocessed", sender=Event)
+def email_unprocessed(sender, instance, **kwargs):
+    """Put an e-mail back in the triage inbox when the last request or
+    Event made from it is deleted"""
+    if instance.email_id is None:
+        return
+
+    InboundEmail.objects.filter(pk=instance.email_id, processed=True).\
+        exclude(foia__isnull=False).exclude(event__isnull=False).\
+        update(processed=False)
+
+
+@receiver(post_delete, dispatch_uid="event_deleted_status", sender=Event)
+def event_deleted_status(sender, instance, **kwargs):
+    """Fall back to the previous Event's status when one is deleted, and
+    take its fees out of the project's totals. This runs inside the
+    deletion's transaction."""
+    for foia in Foia.objects.filter(pk=instance.foia_id):
+        foia.refresh_status()
+        ProjectStats.add_fees(foia.project_id,
+                              -(instance.amount_asked or 0),
+                              -(instance.amount_paid or 0))
+
+
+@receiver(post_delete, dispatch_uid="foia_deleted_stats", sender=Foia)
+def foia_deleted_stats(sender, instance, **kwargs):
+    """Take deleted requests out of their project's stats. Their Events
+    are deleted first and change the request's status on the way, so this
+    recalculates rather than trusting the instance's copy."""
+    if instance.project_id is None:
+        return
+
+    if Project.objects.filter(pk=instance.project_id).exists():
+        ProjectStats(project_id=instance.project_id).refresh()
+
+
+@receiver(post_save, dispatch_uid="event_report", sender=Event)
+@receiver(post_delete, dispatch_uid="event_deleted_report", sender=Event)
+def event_report(sender, instance, **kwargs):
+    """Patch the request's row in the cached agency report once the
+    request's stored response times have been refreshed and committed"""
+    transaction.on_commit(
+        lambda: reports.refresh_request(instance.foia_id))
+
+
+@receiver(post_delete, dispatch_uid="foia_deleted_report", sender=Foia)
+def foia_deleted_report(sender, instance, **kwargs):
+    """Drop deleted requests from the cached agency report"""
+    foia_id = instance.pk
+    transaction.on_commit(lambda: reports.refresh_request(foia_id))
+
+
+@receiver(post_save, dispatch_uid="foia_change_feed", sender=Foia)
+def foia_change_feed(sender, instance, created, **kwargs):
+    """Tell open request lists about a new or edited request once it's
+    committed"""
+    foia_id = instance.pk
+    transaction.on_commit(lambda: changes.publish(foia_id, created=created))
+
+
+@receiver(post_save, dispatch_uid="event_change_feed", sender=Event)
+@receiver(post_delete, dispatch_uid="event_deleted_change_feed",
+          sender=Event)
+def event_change_feed(sender, instance, **kwargs):
+    """Status updates change their request's row too"""
+    foia_id = instance.foia_id
+    transaction.on_commit(lambda: changes.publish(foia_id))
+
+
+@receiver(post_delete, dispatch_uid="foia_deleted_change_feed", sender=Foia)
+def foia_deleted_change_feed(sender, instance, **kwargs):
+    foia_id = instance.pk
+    transaction.on_commit(lambda: changes.publish(foia_id, deleted=True))
@@ -3,6 +3,6 @@
 }}),ae.each({slideDown:F("show"),slideUp:F("hide"),slideToggle:F("toggle"),fadeIn:{opacity:"show"},fadeOut:{opacity:"hide"},fadeToggle:{opacity:"toggle"}},function(e,t){ae.fn[e]=function(e,n,r){return this.animate(t,e,n,r)}}),ae.timers=[],ae.fx.tick=function(){var e,t=0,n=ae.timers;for(it=ae.now();t<n.length;t++)e=n[t],e()||n[t]!==e||n.splice(t--,1);n.length||ae.fx.stop(),it=void 0},ae.fx.timer=function(e){ae.timers.push(e),e()?ae.fx.start():ae.timers.pop()},ae.fx.interval=13,ae.fx.start=function(){at||(at=e.setInterval(ae.fx.tick,ae.fx.interval))},ae.fx.stop=function(){e.clearInterval(at),at=null},ae.fx.speeds={slow:600,fast:200,_default:400},ae.fn.delay=function(t,n){return t=ae.fx?ae.fx.speeds[t]||t:t,n=n||"fx",this.queue(n,function(n,r){var i=e.setTimeout(n,t);r.stop=function(){e.clearTimeout(i)}})},function(){var e=Z.createElement("input"),t=Z.createElement("select"),n=t.appendChild(Z.createElement("option"));e.type="checkbox",re.checkOn=""!==e.value,re.optSelected=n.selected,t.disabled=!0,re.optDisabled=!n.disabled,e=Z.createElement("input"),e.value="t",e.type="radio",re.radioValue="t"===e.value}();var lt,ut=ae.expr.attrHandle;ae.fn.extend({attr:function(e,t){return De(this,ae.attr,e,t,arguments.length>1)},removeAttr:function(e){return this.each(function(){ae.removeAttr(this,e)})}}),ae.extend({attr:function(e,t,n){var r,i,a=e.nodeType;if(3!==a&&8!==a&&2!==a)return"undefined"==typeof e.getAttribute?ae.prop(e,t,n):(1===a&&ae.isXMLDoc(e)||(t=t.toLowerCase(),i=ae.attrHooks[t]||(ae.expr.match.bool.test(t)?lt:void 0)),void 0!==n?null===n?void ae.removeAttr(e,t):i&&"set"in i&&void 0!==(r=i.set(e,n,t))?r:(e.setAttribute(t,n+""),n):i&&"get"in i&&null!==(r=i.get(e,t))?r:(r=ae.find.attr(e,t),null==r?void 0:r))},attrHooks:{type:{set:function(e,t){if(!re.radioValue&&"radio"===t&&ae.nodeName(e,"input")){var n=e.value;return e.setAttribute("type",t),n&&(e.value=n),t}}}},removeAttr:function(e,t){var n,r,i=0,a=t&&t.match(ke);if(a&&1===e.nodeType)for(;n=a[i++];)r=ae.propFix[n]||n,ae.expr.match.bool.test(n)&&(e[r]=!1),e.removeAttribute(n)}}),lt={set:function(e,t,n){return t===!1?ae.removeAttr(e,n):e.setAttribute(n,n),n}},ae.each(ae.expr.match.bool.source.match(/\w+/g),function(e,t){var n=ut[t]||ae.find.attr;ut[t]=function(e,t,r){var i,a;return r||(a=ut[t],ut[t]=i,i=null!=n(e,t,r)?t.toLowerCase():null,ut[t]=a),i}});var dt=/^(?:input|select|textarea|button)$/i,ct=/^(?:a|area)$/i;ae.fn.extend({prop:function(e,t){return De(this,ae.prop,e,t,arguments.length>1)},removeProp:function(e){return this.each(function(){delete this[ae.propFix[e]||e]})}}),ae.extend({prop:function(e,t,n){var r,i,a=e.nodeType;if(3!==a&&8!==a&&2!==a)return 1===a&&ae.isXMLDoc(e)||(t=ae.propFix[t]||t,i=ae.propHooks[t]),void 0!==n?i&&"set"in i&&void 0!==(r=i.set(e,n,t))?r:e[t]=n:i&&"get"in i&&null!==(r=i.get(e,t))?r:e[t]},propHooks:{tabIndex:{get:function(e){var t=ae.find.attr(e,"tabindex");return t?parseInt(t,10):dt.test(e.nodeName)||ct.test(e.nodeName)&&e.href?0:-1}}},propFix:{"for":"htmlFor","class":"className"}}),re.optSelected||(ae.propHooks.selected={get:function(e){var t=e.parentNode;return t&&t.parentNode&&t.parentNode.selectedIndex,null},set:function(e){var t=e.parentNode;t&&(t.selectedIndex,t.parentNode&&t.parentNode.selectedIndex)}}),ae.each(["tabIndex","readOnly","maxLength","cellSpacing","cellPadding","rowSpan","colSpan","useMap","frameBorder","contentEditable"],function(){ae.propFix[this.toLowerCase()]=this});var ft=/[\t\r\n\f]/g;ae.fn.extend({addClass:function(e){var t,n,r,i,a,o,s,l=0;if(ae.isFunction(e))return this.each(function(t){ae(this).addClass(e.call(this,t,W(this)))});if("string"==typeof e&&e)for(t=e.match(ke)||[];n=this[l++];)if(i=W(n),r=1===n.nodeType&&(" "+i+" ").replace(ft," ")){for(o=0;a=t[o++];)r.indexOf(" "+a+" ")<0&&(r+=a+" ");s=ae.trim(r),i!==s&&n.setAttribute("class",s)}return this},removeClass:function(e){var t,n,r,i,a,o,s,l=0;if(ae.isFunction(e))return this.each(function(t){ae(this).removeClass(e.call(this,t,W(this)))});if(!arguments.length)return this.attr("class","");if("string"==typeof e&&e)for(t=e.match(ke)||[];n=this[l++];)if(i=W(n),r=1===n.nodeType&&(" "+i+" ").replace(ft," ")){for(o=0;a=t[o++];)for(;r.indexOf(" "+a+" ")>-1;)r=r.replace(" "+a+" "," ");s=ae.trim(r),i!==s&&n.setAttribute("class",s)}return this},toggleClass:function(e,t){var n=typeof e;return"boolean"==typeof t&&"string"===n?t?this.addClass(e):this.removeClass(e):ae.isFunction(e)?this.each(function(n){ae(this).toggleClass(e.call(this,n,W(this),t),t)}):this.each(function(){var t,r,i,a;if("string"===n)for(r=0,i=ae(this),a=e.match(ke)||[];t=a[r++];)i.hasClass(t)?i.removeClass(t):i.addClass(t);else void 0!==e&&"boolean"!==n||(t=W(this),t&&Se.set(this,"__className__",t),this.setAttribute&&this.setAttribute("class",t||e===!1?"":Se.get(this,"__className__")||""))})},hasClass:function(e){var t,n,r=0;for(t=" "+e+" ";n=this[r++];)if(1===n.nodeType&&(" "+W(n)+" ").replace(ft," ").indexOf(t)>-1)return!0;return!1}});var ht=/\r/g,pt=/[\x20\t\r\n\f]+/g;ae.fn.extend({val:function(e){var t,n,r,i=this[0];{if(arguments.length)return r=ae.isFunction(e),this.each(function(n){var i;1===this.nodeType&&(i=r?e.call(this,n,ae(this).val()):e,null==i?i="":"number"==typeof i?i+="":ae.isArray(i)&&(i=ae.map(i,function(e){return null==e?"":e+""})),t=ae.valHooks[this.type]||ae.valHooks[this.nodeName.toLowerCase()],t&&"set"in t&&void 0!==t.set(this,i,"value")||(this.value=i))});if(i)return t=ae.valHooks[i.type]||ae.valHooks[i.nodeName.toLowerCase()],t&&"get"in t&&void 0!==(n=t.get(i,"value"))?n:(n=i.value,"string"==typeof n?n.replace(ht,""):null==n?"":n)}}}),ae.extend({valHooks:{option:{get:function(e){var t=ae.find.attr(e,"value");return null!=t?t:ae.trim(ae.text(e)).replace(pt," ")}},select:{get:function(e){for(var t,n,r=e.options,i=e.selectedIndex,a="select-one"===e.type||i<0,o=a?null:[],s=a?i+1:r.length,l=i<0?s:a?i:0;l<s;l++)if(n=r[l],(n.selected||l===i)&&(re.optDisabled?!n.disabled:null===n.getAttribute("disabled"))&&(!n.parentNode.disabled||!ae.nodeName(n.parentNode,"optgroup"))){if(t=ae(n).val(),a)return t;o.push(t)}return o},set:function(e,t){for(var n,r,i=e.options,a=ae.makeArray(t),o=i.length;o--;)r=i[o],(r.selected=ae.inArray(ae.valHooks.option.get(r),a)>-1)&&(n=!0);return n||(e.selectedIndex=-1),a}}}}),ae.each(["radio","checkbox"],function(){ae.valHooks[this]={set:function(e,t){if(ae.isArray(t))return e.checked=ae.inArray(ae(e).val(),t)>-1}},re.checkOn||(ae.valHooks[this].get=function(e){return null===e.getAttribute("value")?"on":e.value})});var mt=/^(?:focusinfocus|focusoutblur)$/;ae.extend(ae.event,{trigger:function(t,n,r,i){var a,o,s,l,u,d,c,f=[r||Z],h=ne.call(t,"type")?t.type:t,p=ne.call(t,"namespace")?t.namespace.split("."):[];if(o=s=r=r||Z,3!==r.nodeType&&8!==r.nodeType&&!mt.test(h+ae.event.triggered)&&(h.indexOf(".")>-1&&(p=h.split("."),h=p.shift(),p.sort()),u=h.indexOf(":")<0&&"on"+h,t=t[ae.expando]?t:new ae.Event(h,"object"==typeof t&&t),t.isTrigger=i?2:3,t.namespace=p.join("."),t.rnamespace=t.namespace?new RegExp("(^|\\.)"+p.join("\\.(?:.*\\.|)")+"(\\.|$)"):null,t.result=void 0,t.target||(t.target=r),n=null==n?[t]:ae.makeArray(n,[t]),c=ae.event.special[h]||{},i||!c.trigger||c.trigger.apply(r,n)!==!1)){if(!i&&!c.noBubble&&!ae.isWindow(r)){for(l=c.delegateType||h,mt.test(l+h)||(o=o.parentNode);o;o=o.parentNode)f.push(o),s=o;s===(r.ownerDocument||Z)&&f.push(s.defaultView||s.parentWindow||e)}for(a=0;(o=f[a++])&&!t.isPropagationStopped();)t.type=a>1?l:c.bindType||h,d=(Se.get(o,"events")||{})[t.type]&&Se.get(o,"handle"),d&&d.apply(o,n),d=u&&o[u],d&&d.apply&&_e(o)&&(t.result=d.apply(o,n),t.result===!1&&t.preventDefault());return t.type=h,i||t.isDefaultPrevented()||c._default&&c._default.apply(f.pop(),n)!==!1||!_e(r)||u&&ae.isFunction(r[h])&&!ae.isWindow(r)&&(s=r[u],s&&(r[u]=null),ae.event.triggered=h,r[h](),ae.event.triggered=void 0,s&&(r[u]=s)),t.result}},simulate:function(e,t,n){var r=ae.extend(new ae.Event,n,{type:e,isSimulated:!0});ae.event.trigger(r,null,t)}}),ae.fn.extend({trigger:function(e,t){return this.each(function(){ae.event.trigger(e,t,this)})},triggerHandler:function(e,t){var n=this[0];if(n)return ae.event.trigger(e,t,n,!0)}}),ae.each("blur focus focusin focusout load resize scroll unload click dblclick mousedown mouseup mousemove mouseover mouseout mouseenter mouseleave change select submit keydown keypress keyup error contextmenu".split(" "),function(e,t){ae.fn[t]=function(e,n){return arguments.length>0?this.on(t,null,e,n):this.trigger(t)}}),ae.fn.extend({hover:function(e,t){return this.mouseenter(e).mouseleave(t||e)}}),re.focusin="onfocusin"in e,re.focusin||ae.each({focus:"focusin",blur:"focusout"},function(e,t){var n=function(e){ae.event.simulate(t,e.target,ae.event.fix(e))};ae.event.special[t]={setup:function(){var r=this.ownerDocument||this,i=Se.access(r,t);i||r.addEventListener(e,n,!0),Se.access(r,t,(i||0)+1)},teardown:function(){var r=this.ownerDocument||this,i=Se.access(r,t)-1;i?Se.access(r,t,i):(r.removeEventListener(e,n,!0),Se.remove(r,t))}}});var gt=e.location,vt=ae.now(),yt=/\?/;ae.parseJSON=function(e){return JSON.parse(e+"")},ae.parseXML=function(t){var n;if(!t||"string"!=typeof t)return null;try{n=(new e.DOMParser).parseFromString(t,"text/xml")}catch(r){n=void 0}return n&&!n.getElementsByTagName("parsererror").length||ae.error("Invalid XML: "+t),n};var wt=/#.*$/,bt=/([?&])_=[^&]*/,kt=/^(.*?):[ \t]*([^\r\n]*)$/gm,xt=/^(?:about|app|app-storage|.+-extension|file|res|widget):$/,Dt=/^(?:GET|HEAD)$/,_t=/^\/\//,St={},Ct={},Ot="*/".concat("*"),Tt=Z.createElement("a");Tt.href=gt.href,ae.extend({active:0,lastModified:{},etag:{},ajaxSettings:{url:gt.href,type:"GET",isLocal:xt.test(gt.protocol),global:!0,processData:!0,async:!0,contentType:"application/x-www-form-urlencoded; charset=UTF-8",accepts:{"*":Ot,text:"text/plain",html:"text/html",xml:"application/xml, text/xml",json:"application/json, text/javascript"},contents:{xml:/\bxml\b/,html:/\bhtml/,json:/\bjson\b/},responseFields:{xml:"responseXML",text:"responseText",json:"responseJSON"},converters:{"* text":String,"text html":!0,"text json":ae.parseJSON,"text xml":ae.parseXML},flatOptions:{url:!0,context:!0}},ajaxSetup:function(e,t){return t?R(R(e,ae.ajaxSettings),t):R(ae.ajaxSettings,e)},ajaxPrefilter:H(St),ajaxTransport:H(Ct),ajax:function(t,n){function r(t,n,r,s){var u,c,y,w,k,D=n;2!==b&&(b=2,l&&e.clearTimeout(l),i=void 0,o=s||"",x.readyState=t>0?4:0,u=t>=200&&t<300||304===t,r&&(w=q(f,x,r)),w=V(f,w,x,u),u?(f.ifModified&&(k=x.getResponseHeader("Last-Modified"),k&&(ae.lastModified[a]=k),k=x.getResponseHeader("etag"),k&&(ae.etag[a]=k)),204===t||"HEAD"===f.type?D="nocontent":304===t?D="notmodified":(D=w.state,c=w.data,y=w.error,u=!y)):(y=D,!t&&D||(D="error",t<0&&(t=0))),x.status=t,x.statusText=(n||D)+"",u?m.resolveWith(h,[c,D,x]):m.rejectWith(h,[x,D,y]),x.statusCode(v),v=void 0,d&&p.trigger(u?"ajaxSuccess":"ajaxError",[x,f,u?c:y]),g.fireWith(h,[x,D]),d&&(p.trigger("ajaxComplete",[x,f]),--ae.active||ae.event.trigger("ajaxStop")))}"object"==typeof t&&(n=t,t=void 0),n=n||{};var i,a,o,s,l,u,d,c,f=ae.ajaxSetup({},n),h=f.context||f,p=f.context&&(h.nodeType||h.jquery)?ae(h):ae.event,m=ae.Deferred(),g=ae.Callbacks("once memory"),v=f.statusCode||{},y={},w={},b=0,k="canceled",x={readyState:0,getResponseHeader:function(e){var t;if(2===b){if(!s)for(s={};t=kt.exec(o);)s[t[1].toLowerCase()]=t[2];t=s[e.toLowerCase()]}return null==t?null:t},getAllResponseHeaders:function(){return 2===b?o:null},setRequestHeader:function(e,t){var n=e.toLowerCase();return b||(e=w[n]=w[n]||e,y[e]=t),this},overrideMimeType:function(e){return b||(f.mimeType=e),this},statusCode:function(e){var t;if(e)if(b<2)for(t in e)v[t]=[v[t],e[t]];else x.always(e[x.status]);return this},abort:function(e){var t=e||k;return i&&i.abort(t),r(0,t),this}};if(m.promise(x).complete=g.add,x.success=x.done,x.error=x.fail,f.url=((t||f.url||gt.href)+"").replace(wt,"").replace(_t,gt.protocol+"//"),f.type=n.method||n.type||f.method||f.type,f.dataTypes=ae.trim(f.dataType||"*").toLowerCase().match(ke)||[""],null==f.crossDomain){u=Z.createElement("a");try{u.href=f.url,u.href=u.href,f.crossDomain=Tt.protocol+"//"+Tt.host!=u.protocol+"//"+u.host}catch(D){f.crossDomain=!0}}if(f.data&&f.processData&&"string"!=typeof f.data&&(f.data=ae.param(f.data,f.traditional)),z(St,f,n,x),2===b)return x;d=ae.event&&f.global,d&&0===ae.active++&&ae.event.trigger("ajaxStart"),f.type=f.type.toUpperCase(),f.hasContent=!Dt.test(f.type),a=f.url,f.hasContent||(f.data&&(a=f.url+=(yt.test(a)?"&":"?")+f.data,delete f.data),f.cache===!1&&(f.url=bt.test(a)?a.replace(bt,"$1_="+vt++):a+(yt.test(a)?"&":"?")+"_="+vt++)),f.ifModified&&(ae.lastModified[a]&&x.setRequestHeader("If-Modified-Since",ae.lastModified[a]),ae.etag[a]&&x.setRequestHeader("If-None-Match",ae.etag[a])),(f.data&&f.hasContent&&f.contentType!==!1||n.contentType)&&x.setRequestHeader("Content-Type",f.contentType),x.setRequestHeader("Accept",f.dataTypes[0]&&f.accepts[f.dataTypes[0]]?f.accepts[f.dataTypes[0]]+("*"!==f.dataTypes[0]?", "+Ot+"; q=0.01":""):f.accepts["*"]);for(c in f.headers)x.setRequestHeader(c,f.headers[c]);if(f.beforeSend&&(f.beforeSend.call(h,x,f)===!1||2===b))return x.abort();k="abort";for(c in{success:1,error:1,complete:1})x[c](f[c]);if(i=z(Ct,f,n,x)){if(x.readyState=1,d&&p.trigger("ajaxSend",[x,f]),2===b)return x;f.async&&f.timeout>0&&(l=e.setTimeout(function(){x.abort("timeout")},f.timeout));try{b=1,i.send(y,r)}catch(D){if(!(b<2))throw D;r(-1,D)}}else r(-1,"No Transport");return x},getJSON:function(e,t,n){return ae.get(e,t,n,"json")},getScript:function(e,t){return ae.get(e,void 0,t,"script")}}),ae.each(["get","post"],function(e,t){ae[t]=function(e,n,r,i){return ae.isFunction(n)&&(i=i||r,r=n,n=void 0),ae.ajax(ae.extend({url:e,type:t,dataType:i,data:n,success:r},ae.isPlainObject(e)&&e))}}),ae._evalUrl=function(e){return ae.ajax({url:e,type:"GET",dataType:"script",async:!1,global:!1,"throws":!0})},ae.fn.extend({wrapAll:function(e){var t;return ae.isFunction(e)?this.each(function(t){ae(this).wrapAll(e.call(this,t))}):(this[0]&&(t=ae(e,this[0].ownerDocument).eq(0).clone(!0),this[0].parentNode&&t.insertBefore(this[0]),t.map(function(){for(var e=this;e.firstElementChild;)e=e.firstElementChild;return e}).append(this)),this)},wrapInner:function(e){return ae.isFunction(e)?this.each(function(t){ae(this).wrapInner(e.call(this,t))}):this.each(function(){var t=ae(this),n=t.contents();n.length?n.wrapAll(e):t.append(e)})},wrap:function(e){var t=ae.isFunction(e);return this.each(function(n){ae(this).wrapAll(t?e.call(this,n):e)})},unwrap:function(){return this.parent().each(function(){ae.nodeName(this,"body")||ae(this).replaceWith(this.childNodes)}).end()}}),ae.expr.filters.hidden=function(e){return!ae.expr.filters.visible(e)},ae.expr.filters.visible=function(e){return e.offsetWidth>0||e.offsetHeight>0||e.getClientRects().length>0};var Mt=/%20/g,Yt=/\[\]$/,jt=/\r?\n/g,Pt=/^(?:submit|button|image|reset|file)$/i,Nt=/^(?:input|select|textarea|keygen)/i;ae.param=function(e,t){var n,r=[],i=function(e,t){t=ae.isFunction(t)?t():null==t?"":t,r[r.length]=encodeURIComponent(e)+"="+encodeURIComponent(t)};if(void 0===t&&(t=ae.ajaxSettings&&ae.ajaxSettings.traditional),ae.isArray(e)||e.jquery&&!ae.isPlainObject(e))ae.each(e,function(){i(this.name,this.value)});else for(n in e)U(n,e[n],t,i);return r.join("&").replace(Mt,"+")},ae.fn.extend({serialize:function(){return ae.param(this.serializeArray())},serializeArray:function(){return this.map(function(){var e=ae.prop(this,"elements");return e?ae.makeArray(e):this}).filter(function(){var e=this.type;return this.name&&!ae(this).is(":disabled")&&Nt.test(this.nodeName)&&!Pt.test(e)&&(this.checked||!Ne.test(e))}).map(function(e,t){var n=ae(this).val();return null==n?null:ae.isArray(n)?ae.map(n,function(e){return{name:t.name,value:e.replace(jt,"\r\n")}}):{name:t.name,value:n.replace(jt,"\r\n")}}).get()}}),ae.ajaxSettings.xhr=function(){try{return new e.XMLHttpRequest}catch(t){}};var At={0:200,1223:204},Ft=ae.ajaxSettings.xhr();re.cors=!!Ft&&"withCredentials"in Ft,re.ajax=Ft=!!Ft,ae.ajaxTransport(function(t){var n,r;if(re.cors||Ft&&!t.crossDomain)return{send:function(i,a){var o,s=t.xhr();if(s.open(t.type,t.url,t.async,t.username,t.password),t.xhrFields)for(o in t.xhrFields)s[o]=t.xhrFields[o];t.mimeType&&s.overrideMimeType&&s.overrideMimeType(t.mimeType),t.crossDomain||i["X-Requested-With"]||(i["X-Requested-With"]="XMLHttpRequest");for(o in i)s.setRequestHeader(o,i[o]);n=function(e){return function(){n&&(n=r=s.onload=s.onerror=s.onabort=s.onreadystatechange=null,"abort"===e?s.abort():"error"===e?"number"!=typeof s.status?a(0,"error"):a(s.status,s.statusText):a(At[s.status]||s.status,s.statusText,"text"!==(s.responseType||"text")||"string"!=typeof s.responseText?{binary:s.response}:{text:s.responseText},s.getAllResponseHeaders()))}},s.onload=n(),r=s.onerror=n("error"),void 0!==s.onabort?s.onabort=r:s.onreadystatechange=function(){4===s.readyState&&e.setTimeout(function(){n&&r()})},n=n("abort");try{s.send(t.hasContent&&t.data||null)}catch(l){if(n)throw l}},abort:function(){n&&n()}}}),ae.ajaxSetup({accepts:{script:"text/javascript, application/javascript, application/ecmascript, application/x-ecmascript"},contents:{script:/\b(?:java|ecma)script\b/},converters:{"text script":function(e){return ae.globalEval(e),e}}}),ae.ajaxPrefilter("script",function(e){void 0===e.cache&&(e.cache=!1),e.crossDomain&&(e.type="GET")}),ae.ajaxTransport("script",function(e){if(e.crossDomain){var t,n;return{send:function(r,i){t=ae("<script>").prop({charset:e.scriptCharset,src:e.url}).on("load error",n=function(e){t.remove(),n=null,e&&i("error"===e.type?404:200,e.type)}),Z.head.appendChild(t[0])},abort:function(){n&&n()}}}});var $t=[],It=/(=)\?(?=&|$)|\?\?/;ae.ajaxSetup({jsonp:"callback",jsonpCallback:function(){var e=$t.pop()||ae.expando+"_"+vt++;return this[e]=!0,e}}),ae.ajaxPrefilter("json jsonp",function(t,n,r){var i,a,o,s=t.jsonp!==!1&&(It.test(t.url)?"url":"string"==typeof t.data&&0===(t.contentType||"").indexOf("application/x-www-form-urlencoded")&&It.test(t.data)&&"data");if(s||"jsonp"===t.dataTypes[0])return i=t.jsonpCallback=ae.isFunction(t.jsonpCallback)?t.jsonpCallback():t.jsonpCallback,s?t[s]=t[s].replace(It,"$1"+i):t.jsonp!==!1&&(t.url+=(yt.test(t.url)?"&":"?")+t.jsonp+"="+i),t.converters["script json"]=function(){return o||ae.error(i+" was not called"),o[0]},t.dataTypes[0]="json",a=e[i],e[i]=function(){o=arguments},r.always(function(){void 0===a?ae(e).removeProp(i):e[i]=a,t[i]&&(t.jsonpCallback=n.jsonpCallback,$t.push(i)),o&&ae.isFunction(a)&&a(o[0]),o=a=void 0}),"script"}),ae.parseHTML=function(e,t,n){if(!e||"string"!=typeof e)return null;"boolean"==typeof t&&(n=t,t=!1),t=t||Z;var r=pe.exec(e),i=!n&&[];return r?[t.createElement(r[1])]:(r=f([e],t,i),i&&i.length&&ae(i).remove(),ae.merge([],r.childNodes))};var Et=ae.fn.load;ae.fn.load=function(e,t,n){if("string"!=typeof e&&Et)return Et.apply(this,arguments);var r,i,a,o=this,s=e.indexOf(" ");return s>-1&&(r=ae.trim(e.slice(s)),e=e.slice(0,s)),ae.isFunction(t)?(n=t,t=void 0):t&&"object"==typeof t&&(i="POST"),o.length>0&&ae.ajax({url:e,type:i||"GET",dataType:"html",data:t}).done(function(e){a=arguments,o.html(r?ae("<div>").append(ae.parseHTML(e)).find(r):e)}).always(n&&function(e,t){o.each(function(){n.apply(this,a||[e.responseText,t,e])})}),this},ae.each(["ajaxStart","ajaxStop","ajaxComplete","ajaxError","ajaxSuccess","ajaxSend"],function(e,t){ae.fn[t]=function(e){return this.on(t,e)}}),ae.expr.filters.animated=function(e){return ae.grep(ae.timers,function(t){return e===t.elem}).length},ae.offset={setOffset:function(e,t,n){var r,i,a,o,s,l,u,d=ae.css(e,"position"),c=ae(e),f={};"static"===d&&(e.style.position="relative"),s=c.offset(),a=ae.css(e,"top"),l=ae.css(e,"left"),u=("absolute"===d||"fixed"===d)&&(a+l).indexOf("auto")>-1,u?(r=c.position(),o=r.top,i=r.left):(o=parseFloat(a)||0,i=parseFloat(l)||0),ae.isFunction(t)&&(t=t.call(e,n,ae.extend({},s))),null!=t.top&&(f.top=t.top-s.top+o),null!=t.left&&(f.left=t.left-s.left+i),"using"in t?t.using.call(e,f):c.css(f)}},ae.fn.extend({offset:function(e){if(arguments.length)return void 0===e?this:this.each(function(t){ae.offset.setOffset(this,e,t)});var t,n,r=this[0],i={top:0,left:0},a=r&&r.ownerDocument;if(a)return t=a.documentElement,ae.contains(t,r)?(i=r.getBoundingClientRect(),n=B(a),{top:i.top+n.pageYOffset-t.clientTop,left:i.left+n.pageXOffset-t.clientLeft}):i},position:function(){if(this[0]){var e,t,n=this[0],r={top:0,left:0};return"fixed"===ae.css(n,"position")?t=n.getBoundingClientRect():(e=this.offsetParent(),t=this.offset(),ae.nodeName(e[0],"html")||(r=e.offset()),r.top+=ae.css(e[0],"borderTopWidth",!0),r.left+=ae.css(e[0],"borderLeftWidth",!0)),{top:t.top-r.top-ae.css(n,"marginTop",!0),left:t.left-r.left-ae.css(n,"marginLeft",!0)}}},offsetParent:function(){return this.map(function(){for(var e=this.offsetParent;e&&"static"===ae.css(e,"position");)e=e.offsetParent;return e||Qe})}}),ae.each({scrollLeft:"pageXOffset",scrollTop:"pageYOffset"},function(e,t){var n="pageYOffset"===t;ae.fn[e]=function(r){return De(this,function(e,r,i){var a=B(e);return void 0===i?a?a[t]:e[r]:void(a?a.scrollTo(n?a.pageXOffset:i,n?i:a.pageYOffset):e[r]=i)},e,r,arguments.length)}}),ae.each(["top","left"],function(e,t){ae.cssHooks[t]=O(re.pixelPosition,function(e,n){if(n)return n=C(e,t),Ze.test(n)?ae(e).position()[t]+"px":n})}),ae.each({Height:"height",Width:"width"},function(e,t){ae.each({padding:"inner"+e,content:t,"":"outer"+e},function(n,r){ae.fn[r]=function(r,i){var a=arguments.length&&(n||"boolean"!=typeof r),o=n||(r===!0||i===!0?"margin":"border");return De(this,function(t,n,r){var i;return ae.isWindow(t)?t.document.documentElement["client"+e]:9===t.nodeType?(i=t.documentElement,Math.max(t.body["scroll"+e],i["scroll"+e],t.body["offset"+e],i["offset"+e],i["client"+e])):void 0===r?ae.css(t,n,o):ae.style(t,n,r,o)},t,a?r:void 0,a,null)}})}),ae.fn.extend({bind:function(e,t,n){return this.on(e,null,t,n)},unbind:function(e,t){return this.off(e,null,t)},delegate:function(e,t,n,r){return this.on(t,e,n,r)},undelegate:function(e,t,n){return 1===arguments.length?this.off(e,"**"):this.off(t,e||"**",n)},size:function(){return this.length}}),ae.fn.andSelf=ae.fn.addBack,"function"==typeof define&&define.amd&&define("jquery",[],function(){return ae});var Lt=e.jQuery,Wt=e.$;return ae.noConflict=function(t){return e.$===ae&&(e.$=Wt),t&&e.jQuery===ae&&(e.jQuery=Lt),ae},t||(e.jQuery=e.$=ae),ae})},{}],2:[function(e,t,n){!function(e,r){"function"==typeof define&&define.amd?define(r):"object"==typeof n?t.exports=r():e.MicroPlugin=r()}(this,function(){var e={};e.mixin=function(e){e.plugins={},e.prototype.initializePlugins=function(e){var n,r,i,a=this,o=[];if(a.plugins={names:[],settings:{},requested:{},loaded:{}},t.isArray(e))for(n=0,r=e.length;n<r;n++)"string"==typeof e[n]?o.push(e[n]):(a.plugins.settings[e[n].name]=e[n].options,o.push(e[n].name));else if(e)for(i in e)e.hasOwnProperty(i)&&(a.plugins.settings[i]=e[i],o.push(i));for(;o.length;)a.require(o.shift())},e.prototype.loadPlugin=function(t){var n=this,r=n.plugins,i=e.plugins[t];if(!e.plugins.hasOwnProperty(t))throw new Error('Unable to find "'+t+'" plugin');r.requested[t]=!0,r.loaded[t]=i.fn.apply(n,[n.plugins.settings[t]||{}]),r.names.push(t)},e.prototype.require=function(e){var t=this,n=t.plugins;if(!t.plugins.loaded.hasOwnProperty(e)){if(n.requested[e])throw new Error('Plugin has circular dependency ("'+e+'")');t.loadPlugin(e)}return n.loaded[e]},e.define=function(t,n){e.plugins[t]={name:t,fn:n}}};var t={isArray:Array.isArray||function(e){return"[object Array]"===Object.prototype.toString.call(e)}};return e})},{}],3:[function(e,t,n){!function(e,r){"object"==typeof n&&"undefined"!=typeof t?t.exports=r():"function"==typeof define&&define.amd?define(r):e.moment=r()}(this,function(){"use strict";function n(){return kr.apply(null,arguments)}function r(e){kr=e}function i(e){return e instanceof Array||"[object Array]"===Object.prototype.toString.call(e)}function a(e){return null!=e&&"[object Object]"===Object.prototype.toString.call(e)}function o(e){var t;for(t in e)return!1;return!0}function s(e){return void 0===e}function l(e){return"number"==typeof e||"[object Number]"===Object.prototype.toString.call(e)}function u(e){return e instanceof Date||"[object Date]"===Object.prototype.toString.call(e)}function d(e,t){var n,r=[];for(n=0;n<e.length;++n)r.push(t(e[n],n));return r}function c(e,t){return Object.prototype.hasOwnProperty.call(e,t)}function f(e,t){for(var n in t)c(t,n)&&(e[n]=t[n]);return c(t,"toString")&&(e.toString=t.toString),c(t,"valueOf")&&(e.valueOf=t.valueOf),e}function h(e,t,n,r){return bt(e,t,n,r,!0).utc()}function p(){return{empty:!1,unusedTokens:[],unusedInput:[],overflow:-2,charsLeftOver:0,nullInput:!1,invalidMonth:null,invalidFormat:!1,userInvalidated:!1,iso:!1,parsedDateParts:[],meridiem:null,rfc2822:!1,weekdayMismatch:!1}}function m(e){return null==e._pf&&(e._pf=p()),e._pf}function g(e){if(null==e._isValid){var t=m(e),n=Dr.call(t.parsedDateParts,function(e){return null!=e}),r=!isNaN(e._d.getTime())&&t.overflow<0&&!t.empty&&!t.invalidMonth&&!t.invalidWeekday&&!t.nullInput&&!t.invalidFormat&&!t.userInvalidated&&(!t.meridiem||t.meridiem&&n);if(e._strict&&(r=r&&0===t.charsLeftOver&&0===t.unusedTokens.length&&void 0===t.bigHour),null!=Object.isFrozen&&Object.isFrozen(e))return r;e._isValid=r}return e._isValid}function v(e){var t=h(NaN);return null!=e?f(m(t),e):m(t).userInvalidated=!0,t}function y(e,t){var n,r,i;if(s(t._isAMomentObject)||(e._isAMomentObject=t._isAMomentObject),s(t._i)||(e._i=t._i),s(t._f)||(e._f=t._f),s(t._l)||(e._l=t._l),s(t._strict)||(e._strict=t._strict),s(t._tzm)||(e._tzm=t._tzm),s(t._isUTC)||(e._isUTC=t._isUTC),s(t._offset)||(e._offset=t._offset),s(t._pf)||(e._pf=m(t)),s(t._locale)||(e._locale=t._locale),_r.length>0)for(n=0;n<_r.length;n++)r=_r[n],i=t[r],s(i)||(e[r]=i);return e}function w(e){y(this,e),this._d=new Date(null!=e._d?e._d.getTime():NaN),this.isValid()||(this._d=new Date(NaN)),Sr===!1&&(Sr=!0,n.updateOffset(this),Sr=!1)}function b(e){return e instanceof w||null!=e&&null!=e._isAMomentObject}function k(e){return e<0?Math.ceil(e)||0:Math.floor(e)}function x(e){var t=+e,n=0;return 0!==t&&isFinite(t)&&(n=k(t)),n}function D(e,t,n){var r,i=Math.min(e.length,t.length),a=Math.abs(e.length-t.length),o=0;for(r=0;r<i;r++)(n&&e[r]!==t[r]||!n&&x(e[r])!==x(t[r]))&&o++;return o+a}function _(e){n.suppressDeprecationWarnings===!1&&"undefined"!=typeof console&&console.warn&&console.warn("Deprecation warning: "+e)}function S(e,t){var r=!0;return f(function(){if(null!=n.deprecationHandler&&n.deprecationHandler(null,e),r){for(var i,a=[],o=0;o<arguments.length;o++){if(i="","object"==typeof arguments[o]){i+="\n["+o+"] ";for(var s in arguments[0])i+=s+": "+arguments[0][s]+", ";i=i.slice(0,-2)}else i=arguments[o];a.push(i)}_(e+"\nArguments: "+Array.prototype.slice.call(a).join("")+"\n"+(new Error).stack),r=!1}return t.apply(this,arguments)},t)}function C(e,t){null!=n.deprecationHandler&&n.deprecationHandler(e,t),Cr[e]||(_(t),Cr[e]=!0)}function O(e){return e instanceof Function||"[object Function]"===Object.prototype.toString.call(e)}function T(e){var t,n;for(n in e)t=e[n],O(t)?this[n]=t:this["_"+n]=t;this._config=e,this._dayOfMonthOrdinalParseLenient=new RegExp((this._dayOfMonthOrdinalParse.source||this._ordinalParse.source)+"|"+/\d{1,2}/.source)}function M(e,t){var n,r=f({},e);for(n in t)c(t,n)&&(a(e[n])&&a(t[n])?(r[n]={},f(r[n],e[n]),f(r[n],t[n])):null!=t[n]?r[n]=t[n]:delete r[n]);for(n in e)c(e,n)&&!c(t,n)&&a(e[n])&&(r[n]=f({},r[n]));return r}function Y(e){null!=e&&this.set(e)}function j(e,t,n){var r=this._calendar[e]||this._calendar.sameElse;return O(r)?r.call(t,n):r}function P(e){var t=this._longDateFormat[e],n=this._longDateFormat[e.toUpperCase()];return t||!n?t:(this._longDateFormat[e]=n.replace(/MMMM|MM|DD|dddd/g,function(e){return e.slice(1)}),this._longDateFormat[e])}function N(){return this._invalidDate}function A(e){return this._ordinal.replace("%d",e)}function F(e,t,n,r){var i=this._relativeTime[n];return O(i)?i(e,t,n,r):i.replace(/%d/i,e)}function $(e,t){var n=this._relativeTime[e>0?"future":"past"];return O(n)?n(t):n.replace(/%s/i,t)}function I(e,t){var n=e.toLowerCase();$r[n]=$r[n+"s"]=$r[t]=e}function E(e){return"string"==typeof e?$r[e]||$r[e.toLowerCase()]:void 0}function L(e){var t,n,r={};for(n in e)c(e,n)&&(t=E(n),t&&(r[t]=e[n]));return r}function W(e,t){Ir[e]=t}function H(e){var t=[];for(var n in e)t.push({unit:n,priority:Ir[n]});return t.sort(function(e,t){return e.priority-t.priority}),t}function z(e,t){return function(r){return null!=r?(q(this,e,r),n.updateOffset(this,t),this):R(this,e)}}function R(e,t){return e.isValid()?e._d["get"+(e._isUTC?"UTC":"")+t]():NaN}function q(e,t,n){e.isValid()&&e._d["set"+(e._isUTC?"UTC":"")+t](n)}function V(e){return e=E(e),O(this[e])?this[e]():this}function U(e,t){if("object"==typeof e){e=L(e);for(var n=H(e),r=0;r<n.length;r++)this[n[r].unit](e[n[r].unit])}else if(e=E(e),O(this[e]))return this[e](t);return this}function B(e,t,n){var r=""+Math.abs(e),i=t-r.length,a=e>=0;return(a?n?"+":"":"-")+Math.pow(10,Math.max(0,i)).toString().substr(1)+r}function G(e,t,n,r){var i=r;"string"==typeof r&&(i=function(){return this[r]()}),e&&(Hr[e]=i),t&&(Hr[t[0]]=function(){return B(i.apply(this,arguments),t[1],t[2])}),n&&(Hr[n]=function(){return this.localeData().ordinal(i.apply(this,arguments),e)})}function Z(e){return e.match(/\[[\s\S]/)?e.replace(/^\[|\]$/g,""):e.replace(/\\/g,"")}function K(e){var t,n,r=e.match(Er);for(t=0,n=r.length;t<n;t++)Hr[r[t]]?r[t]=Hr[r[t]]:r[t]=Z(r[t]);return function(t){var i,a="";for(i=0;i<n;i++)a+=O(r[i])?r[i].call(t,e):r[i];return a}}function X(e,t){return e.isValid()?(t=Q(t,e.localeData()),Wr[t]=Wr[t]||K(t),Wr[t](e)):e.localeData().invalidDate()}function Q(e,t){function n(e){return t.longDateFormat(e)||e}var r=5;for(Lr.lastIndex=0;r>=0&&Lr.test(e);)e=e.replace(Lr,n),Lr.lastIndex=0,r-=1;return e}function J(e,t,n){ai[e]=O(t)?t:function(e,r){return e&&n?n:t}}function ee(e,t){return c(ai,e)?ai[e](t._strict,t._locale):new RegExp(te(e))}function te(e){return ne(e.replace("\\","").replace(/\\(\[)|\\(\])|\[([^\]\[]*)\]|\\(.)/g,function(e,t,n,r,i){return t||n||r||i}))}function ne(e){return e.replace(/[-\/\\^$*+?.()|[\]{}]/g,"\\$&")}function re(e,t){var n,r=t;for("string"==typeof e&&(e=[e]),l(t)&&(r=function(e,n){n[t]=x(e)}),n=0;n<e.length;n++)oi[e[n]]=r}function ie(e,t){re(e,function(e,n,r,i){r._w=r._w||{},t(e,r._w,r,i)})}function ae(e,t,n){null!=t&&c(oi,e)&&oi[e](t,n._a,n,e)}function oe(e,t){return new Date(Date.UTC(e,t+1,0)).getUTCDate()}function se(e,t){return e?i(this._months)?this._months[e.month()]:this._months[(this._months.isFormat||vi).test(t)?"format":"standalone"][e.month()]:i(this._months)?this._months:this._months.standalone}function le(e,t){return e?i(this._monthsShort)?this._monthsShort[e.month()]:this._monthsShort[vi.test(t)?"format":"standalone"][e.month()]:i(this._monthsShort)?this._monthsShort:this._monthsShort.standalone}function ue(e,t,n){var r,i,a,o=e.toLocaleLowerCase();if(!this._monthsParse)for(this._monthsParse=[],this._longMonthsParse=[],this._shortMonthsParse=[],r=0;r<12;++r)a=h([2e3,r]),this._shortMonthsParse[r]=this.monthsShort(a,"").toLocaleLowerCase(),this._longMonthsParse[r]=this.months(a,"").toLocaleLowerCase();return n?"MMM"===t?(i=gi.call(this._shortMonthsParse,o),i!==-1?i:null):(i=gi.call(this._longMonthsParse,o),i!==-1?i:null):"MMM"===t?(i=gi.call(this._shortMonthsParse,o),i!==-1?i:(i=gi.call(this._longMonthsParse,o),i!==-1?i:null)):(i=gi.call(this._longMonthsParse,o),i!==-1?i:(i=gi.call(this._shortMonthsParse,o),i!==-1?i:null))}function de(e,t,n){var r,i,a;if(this._monthsParseExact)return ue.call(this,e,t,n);for(this._monthsParse||(this._monthsParse=[],this._longMonthsParse=[],this._shortMonthsParse=[]),r=0;r<12;r++){if(i=h([2e3,r]),n&&!this._longMonthsParse[r]&&(this._longMonthsParse[r]=new RegExp("^"+this.months(i,"").replace(".","")+"$","i"),this._shortMonthsParse[r]=new RegExp("^"+this.monthsShort(i,"").replace(".","")+"$","i")),n||this._monthsParse[r]||(a="^"+this.months(i,"")+"|^"+this.monthsShort(i,""),
 this._monthsParse[r]=new RegExp(a.replace(".",""),"i")),n&&"MMMM"===t&&this._longMonthsParse[r].test(e))return r;if(n&&"MMM"===t&&this._shortMonthsParse[r].test(e))return r;if(!n&&this._monthsParse[r].test(e))return r}}function ce(e,t){var n;if(!e.isValid())return e;if("string"==typeof t)if(/^\d+$/.test(t))t=x(t);else if(t=e.localeData().monthsParse(t),!l(t))return e;return n=Math.min(e.date(),oe(e.year(),t)),e._d["set"+(e._isUTC?"UTC":"")+"Month"](t,n),e}function fe(e){return null!=e?(ce(this,e),n.updateOffset(this,!0),this):R(this,"Month")}function he(){return oe(this.year(),this.month())}function pe(e){return this._monthsParseExact?(c(this,"_monthsRegex")||ge.call(this),e?this._monthsShortStrictRegex:this._monthsShortRegex):(c(this,"_monthsShortRegex")||(this._monthsShortRegex=bi),this._monthsShortStrictRegex&&e?this._monthsShortStrictRegex:this._monthsShortRegex)}function me(e){return this._monthsParseExact?(c(this,"_monthsRegex")||ge.call(this),e?this._monthsStrictRegex:this._monthsRegex):(c(this,"_monthsRegex")||(this._monthsRegex=ki),this._monthsStrictRegex&&e?this._monthsStrictRegex:this._monthsRegex)}function ge(){function e(e,t){return t.length-e.length}var t,n,r=[],i=[],a=[];for(t=0;t<12;t++)n=h([2e3,t]),r.push(this.monthsShort(n,"")),i.push(this.months(n,"")),a.push(this.months(n,"")),a.push(this.monthsShort(n,""));for(r.sort(e),i.sort(e),a.sort(e),t=0;t<12;t++)r[t]=ne(r[t]),i[t]=ne(i[t]);for(t=0;t<24;t++)a[t]=ne(a[t]);this._monthsRegex=new RegExp("^("+a.join("|")+")","i"),this._monthsShortRegex=this._monthsRegex,this._monthsStrictRegex=new RegExp("^("+i.join("|")+")","i"),this._monthsShortStrictRegex=new RegExp("^("+r.join("|")+")","i")}function ve(e){return ye(e)?366:365}function ye(e){return e%4===0&&e%100!==0||e%400===0}function we(){return ye(this.year())}function be(e,t,n,r,i,a,o){var s=new Date(e,t,n,r,i,a,o);return e<100&&e>=0&&isFinite(s.getFullYear())&&s.setFullYear(e),s}function ke(e){var t=new Date(Date.UTC.apply(null,arguments));return e<100&&e>=0&&isFinite(t.getUTCFullYear())&&t.setUTCFullYear(e),t}function xe(e,t,n){var r=7+t-n,i=(7+ke(e,0,r).getUTCDay()-t)%7;return-i+r-1}function De(e,t,n,r,i){var a,o,s=(7+n-r)%7,l=xe(e,r,i),u=1+7*(t-1)+s+l;return u<=0?(a=e-1,o=ve(a)+u):u>ve(e)?(a=e+1,o=u-ve(e)):(a=e,o=u),{year:a,dayOfYear:o}}function _e(e,t,n){var r,i,a=xe(e.year(),t,n),o=Math.floor((e.dayOfYear()-a-1)/7)+1;return o<1?(i=e.year()-1,r=o+Se(i,t,n)):o>Se(e.year(),t,n)?(r=o-Se(e.year(),t,n),i=e.year()+1):(i=e.year(),r=o),{week:r,year:i}}function Se(e,t,n){var r=xe(e,t,n),i=xe(e+1,t,n);return(ve(e)-r+i)/7}function Ce(e){return _e(e,this._week.dow,this._week.doy).week}function Oe(){return this._week.dow}function Te(){return this._week.doy}function Me(e){var t=this.localeData().week(this);return null==e?t:this.add(7*(e-t),"d")}function Ye(e){var t=_e(this,1,4).week;return null==e?t:this.add(7*(e-t),"d")}function je(e,t){return"string"!=typeof e?e:isNaN(e)?(e=t.weekdaysParse(e),"number"==typeof e?e:null):parseInt(e,10)}function Pe(e,t){return"string"==typeof e?t.weekdaysParse(e)%7||7:isNaN(e)?null:e}function Ne(e,t){return e?i(this._weekdays)?this._weekdays[e.day()]:this._weekdays[this._weekdays.isFormat.test(t)?"format":"standalone"][e.day()]:i(this._weekdays)?this._weekdays:this._weekdays.standalone}function Ae(e){return e?this._weekdaysShort[e.day()]:this._weekdaysShort}function Fe(e){return e?this._weekdaysMin[e.day()]:this._weekdaysMin}function $e(e,t,n){var r,i,a,o=e.toLocaleLowerCase();if(!this._weekdaysParse)for(this._weekdaysParse=[],this._shortWeekdaysParse=[],this._minWeekdaysParse=[],r=0;r<7;++r)a=h([2e3,1]).day(r),this._minWeekdaysParse[r]=this.weekdaysMin(a,"").toLocaleLowerCase(),this._shortWeekdaysParse[r]=this.weekdaysShort(a,"").toLocaleLowerCase(),this._weekdaysParse[r]=this.weekdays(a,"").toLocaleLowerCase();return n?"dddd"===t?(i=gi.call(this._weekdaysParse,o),i!==-1?i:null):"ddd"===t?(i=gi.call(this._shortWeekdaysParse,o),i!==-1?i:null):(i=gi.call(this._minWeekdaysParse,o),i!==-1?i:null):"dddd"===t?(i=gi.call(this._weekdaysParse,o),i!==-1?i:(i=gi.call(this._shortWeekdaysParse,o),i!==-1?i:(i=gi.call(this._minWeekdaysParse,o),i!==-1?i:null))):"ddd"===t?(i=gi.call(this._shortWeekdaysParse,o),i!==-1?i:(i=gi.call(this._weekdaysParse,o),i!==-1?i:(i=gi.call(this._minWeekdaysParse,o),i!==-1?i:null))):(i=gi.call(this._minWeekdaysParse,o),i!==-1?i:(i=gi.call(this._weekdaysParse,o),i!==-1?i:(i=gi.call(this._shortWeekdaysParse,o),i!==-1?i:null)))}function Ie(e,t,n){var r,i,a;if(this._weekdaysParseExact)return $e.call(this,e,t,n);for(this._weekdaysParse||(this._weekdaysParse=[],this._minWeekdaysParse=[],this._shortWeekdaysParse=[],this._fullWeekdaysParse=[]),r=0;r<7;r++){if(i=h([2e3,1]).day(r),n&&!this._fullWeekdaysParse[r]&&(this._fullWeekdaysParse[r]=new RegExp("^"+this.weekdays(i,"").replace(".",".?")+"$","i"),this._shortWeekdaysParse[r]=new RegExp("^"+this.weekdaysShort(i,"").replace(".",".?")+"$","i"),this._minWeekdaysParse[r]=new RegExp("^"+this.weekdaysMin(i,"").replace(".",".?")+"$","i")),this._weekdaysParse[r]||(a="^"+this.weekdays(i,"")+"|^"+this.weekdaysShort(i,"")+"|^"+this.weekdaysMin(i,""),this._weekdaysParse[r]=new RegExp(a.replace(".",""),"i")),n&&"dddd"===t&&this._fullWeekdaysParse[r].test(e))return r;if(n&&"ddd"===t&&this._shortWeekdaysParse[r].test(e))return r;if(n&&"dd"===t&&this._minWeekdaysParse[r].test(e))return r;if(!n&&this._weekdaysParse[r].test(e))return r}}function Ee(e){if(!this.isValid())return null!=e?this:NaN;var t=this._isUTC?this._d.getUTCDay():this._d.getDay();return null!=e?(e=je(e,this.localeData()),this.add(e-t,"d")):t}function Le(e){if(!this.isValid())return null!=e?this:NaN;var t=(this.day()+7-this.localeData()._week.dow)%7;return null==e?t:this.add(e-t,"d")}function We(e){if(!this.isValid())return null!=e?this:NaN;if(null!=e){var t=Pe(e,this.localeData());return this.day(this.day()%7?t:t-7)}return this.day()||7}function He(e){return this._weekdaysParseExact?(c(this,"_weekdaysRegex")||qe.call(this),e?this._weekdaysStrictRegex:this._weekdaysRegex):(c(this,"_weekdaysRegex")||(this._weekdaysRegex=Oi),this._weekdaysStrictRegex&&e?this._weekdaysStrictRegex:this._weekdaysRegex)}function ze(e){return this._weekdaysParseExact?(c(this,"_weekdaysRegex")||qe.call(this),e?this._weekdaysShortStrictRegex:this._weekdaysShortRegex):(c(this,"_weekdaysShortRegex")||(this._weekdaysShortRegex=Ti),this._weekdaysShortStrictRegex&&e?this._weekdaysShortStrictRegex:this._weekdaysShortRegex)}function Re(e){return this._weekdaysParseExact?(c(this,"_weekdaysRegex")||qe.call(this),e?this._weekdaysMinStrictRegex:this._weekdaysMinRegex):(c(this,"_weekdaysMinRegex")||(this._weekdaysMinRegex=Mi),this._weekdaysMinStrictRegex&&e?this._weekdaysMinStrictRegex:this._weekdaysMinRegex)}function qe(){function e(e,t){return t.length-e.length}var t,n,r,i,a,o=[],s=[],l=[],u=[];for(t=0;t<7;t++)n=h([2e3,1]).day(t),r=this.weekdaysMin(n,""),i=this.weekdaysShort(n,""),a=this.weekdays(n,""),o.push(r),s.push(i),l.push(a),u.push(r),u.push(i),u.push(a);for(o.sort(e),s.sort(e),l.sort(e),u.sort(e),t=0;t<7;t++)s[t]=ne(s[t]),l[t]=ne(l[t]),u[t]=ne(u[t]);this._weekdaysRegex=new RegExp("^("+u.join("|")+")","i"),this._weekdaysShortRegex=this._weekdaysRegex,this._weekdaysMinRegex=this._weekdaysRegex,this._weekdaysStrictRegex=new RegExp("^("+l.join("|")+")","i"),this._weekdaysShortStrictRegex=new RegExp("^("+s.join("|")+")","i"),this._weekdaysMinStrictRegex=new RegExp("^("+o.join("|")+")","i")}function Ve(){return this.hours()%12||12}function Ue(){return this.hours()||24}function Be(e,t){G(e,0,0,function(){return this.localeData().meridiem(this.hours(),this.minutes(),t)})}function Ge(e,t){return t._meridiemParse}function Ze(e){return"p"===(e+"").toLowerCase().charAt(0)}function Ke(e,t,n){return e>11?n?"pm":"PM":n?"am":"AM"}function Xe(e){return e?e.toLowerCase().replace("_","-"):e}function Qe(e){for(var t,n,r,i,a=0;a<e.length;){for(i=Xe(e[a]).split("-"),t=i.length,n=Xe(e[a+1]),n=n?n.split("-"):null;t>0;){if(r=Je(i.slice(0,t).join("-")))return r;if(n&&n.length>=t&&D(i,n,!0)>=t-1)break;t--}a++}return null}function Je(n){var r=null;if(!Ai[n]&&"undefined"!=typeof t&&t&&t.exports)try{r=Yi._abbr,e("./locale/"+n),et(r)}catch(i){}return Ai[n]}function et(e,t){var n;return e&&(n=s(t)?rt(e):tt(e,t),n&&(Yi=n)),Yi._abbr}function tt(e,t){if(null!==t){var n=Ni;if(t.abbr=e,null!=Ai[e])C("defineLocaleOverride","use moment.updateLocale(localeName, config) to change an existing locale. moment.defineLocale(localeName, config) should only be used for creating a new locale See http://momentjs.com/guides/#/warnings/define-locale/ for more info."),n=Ai[e]._config;else if(null!=t.parentLocale){if(null==Ai[t.parentLocale])return Fi[t.parentLocale]||(Fi[t.parentLocale]=[]),Fi[t.parentLocale].push({name:e,config:t}),null;n=Ai[t.parentLocale]._config}return Ai[e]=new Y(M(n,t)),Fi[e]&&Fi[e].forEach(function(e){tt(e.name,e.config)}),et(e),Ai[e]}return delete Ai[e],null}function nt(e,t){if(null!=t){var n,r=Ni;null!=Ai[e]&&(r=Ai[e]._config),t=M(r,t),n=new Y(t),n.parentLocale=Ai[e],Ai[e]=n,et(e)}else null!=Ai[e]&&(null!=Ai[e].parentLocale?Ai[e]=Ai[e].parentLocale:null!=Ai[e]&&delete Ai[e]);return Ai[e]}function rt(e){var t;if(e&&e._locale&&e._locale._abbr&&(e=e._locale._abbr),!e)return Yi;if(!i(e)){if(t=Je(e))return t;e=[e]}return Qe(e)}function it(){return Mr(Ai)}function at(e){var t,n=e._a;return n&&m(e).overflow===-2&&(t=n[li]<0||n[li]>11?li:n[ui]<1||n[ui]>oe(n[si],n[li])?ui:n[di]<0||n[di]>24||24===n[di]&&(0!==n[ci]||0!==n[fi]||0!==n[hi])?di:n[ci]<0||n[ci]>59?ci:n[fi]<0||n[fi]>59?fi:n[hi]<0||n[hi]>999?hi:-1,m(e)._overflowDayOfYear&&(t<si||t>ui)&&(t=ui),m(e)._overflowWeeks&&t===-1&&(t=pi),m(e)._overflowWeekday&&t===-1&&(t=mi),m(e).overflow=t),e}function ot(e){var t,n,r,i,a,o,s=e._i,l=$i.exec(s)||Ii.exec(s);if(l){for(m(e).iso=!0,t=0,n=Li.length;t<n;t++)if(Li[t][1].exec(l[1])){i=Li[t][0],r=Li[t][2]!==!1;break}if(null==i)return void(e._isValid=!1);if(l[3]){for(t=0,n=Wi.length;t<n;t++)if(Wi[t][1].exec(l[3])){a=(l[2]||" ")+Wi[t][0];break}if(null==a)return void(e._isValid=!1)}if(!r&&null!=a)return void(e._isValid=!1);if(l[4]){if(!Ei.exec(l[4]))return void(e._isValid=!1);o="Z"}e._f=i+(a||"")+(o||""),ht(e)}else e._isValid=!1}function st(e){var t,n,r,i,a,o,s,l,u={" GMT":" +0000"," EDT":" -0400"," EST":" -0500"," CDT":" -0500"," CST":" -0600"," MDT":" -0600"," MST":" -0700"," PDT":" -0700"," PST":" -0800"},d="YXWVUTSRQPONZABCDEFGHIKLM";if(t=e._i.replace(/\([^\)]*\)|[\n\t]/g," ").replace(/(\s\s+)/g," ").replace(/^\s|\s$/g,""),n=zi.exec(t)){if(r=n[1]?"ddd"+(5===n[1].length?", ":" "):"",i="D MMM "+(n[2].length>10?"YYYY ":"YY "),a="HH:mm"+(n[4]?":ss":""),n[1]){var c=new Date(n[2]),f=["Sun","Mon","Tue","Wed","Thu","Fri","Sat"][c.getDay()];if(n[1].substr(0,3)!==f)return m(e).weekdayMismatch=!0,void(e._isValid=!1)}switch(n[5].length){case 2:0===l?s=" +0000":(l=d.indexOf(n[5][1].toUpperCase())-12,s=(l<0?" -":" +")+(""+l).replace(/^-?/,"0").match(/..$/)[0]+"00");break;case 4:s=u[n[5]];break;default:s=u[" GMT"]}n[5]=s,e._i=n.splice(1).join(""),o=" ZZ",e._f=r+i+a+o,ht(e),m(e).rfc2822=!0}else e._isValid=!1}function lt(e){var t=Hi.exec(e._i);return null!==t?void(e._d=new Date((+t[1]))):(ot(e),void(e._isValid===!1&&(delete e._isValid,st(e),e._isValid===!1&&(delete e._isValid,n.createFromInputFallback(e)))))}function ut(e,t,n){return null!=e?e:null!=t?t:n}function dt(e){var t=new Date(n.now());return e._useUTC?[t.getUTCFullYear(),t.getUTCMonth(),t.getUTCDate()]:[t.getFullYear(),t.getMonth(),t.getDate()]}function ct(e){var t,n,r,i,a=[];if(!e._d){for(r=dt(e),e._w&&null==e._a[ui]&&null==e._a[li]&&ft(e),null!=e._dayOfYear&&(i=ut(e._a[si],r[si]),(e._dayOfYear>ve(i)||0===e._dayOfYear)&&(m(e)._overflowDayOfYear=!0),n=ke(i,0,e._dayOfYear),e._a[li]=n.getUTCMonth(),e._a[ui]=n.getUTCDate()),t=0;t<3&&null==e._a[t];++t)e._a[t]=a[t]=r[t];for(;t<7;t++)e._a[t]=a[t]=null==e._a[t]?2===t?1:0:e._a[t];24===e._a[di]&&0===e._a[ci]&&0===e._a[fi]&&0===e._a[hi]&&(e._nextDay=!0,e._a[di]=0),e._d=(e._useUTC?ke:be).apply(null,a),null!=e._tzm&&e._d.setUTCMinutes(e._d.getUTCMinutes()-e._tzm),e._nextDay&&(e._a[di]=24)}}function ft(e){var t,n,r,i,a,o,s,l;if(t=e._w,null!=t.GG||null!=t.W||null!=t.E)a=1,o=4,n=ut(t.GG,e._a[si],_e(kt(),1,4).year),r=ut(t.W,1),i=ut(t.E,1),(i<1||i>7)&&(l=!0);else{a=e._locale._week.dow,o=e._locale._week.doy;var u=_e(kt(),a,o);n=ut(t.gg,e._a[si],u.year),r=ut(t.w,u.week),null!=t.d?(i=t.d,(i<0||i>6)&&(l=!0)):null!=t.e?(i=t.e+a,(t.e<0||t.e>6)&&(l=!0)):i=a}r<1||r>Se(n,a,o)?m(e)._overflowWeeks=!0:null!=l?m(e)._overflowWeekday=!0:(s=De(n,r,i,a,o),e._a[si]=s.year,e._dayOfYear=s.dayOfYear)}function ht(e){if(e._f===n.ISO_8601)return void ot(e);if(e._f===n.RFC_2822)return void st(e);e._a=[],m(e).empty=!0;var t,r,i,a,o,s=""+e._i,l=s.length,u=0;for(i=Q(e._f,e._locale).match(Er)||[],t=0;t<i.length;t++)a=i[t],r=(s.match(ee(a,e))||[])[0],r&&(o=s.substr(0,s.indexOf(r)),o.length>0&&m(e).unusedInput.push(o),s=s.slice(s.indexOf(r)+r.length),u+=r.length),Hr[a]?(r?m(e).empty=!1:m(e).unusedTokens.push(a),ae(a,r,e)):e._strict&&!r&&m(e).unusedTokens.push(a);m(e).charsLeftOver=l-u,s.length>0&&m(e).unusedInput.push(s),e._a[di]<=12&&m(e).bigHour===!0&&e._a[di]>0&&(m(e).bigHour=void 0),m(e).parsedDateParts=e._a.slice(0),m(e).meridiem=e._meridiem,e._a[di]=pt(e._locale,e._a[di],e._meridiem),ct(e),at(e)}function pt(e,t,n){var r;return null==n?t:null!=e.meridiemHour?e.meridiemHour(t,n):null!=e.isPM?(r=e.isPM(n),r&&t<12&&(t+=12),r||12!==t||(t=0),t):t}function mt(e){var t,n,r,i,a;if(0===e._f.length)return m(e).invalidFormat=!0,void(e._d=new Date(NaN));for(i=0;i<e._f.length;i++)a=0,t=y({},e),null!=e._useUTC&&(t._useUTC=e._useUTC),t._f=e._f[i],ht(t),g(t)&&(a+=m(t).charsLeftOver,a+=10*m(t).unusedTokens.length,m(t).score=a,(null==r||a<r)&&(r=a,n=t));f(e,n||t)}function gt(e){if(!e._d){var t=L(e._i);e._a=d([t.year,t.month,t.day||t.date,t.hour,t.minute,t.second,t.millisecond],function(e){return e&&parseInt(e,10)}),ct(e)}}function vt(e){var t=new w(at(yt(e)));return t._nextDay&&(t.add(1,"d"),t._nextDay=void 0),t}function yt(e){var t=e._i,n=e._f;return e._locale=e._locale||rt(e._l),null===t||void 0===n&&""===t?v({nullInput:!0}):("string"==typeof t&&(e._i=t=e._locale.preparse(t)),b(t)?new w(at(t)):(u(t)?e._d=t:i(n)?mt(e):n?ht(e):wt(e),g(e)||(e._d=null),e))}function wt(e){var t=e._i;s(t)?e._d=new Date(n.now()):u(t)?e._d=new Date(t.valueOf()):"string"==typeof t?lt(e):i(t)?(e._a=d(t.slice(0),function(e){return parseInt(e,10)}),ct(e)):a(t)?gt(e):l(t)?e._d=new Date(t):n.createFromInputFallback(e)}function bt(e,t,n,r,s){var l={};return n!==!0&&n!==!1||(r=n,n=void 0),(a(e)&&o(e)||i(e)&&0===e.length)&&(e=void 0),l._isAMomentObject=!0,l._useUTC=l._isUTC=s,l._l=n,l._i=e,l._f=t,l._strict=r,vt(l)}function kt(e,t,n,r){return bt(e,t,n,r,!1)}function xt(e,t){var n,r;if(1===t.length&&i(t[0])&&(t=t[0]),!t.length)return kt();for(n=t[0],r=1;r<t.length;++r)t[r].isValid()&&!t[r][e](n)||(n=t[r]);return n}function Dt(){var e=[].slice.call(arguments,0);return xt("isBefore",e)}function _t(){var e=[].slice.call(arguments,0);return xt("isAfter",e)}function St(e){for(var t in e)if(Ui.indexOf(t)===-1||null!=e[t]&&isNaN(e[t]))return!1;for(var n=!1,r=0;r<Ui.length;++r)if(e[Ui[r]]){if(n)return!1;parseFloat(e[Ui[r]])!==x(e[Ui[r]])&&(n=!0)}return!0}function Ct(){return this._isValid}function Ot(){return Ut(NaN)}function Tt(e){var t=L(e),n=t.year||0,r=t.quarter||0,i=t.month||0,a=t.week||0,o=t.day||0,s=t.hour||0,l=t.minute||0,u=t.second||0,d=t.millisecond||0;this._isValid=St(t),this._milliseconds=+d+1e3*u+6e4*l+1e3*s*60*60,this._days=+o+7*a,this._months=+i+3*r+12*n,this._data={},this._locale=rt(),this._bubble()}function Mt(e){return e instanceof Tt}function Yt(e){return e<0?Math.round(-1*e)*-1:Math.round(e)}function jt(e,t){G(e,0,0,function(){var e=this.utcOffset(),n="+";return e<0&&(e=-e,n="-"),n+B(~~(e/60),2)+t+B(~~e%60,2)})}function Pt(e,t){var n=(t||"").match(e);if(null===n)return null;var r=n[n.length-1]||[],i=(r+"").match(Bi)||["-",0,0],a=+(60*i[1])+x(i[2]);return 0===a?0:"+"===i[0]?a:-a}function Nt(e,t){var r,i;return t._isUTC?(r=t.clone(),i=(b(e)||u(e)?e.valueOf():kt(e).valueOf())-r.valueOf(),r._d.setTime(r._d.valueOf()+i),n.updateOffset(r,!1),r):kt(e).local()}function At(e){return 15*-Math.round(e._d.getTimezoneOffset()/15)}function Ft(e,t,r){var i,a=this._offset||0;if(!this.isValid())return null!=e?this:NaN;if(null!=e){if("string"==typeof e){if(e=Pt(ni,e),null===e)return this}else Math.abs(e)<16&&!r&&(e=60*e);return!this._isUTC&&t&&(i=At(this)),this._offset=e,this._isUTC=!0,null!=i&&this.add(i,"m"),a!==e&&(!t||this._changeInProgress?Xt(this,Ut(e-a,"m"),1,!1):this._changeInProgress||(this._changeInProgress=!0,n.updateOffset(this,!0),this._changeInProgress=null)),this}return this._isUTC?a:At(this)}function $t(e,t){return null!=e?("string"!=typeof e&&(e=-e),this.utcOffset(e,t),this):-this.utcOffset()}function It(e){return this.utcOffset(0,e)}function Et(e){return this._isUTC&&(this.utcOffset(0,e),this._isUTC=!1,e&&this.subtract(At(this),"m")),this}function Lt(){if(null!=this._tzm)this.utcOffset(this._tzm,!1,!0);else if("string"==typeof this._i){var e=Pt(ti,this._i);null!=e?this.utcOffset(e):this.utcOffset(0,!0)}return this}function Wt(e){return!!this.isValid()&&(e=e?kt(e).utcOffset():0,(this.utcOffset()-e)%60===0)}function Ht(){return this.utcOffset()>this.clone().month(0).utcOffset()||this.utcOffset()>this.clone().month(5).utcOffset()}function zt(){if(!s(this._isDSTShifted))return this._isDSTShifted;var e={};if(y(e,this),e=yt(e),e._a){var t=e._isUTC?h(e._a):kt(e._a);this._isDSTShifted=this.isValid()&&D(e._a,t.toArray())>0}else this._isDSTShifted=!1;return this._isDSTShifted}function Rt(){return!!this.isValid()&&!this._isUTC}function qt(){return!!this.isValid()&&this._isUTC}function Vt(){return!!this.isValid()&&(this._isUTC&&0===this._offset)}function Ut(e,t){var n,r,i,a=e,o=null;return Mt(e)?a={ms:e._milliseconds,d:e._days,M:e._months}:l(e)?(a={},t?a[t]=e:a.milliseconds=e):(o=Gi.exec(e))?(n="-"===o[1]?-1:1,a={y:0,d:x(o[ui])*n,h:x(o[di])*n,m:x(o[ci])*n,s:x(o[fi])*n,ms:x(Yt(1e3*o[hi]))*n}):(o=Zi.exec(e))?(n="-"===o[1]?-1:1,a={y:Bt(o[2],n),M:Bt(o[3],n),w:Bt(o[4],n),d:Bt(o[5],n),h:Bt(o[6],n),m:Bt(o[7],n),s:Bt(o[8],n)}):null==a?a={}:"object"==typeof a&&("from"in a||"to"in a)&&(i=Zt(kt(a.from),kt(a.to)),a={},a.ms=i.milliseconds,a.M=i.months),r=new Tt(a),Mt(e)&&c(e,"_locale")&&(r._locale=e._locale),r}function Bt(e,t){var n=e&&parseFloat(e.replace(",","."));return(isNaN(n)?0:n)*t}function Gt(e,t){var n={milliseconds:0,months:0};return n.months=t.month()-e.month()+12*(t.year()-e.year()),e.clone().add(n.months,"M").isAfter(t)&&--n.months,n.milliseconds=+t-+e.clone().add(n.months,"M"),n}function Zt(e,t){var n;return e.isValid()&&t.isValid()?(t=Nt(t,e),e.isBefore(t)?n=Gt(e,t):(n=Gt(t,e),n.milliseconds=-n.milliseconds,n.months=-n.months),n):{milliseconds:0,months:0}}function Kt(e,t){return function(n,r){var i,a;return null===r||isNaN(+r)||(C(t,"moment()."+t+"(period, number) is deprecated. Please use moment()."+t+"(number, period). See http://momentjs.com/guides/#/warnings/add-inverted-param/ for more info."),a=n,n=r,r=a),n="string"==typeof n?+n:n,i=Ut(n,r),Xt(this,i,e),this}}function Xt(e,t,r,i){var a=t._milliseconds,o=Yt(t._days),s=Yt(t._months);e.isValid()&&(i=null==i||i,a&&e._d.setTime(e._d.valueOf()+a*r),o&&q(e,"Date",R(e,"Date")+o*r),s&&ce(e,R(e,"Month")+s*r),i&&n.updateOffset(e,o||s))}function Qt(e,t){var n=e.diff(t,"days",!0);return n<-6?"sameElse":n<-1?"lastWeek":n<0?"lastDay":n<1?"sameDay":n<2?"nextDay":n<7?"nextWeek":"sameElse"}function Jt(e,t){var r=e||kt(),i=Nt(r,this).startOf("day"),a=n.calendarFormat(this,i)||"sameElse",o=t&&(O(t[a])?t[a].call(this,r):t[a]);return this.format(o||this.localeData().calendar(a,this,kt(r)))}function en(){return new w(this)}function tn(e,t){var n=b(e)?e:kt(e);return!(!this.isValid()||!n.isValid())&&(t=E(s(t)?"millisecond":t),"millisecond"===t?this.valueOf()>n.valueOf():n.valueOf()<this.clone().startOf(t).valueOf())}function nn(e,t){var n=b(e)?e:kt(e);return!(!this.isValid()||!n.isValid())&&(t=E(s(t)?"millisecond":t),"millisecond"===t?this.valueOf()<n.valueOf():this.clone().endOf(t).valueOf()<n.valueOf())}function rn(e,t,n,r){return r=r||"()",("("===r[0]?this.isAfter(e,n):!this.isBefore(e,n))&&(")"===r[1]?this.isBefore(t,n):!this.isAfter(t,n))}function an(e,t){var n,r=b(e)?e:kt(e);return!(!this.isValid()||!r.isValid())&&(t=E(t||"millisecond"),"millisecond"===t?this.valueOf()===r.valueOf():(n=r.valueOf(),this.clone().startOf(t).valueOf()<=n&&n<=this.clone().endOf(t).valueOf()))}function on(e,t){return this.isSame(e,t)||this.isAfter(e,t)}function sn(e,t){return this.isSame(e,t)||this.isBefore(e,t)}function ln(e,t,n){var r,i,a,o;return this.isValid()?(r=Nt(e,this),r.isValid()?(i=6e4*(r.utcOffset()-this.utcOffset()),t=E(t),"year"===t||"month"===t||"quarter"===t?(o=un(this,r),"quarter"===t?o/=3:"year"===t&&(o/=12)):(a=this-r,o="second"===t?a/1e3:"minute"===t?a/6e4:"hour"===t?a/36e5:"day"===t?(a-i)/864e5:"week"===t?(a-i)/6048e5:a),n?o:k(o)):NaN):NaN}function un(e,t){var n,r,i=12*(t.year()-e.year())+(t.month()-e.month()),a=e.clone().add(i,"months");return t-a<0?(n=e.clone().add(i-1,"months"),r=(t-a)/(a-n)):(n=e.clone().add(i+1,"months"),r=(t-a)/(n-a)),-(i+r)||0}function dn(){return this.clone().locale("en").format("ddd MMM DD YYYY HH:mm:ss [GMT]ZZ")}function cn(){if(!this.isValid())return null;var e=this.clone().utc();return e.year()<0||e.year()>9999?X(e,"YYYYYY-MM-DD[T]HH:mm:ss.SSS[Z]"):O(Date.prototype.toISOString)?this.toDate().toISOString():X(e,"YYYY-MM-DD[T]HH:mm:ss.SSS[Z]")}function fn(){if(!this.isValid())return"moment.invalid(/* "+this._i+" */)";var e="moment",t="";this.isLocal()||(e=0===this.utcOffset()?"moment.utc":"moment.parseZone",t="Z");var n="["+e+'("]',r=0<=this.year()&&this.year()<=9999?"YYYY":"YYYYYY",i="-MM-DD[T]HH:mm:ss.SSS",a=t+'[")]';return this.format(n+r+i+a)}function hn(e){e||(e=this.isUtc()?n.defaultFormatUtc:n.defaultFormat);var t=X(this,e);return this.localeData().postformat(t)}function pn(e,t){return this.isValid()&&(b(e)&&e.isValid()||kt(e).isValid())?Ut({to:this,from:e}).locale(this.locale()).humanize(!t):this.localeData().invalidDate()}function mn(e){return this.from(kt(),e)}function gn(e,t){return this.isValid()&&(b(e)&&e.isValid()||kt(e).isValid())?Ut({from:this,to:e}).locale(this.locale()).humanize(!t):this.localeData().invalidDate()}function vn(e){return this.to(kt(),e)}function yn(e){var t;return void 0===e?this._locale._abbr:(t=rt(e),null!=t&&(this._locale=t),this)}function wn(){return this._locale}function bn(e){switch(e=E(e)){case"year":this.month(0);case"quarter":case"month":this.date(1);case"week":case"isoWeek":case"day":case"date":this.hours(0);case"hour":this.minutes(0);case"minute":this.seconds(0);case"second":this.milliseconds(0)}return"week"===e&&this.weekday(0),"isoWeek"===e&&this.isoWeekday(1),"quarter"===e&&this.month(3*Math.floor(this.month()/3)),this}function kn(e){return e=E(e),void 0===e||"millisecond"===e?this:("date"===e&&(e="day"),this.startOf(e).add(1,"isoWeek"===e?"week":e).subtract(1,"ms"))}function xn(){return this._d.valueOf()-6e4*(this._offset||0)}function Dn(){return Math.floor(this.valueOf()/1e3)}function _n(){return new Date(this.valueOf())}function Sn(){var e=this;return[e.year(),e.month(),e.date(),e.hour(),e.minute(),e.second(),e.millisecond()]}function Cn(){var e=this;return{years:e.year(),months:e.month(),date:e.date(),hours:e.hours(),minutes:e.minutes(),seconds:e.seconds(),milliseconds:e.milliseconds()}}function On(){return this.isValid()?this.toISOString():null}function Tn(){return g(this)}function Mn(){return f({},m(this))}function Yn(){return m(this).overflow}function jn(){return{input:this._i,format:this._f,locale:this._locale,isUTC:this._isUTC,strict:this._strict}}function Pn(e,t){G(0,[e,e.length],0,t)}function Nn(e){return In.call(this,e,this.week(),this.weekday(),this.localeData()._week.dow,this.localeData()._week.doy)}function An(e){return In.call(this,e,this.isoWeek(),this.isoWeekday(),1,4)}function Fn(){return Se(this.year(),1,4)}function $n(){var e=this.localeData()._week;return Se(this.year(),e.dow,e.doy)}function In(e,t,n,r,i){var a;return null==e?_e(this,r,i).year:(a=Se(e,r,i),t>a&&(t=a),En.call(this,e,t,n,r,i))}function En(e,t,n,r,i){var a=De(e,t,n,r,i),o=ke(a.year,0,a.dayOfYear);return this.year(o.getUTCFullYear()),this.month(o.getUTCMonth()),this.date(o.getUTCDate()),this}function Ln(e){return null==e?Math.ceil((this.month()+1)/3):this.month(3*(e-1)+this.month()%3)}function Wn(e){var t=Math.round((this.clone().startOf("day")-this.clone().startOf("year"))/864e5)+1;return null==e?t:this.add(e-t,"d")}function Hn(e,t){t[hi]=x(1e3*("0."+e))}function zn(){return this._isUTC?"UTC":""}function Rn(){return this._isUTC?"Coordinated Universal Time":""}function qn(e){return kt(1e3*e)}function Vn(){return kt.apply(null,arguments).parseZone()}function Un(e){return e}function Bn(e,t,n,r){var i=rt(),a=h().set(r,t);return i[n](a,e)}function Gn(e,t,n){if(l(e)&&(t=e,e=void 0),e=e||"",null!=t)return Bn(e,t,n,"month");var r,i=[];for(r=0;r<12;r++)i[r]=Bn(e,r,n,"month");return i}function Zn(e,t,n,r){"boolean"==typeof e?(l(t)&&(n=t,t=void 0),t=t||""):(t=e,n=t,e=!1,l(t)&&(n=t,t=void 0),t=t||"");var i=rt(),a=e?i._week.dow:0;if(null!=n)return Bn(t,(n+a)%7,r,"day");var o,s=[];for(o=0;o<7;o++)s[o]=Bn(t,(o+a)%7,r,"day");return s}function Kn(e,t){return Gn(e,t,"months")}function Xn(e,t){return Gn(e,t,"monthsShort")}function Qn(e,t,n){return Zn(e,t,n,"weekdays")}function Jn(e,t,n){return Zn(e,t,n,"weekdaysShort")}function er(e,t,n){return Zn(e,t,n,"weekdaysMin")}function tr(){var e=this._data;return this._milliseconds=oa(this._milliseconds),this._days=oa(this._days),this._months=oa(this._months),e.milliseconds=oa(e.milliseconds),e.seconds=oa(e.seconds),e.minutes=oa(e.minutes),e.hours=oa(e.hours),e.months=oa(e.months),e.years=oa(e.years),this}function nr(e,t,n,r){var i=Ut(t,n);return e._milliseconds+=r*i._milliseconds,e._days+=r*i._days,e._months+=r*i._months,e._bubble()}function rr(e,t){return nr(this,e,t,1)}function ir(e,t){return nr(this,e,t,-1)}function ar(e){return e<0?Math.floor(e):Math.ceil(e)}function or(){var e,t,n,r,i,a=this._milliseconds,o=this._days,s=this._months,l=this._data;return a>=0&&o>=0&&s>=0||a<=0&&o<=0&&s<=0||(a+=864e5*ar(lr(s)+o),o=0,s=0),l.milliseconds=a%1e3,e=k(a/1e3),l.seconds=e%60,t=k(e/60),l.minutes=t%60,n=k(t/60),l.hours=n%24,o+=k(n/24),i=k(sr(o)),s+=i,o-=ar(lr(i)),r=k(s/12),s%=12,l.days=o,l.months=s,l.years=r,this}function sr(e){return 4800*e/146097}function lr(e){return 146097*e/4800}function ur(e){if(!this.isValid())return NaN;var t,n,r=this._milliseconds;if(e=E(e),"month"===e||"year"===e)return t=this._days+r/864e5,n=this._months+sr(t),"month"===e?n:n/12;switch(t=this._days+Math.round(lr(this._months)),e){case"week":return t/7+r/6048e5;case"day":return t+r/864e5;case"hour":return 24*t+r/36e5;case"minute":return 1440*t+r/6e4;case"second":return 86400*t+r/1e3;case"millisecond":return Math.floor(864e5*t)+r;default:throw new Error("Unknown unit "+e)}}function dr(){return this.isValid()?this._milliseconds+864e5*this._days+this._months%12*2592e6+31536e6*x(this._months/12):NaN}function cr(e){return function(){return this.as(e)}}function fr(e){return e=E(e),this.isValid()?this[e+"s"]():NaN}function hr(e){return function(){return this.isValid()?this._data[e]:NaN}}function pr(){return k(this.days()/7)}function mr(e,t,n,r,i){return i.relativeTime(t||1,!!n,e,r)}function gr(e,t,n){var r=Ut(e).abs(),i=xa(r.as("s")),a=xa(r.as("m")),o=xa(r.as("h")),s=xa(r.as("d")),l=xa(r.as("M")),u=xa(r.as("y")),d=i<=Da.ss&&["s",i]||i<Da.s&&["ss",i]||a<=1&&["m"]||a<Da.m&&["mm",a]||o<=1&&["h"]||o<Da.h&&["hh",o]||s<=1&&["d"]||s<Da.d&&["dd",s]||l<=1&&["M"]||l<Da.M&&["MM",l]||u<=1&&["y"]||["yy",u];return d[2]=t,d[3]=+e>0,d[4]=n,mr.apply(null,d)}function vr(e){return void 0===e?xa:"function"==typeof e&&(xa=e,!0)}function yr(e,t){return void 0!==Da[e]&&(void 0===t?Da[e]:(Da[e]=t,"s"===e&&(Da.ss=t-1),!0))}function wr(e){if(!this.isValid())return this.localeData().invalidDate();var t=this.localeData(),n=gr(this,!e,t);return e&&(n=t.pastFuture(+this,n)),t.postformat(n)}function br(){if(!this.isValid())return this.localeData().invalidDate();var e,t,n,r=_a(this._milliseconds)/1e3,i=_a(this._days),a=_a(this._months);e=k(r/60),t=k(e/60),r%=60,e%=60,n=k(a/12),a%=12;var o=n,s=a,l=i,u=t,d=e,c=r,f=this.asSeconds();return f?(f<0?"-":"")+"P"+(o?o+"Y":"")+(s?s+"M":"")+(l?l+"D":"")+(u||d||c?"T":"")+(u?u+"H":"")+(d?d+"M":"")+(c?c+"S":""):"P0D"}var kr,xr;xr=Array.prototype.some?Array.prototype.some:function(e){for(var t=Object(this),n=t.length>>>0,r=0;r<n;r++)if(r in t&&e.call(this,t[r],r,t))return!0;return!1};var Dr=xr,_r=n.momentProperties=[],Sr=!1,Cr={};n.suppressDeprecationWarnings=!1,n.deprecationHandler=null;var Or;Or=Object.keys?Object.keys:function(e){var t,n=[];for(t in e)c(e,t)&&n.push(t);return n};var Tr,Mr=Or,Yr={sameDay:"[Today at] LT",nextDay:"[Tomorrow at] LT",nextWeek:"dddd [at] LT",lastDay:"[Yesterday at] LT",lastWeek:"[Last] dddd [at] LT",sameElse:"L"},jr={LTS:"h:mm:ss A",LT:"h:mm A",L:"MM/DD/YYYY",LL:"MMMM D, YYYY",LLL:"MMMM D, YYYY h:mm A",LLLL:"dddd, MMMM D, YYYY h:mm A"},Pr="Invalid date",Nr="%d",Ar=/\d{1,2}/,Fr={future:"in %s",past:"%s ago",s:"a few seconds",ss:"%d seconds",m:"a minute",mm:"%d minutes",h:"an hour",hh:"%d hours",d:"a day",dd:"%d days",M:"a month",MM:"%d months",y:"a year",yy:"%d years"},$r={},Ir={},Er=/(\[[^\[]*\])|(\\)?([Hh]mm(ss)?|Mo|MM?M?M?|Do|DDDo|DD?D?D?|ddd?d?|do?|w[o|w]?|W[o|W]?|Qo?|YYYYYY|YYYYY|YYYY|YY|gg(ggg?)?|GG(GGG?)?|e|E|a|A|hh?|HH?|kk?|mm?|ss?|S{1,9}|x|X|zz?|ZZ?|.)/g,Lr=/(\[[^\[]*\])|(\\)?(LTS|LT|LL?L?L?|l{1,4})/g,Wr={},Hr={},zr=/\d/,Rr=/\d\d/,qr=/\d{3}/,Vr=/\d{4}/,Ur=/[+-]?\d{6}/,Br=/\d\d?/,Gr=/\d\d\d\d?/,Zr=/\d\d\d\d\d\d?/,Kr=/\d{1,3}/,Xr=/\d{1,4}/,Qr=/[+-]?\d{1,6}/,Jr=/\d+/,ei=/[+-]?\d+/,ti=/Z|[+-]\d\d:?\d\d/gi,ni=/Z|[+-]\d\d(?::?\d\d)?/gi,ri=/[+-]?\d+(\.\d{1,3})?/,ii=/[0-9]*['a-z\u00A0-\u05FF\u0700-\uD7FF\uF900-\uFDCF\uFDF0-\uFFEF]+|[\u0600-\u06FF\/]+(\s*?[\u0600-\u06FF]+){1,2}/i,ai={},oi={},si=0,li=1,ui=2,di=3,ci=4,fi=5,hi=6,pi=7,mi=8;Tr=Array.prototype.indexOf?Array.prototype.indexOf:function(e){var t;for(t=0;t<this.length;++t)if(this[t]===e)return t;return-1};var gi=Tr;G("M",["MM",2],"Mo",function(){return this.month()+1}),G("MMM",0,0,function(e){return this.localeData().monthsShort(this,e)}),G("MMMM",0,0,function(e){return this.localeData().months(this,e)}),I("month","M"),W("month",8),J("M",Br),J("MM",Br,Rr),J("MMM",function(e,t){return t.monthsShortRegex(e)}),J("MMMM",function(e,t){return t.monthsRegex(e)}),re(["M","MM"],function(e,t){t[li]=x(e)-1}),re(["MMM","MMMM"],function(e,t,n,r){var i=n._locale.monthsParse(e,r,n._strict);null!=i?t[li]=i:m(n).invalidMonth=e});var vi=/D[oD]?(\[[^\[\]]*\]|\s)+MMMM?/,yi="January_February_March_April_May_June_July_August_September_October_November_December".split("_"),wi="Jan_Feb_Mar_Apr_May_Jun_Jul_Aug_Sep_Oct_Nov_Dec".split("_"),bi=ii,ki=ii;G("Y",0,0,function(){var e=this.year();return e<=9999?""+e:"+"+e}),G(0,["YY",2],0,function(){return this.year()%100}),G(0,["YYYY",4],0,"year"),G(0,["YYYYY",5],0,"year"),G(0,["YYYYYY",6,!0],0,"year"),I("year","y"),W("year",1),J("Y",ei),J("YY",Br,Rr),J("YYYY",Xr,Vr),J("YYYYY",Qr,Ur),J("YYYYYY",Qr,Ur),re(["YYYYY","YYYYYY"],si),re("YYYY",function(e,t){t[si]=2===e.length?n.parseTwoDigitYear(e):x(e)}),re("YY",function(e,t){t[si]=n.parseTwoDigitYear(e)}),re("Y",function(e,t){t[si]=parseInt(e,10)}),n.parseTwoDigitYear=function(e){return x(e)+(x(e)>68?1900:2e3)};var xi=z("FullYear",!0);G("w",["ww",2],"wo","week"),G("W",["WW",2],"Wo","isoWeek"),I("week","w"),I("isoWeek","W"),W("week",5),W("isoWeek",5),J("w",Br),J("ww",Br,Rr),J("W",Br),J("WW",Br,Rr),ie(["w","ww","W","WW"],function(e,t,n,r){t[r.substr(0,1)]=x(e)});var Di={dow:0,doy:6};G("d",0,"do","day"),G("dd",0,0,function(e){return this.localeData().weekdaysMin(this,e)}),G("ddd",0,0,function(e){return this.localeData().weekdaysShort(this,e)}),G("dddd",0,0,function(e){return this.localeData().weekdays(this,e)}),G("e",0,0,"weekday"),G("E",0,0,"isoWeekday"),I("day","d"),I("weekday","e"),
 I("isoWeekday","E"),W("day",11),W("weekday",11),W("isoWeekday",11),J("d",Br),J("e",Br),J("E",Br),J("dd",function(e,t){return t.weekdaysMinRegex(e)}),J("ddd",function(e,t){return t.weekdaysShortRegex(e)}),J("dddd",function(e,t){return t.weekdaysRegex(e)}),ie(["dd","ddd","dddd"],function(e,t,n,r){var i=n._locale.weekdaysParse(e,r,n._strict);null!=i?t.d=i:m(n).invalidWeekday=e}),ie(["d","e","E"],function(e,t,n,r){t[r]=x(e)});var _i="Sunday_Monday_Tuesday_Wednesday_Thursday_Friday_Saturday".split("_"),Si="Sun_Mon_Tue_Wed_Thu_Fri_Sat".split("_"),Ci="Su_Mo_Tu_We_Th_Fr_Sa".split("_"),Oi=ii,Ti=ii,Mi=ii;G("H",["HH",2],0,"hour"),G("h",["hh",2],0,Ve),G("k",["kk",2],0,Ue),G("hmm",0,0,function(){return""+Ve.apply(this)+B(this.minutes(),2)}),G("hmmss",0,0,function(){return""+Ve.apply(this)+B(this.minutes(),2)+B(this.seconds(),2)}),G("Hmm",0,0,function(){return""+this.hours()+B(this.minutes(),2)}),G("Hmmss",0,0,function(){return""+this.hours()+B(this.minutes(),2)+B(this.seconds(),2)}),Be("a",!0),Be("A",!1),I("hour","h"),W("hour",13),J("a",Ge),J("A",Ge),J("H",Br),J("h",Br),J("k",Br),J("HH",Br,Rr),J("hh",Br,Rr),J("kk",Br,Rr),J("hmm",Gr),J("hmmss",Zr),J("Hmm",Gr),J("Hmmss",Zr),re(["H","HH"],di),re(["k","kk"],function(e,t,n){var r=x(e);t[di]=24===r?0:r}),re(["a","A"],function(e,t,n){n._isPm=n._locale.isPM(e),n._meridiem=e}),re(["h","hh"],function(e,t,n){t[di]=x(e),m(n).bigHour=!0}),re("hmm",function(e,t,n){var r=e.length-2;t[di]=x(e.substr(0,r)),t[ci]=x(e.substr(r)),m(n).bigHour=!0}),re("hmmss",function(e,t,n){var r=e.length-4,i=e.length-2;t[di]=x(e.substr(0,r)),t[ci]=x(e.substr(r,2)),t[fi]=x(e.substr(i)),m(n).bigHour=!0}),re("Hmm",function(e,t,n){var r=e.length-2;t[di]=x(e.substr(0,r)),t[ci]=x(e.substr(r))}),re("Hmmss",function(e,t,n){var r=e.length-4,i=e.length-2;t[di]=x(e.substr(0,r)),t[ci]=x(e.substr(r,2)),t[fi]=x(e.substr(i))});var Yi,ji=/[ap]\.?m?\.?/i,Pi=z("Hours",!0),Ni={calendar:Yr,longDateFormat:jr,invalidDate:Pr,ordinal:Nr,dayOfMonthOrdinalParse:Ar,relativeTime:Fr,months:yi,monthsShort:wi,week:Di,weekdays:_i,weekdaysMin:Ci,weekdaysShort:Si,meridiemParse:ji},Ai={},Fi={},$i=/^\s*((?:[+-]\d{6}|\d{4})-(?:\d\d-\d\d|W\d\d-\d|W\d\d|\d\d\d|\d\d))(?:(T| )(\d\d(?::\d\d(?::\d\d(?:[.,]\d+)?)?)?)([\+\-]\d\d(?::?\d\d)?|\s*Z)?)?$/,Ii=/^\s*((?:[+-]\d{6}|\d{4})(?:\d\d\d\d|W\d\d\d|W\d\d|\d\d\d|\d\d))(?:(T| )(\d\d(?:\d\d(?:\d\d(?:[.,]\d+)?)?)?)([\+\-]\d\d(?::?\d\d)?|\s*Z)?)?$/,Ei=/Z|[+-]\d\d(?::?\d\d)?/,Li=[["YYYYYY-MM-DD",/[+-]\d{6}-\d\d-\d\d/],["YYYY-MM-DD",/\d{4}-\d\d-\d\d/],["GGGG-[W]WW-E",/\d{4}-W\d\d-\d/],["GGGG-[W]WW",/\d{4}-W\d\d/,!1],["YYYY-DDD",/\d{4}-\d{3}/],["YYYY-MM",/\d{4}-\d\d/,!1],["YYYYYYMMDD",/[+-]\d{10}/],["YYYYMMDD",/\d{8}/],["GGGG[W]WWE",/\d{4}W\d{3}/],["GGGG[W]WW",/\d{4}W\d{2}/,!1],["YYYYDDD",/\d{7}/]],Wi=[["HH:mm:ss.SSSS",/\d\d:\d\d:\d\d\.\d+/],["HH:mm:ss,SSSS",/\d\d:\d\d:\d\d,\d+/],["HH:mm:ss",/\d\d:\d\d:\d\d/],["HH:mm",/\d\d:\d\d/],["HHmmss.SSSS",/\d\d\d\d\d\d\.\d+/],["HHmmss,SSSS",/\d\d\d\d\d\d,\d+/],["HHmmss",/\d\d\d\d\d\d/],["HHmm",/\d\d\d\d/],["HH",/\d\d/]],Hi=/^\/?Date\((\-?\d+)/i,zi=/^((?:Mon|Tue|Wed|Thu|Fri|Sat|Sun),?\s)?(\d?\d\s(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s(?:\d\d)?\d\d\s)(\d\d:\d\d)(\:\d\d)?(\s(?:UT|GMT|[ECMP][SD]T|[A-IK-Za-ik-z]|[+-]\d{4}))$/;n.createFromInputFallback=S("value provided is not in a recognized RFC2822 or ISO format. moment construction falls back to js Date(), which is not reliable across all browsers and versions. Non RFC2822/ISO date formats are discouraged and will be removed in an upcoming major release. Please refer to http://momentjs.com/guides/#/warnings/js-date/ for more info.",function(e){e._d=new Date(e._i+(e._useUTC?" UTC":""))}),n.ISO_8601=function(){},n.RFC_2822=function(){};var Ri=S("moment().min is deprecated, use moment.max instead. http://momentjs.com/guides/#/warnings/min-max/",function(){var e=kt.apply(null,arguments);return this.isValid()&&e.isValid()?e<this?this:e:v()}),qi=S("moment().max is deprecated, use moment.min instead. http://momentjs.com/guides/#/warnings/min-max/",function(){var e=kt.apply(null,arguments);return this.isValid()&&e.isValid()?e>this?this:e:v()}),Vi=function(){return Date.now?Date.now():+new Date},Ui=["year","quarter","month","week","day","hour","minute","second","millisecond"];jt("Z",":"),jt("ZZ",""),J("Z",ni),J("ZZ",ni),re(["Z","ZZ"],function(e,t,n){n._useUTC=!0,n._tzm=Pt(ni,e)});var Bi=/([\+\-]|\d\d)/gi;n.updateOffset=function(){};var Gi=/^(\-)?(?:(\d*)[. ])?(\d+)\:(\d+)(?:\:(\d+)(\.\d*)?)?$/,Zi=/^(-)?P(?:(-?[0-9,.]*)Y)?(?:(-?[0-9,.]*)M)?(?:(-?[0-9,.]*)W)?(?:(-?[0-9,.]*)D)?(?:T(?:(-?[0-9,.]*)H)?(?:(-?[0-9,.]*)M)?(?:(-?[0-9,.]*)S)?)?$/;Ut.fn=Tt.prototype,Ut.invalid=Ot;var Ki=Kt(1,"add"),Xi=Kt(-1,"subtract");n.defaultFormat="YYYY-MM-DDTHH:mm:ssZ",n.defaultFormatUtc="YYYY-MM-DDTHH:mm:ss[Z]";var Qi=S("moment().lang() is deprecated. Instead, use moment().localeData() to get the language configuration. Use moment().locale() to change languages.",function(e){return void 0===e?this.localeData():this.locale(e)});G(0,["gg",2],0,function(){return this.weekYear()%100}),G(0,["GG",2],0,function(){return this.isoWeekYear()%100}),Pn("gggg","weekYear"),Pn("ggggg","weekYear"),Pn("GGGG","isoWeekYear"),Pn("GGGGG","isoWeekYear"),I("weekYear","gg"),I("isoWeekYear","GG"),W("weekYear",1),W("isoWeekYear",1),J("G",ei),J("g",ei),J("GG",Br,Rr),J("gg",Br,Rr),J("GGGG",Xr,Vr),J("gggg",Xr,Vr),J("GGGGG",Qr,Ur),J("ggggg",Qr,Ur),ie(["gggg","ggggg","GGGG","GGGGG"],function(e,t,n,r){t[r.substr(0,2)]=x(e)}),ie(["gg","GG"],function(e,t,r,i){t[i]=n.parseTwoDigitYear(e)}),G("Q",0,"Qo","quarter"),I("quarter","Q"),W("quarter",7),J("Q",zr),re("Q",function(e,t){t[li]=3*(x(e)-1)}),G("D",["DD",2],"Do","date"),I("date","D"),W("date",9),J("D",Br),J("DD",Br,Rr),J("Do",function(e,t){return e?t._dayOfMonthOrdinalParse||t._ordinalParse:t._dayOfMonthOrdinalParseLenient}),re(["D","DD"],ui),re("Do",function(e,t){t[ui]=x(e.match(Br)[0],10)});var Ji=z("Date",!0);G("DDD",["DDDD",3],"DDDo","dayOfYear"),I("dayOfYear","DDD"),W("dayOfYear",4),J("DDD",Kr),J("DDDD",qr),re(["DDD","DDDD"],function(e,t,n){n._dayOfYear=x(e)}),G("m",["mm",2],0,"minute"),I("minute","m"),W("minute",14),J("m",Br),J("mm",Br,Rr),re(["m","mm"],ci);var ea=z("Minutes",!1);G("s",["ss",2],0,"second"),I("second","s"),W("second",15),J("s",Br),J("ss",Br,Rr),re(["s","ss"],fi);var ta=z("Seconds",!1);G("S",0,0,function(){return~~(this.millisecond()/100)}),G(0,["SS",2],0,function(){return~~(this.millisecond()/10)}),G(0,["SSS",3],0,"millisecond"),G(0,["SSSS",4],0,function(){return 10*this.millisecond()}),G(0,["SSSSS",5],0,function(){return 100*this.millisecond()}),G(0,["SSSSSS",6],0,function(){return 1e3*this.millisecond()}),G(0,["SSSSSSS",7],0,function(){return 1e4*this.millisecond()}),G(0,["SSSSSSSS",8],0,function(){return 1e5*this.millisecond()}),G(0,["SSSSSSSSS",9],0,function(){return 1e6*this.millisecond()}),I("millisecond","ms"),W("millisecond",16),J("S",Kr,zr),J("SS",Kr,Rr),J("SSS",Kr,qr);var na;for(na="SSSS";na.length<=9;na+="S")J(na,Jr);for(na="S";na.length<=9;na+="S")re(na,Hn);var ra=z("Milliseconds",!1);G("z",0,0,"zoneAbbr"),G("zz",0,0,"zoneName");var ia=w.prototype;ia.add=Ki,ia.calendar=Jt,ia.clone=en,ia.diff=ln,ia.endOf=kn,ia.format=hn,ia.from=pn,ia.fromNow=mn,ia.to=gn,ia.toNow=vn,ia.get=V,ia.invalidAt=Yn,ia.isAfter=tn,ia.isBefore=nn,ia.isBetween=rn,ia.isSame=an,ia.isSameOrAfter=on,ia.isSameOrBefore=sn,ia.isValid=Tn,ia.lang=Qi,ia.locale=yn,ia.localeData=wn,ia.max=qi,ia.min=Ri,ia.parsingFlags=Mn,ia.set=U,ia.startOf=bn,ia.subtract=Xi,ia.toArray=Sn,ia.toObject=Cn,ia.toDate=_n,ia.toISOString=cn,ia.inspect=fn,ia.toJSON=On,ia.toString=dn,ia.unix=Dn,ia.valueOf=xn,ia.creationData=jn,ia.year=xi,ia.isLeapYear=we,ia.weekYear=Nn,ia.isoWeekYear=An,ia.quarter=ia.quarters=Ln,ia.month=fe,ia.daysInMonth=he,ia.week=ia.weeks=Me,ia.isoWeek=ia.isoWeeks=Ye,ia.weeksInYear=$n,ia.isoWeeksInYear=Fn,ia.date=Ji,ia.day=ia.days=Ee,ia.weekday=Le,ia.isoWeekday=We,ia.dayOfYear=Wn,ia.hour=ia.hours=Pi,ia.minute=ia.minutes=ea,ia.second=ia.seconds=ta,ia.millisecond=ia.milliseconds=ra,ia.utcOffset=Ft,ia.utc=It,ia.local=Et,ia.parseZone=Lt,ia.hasAlignedHourOffset=Wt,ia.isDST=Ht,ia.isLocal=Rt,ia.isUtcOffset=qt,ia.isUtc=Vt,ia.isUTC=Vt,ia.zoneAbbr=zn,ia.zoneName=Rn,ia.dates=S("dates accessor is deprecated. Use date instead.",Ji),ia.months=S("months accessor is deprecated. Use month instead",fe),ia.years=S("years accessor is deprecated. Use year instead",xi),ia.zone=S("moment().zone is deprecated, use moment().utcOffset instead. http://momentjs.com/guides/#/warnings/zone/",$t),ia.isDSTShifted=S("isDSTShifted is deprecated. See http://momentjs.com/guides/#/warnings/dst-shifted/ for more information",zt);var aa=Y.prototype;aa.calendar=j,aa.longDateFormat=P,aa.invalidDate=N,aa.ordinal=A,aa.preparse=Un,aa.postformat=Un,aa.relativeTime=F,aa.pastFuture=$,aa.set=T,aa.months=se,aa.monthsShort=le,aa.monthsParse=de,aa.monthsRegex=me,aa.monthsShortRegex=pe,aa.week=Ce,aa.firstDayOfYear=Te,aa.firstDayOfWeek=Oe,aa.weekdays=Ne,aa.weekdaysMin=Fe,aa.weekdaysShort=Ae,aa.weekdaysParse=Ie,aa.weekdaysRegex=He,aa.weekdaysShortRegex=ze,aa.weekdaysMinRegex=Re,aa.isPM=Ze,aa.meridiem=Ke,et("en",{dayOfMonthOrdinalParse:/\d{1,2}(th|st|nd|rd)/,ordinal:function(e){var t=e%10,n=1===x(e%100/10)?"th":1===t?"st":2===t?"nd":3===t?"rd":"th";return e+n}}),n.lang=S("moment.lang is deprecated. Use moment.locale instead.",et),n.langData=S("moment.langData is deprecated. Use moment.localeData instead.",rt);var oa=Math.abs,sa=cr("ms"),la=cr("s"),ua=cr("m"),da=cr("h"),ca=cr("d"),fa=cr("w"),ha=cr("M"),pa=cr("y"),ma=hr("milliseconds"),ga=hr("seconds"),va=hr("minutes"),ya=hr("hours"),wa=hr("days"),ba=hr("months"),ka=hr("years"),xa=Math.round,Da={ss:44,s:45,m:45,h:22,d:26,M:11},_a=Math.abs,Sa=Tt.prototype;return Sa.isValid=Ct,Sa.abs=tr,Sa.add=rr,Sa.subtract=ir,Sa.as=ur,Sa.asMilliseconds=sa,Sa.asSeconds=la,Sa.asMinutes=ua,Sa.asHours=da,Sa.asDays=ca,Sa.asWeeks=fa,Sa.asMonths=ha,Sa.asYears=pa,Sa.valueOf=dr,Sa._bubble=or,Sa.get=fr,Sa.milliseconds=ma,Sa.seconds=ga,Sa.minutes=va,Sa.hours=ya,Sa.days=wa,Sa.weeks=pr,Sa.months=ba,Sa.years=ka,Sa.humanize=wr,Sa.toISOString=br,Sa.toString=br,Sa.toJSON=br,Sa.locale=yn,Sa.localeData=wn,Sa.toIsoString=S("toIsoString() is deprecated. Please use toISOString() instead (notice the capitals)",br),Sa.lang=Qi,G("X",0,0,"unix"),G("x",0,0,"valueOf"),J("x",ei),J("X",ri),re("X",function(e,t,n){n._d=new Date(1e3*parseFloat(e,10))}),re("x",function(e,t,n){n._d=new Date(x(e))}),n.version="2.18.1",r(kt),n.fn=ia,n.min=Dt,n.max=_t,n.now=Vi,n.utc=h,n.unix=qn,n.months=Kn,n.isDate=u,n.locale=et,n.invalid=v,n.duration=Ut,n.isMoment=b,n.weekdays=Qn,n.parseZone=Vn,n.localeData=rt,n.isDuration=Mt,n.monthsShort=Xn,n.weekdaysMin=er,n.defineLocale=tt,n.updateLocale=nt,n.locales=it,n.weekdaysShort=Jn,n.normalizeUnits=E,n.relativeTimeRounding=vr,n.relativeTimeThreshold=yr,n.calendarFormat=Qt,n.prototype=ia,n})},{}],4:[function(e,t,n){!function(r,i){"function"==typeof define&&define.amd?define(["jquery","sifter","microplugin"],i):"object"==typeof n?t.exports=i(e("jquery"),e("sifter"),e("microplugin")):r.Selectize=i(r.jQuery,r.Sifter,r.MicroPlugin)}(this,function(e,t,n){"use strict";var r=function(e,t){if("string"!=typeof t||t.length){var n="string"==typeof t?new RegExp(t,"i"):t,r=function(e){var t=0;if(3===e.nodeType){var i=e.data.search(n);if(i>=0&&e.data.length>0){var a=e.data.match(n),o=document.createElement("span");o.className="highlight";var s=e.splitText(i),l=(s.splitText(a[0].length),s.cloneNode(!0));o.appendChild(l),s.parentNode.replaceChild(o,s),t=1}}else if(1===e.nodeType&&e.childNodes&&!/(script|style)/i.test(e.tagName))for(var u=0;u<e.childNodes.length;++u)u+=r(e.childNodes[u]);return t};return e.each(function(){r(this)})}};e.fn.removeHighlight=function(){return this.find("span.highlight").each(function(){this.parentNode.firstChild.nodeName;var e=this.parentNode;e.replaceChild(this.firstChild,this),e.normalize()}).end()};var i=function(){};i.prototype={on:function(e,t){this._events=this._events||{},this._events[e]=this._events[e]||[],this._events[e].push(t)},off:function(e,t){var n=arguments.length;return 0===n?delete this._events:1===n?delete this._events[e]:(this._events=this._events||{},void(e in this._events!=!1&&this._events[e].splice(this._events[e].indexOf(t),1)))},trigger:function(e){if(this._events=this._events||{},e in this._events!=!1)for(var t=0;t<this._events[e].length;t++)this._events[e][t].apply(this,Array.prototype.slice.call(arguments,1))}},i.mixin=function(e){for(var t=["on","off","trigger"],n=0;n<t.length;n++)e.prototype[t[n]]=i.prototype[t[n]]};var a=/Mac/.test(navigator.userAgent),o=65,s=13,l=27,u=37,d=38,c=80,f=39,h=40,p=78,m=8,g=46,v=16,y=a?91:17,w=a?18:17,b=9,k=1,x=2,D=!/android/i.test(window.navigator.userAgent)&&!!document.createElement("input").validity,_=function(e){return"undefined"!=typeof e},S=function(e){return"undefined"==typeof e||null===e?null:"boolean"==typeof e?e?"1":"0":e+""},C=function(e){return(e+"").replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/>/g,"&gt;").replace(/"/g,"&quot;")},O={};O.before=function(e,t,n){var r=e[t];e[t]=function(){return n.apply(e,arguments),r.apply(e,arguments)}},O.after=function(e,t,n){var r=e[t];e[t]=function(){var t=r.apply(e,arguments);return n.apply(e,arguments),t}};var T=function(e){var t=!1;return function(){t||(t=!0,e.apply(this,arguments))}},M=function(e,t){var n;return function(){var r=this,i=arguments;window.clearTimeout(n),n=window.setTimeout(function(){e.apply(r,i)},t)}},Y=function(e,t,n){var r,i=e.trigger,a={};e.trigger=function(){var n=arguments[0];return t.indexOf(n)===-1?i.apply(e,arguments):void(a[n]=arguments)},n.apply(e,[]),e.trigger=i;for(r in a)a.hasOwnProperty(r)&&i.apply(e,a[r])},j=function(e,t,n,r){e.on(t,n,function(t){for(var n=t.target;n&&n.parentNode!==e[0];)n=n.parentNode;return t.currentTarget=n,r.apply(this,[t])})},P=function(e){var t={};if("selectionStart"in e)t.start=e.selectionStart,t.length=e.selectionEnd-t.start;else if(document.selection){e.focus();var n=document.selection.createRange(),r=document.selection.createRange().text.length;n.moveStart("character",-e.value.length),t.start=n.text.length-r,t.length=r}return t},N=function(e,t,n){var r,i,a={};if(n)for(r=0,i=n.length;r<i;r++)a[n[r]]=e.css(n[r]);else a=e.css();t.css(a)},A=function(t,n){if(!t)return 0;var r=e("<test>").css({position:"absolute",top:-99999,left:-99999,width:"auto",padding:0,whiteSpace:"pre"}).text(t).appendTo("body");N(n,r,["letterSpacing","fontSize","fontFamily","fontWeight","textTransform"]);var i=r.width();return r.remove(),i},F=function(e){var t=null,n=function(n,r){var i,a,o,s,l,u,d,c;n=n||window.event||{},r=r||{},n.metaKey||n.altKey||(r.force||e.data("grow")!==!1)&&(i=e.val(),n.type&&"keydown"===n.type.toLowerCase()&&(a=n.keyCode,o=a>=97&&a<=122||a>=65&&a<=90||a>=48&&a<=57||32===a,a===g||a===m?(c=P(e[0]),c.length?i=i.substring(0,c.start)+i.substring(c.start+c.length):a===m&&c.start?i=i.substring(0,c.start-1)+i.substring(c.start+1):a===g&&"undefined"!=typeof c.start&&(i=i.substring(0,c.start)+i.substring(c.start+1))):o&&(u=n.shiftKey,d=String.fromCharCode(n.keyCode),d=u?d.toUpperCase():d.toLowerCase(),i+=d)),s=e.attr("placeholder"),!i&&s&&(i=s),l=A(i,e)+4,l!==t&&(t=l,e.width(l),e.triggerHandler("resize")))};e.on("keydown keyup update blur",n),n()},$=function(e){var t=document.createElement("div");return t.appendChild(e.cloneNode(!0)),t.innerHTML},I=function(e,t){t||(t={});var n="Selectize";console.error(n+": "+e),t.explanation&&(console.group&&console.group(),console.error(t.explanation),console.group&&console.groupEnd())},E=function(n,r){var i,a,o,s,l=this;s=n[0],s.selectize=l;var u=window.getComputedStyle&&window.getComputedStyle(s,null);if(o=u?u.getPropertyValue("direction"):s.currentStyle&&s.currentStyle.direction,o=o||n.parents("[dir]:first").attr("dir")||"",e.extend(l,{order:0,settings:r,$input:n,tabIndex:n.attr("tabindex")||"",tagType:"select"===s.tagName.toLowerCase()?k:x,rtl:/rtl/i.test(o),eventNS:".selectize"+ ++E.count,highlightedValue:null,isOpen:!1,isDisabled:!1,isRequired:n.is("[required]"),isInvalid:!1,isLocked:!1,isFocused:!1,isInputHidden:!1,isSetup:!1,isShiftDown:!1,isCmdDown:!1,isCtrlDown:!1,ignoreFocus:!1,ignoreBlur:!1,ignoreHover:!1,hasOptions:!1,currentResults:null,lastValue:"",caretPos:0,loading:0,loadedSearches:{},$activeOption:null,$activeItems:[],optgroups:{},options:{},userOptions:{},items:[],renderCache:{},onSearchChange:null===r.loadThrottle?l.onSearchChange:M(l.onSearchChange,r.loadThrottle)}),l.sifter=new t(this.options,{diacritics:r.diacritics}),l.settings.options){for(i=0,a=l.settings.options.length;i<a;i++)l.registerOption(l.settings.options[i]);delete l.settings.options}if(l.settings.optgroups){for(i=0,a=l.settings.optgroups.length;i<a;i++)l.registerOptionGroup(l.settings.optgroups[i]);delete l.settings.optgroups}l.settings.mode=l.settings.mode||(1===l.settings.maxItems?"single":"multi"),"boolean"!=typeof l.settings.hideSelected&&(l.settings.hideSelected="multi"===l.settings.mode),l.initializePlugins(l.settings.plugins),l.setupCallbacks(),l.setupTemplates(),l.setup()};return i.mixin(E),"undefined"!=typeof n?n.mixin(E):I("Dependency MicroPlugin is missing",{explanation:'Make sure you either: (1) are using the "standalone" version of Selectize, or (2) require MicroPlugin before you load Selectize.'}),e.extend(E.prototype,{setup:function(){var t,n,r,i,o,s,l,u,d,c,f=this,h=f.settings,p=f.eventNS,m=e(window),g=e(document),b=f.$input;if(l=f.settings.mode,u=b.attr("class")||"",t=e("<div>").addClass(h.wrapperClass).addClass(u).addClass(l),n=e("<div>").addClass(h.inputClass).addClass("items").appendTo(t),r=e('<input type="text" autocomplete="off" />').appendTo(n).attr("tabindex",b.is(":disabled")?"-1":f.tabIndex),s=e(h.dropdownParent||t),i=e("<div>").addClass(h.dropdownClass).addClass(l).hide().appendTo(s),o=e("<div>").addClass(h.dropdownContentClass).appendTo(i),(c=b.attr("id"))&&(r.attr("id",c+"-selectized"),e("label[for='"+c+"']").attr("for",c+"-selectized")),f.settings.copyClassesToDropdown&&i.addClass(u),t.css({width:b[0].style.width}),f.plugins.names.length&&(d="plugin-"+f.plugins.names.join(" plugin-"),t.addClass(d),i.addClass(d)),(null===h.maxItems||h.maxItems>1)&&f.tagType===k&&b.attr("multiple","multiple"),f.settings.placeholder&&r.attr("placeholder",h.placeholder),!f.settings.splitOn&&f.settings.delimiter){var x=f.settings.delimiter.replace(/[-\/\\^$*+?.()|[\]{}]/g,"\\$&");f.settings.splitOn=new RegExp("\\s*"+x+"+\\s*")}b.attr("autocorrect")&&r.attr("autocorrect",b.attr("autocorrect")),b.attr("autocapitalize")&&r.attr("autocapitalize",b.attr("autocapitalize")),f.$wrapper=t,f.$control=n,f.$control_input=r,f.$dropdown=i,f.$dropdown_content=o,i.on("mouseenter","[data-selectable]",function(){return f.onOptionHover.apply(f,arguments)}),i.on("mousedown click","[data-selectable]",function(){return f.onOptionSelect.apply(f,arguments)}),j(n,"mousedown","*:not(input)",function(){return f.onItemSelect.apply(f,arguments)}),F(r),n.on({mousedown:function(){return f.onMouseDown.apply(f,arguments)},click:function(){return f.onClick.apply(f,arguments)}}),r.on({mousedown:function(e){e.stopPropagation()},keydown:function(){return f.onKeyDown.apply(f,arguments)},keyup:function(){return f.onKeyUp.apply(f,arguments)},keypress:function(){return f.onKeyPress.apply(f,arguments)},resize:function(){f.positionDropdown.apply(f,[])},blur:function(){return f.onBlur.apply(f,arguments)},focus:function(){return f.ignoreBlur=!1,f.onFocus.apply(f,arguments)},paste:function(){return f.onPaste.apply(f,arguments)}}),g.on("keydown"+p,function(e){f.isCmdDown=e[a?"metaKey":"ctrlKey"],f.isCtrlDown=e[a?"altKey":"ctrlKey"],f.isShiftDown=e.shiftKey}),g.on("keyup"+p,function(e){e.keyCode===w&&(f.isCtrlDown=!1),e.keyCode===v&&(f.isShiftDown=!1),e.keyCode===y&&(f.isCmdDown=!1)}),g.on("mousedown"+p,function(e){if(f.isFocused){if(e.target===f.$dropdown[0]||e.target.parentNode===f.$dropdown[0])return!1;f.$control.has(e.target).length||e.target===f.$control[0]||f.blur(e.target)}}),m.on(["scroll"+p,"resize"+p].join(" "),function(){f.isOpen&&f.positionDropdown.apply(f,arguments)}),m.on("mousemove"+p,function(){f.ignoreHover=!1}),this.revertSettings={$children:b.children().detach(),tabindex:b.attr("tabindex")},b.attr("tabindex",-1).hide().after(f.$wrapper),e.isArray(h.items)&&(f.setValue(h.items),delete h.items),D&&b.on("invalid"+p,function(e){e.preventDefault(),f.isInvalid=!0,f.refreshState()}),f.updateOriginalInput(),f.refreshItems(),f.refreshState(),f.updatePlaceholder(),f.isSetup=!0,b.is(":disabled")&&f.disable(),f.on("change",this.onChange),b.data("selectize",f),b.addClass("selectized"),f.trigger("initialize"),h.preload===!0&&f.onSearchChange("")},setupTemplates:function(){var t=this,n=t.settings.labelField,r=t.settings.optgroupLabelField,i={optgroup:function(e){return'<div class="optgroup">'+e.html+"</div>"},optgroup_header:function(e,t){return'<div class="optgroup-header">'+t(e[r])+"</div>"},option:function(e,t){return'<div class="option">'+t(e[n])+"</div>"},item:function(e,t){return'<div class="item">'+t(e[n])+"</div>"},option_create:function(e,t){return'<div class="create">Add <strong>'+t(e.input)+"</strong>&hellip;</div>"}};t.settings.render=e.extend({},i,t.settings.render)},setupCallbacks:function(){var e,t,n={initialize:"onInitialize",change:"onChange",item_add:"onItemAdd",item_remove:"onItemRemove",clear:"onClear",option_add:"onOptionAdd",option_remove:"onOptionRemove",option_clear:"onOptionClear",optgroup_add:"onOptionGroupAdd",optgroup_remove:"onOptionGroupRemove",optgroup_clear:"onOptionGroupClear",dropdown_open:"onDropdownOpen",dropdown_close:"onDropdownClose",type:"onType",load:"onLoad",focus:"onFocus",blur:"onBlur"};for(e in n)n.hasOwnProperty(e)&&(t=this.settings[n[e]],t&&this.on(e,t))},onClick:function(e){var t=this;t.isFocused||(t.focus(),e.preventDefault())},onMouseDown:function(t){var n=this,r=t.isDefaultPrevented();e(t.target);if(n.isFocused){if(t.target!==n.$control_input[0])return"single"===n.settings.mode?n.isOpen?n.close():n.open():r||n.setActiveItem(null),!1}else r||window.setTimeout(function(){n.focus()},0)},onChange:function(){this.$input.trigger("change")},onPaste:function(t){var n=this;return n.isFull()||n.isInputHidden||n.isLocked?void t.preventDefault():void(n.settings.splitOn&&setTimeout(function(){var t=n.$control_input.val();if(t.match(n.settings.splitOn))for(var r=e.trim(t).split(n.settings.splitOn),i=0,a=r.length;i<a;i++)n.createItem(r[i])},0))},onKeyPress:function(e){if(this.isLocked)return e&&e.preventDefault();var t=String.fromCharCode(e.keyCode||e.which);return this.settings.create&&"multi"===this.settings.mode&&t===this.settings.delimiter?(this.createItem(),e.preventDefault(),!1):void 0},onKeyDown:function(e){var t=(e.target===this.$control_input[0],this);if(t.isLocked)return void(e.keyCode!==b&&e.preventDefault());switch(e.keyCode){case o:if(t.isCmdDown)return void t.selectAll();break;case l:return void(t.isOpen&&(e.preventDefault(),e.stopPropagation(),t.close()));case p:if(!e.ctrlKey||e.altKey)break;case h:if(!t.isOpen&&t.hasOptions)t.open();else if(t.$activeOption){t.ignoreHover=!0;var n=t.getAdjacentOption(t.$activeOption,1);n.length&&t.setActiveOption(n,!0,!0)}return void e.preventDefault();case c:if(!e.ctrlKey||e.altKey)break;case d:if(t.$activeOption){t.ignoreHover=!0;var r=t.getAdjacentOption(t.$activeOption,-1);r.length&&t.setActiveOption(r,!0,!0)}return void e.preventDefault();case s:return void(t.isOpen&&t.$activeOption&&(t.onOptionSelect({currentTarget:t.$activeOption}),e.preventDefault()));case u:return void t.advanceSelection(-1,e);case f:return void t.advanceSelection(1,e);case b:return t.settings.selectOnTab&&t.isOpen&&t.$activeOption&&(t.onOptionSelect({currentTarget:t.$activeOption}),t.isFull()||e.preventDefault()),void(t.settings.create&&t.createItem()&&e.preventDefault());case m:case g:return void t.deleteSelection(e)}return!t.isFull()&&!t.isInputHidden||(a?e.metaKey:e.ctrlKey)?void 0:void e.preventDefault()},onKeyUp:function(e){var t=this;if(t.isLocked)return e&&e.preventDefault();var n=t.$control_input.val()||"";t.lastValue!==n&&(t.lastValue=n,t.onSearchChange(n),t.refreshOptions(),t.trigger("type",n))},onSearchChange:function(e){var t=this,n=t.settings.load;n&&(t.loadedSearches.hasOwnProperty(e)||(t.loadedSearches[e]=!0,t.load(function(r){n.apply(t,[e,r])})))},onFocus:function(e){var t=this,n=t.isFocused;return t.isDisabled?(t.blur(),e&&e.preventDefault(),!1):void(t.ignoreFocus||(t.isFocused=!0,"focus"===t.settings.preload&&t.onSearchChange(""),n||t.trigger("focus"),t.$activeItems.length||(t.showInput(),t.setActiveItem(null),t.refreshOptions(!!t.settings.openOnFocus)),t.refreshState()))},onBlur:function(e,t){var n=this;if(n.isFocused&&(n.isFocused=!1,!n.ignoreFocus)){if(!n.ignoreBlur&&document.activeElement===n.$dropdown_content[0])return n.ignoreBlur=!0,void n.onFocus(e);var r=function(){n.close(),n.setTextboxValue(""),n.setActiveItem(null),n.setActiveOption(null),n.setCaret(n.items.length),n.refreshState(),t&&t.focus&&t.focus(),n.ignoreFocus=!1,n.trigger("blur")};n.ignoreFocus=!0,n.settings.create&&n.settings.createOnBlur?n.createItem(null,!1,r):r()}},onOptionHover:function(e){this.ignoreHover||this.setActiveOption(e.currentTarget,!1)},onOptionSelect:function(t){var n,r,i=this;t.preventDefault&&(t.preventDefault(),t.stopPropagation()),r=e(t.currentTarget),r.hasClass("create")?i.createItem(null,function(){i.settings.closeAfterSelect&&i.close()}):(n=r.attr("data-value"),"undefined"!=typeof n&&(i.lastQuery=null,i.setTextboxValue(""),i.addItem(n),i.settings.closeAfterSelect?i.close():!i.settings.hideSelected&&t.type&&/mouse/.test(t.type)&&i.setActiveOption(i.getOption(n))))},onItemSelect:function(e){var t=this;t.isLocked||"multi"===t.settings.mode&&(e.preventDefault(),t.setActiveItem(e.currentTarget,e))},load:function(e){var t=this,n=t.$wrapper.addClass(t.settings.loadingClass);t.loading++,e.apply(t,[function(e){t.loading=Math.max(t.loading-1,0),e&&e.length&&(t.addOption(e),t.refreshOptions(t.isFocused&&!t.isInputHidden)),t.loading||n.removeClass(t.settings.loadingClass),t.trigger("load",e)}])},setTextboxValue:function(e){var t=this.$control_input,n=t.val()!==e;n&&(t.val(e).triggerHandler("update"),this.lastValue=e)},getValue:function(){return this.tagType===k&&this.$input.attr("multiple")?this.items:this.items.join(this.settings.delimiter)},setValue:function(e,t){var n=t?[]:["change"];Y(this,n,function(){this.clear(t),this.addItems(e,t)})},setActiveItem:function(t,n){var r,i,a,o,s,l,u,d,c=this;if("single"!==c.settings.mode){if(t=e(t),!t.length)return e(c.$activeItems).removeClass("active"),c.$activeItems=[],void(c.isFocused&&c.showInput());if(r=n&&n.type.toLowerCase(),"mousedown"===r&&c.isShiftDown&&c.$activeItems.length){for(d=c.$control.children(".active:last"),o=Array.prototype.indexOf.apply(c.$control[0].childNodes,[d[0]]),s=Array.prototype.indexOf.apply(c.$control[0].childNodes,[t[0]]),o>s&&(u=o,o=s,s=u),i=o;i<=s;i++)l=c.$control[0].childNodes[i],c.$activeItems.indexOf(l)===-1&&(e(l).addClass("active"),c.$activeItems.push(l));n.preventDefault()}else"mousedown"===r&&c.isCtrlDown||"keydown"===r&&this.isShiftDown?t.hasClass("active")?(a=c.$activeItems.indexOf(t[0]),c.$activeItems.splice(a,1),t.removeClass("active")):c.$activeItems.push(t.addClass("active")[0]):(e(c.$activeItems).removeClass("active"),c.$activeItems=[t.addClass("active")[0]]);c.hideInput(),this.isFocused||c.focus()}},setActiveOption:function(t,n,r){var i,a,o,s,l,u=this;u.$activeOption&&u.$activeOption.removeClass("active"),u.$activeOption=null,t=e(t),t.length&&(u.$activeOption=t.addClass("active"),!n&&_(n)||(i=u.$dropdown_content.height(),a=u.$activeOption.outerHeight(!0),n=u.$dropdown_content.scrollTop()||0,o=u.$activeOption.offset().top-u.$dropdown_content.offset().top+n,s=o,l=o-i+a,o+a>i+n?u.$dropdown_content.stop().animate({scrollTop:l},r?u.settings.scrollDuration:0):o<n&&u.$dropdown_content.stop().animate({scrollTop:s},r?u.settings.scrollDuration:0)))},selectAll:function(){var e=this;"single"!==e.settings.mode&&(e.$activeItems=Array.prototype.slice.apply(e.$control.children(":not(input)").addClass("active")),e.$activeItems.length&&(e.hideInput(),e.close()),e.focus())},hideInput:function(){var e=this;e.setTextboxValue(""),e.$control_input.css({opacity:0,position:"absolute",left:e.rtl?1e4:-1e4}),e.isInputHidden=!0},showInput:function(){this.$control_input.css({opacity:1,position:"relative",left:0}),this.isInputHidden=!1},focus:function(){var e=this;e.isDisabled||(e.ignoreFocus=!0,e.$control_input[0].focus(),window.setTimeout(function(){e.ignoreFocus=!1,e.onFocus()},0))},blur:function(e){this.$control_input[0].blur(),this.onBlur(null,e)},getScoreFunction:function(e){return this.sifter.getScoreFunction(e,this.getSearchOptions())},getSearchOptions:function(){var e=this.settings,t=e.sortField;return"string"==typeof t&&(t=[{field:t}]),{fields:e.searchField,conjunction:e.searchConjunction,sort:t}},search:function(t){var n,r,i,a=this,o=a.settings,s=this.getSearchOptions();if(o.score&&(i=a.settings.score.apply(this,[t]),"function"!=typeof i))throw new Error('Selectize "score" setting must be a function that returns a function');if(t!==a.lastQuery?(a.lastQuery=t,r=a.sifter.search(t,e.extend(s,{score:i})),a.currentResults=r):r=e.extend(!0,{},a.currentResults),o.hideSelected)for(n=r.items.length-1;n>=0;n--)a.items.indexOf(S(r.items[n].id))!==-1&&r.items.splice(n,1);return r},refreshOptions:function(t){var n,i,a,o,s,l,u,d,c,f,h,p,m,g,v,y;"undefined"==typeof t&&(t=!0);var w=this,b=e.trim(w.$control_input.val()),k=w.search(b),x=w.$dropdown_content,D=w.$activeOption&&S(w.$activeOption.attr("data-value"));for(o=k.items.length,"number"==typeof w.settings.maxOptions&&(o=Math.min(o,w.settings.maxOptions)),s={},l=[],n=0;n<o;n++)for(u=w.options[k.items[n].id],d=w.render("option",u),c=u[w.settings.optgroupField]||"",f=e.isArray(c)?c:[c],i=0,a=f&&f.length;i<a;i++)c=f[i],w.optgroups.hasOwnProperty(c)||(c=""),s.hasOwnProperty(c)||(s[c]=document.createDocumentFragment(),l.push(c)),s[c].appendChild(d);for(this.settings.lockOptgroupOrder&&l.sort(function(e,t){var n=w.optgroups[e].$order||0,r=w.optgroups[t].$order||0;return n-r}),h=document.createDocumentFragment(),n=0,o=l.length;n<o;n++)c=l[n],w.optgroups.hasOwnProperty(c)&&s[c].childNodes.length?(p=document.createDocumentFragment(),p.appendChild(w.render("optgroup_header",w.optgroups[c])),p.appendChild(s[c]),h.appendChild(w.render("optgroup",e.extend({},w.optgroups[c],{html:$(p),dom:p})))):h.appendChild(s[c]);if(x.html(h),w.settings.highlight&&k.query.length&&k.tokens.length)for(x.removeHighlight(),n=0,o=k.tokens.length;n<o;n++)r(x,k.tokens[n].regex);if(!w.settings.hideSelected)for(n=0,o=w.items.length;n<o;n++)w.getOption(w.items[n]).addClass("selected");m=w.canCreate(b),m&&(x.prepend(w.render("option_create",{input:b})),y=e(x[0].childNodes[0])),w.hasOptions=k.items.length>0||m,w.hasOptions?(k.items.length>0?(v=D&&w.getOption(D),v&&v.length?g=v:"single"===w.settings.mode&&w.items.length&&(g=w.getOption(w.items[0])),g&&g.length||(g=y&&!w.settings.addPrecedence?w.getAdjacentOption(y,1):x.find("[data-selectable]:first"))):g=y,w.setActiveOption(g),t&&!w.isOpen&&w.open()):(w.setActiveOption(null),t&&w.isOpen&&w.close())},addOption:function(t){var n,r,i,a=this;if(e.isArray(t))for(n=0,r=t.length;n<r;n++)a.addOption(t[n]);else(i=a.registerOption(t))&&(a.userOptions[i]=!0,a.lastQuery=null,a.trigger("option_add",i,t))},registerOption:function(e){var t=S(e[this.settings.valueField]);return"undefined"!=typeof t&&null!==t&&!this.options.hasOwnProperty(t)&&(e.$order=e.$order||++this.order,this.options[t]=e,t)},registerOptionGroup:function(e){var t=S(e[this.settings.optgroupValueField]);return!!t&&(e.$order=e.$order||++this.order,this.optgroups[t]=e,t)},addOptionGroup:function(e,t){t[this.settings.optgroupValueField]=e,(e=this.registerOptionGroup(t))&&this.trigger("optgroup_add",e,t)},removeOptionGroup:function(e){this.optgroups.hasOwnProperty(e)&&(delete this.optgroups[e],this.renderCache={},this.trigger("optgroup_remove",e))},clearOptionGroups:function(){
-this.optgroups={},this.renderCache={},this.trigger("optgroup_clear")},updateOption:function(t,n){var r,i,a,o,s,l,u,d=this;if(t=S(t),a=S(n[d.settings.valueField]),null!==t&&d.options.hasOwnProperty(t)){if("string"!=typeof a)throw new Error("Value must be set in option data");u=d.options[t].$order,a!==t&&(delete d.options[t],o=d.items.indexOf(t),o!==-1&&d.items.splice(o,1,a)),n.$order=n.$order||u,d.options[a]=n,s=d.renderCache.item,l=d.renderCache.option,s&&(delete s[t],delete s[a]),l&&(delete l[t],delete l[a]),d.items.indexOf(a)!==-1&&(r=d.getItem(t),i=e(d.render("item",n)),r.hasClass("active")&&i.addClass("active"),r.replaceWith(i)),d.lastQuery=null,d.isOpen&&d.refreshOptions(!1)}},removeOption:function(e,t){var n=this;e=S(e);var r=n.renderCache.item,i=n.renderCache.option;r&&delete r[e],i&&delete i[e],delete n.userOptions[e],delete n.options[e],n.lastQuery=null,n.trigger("option_remove",e),n.removeItem(e,t)},clearOptions:function(){var e=this;e.loadedSearches={},e.userOptions={},e.renderCache={},e.options=e.sifter.items={},e.lastQuery=null,e.trigger("option_clear"),e.clear()},getOption:function(e){return this.getElementWithValue(e,this.$dropdown_content.find("[data-selectable]"))},getAdjacentOption:function(t,n){var r=this.$dropdown.find("[data-selectable]"),i=r.index(t)+n;return i>=0&&i<r.length?r.eq(i):e()},getElementWithValue:function(t,n){if(t=S(t),"undefined"!=typeof t&&null!==t)for(var r=0,i=n.length;r<i;r++)if(n[r].getAttribute("data-value")===t)return e(n[r]);return e()},getItem:function(e){return this.getElementWithValue(e,this.$control.children())},addItems:function(t,n){for(var r=e.isArray(t)?t:[t],i=0,a=r.length;i<a;i++)this.isPending=i<a-1,this.addItem(r[i],n)},addItem:function(t,n){var r=n?[]:["change"];Y(this,r,function(){var r,i,a,o,s,l=this,u=l.settings.mode;return t=S(t),l.items.indexOf(t)!==-1?void("single"===u&&l.close()):void(l.options.hasOwnProperty(t)&&("single"===u&&l.clear(n),"multi"===u&&l.isFull()||(r=e(l.render("item",l.options[t])),s=l.isFull(),l.items.splice(l.caretPos,0,t),l.insertAtCaret(r),(!l.isPending||!s&&l.isFull())&&l.refreshState(),l.isSetup&&(a=l.$dropdown_content.find("[data-selectable]"),l.isPending||(i=l.getOption(t),o=l.getAdjacentOption(i,1).attr("data-value"),l.refreshOptions(l.isFocused&&"single"!==u),o&&l.setActiveOption(l.getOption(o))),!a.length||l.isFull()?l.close():l.positionDropdown(),l.updatePlaceholder(),l.trigger("item_add",t,r),l.updateOriginalInput({silent:n})))))})},removeItem:function(t,n){var r,i,a,o=this;r=t instanceof e?t:o.getItem(t),t=S(r.attr("data-value")),i=o.items.indexOf(t),i!==-1&&(r.remove(),r.hasClass("active")&&(a=o.$activeItems.indexOf(r[0]),o.$activeItems.splice(a,1)),o.items.splice(i,1),o.lastQuery=null,!o.settings.persist&&o.userOptions.hasOwnProperty(t)&&o.removeOption(t,n),i<o.caretPos&&o.setCaret(o.caretPos-1),o.refreshState(),o.updatePlaceholder(),o.updateOriginalInput({silent:n}),o.positionDropdown(),o.trigger("item_remove",t,r))},createItem:function(t,n){var r=this,i=r.caretPos;t=t||e.trim(r.$control_input.val()||"");var a=arguments[arguments.length-1];if("function"!=typeof a&&(a=function(){}),"boolean"!=typeof n&&(n=!0),!r.canCreate(t))return a(),!1;r.lock();var o="function"==typeof r.settings.create?this.settings.create:function(e){var t={};return t[r.settings.labelField]=e,t[r.settings.valueField]=e,t},s=T(function(e){if(r.unlock(),!e||"object"!=typeof e)return a();var t=S(e[r.settings.valueField]);return"string"!=typeof t?a():(r.setTextboxValue(""),r.addOption(e),r.setCaret(i),r.addItem(t),r.refreshOptions(n&&"single"!==r.settings.mode),void a(e))}),l=o.apply(this,[t,s]);return"undefined"!=typeof l&&s(l),!0},refreshItems:function(){this.lastQuery=null,this.isSetup&&this.addItem(this.items),this.refreshState(),this.updateOriginalInput()},refreshState:function(){this.refreshValidityState(),this.refreshClasses()},refreshValidityState:function(){if(!this.isRequired)return!1;var e=!this.items.length;this.isInvalid=e,this.$control_input.prop("required",e),this.$input.prop("required",!e)},refreshClasses:function(){var t=this,n=t.isFull(),r=t.isLocked;t.$wrapper.toggleClass("rtl",t.rtl),t.$control.toggleClass("focus",t.isFocused).toggleClass("disabled",t.isDisabled).toggleClass("required",t.isRequired).toggleClass("invalid",t.isInvalid).toggleClass("locked",r).toggleClass("full",n).toggleClass("not-full",!n).toggleClass("input-active",t.isFocused&&!t.isInputHidden).toggleClass("dropdown-active",t.isOpen).toggleClass("has-options",!e.isEmptyObject(t.options)).toggleClass("has-items",t.items.length>0),t.$control_input.data("grow",!n&&!r)},isFull:function(){return null!==this.settings.maxItems&&this.items.length>=this.settings.maxItems},updateOriginalInput:function(e){var t,n,r,i,a=this;if(e=e||{},a.tagType===k){for(r=[],t=0,n=a.items.length;t<n;t++)i=a.options[a.items[t]][a.settings.labelField]||"",r.push('<option value="'+C(a.items[t])+'" selected="selected">'+C(i)+"</option>");r.length||this.$input.attr("multiple")||r.push('<option value="" selected="selected"></option>'),a.$input.html(r.join(""))}else a.$input.val(a.getValue()),a.$input.attr("value",a.$input.val());a.isSetup&&(e.silent||a.trigger("change",a.$input.val()))},updatePlaceholder:function(){if(this.settings.placeholder){var e=this.$control_input;this.items.length?e.removeAttr("placeholder"):e.attr("placeholder",this.settings.placeholder),e.triggerHandler("update",{force:!0})}},open:function(){var e=this;e.isLocked||e.isOpen||"multi"===e.settings.mode&&e.isFull()||(e.focus(),e.isOpen=!0,e.refreshState(),e.$dropdown.css({visibility:"hidden",display:"block"}),e.positionDropdown(),e.$dropdown.css({visibility:"visible"}),e.trigger("dropdown_open",e.$dropdown))},close:function(){var e=this,t=e.isOpen;"single"===e.settings.mode&&e.items.length&&(e.hideInput(),e.$control_input.blur()),e.isOpen=!1,e.$dropdown.hide(),e.setActiveOption(null),e.refreshState(),t&&e.trigger("dropdown_close",e.$dropdown)},positionDropdown:function(){var e=this.$control,t="body"===this.settings.dropdownParent?e.offset():e.position();t.top+=e.outerHeight(!0),this.$dropdown.css({width:e.outerWidth(),top:t.top,left:t.left})},clear:function(e){var t=this;t.items.length&&(t.$control.children(":not(input)").remove(),t.items=[],t.lastQuery=null,t.setCaret(0),t.setActiveItem(null),t.updatePlaceholder(),t.updateOriginalInput({silent:e}),t.refreshState(),t.showInput(),t.trigger("clear"))},insertAtCaret:function(t){var n=Math.min(this.caretPos,this.items.length);0===n?this.$control.prepend(t):e(this.$control[0].childNodes[n]).before(t),this.setCaret(n+1)},deleteSelection:function(t){var n,r,i,a,o,s,l,u,d,c=this;if(i=t&&t.keyCode===m?-1:1,a=P(c.$control_input[0]),c.$activeOption&&!c.settings.hideSelected&&(l=c.getAdjacentOption(c.$activeOption,-1).attr("data-value")),o=[],c.$activeItems.length){for(d=c.$control.children(".active:"+(i>0?"last":"first")),s=c.$control.children(":not(input)").index(d),i>0&&s++,n=0,r=c.$activeItems.length;n<r;n++)o.push(e(c.$activeItems[n]).attr("data-value"));t&&(t.preventDefault(),t.stopPropagation())}else(c.isFocused||"single"===c.settings.mode)&&c.items.length&&(i<0&&0===a.start&&0===a.length?o.push(c.items[c.caretPos-1]):i>0&&a.start===c.$control_input.val().length&&o.push(c.items[c.caretPos]));if(!o.length||"function"==typeof c.settings.onDelete&&c.settings.onDelete.apply(c,[o])===!1)return!1;for("undefined"!=typeof s&&c.setCaret(s);o.length;)c.removeItem(o.pop());return c.showInput(),c.positionDropdown(),c.refreshOptions(!0),l&&(u=c.getOption(l),u.length&&c.setActiveOption(u)),!0},advanceSelection:function(e,t){var n,r,i,a,o,s,l=this;0!==e&&(l.rtl&&(e*=-1),n=e>0?"last":"first",r=P(l.$control_input[0]),l.isFocused&&!l.isInputHidden?(a=l.$control_input.val().length,o=e<0?0===r.start&&0===r.length:r.start===a,o&&!a&&l.advanceCaret(e,t)):(s=l.$control.children(".active:"+n),s.length&&(i=l.$control.children(":not(input)").index(s),l.setActiveItem(null),l.setCaret(e>0?i+1:i))))},advanceCaret:function(e,t){var n,r,i=this;0!==e&&(n=e>0?"next":"prev",i.isShiftDown?(r=i.$control_input[n](),r.length&&(i.hideInput(),i.setActiveItem(r),t&&t.preventDefault())):i.setCaret(i.caretPos+e))},setCaret:function(t){var n=this;if(t="single"===n.settings.mode?n.items.length:Math.max(0,Math.min(n.items.length,t)),!n.isPending){var r,i,a,o;for(a=n.$control.children(":not(input)"),r=0,i=a.length;r<i;r++)o=e(a[r]).detach(),r<t?n.$control_input.before(o):n.$control.append(o)}n.caretPos=t},lock:function(){this.close(),this.isLocked=!0,this.refreshState()},unlock:function(){this.isLocked=!1,this.refreshState()},disable:function(){var e=this;e.$input.prop("disabled",!0),e.$control_input.prop("disabled",!0).prop("tabindex",-1),e.isDisabled=!0,e.lock()},enable:function(){var e=this;e.$input.prop("disabled",!1),e.$control_input.prop("disabled",!1).prop("tabindex",e.tabIndex),e.isDisabled=!1,e.unlock()},destroy:function(){var t=this,n=t.eventNS,r=t.revertSettings;t.trigger("destroy"),t.off(),t.$wrapper.remove(),t.$dropdown.remove(),t.$input.html("").append(r.$children).removeAttr("tabindex").removeClass("selectized").attr({tabindex:r.tabindex}).show(),t.$control_input.removeData("grow"),t.$input.removeData("selectize"),e(window).off(n),e(document).off(n),e(document.body).off(n),delete t.$input[0].selectize},render:function(t,n){var r,i,a="",o=!1,s=this;return"option"!==t&&"item"!==t||(r=S(n[s.settings.valueField]),o=!!r),o&&(_(s.renderCache[t])||(s.renderCache[t]={}),s.renderCache[t].hasOwnProperty(r))?s.renderCache[t][r]:(a=e(s.settings.render[t].apply(this,[n,C])),"option"===t||"option_create"===t?a.attr("data-selectable",""):"optgroup"===t&&(i=n[s.settings.optgroupValueField]||"",a.attr("data-group",i)),"option"!==t&&"item"!==t||a.attr("data-value",r||""),o&&(s.renderCache[t][r]=a[0]),a[0])},clearCache:function(e){var t=this;"undefined"==typeof e?t.renderCache={}:delete t.renderCache[e]},canCreate:function(e){var t=this;if(!t.settings.create)return!1;var n=t.settings.createFilter;return e.length&&("function"!=typeof n||n.apply(t,[e]))&&("string"!=typeof n||new RegExp(n).test(e))&&(!(n instanceof RegExp)||n.test(e))}}),E.count=0,E.defaults={options:[],optgroups:[],plugins:[],delimiter:",",splitOn:null,persist:!0,diacritics:!0,create:!1,createOnBlur:!1,createFilter:null,highlight:!0,openOnFocus:!0,maxOptions:1e3,maxItems:null,hideSelected:null,addPrecedence:!1,selectOnTab:!1,preload:!1,allowEmptyOption:!1,closeAfterSelect:!1,scrollDuration:60,loadThrottle:300,loadingClass:"loading",dataAttr:"data-data",optgroupField:"optgroup",valueField:"value",labelField:"text",optgroupLabelField:"label",optgroupValueField:"value",lockOptgroupOrder:!1,sortField:"$order",searchField:["text"],searchConjunction:"and",mode:null,wrapperClass:"selectize-control",inputClass:"selectize-input",dropdownClass:"selectize-dropdown",dropdownContentClass:"selectize-dropdown-content",dropdownParent:null,copyClassesToDropdown:!0,render:{}},e.fn.selectize=function(t){var n=e.fn.selectize.defaults,r=e.extend({},n,t),i=r.dataAttr,a=r.labelField,o=r.valueField,s=r.optgroupField,l=r.optgroupLabelField,u=r.optgroupValueField,d=function(t,n){var s,l,u,d,c=t.attr(i);if(c)for(n.options=JSON.parse(c),s=0,l=n.options.length;s<l;s++)n.items.push(n.options[s][o]);else{var f=e.trim(t.val()||"");if(!r.allowEmptyOption&&!f.length)return;for(u=f.split(r.delimiter),s=0,l=u.length;s<l;s++)d={},d[a]=u[s],d[o]=u[s],n.options.push(d);n.items=u}},c=function(t,n){var d,c,f,h,p=n.options,m={},g=function(e){var t=i&&e.attr(i);return"string"==typeof t&&t.length?JSON.parse(t):null},v=function(t,i){t=e(t);var l=S(t.val());if(l||r.allowEmptyOption)if(m.hasOwnProperty(l)){if(i){var u=m[l][s];u?e.isArray(u)?u.push(i):m[l][s]=[u,i]:m[l][s]=i}}else{var d=g(t)||{};d[a]=d[a]||t.text(),d[o]=d[o]||l,d[s]=d[s]||i,m[l]=d,p.push(d),t.is(":selected")&&n.items.push(l)}},y=function(t){var r,i,a,o,s;for(t=e(t),a=t.attr("label"),a&&(o=g(t)||{},o[l]=a,o[u]=a,n.optgroups.push(o)),s=e("option",t),r=0,i=s.length;r<i;r++)v(s[r],a)};for(n.maxItems=t.attr("multiple")?null:1,h=t.children(),d=0,c=h.length;d<c;d++)f=h[d].tagName.toLowerCase(),"optgroup"===f?y(h[d]):"option"===f&&v(h[d])};return this.each(function(){if(!this.selectize){var i,a=e(this),o=this.tagName.toLowerCase(),s=a.attr("placeholder")||a.attr("data-placeholder");s||r.allowEmptyOption||(s=a.children('option[value=""]').text());var l={placeholder:s,options:[],optgroups:[],items:[]};"select"===o?c(a,l):d(a,l),i=new E(a,e.extend(!0,{},n,l,t))}})},e.fn.selectize.defaults=E.defaults,e.fn.selectize.support={validity:D},E.define("drag_drop",function(t){if(!e.fn.sortable)throw new Error('The "drag_drop" plugin requires jQuery UI "sortable".');if("multi"===this.settings.mode){var n=this;n.lock=function(){var e=n.lock;return function(){var t=n.$control.data("sortable");return t&&t.disable(),e.apply(n,arguments)}}(),n.unlock=function(){var e=n.unlock;return function(){var t=n.$control.data("sortable");return t&&t.enable(),e.apply(n,arguments)}}(),n.setup=function(){var t=n.setup;return function(){t.apply(this,arguments);var r=n.$control.sortable({items:"[data-value]",forcePlaceholderSize:!0,disabled:n.isLocked,start:function(e,t){t.placeholder.css("width",t.helper.css("width")),r.css({overflow:"visible"})},stop:function(){r.css({overflow:"hidden"});var t=n.$activeItems?n.$activeItems.slice():null,i=[];r.children("[data-value]").each(function(){i.push(e(this).attr("data-value"))}),n.setValue(i),n.setActiveItem(t)}})}}()}}),E.define("dropdown_header",function(t){var n=this;t=e.extend({title:"Untitled",headerClass:"selectize-dropdown-header",titleRowClass:"selectize-dropdown-header-title",labelClass:"selectize-dropdown-header-label",closeClass:"selectize-dropdown-header-close",html:function(e){return'<div class="'+e.headerClass+'"><div class="'+e.titleRowClass+'"><span class="'+e.labelClass+'">'+e.title+'</span><a href="javascript:void(0)" class="'+e.closeClass+'">&times;</a></div></div>'}},t),n.setup=function(){var r=n.setup;return function(){r.apply(n,arguments),n.$dropdown_header=e(t.html(t)),n.$dropdown.prepend(n.$dropdown_header)}}()}),E.define("optgroup_columns",function(t){var n=this;t=e.extend({equalizeWidth:!0,equalizeHeight:!0},t),this.getAdjacentOption=function(t,n){var r=t.closest("[data-group]").find("[data-selectable]"),i=r.index(t)+n;return i>=0&&i<r.length?r.eq(i):e()},this.onKeyDown=function(){var e=n.onKeyDown;return function(t){var r,i,a,o;return!this.isOpen||t.keyCode!==u&&t.keyCode!==f?e.apply(this,arguments):(n.ignoreHover=!0,o=this.$activeOption.closest("[data-group]"),r=o.find("[data-selectable]").index(this.$activeOption),o=t.keyCode===u?o.prev("[data-group]"):o.next("[data-group]"),a=o.find("[data-selectable]"),i=a.eq(Math.min(a.length-1,r)),void(i.length&&this.setActiveOption(i)))}}();var r=function(){var e,t=r.width,n=document;return"undefined"==typeof t&&(e=n.createElement("div"),e.innerHTML='<div style="width:50px;height:50px;position:absolute;left:-50px;top:-50px;overflow:auto;"><div style="width:1px;height:100px;"></div></div>',e=e.firstChild,n.body.appendChild(e),t=r.width=e.offsetWidth-e.clientWidth,n.body.removeChild(e)),t},i=function(){var i,a,o,s,l,u,d;if(d=e("[data-group]",n.$dropdown_content),a=d.length,a&&n.$dropdown_content.width()){if(t.equalizeHeight){for(o=0,i=0;i<a;i++)o=Math.max(o,d.eq(i).height());d.css({height:o})}t.equalizeWidth&&(u=n.$dropdown_content.innerWidth()-r(),s=Math.round(u/a),d.css({width:s}),a>1&&(l=u-s*(a-1),d.eq(a-1).css({width:l})))}};(t.equalizeHeight||t.equalizeWidth)&&(O.after(this,"positionDropdown",i),O.after(this,"refreshOptions",i))}),E.define("remove_button",function(t){t=e.extend({label:"&times;",title:"Remove",className:"remove",append:!0},t);var n=function(t,n){n.className="remove-single";var r=t,i='<a href="javascript:void(0)" class="'+n.className+'" tabindex="-1" title="'+C(n.title)+'">'+n.label+"</a>",a=function(e,t){return e+t};t.setup=function(){var o=r.setup;return function(){if(n.append){var s=e(r.$input.context).attr("id"),l=(e("#"+s),r.settings.render.item);r.settings.render.item=function(e){return a(l.apply(t,arguments),i)}}o.apply(t,arguments),t.$control.on("click","."+n.className,function(e){e.preventDefault(),r.isLocked||r.clear()})}}()},r=function(t,n){var r=t,i='<a href="javascript:void(0)" class="'+n.className+'" tabindex="-1" title="'+C(n.title)+'">'+n.label+"</a>",a=function(e,t){var n=e.search(/(<\/[^>]+>\s*)$/);return e.substring(0,n)+t+e.substring(n)};t.setup=function(){var o=r.setup;return function(){if(n.append){var s=r.settings.render.item;r.settings.render.item=function(e){return a(s.apply(t,arguments),i)}}o.apply(t,arguments),t.$control.on("click","."+n.className,function(t){if(t.preventDefault(),!r.isLocked){var n=e(t.currentTarget).parent();r.setActiveItem(n),r.deleteSelection()&&r.setCaret(r.items.length)}})}}()};return"single"===this.settings.mode?void n(this,t):void r(this,t)}),E.define("restore_on_backspace",function(e){var t=this;e.text=e.text||function(e){return e[this.settings.labelField]},this.onKeyDown=function(){var n=t.onKeyDown;return function(t){var r,i;return t.keyCode===m&&""===this.$control_input.val()&&!this.$activeItems.length&&(r=this.caretPos-1,r>=0&&r<this.items.length)?(i=this.options[this.items[r]],this.deleteSelection(t)&&(this.setTextboxValue(e.text.apply(this,[i])),this.refreshOptions(!0)),void t.preventDefault()):n.apply(this,arguments)}}()}),E})},{jquery:1,microplugin:2,sifter:5}],5:[function(e,t,n){!function(e,r){"function"==typeof define&&define.amd?define(r):"object"==typeof n?t.exports=r():e.Sifter=r()}(this,function(){var e=function(e,t){this.items=e,this.settings=t||{diacritics:!0}};e.prototype.tokenize=function(e){if(e=i(String(e||"").toLowerCase()),!e||!e.length)return[];var t,n,r,o,l=[],u=e.split(/ +/);for(t=0,n=u.length;t<n;t++){if(r=a(u[t]),this.settings.diacritics)for(o in s)s.hasOwnProperty(o)&&(r=r.replace(new RegExp(o,"g"),s[o]));l.push({string:u[t],regex:new RegExp(r,"i")})}return l},e.prototype.iterator=function(e,t){var n;n=o(e)?Array.prototype.forEach||function(e){for(var t=0,n=this.length;t<n;t++)e(this[t],t,this)}:function(e){for(var t in this)this.hasOwnProperty(t)&&e(this[t],t,this)},n.apply(e,[t])},e.prototype.getScoreFunction=function(e,t){var n,i,a,o,s;n=this,e=n.prepareSearch(e,t),a=e.tokens,i=e.options.fields,o=a.length,s=e.options.nesting;var l=function(e,t){var n,r;return e?(e=String(e||""),r=e.search(t.regex),r===-1?0:(n=t.string.length/e.length,0===r&&(n+=.5),n)):0},u=function(){var e=i.length;return e?1===e?function(e,t){return l(r(t,i[0],s),e)}:function(t,n){for(var a=0,o=0;a<e;a++)o+=l(r(n,i[a],s),t);return o/e}:function(){return 0}}();return o?1===o?function(e){return u(a[0],e)}:"and"===e.options.conjunction?function(e){for(var t,n=0,r=0;n<o;n++){if(t=u(a[n],e),t<=0)return 0;r+=t}return r/o}:function(e){for(var t=0,n=0;t<o;t++)n+=u(a[t],e);return n/o}:function(){return 0}},e.prototype.getSortFunction=function(e,n){var i,a,o,s,l,u,d,c,f,h,p;if(o=this,e=o.prepareSearch(e,n),p=!e.query&&n.sort_empty||n.sort,f=function(e,t){return"$score"===e?t.score:r(o.items[t.id],e,n.nesting)},l=[],p)for(i=0,a=p.length;i<a;i++)(e.query||"$score"!==p[i].field)&&l.push(p[i]);if(e.query){for(h=!0,i=0,a=l.length;i<a;i++)if("$score"===l[i].field){h=!1;break}h&&l.unshift({field:"$score",direction:"desc"})}else for(i=0,a=l.length;i<a;i++)if("$score"===l[i].field){l.splice(i,1);break}for(c=[],i=0,a=l.length;i<a;i++)c.push("desc"===l[i].direction?-1:1);return u=l.length,u?1===u?(s=l[0].field,d=c[0],function(e,n){return d*t(f(s,e),f(s,n))}):function(e,n){var r,i,a;for(r=0;r<u;r++)if(a=l[r].field,i=c[r]*t(f(a,e),f(a,n)))return i;return 0}:null},e.prototype.prepareSearch=function(e,t){if("object"==typeof e)return e;t=n({},t);var r=t.fields,i=t.sort,a=t.sort_empty;return r&&!o(r)&&(t.fields=[r]),i&&!o(i)&&(t.sort=[i]),a&&!o(a)&&(t.sort_empty=[a]),{options:t,query:String(e||"").toLowerCase(),tokens:this.tokenize(e),total:0,items:[]}},e.prototype.search=function(e,t){var n,r,i,a,o=this;return r=this.prepareSearch(e,t),t=r.options,e=r.query,a=t.score||o.getScoreFunction(r),e.length?o.iterator(o.items,function(e,i){n=a(e),(t.filter===!1||n>0)&&r.items.push({score:n,id:i})}):o.iterator(o.items,function(e,t){r.items.push({score:1,id:t})}),i=o.getSortFunction(r,t),i&&r.items.sort(i),r.total=r.items.length,"number"==typeof t.limit&&(r.items=r.items.slice(0,t.limit)),r};var t=function(e,t){return"number"==typeof e&&"number"==typeof t?e>t?1:e<t?-1:0:(e=l(String(e||"")),t=l(String(t||"")),e>t?1:t>e?-1:0)},n=function(e,t){var n,r,i,a;for(n=1,r=arguments.length;n<r;n++)if(a=arguments[n])for(i in a)a.hasOwnProperty(i)&&(e[i]=a[i]);return e},r=function(e,t,n){if(e&&t){if(!n)return e[t];for(var r=t.split(".");r.length&&(e=e[r.shift()]););return e}},i=function(e){return(e+"").replace(/^\s+|\s+$|/g,"")},a=function(e){return(e+"").replace(/([.?*+^$[\]\\(){}|-])/g,"\\$1")},o=Array.isArray||"undefined"!=typeof $&&$.isArray||function(e){return"[object Array]"===Object.prototype.toString.call(e)},s={a:"[aḀḁĂăÂâǍǎȺⱥȦȧẠạÄäÀàÁáĀāÃãÅåąĄÃąĄ]",b:"[b␢βΒB฿𐌁ᛒ]",c:"[cĆćĈĉČčĊċC̄c̄ÇçḈḉȻȼƇƈɕᴄＣｃ]",d:"[dĎďḊḋḐḑḌḍḒḓḎḏĐđD̦d̦ƉɖƊɗƋƌᵭᶁᶑȡᴅＤｄð]",e:"[eÉéÈèÊêḘḙĚěĔĕẼẽḚḛẺẻĖėËëĒēȨȩĘęᶒɆɇȄȅẾếỀềỄễỂểḜḝḖḗḔḕȆȇẸẹỆệⱸᴇＥｅɘǝƏƐε]",f:"[fƑƒḞḟ]",g:"[gɢ₲ǤǥĜĝĞğĢģƓɠĠġ]",h:"[hĤĥĦħḨḩẖẖḤḥḢḣɦʰǶƕ]",i:"[iÍíÌìĬĭÎîǏǐÏïḮḯĨĩĮįĪīỈỉȈȉȊȋỊịḬḭƗɨɨ̆ᵻᶖİiIıɪＩｉ]",j:"[jȷĴĵɈɉʝɟʲ]",k:"[kƘƙꝀꝁḰḱǨǩḲḳḴḵκϰ₭]",l:"[lŁłĽľĻļĹĺḶḷḸḹḼḽḺḻĿŀȽƚⱠⱡⱢɫɬᶅɭȴʟＬｌ]",n:"[nŃńǸǹŇňÑñṄṅŅņṆṇṊṋṈṉN̈n̈ƝɲȠƞᵰᶇɳȵɴＮｎŊŋ]",o:"[oØøÖöÓóÒòÔôǑǒŐőŎŏȮȯỌọƟɵƠơỎỏŌōÕõǪǫȌȍՕօ]",p:"[pṔṕṖṗⱣᵽƤƥᵱ]",q:"[qꝖꝗʠɊɋꝘꝙq̃]",r:"[rŔŕɌɍŘřŖŗṘṙȐȑȒȓṚṛⱤɽ]",s:"[sŚśṠṡṢṣꞨꞩŜŝŠšŞşȘșS̈s̈]",t:"[tŤťṪṫŢţṬṭƮʈȚțṰṱṮṯƬƭ]",u:"[uŬŭɄʉỤụÜüÚúÙùÛûǓǔŰűŬŭƯưỦủŪūŨũŲųȔȕ∪]",v:"[vṼṽṾṿƲʋꝞꝟⱱʋ]",w:"[wẂẃẀẁŴŵẄẅẆẇẈẉ]",x:"[xẌẍẊẋχ]",y:"[yÝýỲỳŶŷŸÿỸỹẎẏỴỵɎɏƳƴ]",z:"[zŹźẐẑŽžŻżẒẓẔẕƵƶ]"},l=function(){var e,t,n,r,i="",a={};for(n in s)if(s.hasOwnProperty(n))for(r=s[n].substring(2,s[n].length-1),i+=r,e=0,t=r.length;e<t;e++)a[r.charAt(e)]=n;var o=new RegExp("["+i+"]","g");return function(e){return e.replace(o,function(e){return a[e]}).toLowerCase()}}();return e})},{}],6:[function(e,t,n){function r(e,t,n){var r=o.extend({format:t,singleDate:!0,showTopBar:!1},n),i=o(e);return i.length&&i.dateRangePicker(r),i}function i(e,t){function n(){a=r.val(),a=a.replace(/\n/g,"<br>"),i.html(a+'<br class="lbr">'),r.css("height",i.height()+20)}var r=o(t),i=o(document.createElement("div")),a=null;r.addClass("txtstuff"),i.addClass("hiddendiv common form-control"),r.after(i),n(),r.on("keyup",n)}function a(){var e=o("#id_status input:checked").val();o("#amounts").toggle(["relatg","relagc"].indexOf(e)!==-1)}var o=e("jquery"),s=e("moment");e("../../vendor/jquery-date-range-picker/jquery.daterangepicker"),e("selectize");var l="hh:mmA dddd, MMM DD, YYYY",u="dddd, MMM DD, YYYY";o(function(){r('input[name*="-scheduled_time"]',l,{startDate:s().format(l),setValue:function(e){var t=s(e,l).hour(10).minute(0);o(this).val(t.format(l))}}),r("#id_update_date",u),r("#id_sent",u),o("textarea").each(i),o("#id_recipients").selectize({required:!0,create:function(e){return{value:e,text:e}}}),o("#amounts").length&&(a(),o("#id_status input").on("change",a)),o("fieldset.collapsible").on("click","legend",function(e){e.preventDefault(),o(this).parent().toggleClass("collapsed")}),o("#id_project").selectize(),o("#id_collaborators").selectize({multiple:!0}),o("#id_foia").selectize()})},{"../../vendor/jquery-date-range-picker/jquery.daterangepicker":7,jquery:1,moment:3,selectize:4}],7:[function(e,t,n){!function(r){"function"==typeof define&&define.amd?define(["jquery","moment"],r):"object"==typeof n&&"undefined"!=typeof t?t.exports=r(e("jquery"),e("moment")):r(jQuery,moment)}(function(e,t){e.dateRangePickerLanguages={"default":{selected:"Selected:",day:"Day",days:"Days",apply:"Close","week-1":"mo","week-2":"tu","week-3":"we","week-4":"th","week-5":"fr","week-6":"sa","week-7":"su","week-number":"W","month-name":["january","february","march","april","may","june","july","august","september","october","november","december"],shortcuts:"Shortcuts","custom-values":"Custom Values",past:"Past",following:"Following",previous:"Previous","prev-week":"Week","prev-month":"Month","prev-year":"Year",next:"Next","next-week":"Week","next-month":"Month","next-year":"Year","less-than":"Date range should not be more than %d days","more-than":"Date range should not be less than %d days","default-more":"Please select a date range longer than %d days","default-single":"Please select a date","default-less":"Please select a date range less than %d days","default-range":"Please select a date range between %d and %d days","default-default":"Please select a date range",time:"Time",hour:"Hour",minute:"Minute"},az:{selected:"Seçildi:",day:" gün",days:" gün",apply:"tətbiq","week-1":"1","week-2":"2","week-3":"3","week-4":"4","week-5":"5","week-6":"6","week-7":"7","month-name":["yanvar","fevral","mart","aprel","may","iyun","iyul","avqust","sentyabr","oktyabr","noyabr","dekabr"],shortcuts:"Qısayollar",past:"Keçmiş",following:"Növbəti",previous:"&nbsp;&nbsp;&nbsp;","prev-week":"Öncəki həftə","prev-month":"Öncəki ay","prev-year":"Öncəki il",next:"&nbsp;&nbsp;&nbsp;","next-week":"Növbəti həftə","next-month":"Növbəti ay","next-year":"Növbəti il","less-than":"Tarix aralığı %d gündən çox olmamalıdır","more-than":"Tarix aralığı %d gündən az olmamalıdır","default-more":"%d gündən çox bir tarix seçin","default-single":"Tarix seçin","default-less":"%d gündən az bir tarix seçin","default-range":"%d və %d gün aralığında tarixlər seçin","default-default":"Tarix aralığı seçin"},cn:{selected:"已选择:",day:"天",days:"天",apply:"确定","week-1":"一","week-2":"二","week-3":"三","week-4":"四","week-5":"五","week-6":"六","week-7":"日","week-number":"周","month-name":["一月","二月","三月","四月","五月","六月","七月","八月","九月","十月","十一月","十二月"],shortcuts:"快捷选择",past:"过去",following:"将来",previous:"&nbsp;&nbsp;&nbsp;","prev-week":"上周","prev-month":"上个月","prev-year":"去年",next:"&nbsp;&nbsp;&nbsp;","next-week":"下周","next-month":"下个月","next-year":"明年","less-than":"所选日期范围不能大于%d天","more-than":"所选日期范围不能小于%d天","default-more":"请选择大于%d天的日期范围","default-less":"请选择小于%d天的日期范围","default-range":"请选择%d天到%d天的日期范围","default-single":"请选择一个日期","default-default":"请选择一个日期范围",time:"时间",hour:"小时",minute:"分钟"},cz:{selected:"Vybráno:",day:"Den",days:"Dny",apply:"Zavřít","week-1":"po","week-2":"út","week-3":"st","week-4":"čt","week-5":"pá","week-6":"so","week-7":"ne","month-name":["leden","únor","březen","duben","květen","červen","červenec","srpen","září","říjen","listopad","prosinec"],shortcuts:"Zkratky",past:"po",following:"následující",previous:"předchozí","prev-week":"týden","prev-month":"měsíc","prev-year":"rok",next:"další","next-week":"týden","next-month":"měsíc","next-year":"rok","less-than":"Rozsah data by neměl být větší než %d dnů","more-than":"Rozsah data by neměl být menší než %d dnů","default-more":"Prosím zvolte rozsah data větší než %d dnů","default-single":"Prosím zvolte datum","default-less":"Prosím zvolte rozsah data menší než %d dnů","default-range":"Prosím zvolte rozsah data mezi %d a %d dny","default-default":"Prosím zvolte rozsah data"},de:{selected:"Auswahl:",day:"Tag",days:"Tage",apply:"Schließen","week-1":"mo","week-2":"di","week-3":"mi","week-4":"do","week-5":"fr","week-6":"sa","week-7":"so","month-name":["januar","februar","märz","april","mai","juni","juli","august","september","oktober","november","dezember"],shortcuts:"Schnellwahl",past:"Vorherige",following:"Folgende",previous:"Vorherige","prev-week":"Woche","prev-month":"Monat","prev-year":"Jahr",next:"Nächste","next-week":"Woche","next-month":"Monat","next-year":"Jahr","less-than":"Datumsbereich darf nicht größer sein als %d Tage","more-than":"Datumsbereich darf nicht kleiner sein als %d Tage","default-more":"Bitte mindestens %d Tage auswählen","default-single":"Bitte ein Datum auswählen","default-less":"Bitte weniger als %d Tage auswählen","default-range":"Bitte einen Datumsbereich zwischen %d und %d Tagen auswählen","default-default":"Bitte ein Start- und Enddatum auswählen",Time:"Zeit",hour:"Stunde",minute:"Minute"},es:{selected:"Seleccionado:",day:"Dia",days:"Dias",apply:"Cerrar","week-1":"lu","week-2":"ma","week-3":"mi","week-4":"ju","week-5":"vi","week-6":"sa","week-7":"do","month-name":["enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre"],shortcuts:"Accesos directos",past:"Pasado",following:"Siguiente",previous:"Anterior","prev-week":"Semana","prev-month":"Mes","prev-year":"Año",next:"Siguiente","next-week":"Semana","next-month":"Mes","next-year":"Año","less-than":"El rango no deberia ser mayor de %d dias","more-than":"El rango no deberia ser menor de %d dias","default-more":"Por favor selecciona un rango mayor a %d dias","default-single":"Por favor selecciona un dia","default-less":"Por favor selecciona un rango menor a %d dias","default-range":"Por favor selecciona un rango entre %d y %d dias","default-default":"Por favor selecciona un rango de fechas."},fr:{selected:"Sélection:",day:"Jour",days:"Jours",apply:"Fermer","week-1":"lu","week-2":"ma","week-3":"me","week-4":"je","week-5":"ve","week-6":"sa","week-7":"di","month-name":["janvier","février","mars","avril","mai","juin","juillet","août","septembre","octobre","novembre","décembre"],shortcuts:"Raccourcis",past:"Passé",following:"Suivant",previous:"Précédent","prev-week":"Semaine","prev-month":"Mois","prev-year":"Année",next:"Suivant","next-week":"Semaine","next-month":"Mois","next-year":"Année","less-than":"L'intervalle ne doit pas être supérieure à %d jours","more-than":"L'intervalle ne doit pas être inférieure à %d jours","default-more":"Merci de choisir une intervalle supérieure à %d jours","default-single":"Merci de choisir une date","default-less":"Merci de choisir une intervalle inférieure %d jours","default-range":"Merci de choisir une intervalle comprise entre %d et %d jours","default-default":"Merci de choisir une date"},hu:{selected:"Kiválasztva:",day:"Nap",days:"Nap",apply:"Ok","week-1":"h","week-2":"k","week-3":"sz","week-4":"cs","week-5":"p","week-6":"sz","week-7":"v","month-name":["január","február","március","április","május","június","július","augusztus","szeptember","október","november","december"],shortcuts:"Gyorsválasztó",past:"Múlt",following:"Következő",previous:"Előző","prev-week":"Hét","prev-month":"Hónap","prev-year":"Év",next:"Következő","next-week":"Hét","next-month":"Hónap","next-year":"Év","less-than":"A kiválasztás nem lehet több %d napnál","more-than":"A kiválasztás nem lehet több %d napnál","default-more":"Válassz ki egy időszakot ami hosszabb mint %d nap","default-single":"Válassz egy napot","default-less":"Válassz ki egy időszakot ami rövidebb mint %d nap","default-range":"Válassz ki egy %d - %d nap hosszú időszakot","default-default":"Válassz ki egy időszakot"},it:{selected:"Selezionati:",day:"Giorno",days:"Giorni",apply:"Chiudi","week-1":"lu","week-2":"ma","week-3":"me","week-4":"gi","week-5":"ve","week-6":"sa","week-7":"do","month-name":["gennaio","febbraio","marzo","aprile","maggio","giugno","luglio","agosto","settembre","ottobre","novembre","dicembre"],shortcuts:"Scorciatoie",past:"Scorso",following:"Successivo",previous:"Precedente","prev-week":"Settimana","prev-month":"Mese","prev-year":"Anno",next:"Prossimo","next-week":"Settimana","next-month":"Mese","next-year":"Anno","less-than":"L'intervallo non dev'essere maggiore di %d giorni","more-than":"L'intervallo non dev'essere minore di %d giorni","default-more":"Seleziona un intervallo maggiore di %d giorni","default-single":"Seleziona una data","default-less":"Seleziona un intervallo minore di %d giorni","default-range":"Seleziona un intervallo compreso tra i %d e i %d giorni","default-default":"Seleziona un intervallo di date"},no:{selected:"Valgt:",day:"Dag",days:"Dager",apply:"Lukk","week-1":"ma","week-2":"ti","week-3":"on","week-4":"to","week-5":"fr","week-6":"lø","week-7":"sø","month-name":["januar","februar","mars","april","mai","juni","juli","august","september","oktober","november","desember"],shortcuts:"Snarveier","custom-values":"Egendefinerte Verdier",
+this.optgroups={},this.renderCache={},this.trigger("optgroup_clear")},updateOption:function(t,n){var r,i,a,o,s,l,u,d=this;if(t=S(t),a=S(n[d.settings.valueField]),null!==t&&d.options.hasOwnProperty(t)){if("string"!=typeof a)throw new Error("Value must be set in option data");u=d.options[t].$order,a!==t&&(delete d.options[t],o=d.items.indexOf(t),o!==-1&&d.items.splice(o,1,a)),n.$order=n.$order||u,d.options[a]=n,s=d.renderCache.item,l=d.renderCache.option,s&&(delete s[t],delete s[a]),l&&(delete l[t],delete l[a]),d.items.indexOf(a)!==-1&&(r=d.getItem(t),i=e(d.render("item",n)),r.hasClass("active")&&i.addClass("active"),r.replaceWith(i)),d.lastQuery=null,d.isOpen&&d.refreshOptions(!1)}},removeOption:function(e,t){var n=this;e=S(e);var r=n.renderCache.item,i=n.renderCache.option;r&&delete r[e],i&&delete i[e],delete n.userOptions[e],delete n.options[e],n.lastQuery=null,n.trigger("option_remove",e),n.removeItem(e,t)},clearOptions:function(){var e=this;e.loadedSearches={},e.userOptions={},e.renderCache={},e.options=e.sifter.items={},e.lastQuery=null,e.trigger("option_clear"),e.clear()},getOption:function(e){return this.getElementWithValue(e,this.$dropdown_content.find("[data-selectable]"))},getAdjacentOption:function(t,n){var r=this.$dropdown.find("[data-selectable]"),i=r.index(t)+n;return i>=0&&i<r.length?r.eq(i):e()},getElementWithValue:function(t,n){if(t=S(t),"undefined"!=typeof t&&null!==t)for(var r=0,i=n.length;r<i;r++)if(n[r].getAttribute("data-value")===t)return e(n[r]);return e()},getItem:function(e){return this.getElementWithValue(e,this.$control.children())},addItems:function(t,n){for(var r=e.isArray(t)?t:[t],i=0,a=r.length;i<a;i++)this.isPending=i<a-1,this.addItem(r[i],n)},addItem:function(t,n){var r=n?[]:["change"];Y(this,r,function(){var r,i,a,o,s,l=this,u=l.settings.mode;return t=S(t),l.items.indexOf(t)!==-1?void("single"===u&&l.close()):void(l.options.hasOwnProperty(t)&&("single"===u&&l.clear(n),"multi"===u&&l.isFull()||(r=e(l.render("item",l.options[t])),s=l.isFull(),l.items.splice(l.caretPos,0,t),l.insertAtCaret(r),(!l.isPending||!s&&l.isFull())&&l.refreshState(),l.isSetup&&(a=l.$dropdown_content.find("[data-selectable]"),l.isPending||(i=l.getOption(t),o=l.getAdjacentOption(i,1).attr("data-value"),l.refreshOptions(l.isFocused&&"single"!==u),o&&l.setActiveOption(l.getOption(o))),!a.length||l.isFull()?l.close():l.positionDropdown(),l.updatePlaceholder(),l.trigger("item_add",t,r),l.updateOriginalInput({silent:n})))))})},removeItem:function(t,n){var r,i,a,o=this;r=t instanceof e?t:o.getItem(t),t=S(r.attr("data-value")),i=o.items.indexOf(t),i!==-1&&(r.remove(),r.hasClass("active")&&(a=o.$activeItems.indexOf(r[0]),o.$activeItems.splice(a,1)),o.items.splice(i,1),o.lastQuery=null,!o.settings.persist&&o.userOptions.hasOwnProperty(t)&&o.removeOption(t,n),i<o.caretPos&&o.setCaret(o.caretPos-1),o.refreshState(),o.updatePlaceholder(),o.updateOriginalInput({silent:n}),o.positionDropdown(),o.trigger("item_remove",t,r))},createItem:function(t,n){var r=this,i=r.caretPos;t=t||e.trim(r.$control_input.val()||"");var a=arguments[arguments.length-1];if("function"!=typeof a&&(a=function(){}),"boolean"!=typeof n&&(n=!0),!r.canCreate(t))return a(),!1;r.lock();var o="function"==typeof r.settings.create?this.settings.create:function(e){var t={};return t[r.settings.labelField]=e,t[r.settings.valueField]=e,t},s=T(function(e){if(r.unlock(),!e||"object"!=typeof e)return a();var t=S(e[r.settings.valueField]);return"string"!=typeof t?a():(r.setTextboxValue(""),r.addOption(e),r.setCaret(i),r.addItem(t),r.refreshOptions(n&&"single"!==r.settings.mode),void a(e))}),l=o.apply(this,[t,s]);return"undefined"!=typeof l&&s(l),!0},refreshItems:function(){this.lastQuery=null,this.isSetup&&this.addItem(this.items),this.refreshState(),this.updateOriginalInput()},refreshState:function(){this.refreshValidityState(),this.refreshClasses()},refreshValidityState:function(){if(!this.isRequired)return!1;var e=!this.items.length;this.isInvalid=e,this.$control_input.prop("required",e),this.$input.prop("required",!e)},refreshClasses:function(){var t=this,n=t.isFull(),r=t.isLocked;t.$wrapper.toggleClass("rtl",t.rtl),t.$control.toggleClass("focus",t.isFocused).toggleClass("disabled",t.isDisabled).toggleClass("required",t.isRequired).toggleClass("invalid",t.isInvalid).toggleClass("locked",r).toggleClass("full",n).toggleClass("not-full",!n).toggleClass("input-active",t.isFocused&&!t.isInputHidden).toggleClass("dropdown-active",t.isOpen).toggleClass("has-options",!e.isEmptyObject(t.options)).toggleClass("has-items",t.items.length>0),t.$control_input.data("grow",!n&&!r)},isFull:function(){return null!==this.settings.maxItems&&this.items.length>=this.settings.maxItems},updateOriginalInput:function(e){var t,n,r,i,a=this;if(e=e||{},a.tagType===k){for(r=[],t=0,n=a.items.length;t<n;t++)i=a.options[a.items[t]][a.settings.labelField]||"",r.push('<option value="'+C(a.items[t])+'" selected="selected">'+C(i)+"</option>");r.length||this.$input.attr("multiple")||r.push('<option value="" selected="selected"></option>'),a.$input.html(r.join(""))}else a.$input.val(a.getValue()),a.$input.attr("value",a.$input.val());a.isSetup&&(e.silent||a.trigger("change",a.$input.val()))},updatePlaceholder:function(){if(this.settings.placeholder){var e=this.$control_input;this.items.length?e.removeAttr("placeholder"):e.attr("placeholder",this.settings.placeholder),e.triggerHandler("update",{force:!0})}},open:function(){var e=this;e.isLocked||e.isOpen||"multi"===e.settings.mode&&e.isFull()||(e.focus(),e.isOpen=!0,e.refreshState(),e.$dropdown.css({visibility:"hidden",display:"block"}),e.positionDropdown(),e.$dropdown.css({visibility:"visible"}),e.trigger("dropdown_open",e.$dropdown))},close:function(){var e=this,t=e.isOpen;"single"===e.settings.mode&&e.items.length&&(e.hideInput(),e.$control_input.blur()),e.isOpen=!1,e.$dropdown.hide(),e.setActiveOption(null),e.refreshState(),t&&e.trigger("dropdown_close",e.$dropdown)},positionDropdown:function(){var e=this.$control,t="body"===this.settings.dropdownParent?e.offset():e.position();t.top+=e.outerHeight(!0),this.$dropdown.css({width:e.outerWidth(),top:t.top,left:t.left})},clear:function(e){var t=this;t.items.length&&(t.$control.children(":not(input)").remove(),t.items=[],t.lastQuery=null,t.setCaret(0),t.setActiveItem(null),t.updatePlaceholder(),t.updateOriginalInput({silent:e}),t.refreshState(),t.showInput(),t.trigger("clear"))},insertAtCaret:function(t){var n=Math.min(this.caretPos,this.items.length);0===n?this.$control.prepend(t):e(this.$control[0].childNodes[n]).before(t),this.setCaret(n+1)},deleteSelection:function(t){var n,r,i,a,o,s,l,u,d,c=this;if(i=t&&t.keyCode===m?-1:1,a=P(c.$control_input[0]),c.$activeOption&&!c.settings.hideSelected&&(l=c.getAdjacentOption(c.$activeOption,-1).attr("data-value")),o=[],c.$activeItems.length){for(d=c.$control.children(".active:"+(i>0?"last":"first")),s=c.$control.children(":not(input)").index(d),i>0&&s++,n=0,r=c.$activeItems.length;n<r;n++)o.push(e(c.$activeItems[n]).attr("data-value"));t&&(t.preventDefault(),t.stopPropagation())}else(c.isFocused||"single"===c.settings.mode)&&c.items.length&&(i<0&&0===a.start&&0===a.length?o.push(c.items[c.caretPos-1]):i>0&&a.start===c.$control_input.val().length&&o.push(c.items[c.caretPos]));if(!o.length||"function"==typeof c.settings.onDelete&&c.settings.onDelete.apply(c,[o])===!1)return!1;for("undefined"!=typeof s&&c.setCaret(s);o.length;)c.removeItem(o.pop());return c.showInput(),c.positionDropdown(),c.refreshOptions(!0),l&&(u=c.getOption(l),u.length&&c.setActiveOption(u)),!0},advanceSelection:function(e,t){var n,r,i,a,o,s,l=this;0!==e&&(l.rtl&&(e*=-1),n=e>0?"last":"first",r=P(l.$control_input[0]),l.isFocused&&!l.isInputHidden?(a=l.$control_input.val().length,o=e<0?0===r.start&&0===r.length:r.start===a,o&&!a&&l.advanceCaret(e,t)):(s=l.$control.children(".active:"+n),s.length&&(i=l.$control.children(":not(input)").index(s),l.setActiveItem(null),l.setCaret(e>0?i+1:i))))},advanceCaret:function(e,t){var n,r,i=this;0!==e&&(n=e>0?"next":"prev",i.isShiftDown?(r=i.$control_input[n](),r.length&&(i.hideInput(),i.setActiveItem(r),t&&t.preventDefault())):i.setCaret(i.caretPos+e))},setCaret:function(t){var n=this;if(t="single"===n.settings.mode?n.items.length:Math.max(0,Math.min(n.items.length,t)),!n.isPending){var r,i,a,o;for(a=n.$control.children(":not(input)"),r=0,i=a.length;r<i;r++)o=e(a[r]).detach(),r<t?n.$control_input.before(o):n.$control.append(o)}n.caretPos=t},lock:function(){this.close(),this.isLocked=!0,this.refreshState()},unlock:function(){this.isLocked=!1,this.refreshState()},disable:function(){var e=this;e.$input.prop("disabled",!0),e.$control_input.prop("disabled",!0).prop("tabindex",-1),e.isDisabled=!0,e.lock()},enable:function(){var e=this;e.$input.prop("disabled",!1),e.$control_input.prop("disabled",!1).prop("tabindex",e.tabIndex),e.isDisabled=!1,e.unlock()},destroy:function(){var t=this,n=t.eventNS,r=t.revertSettings;t.trigger("destroy"),t.off(),t.$wrapper.remove(),t.$dropdown.remove(),t.$input.html("").append(r.$children).removeAttr("tabindex").removeClass("selectized").attr({tabindex:r.tabindex}).show(),t.$control_input.removeData("grow"),t.$input.removeData("selectize"),e(window).off(n),e(document).off(n),e(document.body).off(n),delete t.$input[0].selectize},render:function(t,n){var r,i,a="",o=!1,s=this;return"option"!==t&&"item"!==t||(r=S(n[s.settings.valueField]),o=!!r),o&&(_(s.renderCache[t])||(s.renderCache[t]={}),s.renderCache[t].hasOwnProperty(r))?s.renderCache[t][r]:(a=e(s.settings.render[t].apply(this,[n,C])),"option"===t||"option_create"===t?a.attr("data-selectable",""):"optgroup"===t&&(i=n[s.settings.optgroupValueField]||"",a.attr("data-group",i)),"option"!==t&&"item"!==t||a.attr("data-value",r||""),o&&(s.renderCache[t][r]=a[0]),a[0])},clearCache:function(e){var t=this;"undefined"==typeof e?t.renderCache={}:delete t.renderCache[e]},canCreate:function(e){var t=this;if(!t.settings.create)return!1;var n=t.settings.createFilter;return e.length&&("function"!=typeof n||n.apply(t,[e]))&&("string"!=typeof n||new RegExp(n).test(e))&&(!(n instanceof RegExp)||n.test(e))}}),E.count=0,E.defaults={options:[],optgroups:[],plugins:[],delimiter:",",splitOn:null,persist:!0,diacritics:!0,create:!1,createOnBlur:!1,createFilter:null,highlight:!0,openOnFocus:!0,maxOptions:1e3,maxItems:null,hideSelected:null,addPrecedence:!1,selectOnTab:!1,preload:!1,allowEmptyOption:!1,closeAfterSelect:!1,scrollDuration:60,loadThrottle:300,loadingClass:"loading",dataAttr:"data-data",optgroupField:"optgroup",valueField:"value",labelField:"text",optgroupLabelField:"label",optgroupValueField:"value",lockOptgroupOrder:!1,sortField:"$order",searchField:["text"],searchConjunction:"and",mode:null,wrapperClass:"selectize-control",inputClass:"selectize-input",dropdownClass:"selectize-dropdown",dropdownContentClass:"selectize-dropdown-content",dropdownParent:null,copyClassesToDropdown:!0,render:{}},e.fn.selectize=function(t){var n=e.fn.selectize.defaults,r=e.extend({},n,t),i=r.dataAttr,a=r.labelField,o=r.valueField,s=r.optgroupField,l=r.optgroupLabelField,u=r.optgroupValueField,d=function(t,n){var s,l,u,d,c=t.attr(i);if(c)for(n.options=JSON.parse(c),s=0,l=n.options.length;s<l;s++)n.items.push(n.options[s][o]);else{var f=e.trim(t.val()||"");if(!r.allowEmptyOption&&!f.length)return;for(u=f.split(r.delimiter),s=0,l=u.length;s<l;s++)d={},d[a]=u[s],d[o]=u[s],n.options.push(d);n.items=u}},c=function(t,n){var d,c,f,h,p=n.options,m={},g=function(e){var t=i&&e.attr(i);return"string"==typeof t&&t.length?JSON.parse(t):null},v=function(t,i){t=e(t);var l=S(t.val());if(l||r.allowEmptyOption)if(m.hasOwnProperty(l)){if(i){var u=m[l][s];u?e.isArray(u)?u.push(i):m[l][s]=[u,i]:m[l][s]=i}}else{var d=g(t)||{};d[a]=d[a]||t.text(),d[o]=d[o]||l,d[s]=d[s]||i,m[l]=d,p.push(d),t.is(":selected")&&n.items.push(l)}},y=function(t){var r,i,a,o,s;for(t=e(t),a=t.attr("label"),a&&(o=g(t)||{},o[l]=a,o[u]=a,n.optgroups.push(o)),s=e("option",t),r=0,i=s.length;r<i;r++)v(s[r],a)};for(n.maxItems=t.attr("multiple")?null:1,h=t.children(),d=0,c=h.length;d<c;d++)f=h[d].tagName.toLowerCase(),"optgroup"===f?y(h[d]):"option"===f&&v(h[d])};return this.each(function(){if(!this.selectize){var i,a=e(this),o=this.tagName.toLowerCase(),s=a.attr("placeholder")||a.attr("data-placeholder");s||r.allowEmptyOption||(s=a.children('option[value=""]').text());var l={placeholder:s,options:[],optgroups:[],items:[]};"select"===o?c(a,l):d(a,l),i=new E(a,e.extend(!0,{},n,l,t))}})},e.fn.selectize.defaults=E.defaults,e.fn.selectize.support={validity:D},E.define("drag_drop",function(t){if(!e.fn.sortable)throw new Error('The "drag_drop" plugin requires jQuery UI "sortable".');if("multi"===this.settings.mode){var n=this;n.lock=function(){var e=n.lock;return function(){var t=n.$control.data("sortable");return t&&t.disable(),e.apply(n,arguments)}}(),n.unlock=function(){var e=n.unlock;return function(){var t=n.$control.data("sortable");return t&&t.enable(),e.apply(n,arguments)}}(),n.setup=function(){var t=n.setup;return function(){t.apply(this,arguments);var r=n.$control.sortable({items:"[data-value]",forcePlaceholderSize:!0,disabled:n.isLocked,start:function(e,t){t.placeholder.css("width",t.helper.css("width")),r.css({overflow:"visible"})},stop:function(){r.css({overflow:"hidden"});var t=n.$activeItems?n.$activeItems.slice():null,i=[];r.children("[data-value]").each(function(){i.push(e(this).attr("data-value"))}),n.setValue(i),n.setActiveItem(t)}})}}()}}),E.define("dropdown_header",function(t){var n=this;t=e.extend({title:"Untitled",headerClass:"selectize-dropdown-header",titleRowClass:"selectize-dropdown-header-title",labelClass:"selectize-dropdown-header-label",closeClass:"selectize-dropdown-header-close",html:function(e){return'<div class="'+e.headerClass+'"><div class="'+e.titleRowClass+'"><span class="'+e.labelClass+'">'+e.title+'</span><a href="javascript:void(0)" class="'+e.closeClass+'">&times;</a></div></div>'}},t),n.setup=function(){var r=n.setup;return function(){r.apply(n,arguments),n.$dropdown_header=e(t.html(t)),n.$dropdown.prepend(n.$dropdown_header)}}()}),E.define("optgroup_columns",function(t){var n=this;t=e.extend({equalizeWidth:!0,equalizeHeight:!0},t),this.getAdjacentOption=function(t,n){var r=t.closest("[data-group]").find("[data-selectable]"),i=r.index(t)+n;return i>=0&&i<r.length?r.eq(i):e()},this.onKeyDown=function(){var e=n.onKeyDown;return function(t){var r,i,a,o;return!this.isOpen||t.keyCode!==u&&t.keyCode!==f?e.apply(this,arguments):(n.ignoreHover=!0,o=this.$activeOption.closest("[data-group]"),r=o.find("[data-selectable]").index(this.$activeOption),o=t.keyCode===u?o.prev("[data-group]"):o.next("[data-group]"),a=o.find("[data-selectable]"),i=a.eq(Math.min(a.length-1,r)),void(i.length&&this.setActiveOption(i)))}}();var r=function(){var e,t=r.width,n=document;return"undefined"==typeof t&&(e=n.createElement("div"),e.innerHTML='<div style="width:50px;height:50px;position:absolute;left:-50px;top:-50px;overflow:auto;"><div style="width:1px;height:100px;"></div></div>',e=e.firstChild,n.body.appendChild(e),t=r.width=e.offsetWidth-e.clientWidth,n.body.removeChild(e)),t},i=function(){var i,a,o,s,l,u,d;if(d=e("[data-group]",n.$dropdown_content),a=d.length,a&&n.$dropdown_content.width()){if(t.equalizeHeight){for(o=0,i=0;i<a;i++)o=Math.max(o,d.eq(i).height());d.css({height:o})}t.equalizeWidth&&(u=n.$dropdown_content.innerWidth()-r(),s=Math.round(u/a),d.css({width:s}),a>1&&(l=u-s*(a-1),d.eq(a-1).css({width:l})))}};(t.equalizeHeight||t.equalizeWidth)&&(O.after(this,"positionDropdown",i),O.after(this,"refreshOptions",i))}),E.define("remove_button",function(t){t=e.extend({label:"&times;",title:"Remove",className:"remove",append:!0},t);var n=function(t,n){n.className="remove-single";var r=t,i='<a href="javascript:void(0)" class="'+n.className+'" tabindex="-1" title="'+C(n.title)+'">'+n.label+"</a>",a=function(e,t){return e+t};t.setup=function(){var o=r.setup;return function(){if(n.append){var s=e(r.$input.context).attr("id"),l=(e("#"+s),r.settings.render.item);r.settings.render.item=function(e){return a(l.apply(t,arguments),i)}}o.apply(t,arguments),t.$control.on("click","."+n.className,function(e){e.preventDefault(),r.isLocked||r.clear()})}}()},r=function(t,n){var r=t,i='<a href="javascript:void(0)" class="'+n.className+'" tabindex="-1" title="'+C(n.title)+'">'+n.label+"</a>",a=function(e,t){var n=e.search(/(<\/[^>]+>\s*)$/);return e.substring(0,n)+t+e.substring(n)};t.setup=function(){var o=r.setup;return function(){if(n.append){var s=r.settings.render.item;r.settings.render.item=function(e){return a(s.apply(t,arguments),i)}}o.apply(t,arguments),t.$control.on("click","."+n.className,function(t){if(t.preventDefault(),!r.isLocked){var n=e(t.currentTarget).parent();r.setActiveItem(n),r.deleteSelection()&&r.setCaret(r.items.length)}})}}()};return"single"===this.settings.mode?void n(this,t):void r(this,t)}),E.define("restore_on_backspace",function(e){var t=this;e.text=e.text||function(e){return e[this.settings.labelField]},this.onKeyDown=function(){var n=t.onKeyDown;return function(t){var r,i;return t.keyCode===m&&""===this.$control_input.val()&&!this.$activeItems.length&&(r=this.caretPos-1,r>=0&&r<this.items.length)?(i=this.options[this.items[r]],this.deleteSelection(t)&&(this.setTextboxValue(e.text.apply(this,[i])),this.refreshOptions(!0)),void t.preventDefault()):n.apply(this,arguments)}}()}),E})},{jquery:1,microplugin:2,sifter:5}],5:[function(e,t,n){!function(e,r){"function"==typeof define&&define.amd?define(r):"object"==typeof n?t.exports=r():e.Sifter=r()}(this,function(){var e=function(e,t){this.items=e,this.settings=t||{diacritics:!0}};e.prototype.tokenize=function(e){if(e=i(String(e||"").toLowerCase()),!e||!e.length)return[];var t,n,r,o,l=[],u=e.split(/ +/);for(t=0,n=u.length;t<n;t++){if(r=a(u[t]),this.settings.diacritics)for(o in s)s.hasOwnProperty(o)&&(r=r.replace(new RegExp(o,"g"),s[o]));l.push({string:u[t],regex:new RegExp(r,"i")})}return l},e.prototype.iterator=function(e,t){var n;n=o(e)?Array.prototype.forEach||function(e){for(var t=0,n=this.length;t<n;t++)e(this[t],t,this)}:function(e){for(var t in this)this.hasOwnProperty(t)&&e(this[t],t,this)},n.apply(e,[t])},e.prototype.getScoreFunction=function(e,t){var n,i,a,o,s;n=this,e=n.prepareSearch(e,t),a=e.tokens,i=e.options.fields,o=a.length,s=e.options.nesting;var l=function(e,t){var n,r;return e?(e=String(e||""),r=e.search(t.regex),r===-1?0:(n=t.string.length/e.length,0===r&&(n+=.5),n)):0},u=function(){var e=i.length;return e?1===e?function(e,t){return l(r(t,i[0],s),e)}:function(t,n){for(var a=0,o=0;a<e;a++)o+=l(r(n,i[a],s),t);return o/e}:function(){return 0}}();return o?1===o?function(e){return u(a[0],e)}:"and"===e.options.conjunction?function(e){for(var t,n=0,r=0;n<o;n++){if(t=u(a[n],e),t<=0)return 0;r+=t}return r/o}:function(e){for(var t=0,n=0;t<o;t++)n+=u(a[t],e);return n/o}:function(){return 0}},e.prototype.getSortFunction=function(e,n){var i,a,o,s,l,u,d,c,f,h,p;if(o=this,e=o.prepareSearch(e,n),p=!e.query&&n.sort_empty||n.sort,f=function(e,t){return"$score"===e?t.score:r(o.items[t.id],e,n.nesting)},l=[],p)for(i=0,a=p.length;i<a;i++)(e.query||"$score"!==p[i].field)&&l.push(p[i]);if(e.query){for(h=!0,i=0,a=l.length;i<a;i++)if("$score"===l[i].field){h=!1;break}h&&l.unshift({field:"$score",direction:"desc"})}else for(i=0,a=l.length;i<a;i++)if("$score"===l[i].field){l.splice(i,1);break}for(c=[],i=0,a=l.length;i<a;i++)c.push("desc"===l[i].direction?-1:1);return u=l.length,u?1===u?(s=l[0].field,d=c[0],function(e,n){return d*t(f(s,e),f(s,n))}):function(e,n){var r,i,a;for(r=0;r<u;r++)if(a=l[r].field,i=c[r]*t(f(a,e),f(a,n)))return i;return 0}:null},e.prototype.prepareSearch=function(e,t){if("object"==typeof e)return e;t=n({},t);var r=t.fields,i=t.sort,a=t.sort_empty;return r&&!o(r)&&(t.fields=[r]),i&&!o(i)&&(t.sort=[i]),a&&!o(a)&&(t.sort_empty=[a]),{options:t,query:String(e||"").toLowerCase(),tokens:this.tokenize(e),total:0,items:[]}},e.prototype.search=function(e,t){var n,r,i,a,o=this;return r=this.prepareSearch(e,t),t=r.options,e=r.query,a=t.score||o.getScoreFunction(r),e.length?o.iterator(o.items,function(e,i){n=a(e),(t.filter===!1||n>0)&&r.items.push({score:n,id:i})}):o.iterator(o.items,function(e,t){r.items.push({score:1,id:t})}),i=o.getSortFunction(r,t),i&&r.items.sort(i),r.total=r.items.length,"number"==typeof t.limit&&(r.items=r.items.slice(0,t.limit)),r};var t=function(e,t){return"number"==typeof e&&"number"==typeof t?e>t?1:e<t?-1:0:(e=l(String(e||"")),t=l(String(t||"")),e>t?1:t>e?-1:0)},n=function(e,t){var n,r,i,a;for(n=1,r=arguments.length;n<r;n++)if(a=arguments[n])for(i in a)a.hasOwnProperty(i)&&(e[i]=a[i]);return e},r=function(e,t,n){if(e&&t){if(!n)return e[t];for(var r=t.split(".");r.length&&(e=e[r.shift()]););return e}},i=function(e){return(e+"").replace(/^\s+|\s+$|/g,"")},a=function(e){return(e+"").replace(/([.?*+^$[\]\\(){}|-])/g,"\\$1")},o=Array.isArray||"undefined"!=typeof $&&$.isArray||function(e){return"[object Array]"===Object.prototype.toString.call(e)},s={a:"[aḀḁĂăÂâǍǎȺⱥȦȧẠạÄäÀàÁáĀāÃãÅåąĄÃąĄ]",b:"[b␢βΒB฿𐌁ᛒ]",c:"[cĆćĈĉČčĊċC̄c̄ÇçḈḉȻȼƇƈɕᴄＣｃ]",d:"[dĎďḊḋḐḑḌḍḒḓḎḏĐđD̦d̦ƉɖƊɗƋƌᵭᶁᶑȡᴅＤｄð]",e:"[eÉéÈèÊêḘḙĚěĔĕẼẽḚḛẺẻĖėËëĒēȨȩĘęᶒɆɇȄȅẾếỀềỄễỂểḜḝḖḗḔḕȆȇẸẹỆệⱸᴇＥｅɘǝƏƐε]",f:"[fƑƒḞḟ]",g:"[gɢ₲ǤǥĜĝĞğĢģƓɠĠġ]",h:"[hĤĥĦħḨḩẖẖḤḥḢḣɦʰǶƕ]",i:"[iÍíÌìĬĭÎîǏǐÏïḮḯĨĩĮįĪīỈỉȈȉȊȋỊịḬḭƗɨɨ̆ᵻᶖİiIıɪＩｉ]",j:"[jȷĴĵɈɉʝɟʲ]",k:"[kƘƙꝀꝁḰḱǨǩḲḳḴḵκϰ₭]",l:"[lŁłĽľĻļĹĺḶḷḸḹḼḽḺḻĿŀȽƚⱠⱡⱢɫɬᶅɭȴʟＬｌ]",n:"[nŃńǸǹŇňÑñṄṅŅņṆṇṊṋṈṉN̈n̈ƝɲȠƞᵰᶇɳȵɴＮｎŊŋ]",o:"[oØøÖöÓóÒòÔôǑǒŐőŎŏȮȯỌọƟɵƠơỎỏŌōÕõǪǫȌȍՕօ]",p:"[pṔṕṖṗⱣᵽƤƥᵱ]",q:"[qꝖꝗʠɊɋꝘꝙq̃]",r:"[rŔŕɌɍŘřŖŗṘṙȐȑȒȓṚṛⱤɽ]",s:"[sŚśṠṡṢṣꞨꞩŜŝŠšŞşȘșS̈s̈]",t:"[tŤťṪṫŢţṬṭƮʈȚțṰṱṮṯƬƭ]",u:"[uŬŭɄʉỤụÜüÚúÙùÛûǓǔŰűŬŭƯưỦủŪūŨũŲųȔȕ∪]",v:"[vṼṽṾṿƲʋꝞꝟⱱʋ]",w:"[wẂẃẀẁŴŵẄẅẆẇẈẉ]",x:"[xẌẍẊẋχ]",y:"[yÝýỲỳŶŷŸÿỸỹẎẏỴỵɎɏƳƴ]",z:"[zŹźẐẑŽžŻżẒẓẔẕƵƶ]"},l=function(){var e,t,n,r,i="",a={};for(n in s)if(s.hasOwnProperty(n))for(r=s[n].substring(2,s[n].length-1),i+=r,e=0,t=r.length;e<t;e++)a[r.charAt(e)]=n;var o=new RegExp("["+i+"]","g");return function(e){return e.replace(o,function(e){return a[e]}).toLowerCase()}}();return e})},{}],6:[function(c,k,l){var a=c('jquery'),h=c('moment');c('../../vendor/jquery-date-range-picker/jquery.daterangepicker');c('selectize');var b='hh:mmA dddd, MMM DD, YYYY',j='dddd, MMM DD, YYYY';function d(c,f,e){var g=a.extend({format:f,singleDate:true,showTopBar:false},e);var b=a(c);if(b.length){b.dateRangePicker(g)}return b}function g(h,f){var b=a(f),c=a(document.createElement('div')),d=null;b.addClass('txtstuff');c.addClass('hiddendiv common form-control');b.after(c);function e(){d=b.val();d=d.replace(/\n/g,'<br>');c.html(d+'<br class="lbr">');b.css('height',c.height()+20)}e();b.on('keyup',e)}function e(c,d){var b=a(c);if(!b.length){return b}b.selectize(a.extend({valueField:'value',labelField:'text',searchField:'text',preload:true,score:function(){return function(){return 1}},load:function(d,c){a.ajax({url:b.data('search-url'),data:{q:d,email:b.data('email')},error:function(){c()},success:function(a){c(a.results)}})}},d));return b}function i(c){var b=c.data('changes-url');if(!b||!window.EventSource){return}var d=new EventSource(b);d.addEventListener('change',function(e){var d=JSON.parse(e.data),b=c.find('[data-foia="'+d.foia+'"]');if(!b.length){if(d.created){a('#new-requests').removeClass('hidden')}return}if(d.deleted){b.remove();return}a.ajax({url:b.data('row-url'),error:function(a){if(a.status===404){b.remove()}},success:function(d){var e=b.find('input[name="foias"]').prop('checked'),c=a(a.parseHTML(a.trim(d)));c.find('input[name="foias"]').prop('checked',e);b.replaceWith(c)}})})}function f(){var b=a('#id_status input:checked').val();a('#amounts').toggle(['relatg','relagc'].indexOf(b)!==-1)}a(function(){d('input[name*="-scheduled_time"]',b,{startDate:h().format(b),setValue:function(d){var c=h(d,b).hour(10).minute(0);a(this).val(c.format(b))}});d('#id_update_date',j);d('#id_sent',j);a('textarea').each(g);e('#id_recipients',{required:true,preload:false,create:function(a){return{value:a,text:a}}});if(a('#amounts').length){f();a('#id_status input').on('change',f)}a('fieldset.collapsible').on('click','legend',function(b){b.preventDefault();a(this).parent().toggleClass('collapsed')});a('#id_project').selectize();a('#id_collaborators').selectize({multiple:true});i(a('form.bulk-update'));var c=a('#id_foia');e(c,{onLoad:function(a){if(c.data('email')&&!this.getValue()&&a&&a.length){this.setValue(a[0].value)}}})})},{"../../vendor/jquery-date-range-picker/jquery.daterangepicker":7,jquery:1,moment:3,selectize:4}],7:[function(e,t,n){!function(r){"function"==typeof define&&define.amd?define(["jquery","moment"],r):"object"==typeof n&&"undefined"!=typeof t?t.exports=r(e("jquery"),e("moment")):r(jQuery,moment)}(function(e,t){e.dateRangePickerLanguages={"default":{selected:"Selected:",day:"Day",days:"Days",apply:"Close","week-1":"mo","week-2":"tu","week-3":"we","week-4":"th","week-5":"fr","week-6":"sa","week-7":"su","week-number":"W","month-name":["january","february","march","april","may","june","july","august","september","october","november","december"],shortcuts:"Shortcuts","custom-values":"Custom Values",past:"Past",following:"Following",previous:"Previous","prev-week":"Week","prev-month":"Month","prev-year":"Year",next:"Next","next-week":"Week","next-month":"Month","next-year":"Year","less-than":"Date range should not be more than %d days","more-than":"Date range should not be less than %d days","default-more":"Please select a date range longer than %d days","default-single":"Please select a date","default-less":"Please select a date range less than %d days","default-range":"Please select a date range between %d and %d days","default-default":"Please select a date range",time:"Time",hour:"Hour",minute:"Minute"},az:{selected:"Seçildi:",day:" gün",days:" gün",apply:"tətbiq","week-1":"1","week-2":"2","week-3":"3","week-4":"4","week-5":"5","week-6":"6","week-7":"7","month-name":["yanvar","fevral","mart","aprel","may","iyun","iyul","avqust","sentyabr","oktyabr","noyabr","dekabr"],shortcuts:"Qısayollar",past:"Keçmiş",following:"Növbəti",previous:"&nbsp;&nbsp;&nbsp;","prev-week":"Öncəki həftə","prev-month":"Öncəki ay","prev-year":"Öncəki il",next:"&nbsp;&nbsp;&nbsp;","next-week":"Növbəti həftə","next-month":"Növbəti ay","next-year":"Növbəti il","less-than":"Tarix aralığı %d gündən çox olmamalıdır","more-than":"Tarix aralığı %d gündən az olmamalıdır","default-more":"%d gündən çox bir tarix seçin","default-single":"Tarix seçin","default-less":"%d gündən az bir tarix seçin","default-range":"%d və %d gün aralığında tarixlər seçin","default-default":"Tarix aralığı seçin"},cn:{selected:"已选择:",day:"天",days:"天",apply:"确定","week-1":"一","week-2":"二","week-3":"三","week-4":"四","week-5":"五","week-6":"六","week-7":"日","week-number":"周","month-name":["一月","二月","三月","四月","五月","六月","七月","八月","九月","十月","十一月","十二月"],shortcuts:"快捷选择",past:"过去",following:"将来",previous:"&nbsp;&nbsp;&nbsp;","prev-week":"上周","prev-month":"上个月","prev-year":"去年",next:"&nbsp;&nbsp;&nbsp;","next-week":"下周","next-month":"下个月","next-year":"明年","less-than":"所选日期范围不能大于%d天","more-than":"所选日期范围不能小于%d天","default-more":"请选择大于%d天的日期范围","default-less":"请选择小于%d天的日期范围","default-range":"请选择%d天到%d天的日期范围","default-single":"请选择一个日期","default-default":"请选择一个日期范围",time:"时间",hour:"小时",minute:"分钟"},cz:{selected:"Vybráno:",day:"Den",days:"Dny",apply:"Zavřít","week-1":"po","week-2":"út","week-3":"st","week-4":"čt","week-5":"pá","week-6":"so","week-7":"ne","month-name":["leden","únor","březen","duben","květen","červen","červenec","srpen","září","říjen","listopad","prosinec"],shortcuts:"Zkratky",past:"po",following:"následující",previous:"předchozí","prev-week":"týden","prev-month":"měsíc","prev-year":"rok",next:"další","next-week":"týden","next-month":"měsíc","next-year":"rok","less-than":"Rozsah data by neměl být větší než %d dnů","more-than":"Rozsah data by neměl být menší než %d dnů","default-more":"Prosím zvolte rozsah data větší než %d dnů","default-single":"Prosím zvolte datum","default-less":"Prosím zvolte rozsah data menší než %d dnů","default-range":"Prosím zvolte rozsah data mezi %d a %d dny","default-default":"Prosím zvolte rozsah data"},de:{selected:"Auswahl:",day:"Tag",days:"Tage",apply:"Schließen","week-1":"mo","week-2":"di","week-3":"mi","week-4":"do","week-5":"fr","week-6":"sa","week-7":"so","month-name":["januar","februar","märz","april","mai","juni","juli","august","september","oktober","november","dezember"],shortcuts:"Schnellwahl",past:"Vorherige",following:"Folgende",previous:"Vorherige","prev-week":"Woche","prev-month":"Monat","prev-year":"Jahr",next:"Nächste","next-week":"Woche","next-month":"Monat","next-year":"Jahr","less-than":"Datumsbereich darf nicht größer sein als %d Tage","more-than":"Datumsbereich darf nicht kleiner sein als %d Tage","default-more":"Bitte mindestens %d Tage auswählen","default-single":"Bitte ein Datum auswählen","default-less":"Bitte weniger als %d Tage auswählen","default-range":"Bitte einen Datumsbereich zwischen %d und %d Tagen auswählen","default-default":"Bitte ein Start- und Enddatum auswählen",Time:"Zeit",hour:"Stunde",minute:"Minute"},es:{selected:"Seleccionado:",day:"Dia",days:"Dias",apply:"Cerrar","week-1":"lu","week-2":"ma","week-3":"mi","week-4":"ju","week-5":"vi","week-6":"sa","week-7":"do","month-name":["enero","febrero","marzo","abril","mayo","junio","julio","agosto","septiembre","octubre","noviembre","diciembre"],shortcuts:"Accesos directos",past:"Pasado",following:"Siguiente",previous:"Anterior","prev-week":"Semana","prev-month":"Mes","prev-year":"Año",next:"Siguiente","next-week":"Semana","next-month":"Mes","next-year":"Año","less-than":"El rango no deberia ser mayor de %d dias","more-than":"El rango no deberia ser menor de %d dias","default-more":"Por favor selecciona un rango mayor a %d dias","default-single":"Por favor selecciona un dia","default-less":"Por favor selecciona un rango menor a %d dias","default-range":"Por favor selecciona un rango entre %d y %d dias","default-default":"Por favor selecciona un rango de fechas."},fr:{selected:"Sélection:",day:"Jour",days:"Jours",apply:"Fermer","week-1":"lu","week-2":"ma","week-3":"me","week-4":"je","week-5":"ve","week-6":"sa","week-7":"di","month-name":["janvier","février","mars","avril","mai","juin","juillet","août","septembre","octobre","novembre","décembre"],shortcuts:"Raccourcis",past:"Passé",following:"Suivant",previous:"Précédent","prev-week":"Semaine","prev-month":"Mois","prev-year":"Année",next:"Suivant","next-week":"Semaine","next-month":"Mois","next-year":"Année","less-than":"L'intervalle ne doit pas être supérieure à %d jours","more-than":"L'intervalle ne doit pas être inférieure à %d jours","default-more":"Merci de choisir une intervalle supérieure à %d jours","default-single":"Merci de choisir une date","default-less":"Merci de choisir une intervalle inférieure %d jours","default-range":"Merci de choisir une intervalle comprise entre %d et %d jours","default-default":"Merci de choisir une date"},hu:{selected:"Kiválasztva:",day:"Nap",days:"Nap",apply:"Ok","week-1":"h","week-2":"k","week-3":"sz","week-4":"cs","week-5":"p","week-6":"sz","week-7":"v","month-name":["január","február","március","április","május","június","július","augusztus","szeptember","október","november","december"],shortcuts:"Gyorsválasztó",past:"Múlt",following:"Következő",previous:"Előző","prev-week":"Hét","prev-month":"Hónap","prev-year":"Év",next:"Következő","next-week":"Hét","next-month":"Hónap","next-year":"Év","less-than":"A kiválasztás nem lehet több %d napnál","more-than":"A kiválasztás nem lehet több %d napnál","default-more":"Válassz ki egy időszakot ami hosszabb mint %d nap","default-single":"Válassz egy napot","default-less":"Válassz ki egy időszakot ami rövidebb mint %d nap","default-range":"Válassz ki egy %d - %d nap hosszú időszakot","default-default":"Válassz ki egy időszakot"},it:{selected:"Selezionati:",day:"Giorno",days:"Giorni",apply:"Chiudi","week-1":"lu","week-2":"ma","week-3":"me","week-4":"gi","week-5":"ve","week-6":"sa","week-7":"do","month-name":["gennaio","febbraio","marzo","aprile","maggio","giugno","luglio","agosto","settembre","ottobre","novembre","dicembre"],shortcuts:"Scorciatoie",past:"Scorso",following:"Successivo",previous:"Precedente","prev-week":"Settimana","prev-month":"Mese","prev-year":"Anno",next:"Prossimo","next-week":"Settimana","next-month":"Mese","next-year":"Anno","less-than":"L'intervallo non dev'essere maggiore di %d giorni","more-than":"L'intervallo non dev'essere minore di %d giorni","default-more":"Seleziona un intervallo maggiore di %d giorni","default-single":"Seleziona una data","default-less":"Seleziona un intervallo minore di %d giorni","default-range":"Seleziona un intervallo compreso tra i %d e i %d giorni","default-default":"Seleziona un intervallo di date"},no:{selected:"Valgt:",day:"Dag",days:"Dager",apply:"Lukk","week-1":"ma","week-2":"ti","week-3":"on","week-4":"to","week-5":"fr","week-6":"lø","week-7":"sø","month-name":["januar","februar","mars","april","mai","juni","juli","august","september","oktober","november","desember"],shortcuts:"Snarveier","custom-values":"Egendefinerte Verdier",
 past:"Over",following:"Følger",previous:"Forrige","prev-week":"Uke","prev-month":"Måned","prev-year":"År",next:"Neste","next-week":"Uke","next-month":"Måned","next-year":"År","less-than":"Datoperioden skal ikkje være lengre enn %d dager","more-than":"Datoperioden skal ikkje være kortere enn %d dager","default-more":"Vennligst velg ein datoperiode lengre enn %d dager","default-single":"Vennligst velg ein dato","default-less":"Vennligst velg ein datoperiode mindre enn %d dager","default-range":"Vennligst velg ein datoperiode mellom %d og %d dager","default-default":"Vennligst velg ein datoperiode",time:"Tid",hour:"Time",minute:"Minutter"},nl:{selected:"Geselecteerd:",day:"Dag",days:"Dagen",apply:"Ok","week-1":"ma","week-2":"di","week-3":"wo","week-4":"do","week-5":"vr","week-6":"za","week-7":"zo","month-name":["januari","februari","maart","april","mei","juni","juli","augustus","september","october","november","december"],shortcuts:"Snelkoppelingen","custom-values":"Aangepaste waarden",past:"Verleden",following:"Komend",previous:"Vorige","prev-week":"Week","prev-month":"Maand","prev-year":"Jaar",next:"Volgende","next-week":"Week","next-month":"Maand","next-year":"Jaar","less-than":"Interval moet langer dan %d dagen zijn","more-than":"Interval mag niet minder dan %d dagen zijn","default-more":"Selecteer een interval langer dan %dagen","default-single":"Selecteer een datum","default-less":"Selecteer een interval minder dan %d dagen","default-range":"Selecteer een interval tussen %d en %d dagen","default-default":"Selecteer een interval",time:"Tijd",hour:"Uur",minute:"Minuut"},ru:{selected:"Выбрано:",day:"День",days:"Дней",apply:"Закрыть","week-1":"пн","week-2":"вт","week-3":"ср","week-4":"чт","week-5":"пт","week-6":"сб","week-7":"вс","month-name":["январь","февраль","март","апрель","май","июнь","июль","август","сентябрь","октябрь","ноябрь","декабрь"],shortcuts:"Быстрый выбор",past:"Прошедшие",following:"Следующие",previous:"&nbsp;&nbsp;&nbsp;","prev-week":"Неделя","prev-month":"Месяц","prev-year":"Год",next:"&nbsp;&nbsp;&nbsp;","next-week":"Неделя","next-month":"Месяц","next-year":"Год","less-than":"Диапазон не может быть больше %d дней","more-than":"Диапазон не может быть меньше %d дней","default-more":"Пожалуйста выберите диапазон больше %d дней","default-single":"Пожалуйста выберите дату","default-less":"Пожалуйста выберите диапазон меньше %d дней","default-range":"Пожалуйста выберите диапазон между %d и %d днями","default-default":"Пожалуйста выберите диапазон"},pl:{selected:"Wybrany:",day:"Dzień",days:"Dni",apply:"Zamknij","week-1":"pon","week-2":"wt","week-3":"śr","week-4":"czw","week-5":"pt","week-6":"so","week-7":"nd","month-name":["styczeń","luty","marzec","kwiecień","maj","czerwiec","lipiec","sierpień","wrzesień","październik","listopad","grudzień"],shortcuts:"Skróty","custom-values":"Niestandardowe wartości",past:"Przeszłe",following:"Następne",previous:"Poprzednie","prev-week":"tydzień","prev-month":"miesiąc","prev-year":"rok",next:"Następny","next-week":"tydzień","next-month":"miesiąc","next-year":"rok","less-than":"Okres nie powinien być dłuższy niż %d dni","more-than":"Okres nie powinien być krótszy niż  %d ni","default-more":"Wybierz okres dłuższy niż %d dni","default-single":"Wybierz datę","default-less":"Wybierz okres krótszy niż %d dni","default-range":"Wybierz okres trwający od %d do %d dni","default-default":"Wybierz okres",time:"Czas",hour:"Godzina",minute:"Minuta"},se:{selected:"Vald:",day:"dag",days:"dagar",apply:"godkänn","week-1":"ma","week-2":"ti","week-3":"on","week-4":"to","week-5":"fr","week-6":"lö","week-7":"sö","month-name":["januari","februari","mars","april","maj","juni","juli","augusti","september","oktober","november","december"],shortcuts:"genvägar","custom-values":"Anpassade värden",past:"över",following:"följande",previous:"förra","prev-week":"vecka","prev-month":"månad","prev-year":"år",next:"nästa","next-week":"vecka","next-month":"måned","next-year":"år","less-than":"Datumintervall bör inte vara mindre än %d dagar","more-than":"Datumintervall bör inte vara mer än %d dagar","default-more":"Välj ett datumintervall längre än %d dagar","default-single":"Välj ett datum","default-less":"Välj ett datumintervall mindre än %d dagar","default-range":"Välj ett datumintervall mellan %d och %d dagar","default-default":"Välj ett datumintervall",time:"tid",hour:"timme",minute:"minut"}},e.fn.dateRangePicker=function(n){function r(t,n){return n.contains(t.target)||t.target==n||void 0!=n.childNodes&&e.inArray(t.target,n.childNodes)>=0}function i(){function i(t){var r=e(t).parents("table").hasClass("month2"),i=r?n.month2:n.month1;i=W(i),!n.singleMonth&&!n.singleDate&&!r&&E(i,n.month2)>=0||U(i)||(j(i,r?"month2":"month1"),F())}function o(e){var t=W(n.month1),r=W(n.month2);U(r)||!n.singleDate&&E(t,r)>=0||(j(t,"month1"),j(r,"month2"),Y())}function s(t){var r=e(t).parents("table").hasClass("month2"),i=r?n.month2:n.month1;i=H(i),r&&E(i,n.month1)<=0||U(i)||(j(i,r?"month2":"month1"),F())}function l(e){var t=H(n.month1),r=H(n.month2);U(t)||!n.singleDate&&E(r,t)<=0||(j(r,"month2"),j(t,"month1"),Y())}var u=this;if(e(this).data("date-picker-opened"))return void $();e(this).data("date-picker-opened",!0),ie=R().hide(),ie.append('<div class="date-range-length-tip"></div>'),ie.delegate(".day","mouseleave",function(){ie.find(".date-range-length-tip").hide(),n.singleDate&&D()}),e(n.container).append(ie),n.inline?ie.addClass("inline-wrapper"):a(),n.alwaysOpen&&ie.find(".apply-btn").hide();var c=ne();if(re(c),n.time.enabled)if(n.startDate&&n.endDate||n.start&&n.end)P(t(n.start||n.startDate).toDate(),"time1"),P(t(n.end||n.endDate).toDate(),"time2");else{var f=n.defaultEndTime?n.defaultEndTime:c;P(c,"time1"),P(f,"time2")}var h="";h=te(n.singleDate?"default-single":n.minDays&&n.maxDays?"default-range":n.minDays?"default-more":n.maxDays?"default-less":"default-default"),ie.find(".default-top").html(h.replace(/\%d/,n.minDays).replace(/\%d/,n.maxDays)),n.singleMonth?ie.addClass("single-month"):ie.addClass("two-months"),setTimeout(function(){d(),se=!0},0),ie.click(function(e){e.stopPropagation()}),e(document).bind("click.datepicker",function(e){r(e,u[0])||ie.is(":visible")&&$()}),ie.find(".next").click(function(){n.stickyMonths?o(this):i(this)}),ie.find(".prev").click(function(){n.stickyMonths?l(this):s(this)}),ie.delegate(".day","click",function(t){y(e(this))}),ie.delegate(".day","mouseenter",function(t){x(e(this))}),ie.delegate(".week-number","click",function(t){w(e(this))}),ie.attr("unselectable","on").css("user-select","none").bind("selectstart",function(e){return e.preventDefault(),!1}),ie.find(".apply-btn").click(function(){$();var t=A(new Date(n.start))+n.separator+A(new Date(n.end));e(u).trigger("datepicker-apply",{value:t,date1:new Date(n.start),date2:new Date(n.end)})}),ie.find("[custom]").click(function(){var t=e(this).attr("custom");n.start=!1,n.end=!1,ie.find(".day.checked").removeClass("checked"),n.setValue.call(ue,t),S(),C(!0),Y(),n.autoClose&&$()}),ie.find("[shortcut]").click(function(){var t=e(this).attr("shortcut"),r=new Date,i=!1;if(t.indexOf("day")!=-1){var a=parseInt(t.split(",",2)[1],10);i=new Date((new Date).getTime()+864e5*a),r=new Date(r.getTime()+864e5*(a>0?1:-1))}else if(t.indexOf("week")!=-1){var o=t.indexOf("prev,")!=-1?-1:1;if(1==o)var s="monday"==n.startOfWeek?1:0;else var s="monday"==n.startOfWeek?0:6;for(r=new Date(r.getTime()-864e5);r.getDay()!=s;)r=new Date(r.getTime()+864e5*o);i=new Date(r.getTime()+864e5*o*6)}else if(t.indexOf("month")!=-1){var o=t.indexOf("prev,")!=-1?-1:1;i=1==o?W(r):H(r),i.setDate(1),r=W(i),r.setDate(1),r=new Date(r.getTime()-864e5)}else if(t.indexOf("year")!=-1){var o=t.indexOf("prev,")!=-1?-1:1;i=new Date,i.setFullYear(r.getFullYear()+o),i.setMonth(0),i.setDate(1),r.setFullYear(r.getFullYear()+o),r.setMonth(11),r.setDate(31)}else if("custom"==t){var l=e(this).html();if(n.customShortcuts&&n.customShortcuts.length>0)for(var u=0;u<n.customShortcuts.length;u++){var d=n.customShortcuts[u];if(d.name==l){var c=[];c=d.dates.call(),c&&2==c.length&&(i=c[0],r=c[1]),c&&1==c.length&&(movetodate=c[0],j(movetodate,"month1"),j(W(movetodate),"month2"),F());break}}}i&&r&&(T(i,r),S())}),ie.find(".time1 input[type=range]").bind("change touchmove mousemove",function(t){var n=t.target,r="hour"==n.name?e(n).val().replace(/^(\d{1})$/,"0$1"):void 0,i="minute"==n.name?e(n).val().replace(/^(\d{1})$/,"0$1"):void 0;p("time1",r,i)}),ie.find(".time2 input[type=range]").bind("change touchmove mousemove",function(t){var n=t.target,r="hour"==n.name?e(n).val().replace(/^(\d{1})$/,"0$1"):void 0,i="minute"==n.name?e(n).val().replace(/^(\d{1})$/,"0$1"):void 0;p("time2",r,i)})}function a(){if(!n.inline){var t=e(le).offset();if("relative"==e(n.container).css("position")){var r=e(n.container).offset();ie.css({top:t.top-r.top+e(le).outerHeight()+4,left:t.left-r.left})}else t.left<460?ie.css({top:t.top+e(le).outerHeight()+parseInt(e("body").css("border-top")||0,10),left:t.left}):ie.css({top:t.top+e(le).outerHeight()+parseInt(e("body").css("border-top")||0,10),left:t.left+e(le).width()-ie.width()-16})}}function o(){return ie}function s(t){a(),I(),l(),n.customOpenAnimation?n.customOpenAnimation.call(ie.get(0),function(){e(le).trigger("datepicker-opened",{relatedTarget:ie})}):ie.slideDown(t,function(){e(le).trigger("datepicker-opened",{relatedTarget:ie})}),e(le).trigger("datepicker-open",{relatedTarget:ie}),F(),d()}function l(){var e=n.getValue.call(ue),r=e?e.split(n.separator):"";if(r&&(1==r.length&&n.singleDate||r.length>=2)){var i=n.format;i.match(/Do/)&&(i=i.replace(/Do/,"D"),r[0]=r[0].replace(/(\d+)(th|nd|st)/,"$1"),r.length>=2&&(r[1]=r[1].replace(/(\d+)(th|nd|st)/,"$1"))),se=!1,r.length>=2?T(u(r[0],i,t.locale(n.language)),u(r[1],i,t.locale(n.language))):1==r.length&&n.singleDate&&M(u(r[0],i,t.locale(n.language))),se=!0}}function u(e,n,r){return t(e,n,r).isValid()?t(e,n,r).toDate():t().toDate()}function d(){var e=ie.find(".gap").css("margin-left");e&&(e=parseInt(e));var t=ie.find(".month1").width(),n=ie.find(".gap").width()+(e?2*e:0),r=ie.find(".month2").width();ie.find(".month-wrapper").width(t+n+r)}function c(e,n){ie.find("."+e+" input[type=range].hour-range").val(t(n).hours()),ie.find("."+e+" input[type=range].minute-range").val(t(n).minutes()),p(e,t(n).format("HH"),t(n).format("mm"))}function f(e,r){n[e]=parseInt(t(parseInt(r)).startOf("day").add(t(n[e+"Time"]).format("HH"),"h").add(t(n[e+"Time"]).format("mm"),"m").valueOf())}function h(){c("time1",n.start),c("time2",n.end)}function p(e,r,i){function a(e,t){var a=t.format("HH"),o=t.format("mm");n[e]=t.startOf("day").add(r||a,"h").add(i||o,"m").valueOf()}switch(r&&ie.find("."+e+" .hour-val").text(r),i&&ie.find("."+e+" .minute-val").text(i),e){case"time1":n.start&&a("start",t(n.start)),a("startTime",t(n.startTime||t().valueOf()));break;case"time2":n.end&&a("end",t(n.end)),a("endTime",t(n.endTime||t().valueOf()))}S(),C(),Y()}function m(){n.start=!1,n.end=!1,ie.find(".day.checked").removeClass("checked"),ie.find(".day.last-date-selected").removeClass("last-date-selected"),ie.find(".day.first-date-selected").removeClass("first-date-selected"),n.setValue.call(ue,""),S(),C(),Y()}function g(e){var r=e;return"week-range"===n.batchMode?r="monday"===n.startOfWeek?t(parseInt(e)).startOf("isoweek").valueOf():t(parseInt(e)).startOf("week").valueOf():"month-range"===n.batchMode&&(r=t(parseInt(e)).startOf("month").valueOf()),r}function v(e){var r=e;return"week-range"===n.batchMode?r="monday"===n.startOfWeek?t(parseInt(e)).endOf("isoweek").valueOf():t(parseInt(e)).endOf("week").valueOf():"month-range"===n.batchMode&&(r=t(parseInt(e)).endOf("month").valueOf()),r}function y(r){if(!r.hasClass("invalid")){var i=r.attr("time");if(r.addClass("checked"),n.singleDate?(n.start=i,n.end=!1):"week"===n.batchMode?"monday"===n.startOfWeek?(n.start=t(parseInt(i)).startOf("isoweek").valueOf(),n.end=t(parseInt(i)).endOf("isoweek").valueOf()):(n.end=t(parseInt(i)).endOf("week").valueOf(),n.start=t(parseInt(i)).startOf("week").valueOf()):"workweek"===n.batchMode?(n.start=t(parseInt(i)).day(1).valueOf(),n.end=t(parseInt(i)).day(5).valueOf()):"weekend"===n.batchMode?(n.start=t(parseInt(i)).day(6).valueOf(),n.end=t(parseInt(i)).day(7).valueOf()):"month"===n.batchMode?(n.start=t(parseInt(i)).startOf("month").valueOf(),n.end=t(parseInt(i)).endOf("month").valueOf()):n.start&&n.end||!n.start&&!n.end?(n.start=g(i),n.end=!1):n.start&&(n.end=v(i),n.time.enabled&&f("end",n.end)),n.time.enabled&&(n.start&&f("start",n.start),n.end&&f("end",n.end)),!n.singleDate&&n.start&&n.end&&n.start>n.end){var a=n.end;n.end=v(n.start),n.start=g(a),n.time.enabled&&n.swapTime&&h()}n.start=parseInt(n.start),n.end=parseInt(n.end),D(),n.start&&!n.end&&(e(le).trigger("datepicker-first-date-selected",{date1:new Date(n.start)}),x(r)),k(i),S(),C(),Y(),_()}}function w(e){var r=parseInt(e.attr("data-start-time"),10);if(n.startWeek){ie.find(".week-number-selected").removeClass("week-number-selected");var i=new Date(r<n.startWeek?r:n.startWeek),a=new Date(r<n.startWeek?n.startWeek:r);n.startWeek=!1,n.start=t(i).day("monday"==n.startOfWeek?1:0).valueOf(),n.end=t(a).day("monday"==n.startOfWeek?7:6).valueOf()}else{n.startWeek=r,e.addClass("week-number-selected");var i=new Date(r);n.start=t(i).day("monday"==n.startOfWeek?1:0).valueOf(),n.end=t(i).day("monday"==n.startOfWeek?7:6).valueOf()}k(),S(),C(),Y(),_()}function b(e){if(e=parseInt(e,10),n.startDate&&L(e,n.startDate)<0)return!1;if(n.endDate&&L(e,n.endDate)>0)return!1;if(n.start&&!n.end&&!n.singleDate){if(n.maxDays>0&&O(e,n.start)>n.maxDays)return!1;if(n.minDays>0&&O(e,n.start)<n.minDays)return!1;if(n.selectForward&&e<n.start)return!1;if(n.selectBackward&&e>n.start)return!1;if(n.beforeShowDay&&"function"==typeof n.beforeShowDay){for(var t=!0,r=e;O(r,n.start)>1;){var i=n.beforeShowDay(new Date(r));if(!i[0]){t=!1;break}if(Math.abs(r-n.start)<864e5)break;r>n.start&&(r-=864e5),r<n.start&&(r+=864e5)}if(!t)return!1}}return!0}function k(){return ie.find(".day.invalid.tmp").removeClass("tmp invalid").addClass("valid"),n.start&&!n.end&&ie.find(".day.toMonth.valid").each(function(){var t=parseInt(e(this).attr("time"),10);b(t)?e(this).addClass("valid tmp").removeClass("invalid"):e(this).addClass("invalid tmp").removeClass("valid")}),!0}function x(t){var r=parseInt(t.attr("time")),i="";if(t.hasClass("has-tooltip")&&t.attr("data-tooltip"))i='<span style="white-space:nowrap">'+t.attr("data-tooltip")+"</span>";else if(!t.hasClass("invalid"))if(n.singleDate)ie.find(".day.hovering").removeClass("hovering"),t.addClass("hovering");else if(ie.find(".day").each(function(){var t=parseInt(e(this).attr("time"));n.start,n.end;t==r?e(this).addClass("hovering"):e(this).removeClass("hovering"),n.start&&!n.end&&(n.start<t&&r>=t||n.start>t&&r<=t)?e(this).addClass("hovering"):e(this).removeClass("hovering")}),n.start&&!n.end){var a=O(r,n.start);n.hoveringTooltip&&("function"==typeof n.hoveringTooltip?i=n.hoveringTooltip(a,n.start,r):n.hoveringTooltip===!0&&a>1&&(i=a+" "+te("days")))}if(i){var o=t.offset(),s=ie.offset(),l=o.left-s.left,u=o.top-s.top;l+=t.width()/2;var d=ie.find(".date-range-length-tip"),c=d.css({visibility:"hidden",display:"none"}).html(i).width(),f=d.height();l-=c/2,u-=f,setTimeout(function(){d.css({left:l,top:u,display:"block",visibility:"visible"})},10)}else ie.find(".date-range-length-tip").hide()}function D(){ie.find(".day.hovering").removeClass("hovering"),ie.find(".date-range-length-tip").hide()}function _(){n.singleDate===!0?se&&n.start&&n.autoClose&&$():se&&n.start&&n.end&&n.autoClose&&$()}function S(){var e=Math.ceil((n.end-n.start)/864e5)+1;n.singleDate?n.start&&!n.end?ie.find(".drp_top-bar").removeClass("error").addClass("normal"):ie.find(".drp_top-bar").removeClass("error").removeClass("normal"):n.maxDays&&e>n.maxDays?(n.start=!1,n.end=!1,ie.find(".day").removeClass("checked"),ie.find(".drp_top-bar").removeClass("normal").addClass("error").find(".error-top").html(te("less-than").replace("%d",n.maxDays))):n.minDays&&e<n.minDays?(n.start=!1,n.end=!1,ie.find(".day").removeClass("checked"),ie.find(".drp_top-bar").removeClass("normal").addClass("error").find(".error-top").html(te("more-than").replace("%d",n.minDays))):n.start||n.end?ie.find(".drp_top-bar").removeClass("error").addClass("normal"):ie.find(".drp_top-bar").removeClass("error").removeClass("normal"),n.singleDate&&n.start&&!n.end||!n.singleDate&&n.start&&n.end?ie.find(".apply-btn").removeClass("disabled"):ie.find(".apply-btn").addClass("disabled"),n.batchMode&&(n.start&&n.startDate&&L(n.start,n.startDate)<0||n.end&&n.endDate&&L(n.end,n.endDate)>0)&&(n.start=!1,n.end=!1,ie.find(".day").removeClass("checked"))}function C(t,r){if(ie.find(".start-day").html("..."),ie.find(".end-day").html("..."),ie.find(".selected-days").hide(),n.start&&ie.find(".start-day").html(A(new Date(parseInt(n.start)))),n.end&&ie.find(".end-day").html(A(new Date(parseInt(n.end)))),n.start&&n.singleDate){ie.find(".apply-btn").removeClass("disabled");var i=A(new Date(n.start));n.setValue.call(ue,i,A(new Date(n.start)),A(new Date(n.end))),se&&!r&&e(le).trigger("datepicker-change",{value:i,date1:new Date(n.start)})}else if(n.start&&n.end){ie.find(".selected-days").show().find(".selected-days-num").html(O(n.end,n.start)),ie.find(".apply-btn").removeClass("disabled");var i=A(new Date(n.start))+n.separator+A(new Date(n.end));n.setValue.call(ue,i,A(new Date(n.start)),A(new Date(n.end))),se&&!r&&e(le).trigger("datepicker-change",{value:i,date1:new Date(n.start),date2:new Date(n.end)})}else t?ie.find(".apply-btn").removeClass("disabled"):ie.find(".apply-btn").addClass("disabled")}function O(e,t){return Math.abs(K(e)-K(t))+1}function T(e,t,r){if(e.getTime()>t.getTime()){var i=t;t=e,e=i,i=null}var a=!0;return n.startDate&&L(e,n.startDate)<0&&(a=!1),n.endDate&&L(t,n.endDate)>0&&(a=!1),a?(n.start=e.getTime(),n.end=t.getTime(),n.time.enabled&&(c("time1",e),c("time2",t)),(n.stickyMonths||L(e,t)>0&&0===E(e,t))&&(n.lookBehind?e=H(t):t=W(e)),n.stickyMonths&&E(t,n.endDate)>0&&(e=H(e),t=H(t)),n.stickyMonths||0===E(e,t)&&(n.lookBehind?e=H(t):t=W(e)),j(e,"month1"),j(t,"month2"),F(),S(),C(!1,r),void _()):(j(n.startDate,"month1"),j(W(n.startDate),"month2"),void F())}function M(e){var t=!0;return n.startDate&&L(e,n.startDate)<0&&(t=!1),n.endDate&&L(e,n.endDate)>0&&(t=!1),t?(n.start=e.getTime(),n.time.enabled&&c("time1",e),j(e,"month1"),n.singleMonth!==!0&&(date2=W(e),j(date2,"month2")),F(),C(),void _()):void j(n.startDate,"month1")}function Y(){(n.start||n.end)&&(ie.find(".day").each(function(){var r=parseInt(e(this).attr("time")),i=n.start,a=n.end;n.time.enabled&&(r=t(r).startOf("day").valueOf(),i=t(i||t().valueOf()).startOf("day").valueOf(),a=t(a||t().valueOf()).startOf("day").valueOf()),n.start&&n.end&&a>=r&&i<=r||n.start&&!n.end&&t(i).format("YYYY-MM-DD")==t(r).format("YYYY-MM-DD")?e(this).addClass("checked"):e(this).removeClass("checked"),n.start&&t(i).format("YYYY-MM-DD")==t(r).format("YYYY-MM-DD")?e(this).addClass("first-date-selected"):e(this).removeClass("first-date-selected"),n.end&&t(a).format("YYYY-MM-DD")==t(r).format("YYYY-MM-DD")?e(this).addClass("last-date-selected"):e(this).removeClass("last-date-selected")}),ie.find(".week-number").each(function(){e(this).attr("data-start-time")==n.startWeek&&e(this).addClass("week-number-selected")}))}function j(e,r){e=t(e).toDate();var i=N(e.getMonth());ie.find("."+r+" .month-name").html(i+" "+e.getFullYear()),ie.find("."+r+" tbody").html(Q(e)),n[r]=e,k()}function P(e,t){ie.find("."+t).append(z()),c(t,e)}function N(e){return te("month-name")[e]}function A(e){return t(e).format(n.format)}function F(){Y();var e=parseInt(t(n.month1).format("YYYYMM")),r=parseInt(t(n.month2).format("YYYYMM")),i=Math.abs(e-r),a=i>1&&89!=i;a?ie.addClass("has-gap").removeClass("no-gap").find(".gap").css("visibility","visible"):ie.removeClass("has-gap").addClass("no-gap").find(".gap").css("visibility","hidden");var o=ie.find("table.month1").height(),s=ie.find("table.month2").height();ie.find(".gap").height(Math.max(o,s)+10)}function $(){if(!n.alwaysOpen){var t=function(){e(le).data("date-picker-opened",!1),e(le).trigger("datepicker-closed",{relatedTarget:ie})};n.customCloseAnimation?n.customCloseAnimation.call(ie.get(0),t):e(ie).slideUp(n.duration,t),e(le).trigger("datepicker-close",{relatedTarget:ie})}}function I(){j(n.month1,"month1"),j(n.month2,"month2")}function E(e,n){var r=parseInt(t(e).format("YYYYMM"))-parseInt(t(n).format("YYYYMM"));return r>0?1:0===r?0:-1}function L(e,n){var r=parseInt(t(e).format("YYYYMMDD"))-parseInt(t(n).format("YYYYMMDD"));return r>0?1:0===r?0:-1}function W(e){return t(e).add(1,"months").toDate()}function H(e){return t(e).add(-1,"months").toDate()}function z(){return"<div><span>"+te("Time")+': <span class="hour-val">00</span>:<span class="minute-val">00</span></span></div><div class="hour"><label>'+te("Hour")+': <input type="range" class="hour-range" name="hour" min="0" max="23"></label></div><div class="minute"><label>'+te("Minute")+': <input type="range" class="minute-range" name="minute" min="0" max="59"></label></div>'}function R(){var t='<div class="date-picker-wrapper';n.extraClass&&(t+=" "+n.extraClass+" "),n.singleDate&&(t+=" single-date "),n.showShortcuts||(t+=" no-shortcuts "),n.showTopbar||(t+=" no-topbar "),n.customTopBar&&(t+=" custom-topbar "),t+='">',n.showTopbar&&(t+='<div class="drp_top-bar">',n.customTopBar?("function"==typeof n.customTopBar&&(n.customTopBar=n.customTopBar()),t+='<div class="custom-top">'+n.customTopBar+"</div>"):(t+='<div class="normal-top"><span style="color:#333">'+te("selected")+' </span> <b class="start-day">...</b>',n.singleDate||(t+=' <span class="separator-day">'+n.separator+'</span> <b class="end-day">...</b> <i class="selected-days">(<span class="selected-days-num">3</span> '+te("days")+")</i>"),t+="</div>",t+='<div class="error-top">error</div><div class="default-top">default</div>'),t+='<input type="button" class="apply-btn disabled'+q()+'" value="'+te("apply")+'" />',t+="</div>");var r=n.showWeekNumbers?6:5;if(t+='<div class="month-wrapper"><table class="month1" cellspacing="0" border="0" cellpadding="0"><thead><tr class="caption"><th style="width:27px;"><span class="prev">&lt;</span></th><th colspan="'+r+'" class="month-name"></th><th style="width:27px;">'+(n.singleDate||!n.stickyMonths?'<span class="next">&gt;</span>':"")+'</th></tr><tr class="week-name">'+V()+"</thead><tbody></tbody></table>",G()&&(t+='<div class="gap">'+B()+'</div><table class="month2" cellspacing="0" border="0" cellpadding="0"><thead><tr class="caption"><th style="width:27px;">'+(n.stickyMonths?"":'<span class="prev">&lt;</span>')+'</th><th colspan="'+r+'" class="month-name"></th><th style="width:27px;"><span class="next">&gt;</span></th></tr><tr class="week-name">'+V()+"</thead><tbody></tbody></table>"),t+='<div style="clear:both;height:0;font-size:0;"></div><div class="time"><div class="time1"></div>',n.singleDate||(t+='<div class="time2"></div>'),t+='</div><div style="clear:both;height:0;font-size:0;"></div></div>',t+='<div class="footer">',n.showShortcuts){t+='<div class="shortcuts"><b>'+te("shortcuts")+"</b>";var i=n.shortcuts;if(i){if(i["prev-days"]&&i["prev-days"].length>0){t+='&nbsp;<span class="prev-days">'+te("past");for(var a=0;a<i["prev-days"].length;a++){var o=i["prev-days"][a];o+=te(i["prev-days"][a]>1?"days":"day"),t+=' <a href="javascript:;" shortcut="day,-'+i["prev-days"][a]+'">'+o+"</a>"}t+="</span>"}if(i["next-days"]&&i["next-days"].length>0){t+='&nbsp;<span class="next-days">'+te("following");for(var a=0;a<i["next-days"].length;a++){var o=i["next-days"][a];o+=te(i["next-days"][a]>1?"days":"day"),t+=' <a href="javascript:;" shortcut="day,'+i["next-days"][a]+'">'+o+"</a>"}t+="</span>"}if(i.prev&&i.prev.length>0){t+='&nbsp;<span class="prev-buttons">'+te("previous");for(var a=0;a<i.prev.length;a++){var o=te("prev-"+i.prev[a]);t+=' <a href="javascript:;" shortcut="prev,'+i.prev[a]+'">'+o+"</a>"}t+="</span>"}if(i.next&&i.next.length>0){t+='&nbsp;<span class="next-buttons">'+te("next");for(var a=0;a<i.next.length;a++){var o=te("next-"+i.next[a]);t+=' <a href="javascript:;" shortcut="next,'+i.next[a]+'">'+o+"</a>"}t+="</span>"}}if(n.customShortcuts)for(var a=0;a<n.customShortcuts.length;a++){var s=n.customShortcuts[a];t+='&nbsp;<span class="custom-shortcut"><a href="javascript:;" shortcut="custom">'+s.name+"</a></span>"}t+="</div>"}if(n.showCustomValues&&(t+='<div class="customValues"><b>'+(n.customValueLabel||te("custom-values"))+"</b>",n.customValues))for(var a=0;a<n.customValues.length;a++){var l=n.customValues[a];t+='&nbsp;<span class="custom-value"><a href="javascript:;" custom="'+l.value+'">'+l.name+"</a></span>"}return t+="</div></div>",e(t)}function q(){var e="";return n.autoClose===!0&&(e+=" hide"),""!==n.applyBtnClass&&(e+=" "+n.applyBtnClass),e}function V(){var e=n.showWeekNumbers?"<th>"+te("week-number")+"</th>":"";return"monday"==n.startOfWeek?e+"<th>"+te("week-1")+"</th><th>"+te("week-2")+"</th><th>"+te("week-3")+"</th><th>"+te("week-4")+"</th><th>"+te("week-5")+"</th><th>"+te("week-6")+"</th><th>"+te("week-7")+"</th>":e+"<th>"+te("week-7")+"</th><th>"+te("week-1")+"</th><th>"+te("week-2")+"</th><th>"+te("week-3")+"</th><th>"+te("week-4")+"</th><th>"+te("week-5")+"</th><th>"+te("week-6")+"</th>"}function U(e){return e=t(e),!(!n.startDate||!e.endOf("month").isBefore(n.startDate))||!(!n.endDate||!e.startOf("month").isAfter(n.endDate))}function B(){for(var e=['<div class="gap-top-mask"></div><div class="gap-bottom-mask"></div><div class="gap-lines">'],t=0;t<20;t++)e.push('<div class="gap-line"><div class="gap-1"></div><div class="gap-2"></div><div class="gap-3"></div></div>');return e.push("</div>"),e.join("")}function G(){return!n.singleMonth}function Z(t,n,r){var i=e.extend(!0,{},t);e.each(n,function(e,t){var n=t(r);for(var a in n)i.hasOwnProperty(a)?i[a]+=n[a]:i[a]=n[a]});var a="";for(var o in i)i.hasOwnProperty(o)&&(a+=o+'="'+i[o]+'" ');return a}function K(e){return Math.floor(X(e)/864e5)}function X(e){return t.isMoment(e)&&(e=e.toDate().getTime()),"object"==typeof e&&e.getTime&&(e=e.getTime()),"string"!=typeof e||e.match(/\d{13}/)||(e=t(e,n.format).toDate().getTime()),e=parseInt(e,10)-60*(new Date).getTimezoneOffset()*1e3}function Q(e){var r=[];e.setDate(1);var i=(new Date(e.getTime()-864e5),new Date),a=e.getDay();if(0===a&&"monday"===n.startOfWeek&&(a=7),a>0)for(var o=a;o>0;o--){var s=new Date(e.getTime()-864e5*o),l=b(s.getTime());n.startDate&&L(s,n.startDate)<0&&(l=!1),n.endDate&&L(s,n.endDate)>0&&(l=!1),r.push({date:s,type:"lastMonth",day:s.getDate(),time:s.getTime(),valid:l})}for(var u=e.getMonth(),o=0;o<40;o++){var d=t(e).add(o,"days").toDate(),l=b(d.getTime());n.startDate&&L(d,n.startDate)<0&&(l=!1),n.endDate&&L(d,n.endDate)>0&&(l=!1),r.push({date:d,type:d.getMonth()==u?"toMonth":"nextMonth",day:d.getDate(),time:d.getTime(),valid:l})}for(var c=[],f=0;f<6&&"nextMonth"!=r[7*f].type;f++){c.push("<tr>");for(var s=0;s<7;s++){var h="monday"==n.startOfWeek?s+1:s,d=r[7*f+h],p=t(d.time).format("L")==t(i).format("L");if(d.extraClass="",d.tooltip="",d.valid&&n.beforeShowDay&&"function"==typeof n.beforeShowDay){var m=n.beforeShowDay(t(d.time).toDate());d.valid=m[0],d.extraClass=m[1]||"",d.tooltip=m[2]||"",""!==d.tooltip&&(d.extraClass+=" has-tooltip ")}var g={time:d.time,"data-tooltip":d.tooltip,"class":"day "+d.type+" "+d.extraClass+" "+(d.valid?"valid":"invalid")+" "+(p?"real-today":"")};0===s&&n.showWeekNumbers&&c.push('<td><div class="week-number" data-start-time="'+d.time+'">'+n.getWeekNumber(d.date)+"</div></td>"),c.push("<td "+Z({},n.dayTdAttrs,d)+"><div "+Z(g,n.dayDivAttrs,d)+">"+J(d.time,d.day)+"</div></td>")}c.push("</tr>")}return c.join("")}function J(e,t){return n.showDateFilter&&"function"==typeof n.showDateFilter?n.showDateFilter(e,t):t}function ee(){if("auto"==n.language){var t=navigator.language?navigator.language:navigator.browserLanguage;if(!t)return e.dateRangePickerLanguages["default"];t=t.toLowerCase();for(var r in e.dateRangePickerLanguages)if(t.indexOf(r)!==-1)return e.dateRangePickerLanguages[r];return e.dateRangePickerLanguages["default"]}return n.language&&n.language in e.dateRangePickerLanguages?e.dateRangePickerLanguages[n.language]:e.dateRangePickerLanguages["default"]}function te(t){var n=t.toLowerCase(),r=t in oe?oe[t]:n in oe?oe[n]:null,i=e.dateRangePickerLanguages["default"];return null==r&&(r=t in i?i[t]:n in i?i[n]:""),r}function ne(){var e=n.defaultTime?n.defaultTime:new Date;return n.lookBehind?(n.startDate&&E(e,n.startDate)<0&&(e=W(t(n.startDate).toDate())),n.endDate&&E(e,n.endDate)>0&&(e=t(n.endDate).toDate())):(n.startDate&&E(e,n.startDate)<0&&(e=t(n.startDate).toDate()),n.endDate&&E(W(e),n.endDate)>0&&(e=H(t(n.endDate).toDate()))),n.singleDate&&(n.startDate&&E(e,n.startDate)<0&&(e=t(n.startDate).toDate()),n.endDate&&E(e,n.endDate)>0&&(e=t(n.endDate).toDate())),e}function re(e){e||(e=ne()),n.lookBehind?(j(H(e),"month1"),j(e,"month2")):(j(e,"month1"),j(W(e),"month2")),n.singleDate&&j(e,"month1"),Y(),F()}n||(n={}),n=e.extend(!0,{autoClose:!1,format:"YYYY-MM-DD",separator:" to ",language:"auto",startOfWeek:"sunday",getValue:function(){return e(this).val()},setValue:function(t){e(this).attr("readonly")||e(this).is(":disabled")||t==e(this).val()||e(this).val(t)},startDate:!1,endDate:!1,time:{enabled:!1},minDays:0,maxDays:0,showShortcuts:!1,shortcuts:{},customShortcuts:[],inline:!1,container:"body",alwaysOpen:!1,singleDate:!1,lookBehind:!1,batchMode:!1,duration:200,stickyMonths:!1,dayDivAttrs:[],dayTdAttrs:[],selectForward:!1,selectBackward:!1,applyBtnClass:"",singleMonth:"auto",hoveringTooltip:function(e,t,n){return e>1?e+" "+te("days"):""},showTopbar:!0,swapTime:!1,showWeekNumbers:!1,getWeekNumber:function(e){return t(e).format("w")},customOpenAnimation:null,customCloseAnimation:null},n),n.start=!1,n.end=!1,n.startWeek=!1,n.isTouchDevice="ontouchstart"in window||navigator.msMaxTouchPoints,n.isTouchDevice&&(n.hoveringTooltip=!1),"auto"==n.singleMonth&&(n.singleMonth=e(window).width()<480),n.singleMonth&&(n.stickyMonths=!1),n.showTopbar||(n.autoClose=!0),n.startDate&&"string"==typeof n.startDate&&(n.startDate=t(n.startDate,n.format).toDate()),n.endDate&&"string"==typeof n.endDate&&(n.endDate=t(n.endDate,n.format).toDate());var ie,ae,oe=ee(),se=!1,le=this,ue=e(le).get(0);return e(this).unbind(".datepicker").bind("click.datepicker",function(e){var t=ie.is(":visible");t||s(n.duration)}).bind("change.datepicker",function(e){l()}).bind("keyup.datepicker",function(){try{clearTimeout(ae)}catch(e){}ae=setTimeout(function(){l()},2e3)}),i.call(this),n.alwaysOpen&&s(0),e(this).data("dateRangePicker",{setDateRange:function(e,r,i){"string"==typeof e&&"string"==typeof r&&(e=t(e,n.format).toDate(),r=t(r,n.format).toDate()),T(e,r,i)},clear:m,close:$,open:s,redraw:I,getDatePicker:o,resetMonthsView:re,destroy:function(){e(le).unbind(".datepicker"),e(le).data("dateRangePicker",""),e(le).data("date-picker-opened",null),ie.remove(),e(window).unbind("resize.datepicker",a),e(document).unbind("click.datepicker",$)}}),e(window).bind("resize.datepicker",a),this}})},{jquery:1,moment:3}]},{},[6]);
 //# sourceMappingURL=scripts.js.map
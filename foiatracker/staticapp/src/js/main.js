@@ -44,6 +44,82 @@ function textAreaResizer(i, el) {
     txt.on('keyup', autosize);
 }
 
+function remoteSelect(selector, options) {
+    // Load a select's options from the JSON search endpoint in its
+    // data-search-url attribute instead of rendering them all in the page
+    var $select = $(selector);
+    if(!$select.length) {
+        return $select;
+    }
+
+    $select.selectize($.extend({
+        valueField: 'value',
+        labelField: 'text',
+        searchField: 'text',
+        preload: true,
+        // Results come back ranked from the server, so keep its order
+        score: function() {
+            return function() { return 1; };
+        },
+        load: function(query, callback) {
+            $.ajax({
+                url: $select.data('search-url'),
+                data: {q: query, email: $select.data('email')},
+                error: function() {
+                    callback();
+                },
+                success: function(res) {
+                    callback(res.results);
+                }
+            });
+        }
+    }, options));
+
+    return $select;
+}
+
+function followChanges($form) {
+    // Keep the request list current: re-render rows that change, drop ones
+    // that are deleted and offer a reload when new requests come in
+    var url = $form.data('changes-url');
+    if(!url || !window.EventSource) {
+        return;
+    }
+
+    var source = new EventSource(url);
+    source.addEventListener('change', function(e) {
+        var change = JSON.parse(e.data),
+            $row = $form.find('[data-foia="' + change.foia + '"]');
+
+        if(!$row.length) {
+            if(change.created) {
+                $('#new-requests').removeClass('hidden');
+            }
+            return;
+        }
+
+        if(change.deleted) {
+            $row.remove();
+            return;
+        }
+
+        $.ajax({
+            url: $row.data('row-url'),
+            error: function(xhr) {
+                if(xhr.status === 404) {
+                    $row.remove();
+                }
+            },
+            success: function(html) {
+                var checked = $row.find('input[name="foias"]').prop('checked'),
+                    $updated = $($.parseHTML($.trim(html)));
+                $updated.find('input[name="foias"]').prop('checked', checked);
+                $row.replaceWith($updated);
+            }
+        });
+    });
+}
+
 function amountVis() {
   var status = $('#id_status input:checked').val();
   $('#amounts').toggle(['relatg', 'relagc'].indexOf(status) !== -1);
@@ -63,8 +139,9 @@ $(function() {
 
     $('textarea').each(textAreaResizer);
 
-    $('#id_recipients').selectize({
+    remoteSelect('#id_recipients', {
         required: true,
+        preload: false,
         create: function(input) {
             return {
                 value: input,
@@ -88,6 +165,17 @@ $(function() {
       multiple: true,
     });
 
-    // FOIA field on event form page
-    $('#id_foia').selectize();
+    followChanges($('form.bulk-update'));
+
+    // FOIA field on event form page; when pairing an e-mail, rank matches
+    // against it and pick the best one until the user chooses another
+    var $foia = $('#id_foia');
+    remoteSelect($foia, {
+        onLoad: function(results) {
+            if($foia.data('email') && !this.getValue() && results &&
+                    results.length) {
+                this.setValue(results[0].value);
+            }
+        }
+    });
 });
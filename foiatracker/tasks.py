@@ -10,7 +10,11 @@ from django.utils.html import strip_tags
 from celery import shared_task
 from slacker import Slacker
 
-from foiatracker.models import Foia, InboundEmail
+from foiatracker import jobs
+from foiatracker.jobs import job_action
+from foiatracker.matching import suggest_matches
+from foiatracker.models import (Event, Foia, InboundEmail, ProjectStats,
+                                Recipient, Reminder)
 
 
 def get_slack():
@@ -23,14 +27,21 @@ def get_slack():
         )
 
 
-def get_slack_user(email):
+def get_slack_member(email):
+    """Return the Slack member whose profile email is @email, or None"""
     slack = get_slack()
     users = cache.get_or_set('slack_users', slack.users.list, 3600)
     for user in users.body['members']:
-        if 'email' in user['profile']:
-            if user['profile']['email'] == email:
-                return user['name'], user['profile']['image_24']
-    return None, None
+        if user['profile'].get('email') == email:
+            return user
+    return None
+
+
+def get_slack_user(email):
+    user = get_slack_member(email)
+    if user is None:
+        return None, None
+    return user['name'], user['profile']['image_24']
 
 
 @shared_task
@@ -42,6 +53,12 @@ def post_new_foia_slack(instance_pk):
     if instance.notified is True or instance.recipients.count() == 0:
         return
 
+    notify_slack(instance)
+
+
+@job_action('renotify_slack', Foia, 'Re-post requests to Slack')
+def notify_slack(instance):
+    """Announce a request in the FOIAtracker Slack channel"""
     slack = get_slack()
 
     msg = "%s just submitted a records request to %s" % (
@@ -98,9 +115,10 @@ def post_new_foia_slack(instance_pk):
         attachments=[attachments, ],
     )
 
-    # Set our flag so we don't re-notify
+    # Set our flag so we don't re-notify. Only the flag is written, since
+    # the request may have changed while Slack was posting.
+    Foia.objects.filter(pk=instance.pk).update(notified=True)
     instance.notified = True
-    instance.save()
 
 
 def email_prompt(email_id):
@@ -125,3 +143,91 @@ def email_prompt(email_id):
         html_message=html_msg,
         fail_silently=True
     )
+
+
+def email_paired(event_id):
+    event = Event.objects.select_related(
+        'email__sender', 'foia').get(pk=event_id)
+
+    base_url = 'http://datalab.dallasnews.com'
+
+    msg = (
+        'FOIAtracker filed your e-mail "%s" as an update to the records '
+        'request "%s" because it\'s part of the same thread.\n\n'
+        'Update its status or move it to another request here: %s%s'
+    ) % (
+        event.email.subject,
+        event.foia,
+        base_url,
+        reverse('event-edit', kwargs={'pk': event.pk}),
+    )
+
+    send_mail(
+        'Filed "%s"' % event.email.subject,
+        msg,
+        'FOIAtracker <newsapps@dallasnews.com>',
+        [event.email.sender.email],
+        fail_silently=True
+    )
+
+
+DATALAB_URL = 'http://datalab.dallasnews.com/'
+REMINDER_MSG = ('Reminder: It\'s time to check in on one of your records '
+                'requests: "%s". See the <%s|request on FOIAtracker> for '
+                'details and don\'t forget to send updates to '
+                '`foia@postbox.dallasnews.com`')
+
+
+@job_action('resend_reminder', Reminder, 'Resend reminders on Slack')
+def send_reminder(reminder):
+    """Message a request's sender on Slack to check in on it, unless the
+    agency has already responded. Raises LookupError if the sender can't
+    be found on Slack."""
+    if reminder.foia.status()[0] != Event.PENDING:
+        return False
+
+    sender_email = reminder.foia.sender.email
+    member = get_slack_member(sender_email)
+    if member is None:
+        raise LookupError('No Slack pairing found for %s.' % sender_email)
+
+    foia_url = '%s%s' % (DATALAB_URL, reverse(
+        'foia-edit', kwargs={'pk': reminder.foia.id}))
+    get_slack().chat.post_message(
+        member['id'], REMINDER_MSG % (reminder.foia, foia_url),
+        username='FOIAtracker', icon_emoji=':foiatracker:'
+    )
+    return True
+
+
+@job_action('rolodex_sync', Recipient, 'Sync recipients with Rolodex')
+def sync_recipient(recipient):
+    # Saving pulls the recipient's details from Rolodex
+    recipient.save()
+
+
+@job_action('suggest_matches', InboundEmail,
+            'Suggest requests for unprocessed e-mails')
+def refresh_suggestions(email):
+    if not email.processed:
+        suggest_matches(email)
+
+
+@shared_task
+def suggest_email_matches(email_id):
+    """Rank requests for an e-mail waiting to be triaged"""
+    refresh_suggestions(InboundEmail.objects.get(pk=email_id))
+
+
+@shared_task
+def refresh_project_median(project_id):
+    """Recalculate a project's median days to resolution"""
+    ProjectStats.refresh_median(project_id)
+
+
+@shared_task
+def run_job_chunk(job_id, offset=0):
+    """Run one chunk of a background job and queue the next"""
+    next_offset = jobs.run_chunk(job_id, offset)
+    if next_offset is not None:
+        run_job_chunk.delay(job_id, next_offset)
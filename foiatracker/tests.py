@@ -1,31 +1,70 @@
 # -*- coding: utf8 -*-
 import os
 import datetime
+import mailbox
+import shutil
+import tempfile
 from mock import patch
 import json
 
-from django.test import TestCase, SimpleTestCase, override_settings
+from django.apps import apps as django_apps
+from django.conf.urls import url
+from django.contrib import admin
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import (TestCase, SimpleTestCase, TransactionTestCase,
+                         override_settings)
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from django.db.models.signals import pre_save, post_save
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import ImproperlyConfigured, ValidationError
 from django.conf import settings
+from django.core.cache import cache
 from django.core.management import call_command
 from django.utils.six import StringIO
 
 from slacker import Slacker
 
-from foiatracker.models import Foia, InboundEmail, Recipient, Sender
+from foiatracker import changes, dedupe, ingest
+from foiatracker.dedupe import find_duplicates as find_recipient_duplicates
+from foiatracker.duplicates import (find_duplicates, minhash, shingles,
+                                    similarity)
+from foiatracker.export import export_rows
+from foiatracker.fields import RecipientsChoiceField
+from foiatracker.jobs import JOB_ACTIONS, run_chunk, start_job
+from foiatracker.filters import FoiaFilter
+from foiatracker.models import (
+    Agency,
+    BackgroundJob,
+    Event,
+    Foia,
+    InboundEmail,
+    MatchSuggestion,
+    Project,
+    ProjectStats,
+    Recipient,
+    RequestSignature,
+    Sender,
+)
+from foiatracker.matching import search_foias, suggest_matches
+from foiatracker.pagination import CursorPaginator, encode_cursor
+from foiatracker.reports import (agency_report, cached_request_rows,
+                                 refresh_requests, request_rows,
+                                 UNKNOWN_AGENCY)
 from foiatracker.signals import (
     foia_to_slack,
     hydrate_from_rolodex,
     hydrate_from_staff_api,
 )
-from foiatracker.tasks import get_slack, get_slack_user
+from foiatracker.tasks import get_slack, get_slack_member, get_slack_user
 from foiatracker.utils import (
+    add_business_days,
+    business_days_between,
     find_contact_by_email,
     get_from_rolodex,
     get_id_from_rolodex_url,
     get_model_by_email,
+    overdue_cutoff,
     query_rolodex_by_email,
     tz_aware_date,
 )
@@ -317,6 +356,101 @@ class InboundWebHookTestCase(TestCase):
         resp = self.client.post('/mailhook/', {})
         self.assertEqual(resp.status_code, 400)
 
+    def test_reply_threaded_to_foia(self):
+        """Replies to a tracked request's e-mail should be paired with that
+        request as an Event"""
+        sender = Sender.objects.create(email='bob@dallasnews.com')
+        original = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='',
+            message_id='<517AC78B.5060404@postbox.dallasnews.com>')
+        foia = Foia.objects.create(email=original, sent=timezone.now(),
+                                   request_subject='Sample request')
+
+        resp = self.client.post('/mailhook/', self.mailgun_fixture)
+        self.assertEqual(resp.status_code, 200)
+
+        reply = InboundEmail.objects.exclude(pk=original.pk).get()
+        self.assertEqual(reply.message_id,
+                         '<517ACC75.5010709@postbox.dallasnews.com>')
+        self.assertEqual(Event.objects.get(email=reply).foia, foia)
+
+    def test_reply_threaded_to_many_requests(self):
+        """Replies to an e-mail filed on several requests should only be
+        paired with the one sent to the reply's recipients, and left
+        unpaired when that's still ambiguous"""
+        sender = Sender.objects.create(email='bob@dallasnews.com')
+        original = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='',
+            message_id='<517AC78B.5060404@postbox.dallasnews.com>')
+        state = Foia.objects.create(email=original, sent=timezone.now(),
+                                    request_subject='Sample request')
+        city = Foia.objects.create(email=original, sent=timezone.now(),
+                                   request_subject='Sample request')
+        state.recipients.add(Recipient.objects.create(email='ken@texas.gov'))
+        city.recipients.add(Recipient.objects.create(email='records@city.gov'))
+
+        resp = self.client.post('/mailhook/', self.mailgun_fixture)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(Event.objects.get().foia, state)
+
+        # Both requests went to the reply's recipient
+        Event.objects.all().delete()
+        InboundEmail.objects.exclude(pk=original.pk).delete()
+        city.recipients.add(Recipient.objects.get(email='ken@texas.gov'))
+        resp = self.client.post('/mailhook/', self.mailgun_fixture)
+        self.assertEqual(resp.status_code, 200)
+        self.assertFalse(Event.objects.exists())
+
+    def test_replay(self):
+        """Replaying stored payloads should receive each message once"""
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as f:
+            json.dump([self.mailgun_fixture, self.mailgun_fixture], f)
+
+        try:
+            out = StringIO()
+            call_command('replaymailgun', path, workers=1, notify=False,
+                         stdout=out)
+            self.assertIn('1 received', out.getvalue())
+            self.assertIn('1 already received', out.getvalue())
+
+            out = StringIO()
+            call_command('replaymailgun', path, workers=1, notify=False,
+                         update=True, stdout=out)
+            self.assertIn('1 updated', out.getvalue())
+        finally:
+            os.remove(path)
+
+        self.assertEqual(InboundEmail.objects.count(), 1)
+
+    def test_replay_without_message_id(self):
+        """Payloads without a Message-Id should be matched on their sender,
+        Date and subject, and rejected without a Date to match on"""
+        payload = self.mailgun_fixture.copy()
+        payload.pop('Message-Id', None)
+        undated = payload.copy()
+        undated['Date'] = 'sometime'
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as f:
+            json.dump([payload, payload, undated], f)
+
+        try:
+            for i in range(2):
+                out = StringIO()
+                call_command('replaymailgun', path, workers=1, notify=False,
+                             stdout=out, stderr=StringIO())
+                self.assertIn('1 rejected', out.getvalue())
+        finally:
+            os.remove(path)
+
+        self.assertEqual(InboundEmail.objects.count(), 1)
+
+    def test_unthreaded_reply(self):
+        """E-mails that don't reply to a tracked e-mail shouldn't be paired"""
+        resp = self.client.post('/mailhook/', self.mailgun_fixture)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(Event.objects.count(), 0)
+
     def test_undisclosed_recipients(self):
         """Don't fail when parsing 'To' addresses without @s"""
         undisclosed_fixture = self.mailgun_fixture.copy()
@@ -329,6 +463,92 @@ class InboundWebHookTestCase(TestCase):
         self.assertEqual(Recipient.objects.count(), 0)
 
 
+class ThreadedReplayTestCase(TransactionTestCase):
+    """Replays on worker threads, which can't see a TestCase's transaction"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Disable post_save signals during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+
+        fixture_path = os.path.join(os.path.dirname(__file__),
+                                    'fixtures/mailgun-post.json')
+        with open(fixture_path, 'r') as f:
+            cls.mailgun_fixture = json.loads(f.read())
+        super(ThreadedReplayTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable post_save signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(ThreadedReplayTestCase, cls).tearDownClass()
+
+    def test_threaded_replay(self):
+        """Workers should receive each message once, with or without a
+        Message-Id"""
+        anonymous = self.mailgun_fixture.copy()
+        anonymous.pop('Message-Id', None)
+        anonymous['subject'] = 'Another message'
+        payloads = [self.mailgun_fixture, anonymous] * 3
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as f:
+            json.dump(payloads, f)
+
+        try:
+            out = StringIO()
+            call_command('replaymailgun', path, workers=2, notify=False,
+                         stdout=out)
+            self.assertIn('2 received', out.getvalue())
+            self.assertIn('4 already received', out.getvalue())
+
+            out = StringIO()
+            call_command('replaymailgun', path, workers=2, notify=False,
+                         stdout=out)
+            self.assertIn('6 already received', out.getvalue())
+        finally:
+            os.remove(path)
+
+        self.assertEqual(InboundEmail.objects.count(), 2)
+
+    def test_threaded_shared_recipient(self):
+        """Workers receiving messages to the same new recipient at once
+        should all succeed and share one Recipient"""
+        payloads = []
+        for i in range(8):
+            payload = self.mailgun_fixture.copy()
+            payload['Message-Id'] = '<shared-%s@example.com>' % i
+            payloads.append(payload)
+        handle, path = tempfile.mkstemp(suffix='.json')
+        with os.fdopen(handle, 'w') as f:
+            json.dump(payloads, f)
+
+        try:
+            out = StringIO()
+            call_command('replaymailgun', path, workers=4, notify=False,
+                         stdout=out, stderr=StringIO())
+        finally:
+            os.remove(path)
+
+        self.assertIn('8 received', out.getvalue())
+        self.assertIn('0 failed', out.getvalue())
+        self.assertEqual(Recipient.objects.count(), 1)
+        self.assertEqual(Sender.objects.count(), 1)
+
+
 @override_settings(SLACK_TOKEN='slack-token', CELERY_TASK_ALWAYS_EAGER=True)
 class SlackMsgTestCase(TestCase):
     multi_db = True
@@ -464,6 +684,24 @@ class SlackMsgTestCase(TestCase):
         self.assertEqual(user_email, None)
         self.assertEqual(user_img, None)
 
+    @patch('foiatracker.tasks.get_slack')
+    @patch('foiatracker.tasks.cache')
+    def test_get_slack_member(self, cache, get_slack):
+        """get_slack_member should return the whole member dict, skipping
+        members (like bots) with no email"""
+        class SlackResponse(object):
+            body = {
+                'members': [
+                    {'id': 'B1', 'name': 'bot', 'profile': {}},
+                    {'id': 'U1', 'name': 'Name',
+                     'profile': {'email': 'a@example.com'}},
+                ]
+            }
+        cache.get_or_set.return_value = SlackResponse()
+
+        self.assertEqual(get_slack_member('a@example.com')['id'], 'U1')
+        self.assertIsNone(get_slack_member('b@example.com'))
+
     @patch('foiatracker.tasks.get_slack')
     @patch('foiatracker.tasks.get_slack_user', return_value=(None, None))
     def test_foia_update(self, get_slack_user, get_slack):
@@ -519,6 +757,23 @@ class UtilsTestCase(TestCase):
                          sender=Sender)
         super(UtilsTestCase, cls).tearDownClass()
 
+    @patch('foiatracker.apps.apps.is_installed', return_value=False)
+    def test_requires_postgres_app(self, is_installed):
+        """The app should refuse to start without django.contrib.postgres"""
+        with self.assertRaises(ImproperlyConfigured):
+            django_apps.get_app_config('foiatracker').ready()
+        is_installed.assert_called_with('django.contrib.postgres')
+
+    def test_get_model_by_email_race(self):
+        """A row created by someone else between the lookup and the insert
+        should be returned rather than raise"""
+        existing = Sender.objects.create(email='a@example.com')
+        with patch.object(Sender.objects, 'get', side_effect=[
+                Sender.DoesNotExist, existing]):
+            self.assertEqual(get_model_by_email(Sender, 'A@example.com'),
+                             existing)
+        self.assertEqual(Sender.objects.count(), 1)
+
     def test_find_contact_by_email(self):
         """Given an e-mail match it with a contact from a Rolodex API
         response, returning None if there's no match"""
@@ -574,6 +829,25 @@ class UtilsTestCase(TestCase):
         fetched = get_model_by_email(Sender, 'c@example.com')
         self.assertEqual(fetched.email, 'c@example.com')
 
+    def test_overdue_cutoff(self):
+        """Requests sent on the cutoff date should be due before today and
+        requests sent the day after shouldn't be"""
+        today = datetime.date(2018, 1, 31)
+        cutoff = overdue_cutoff(11, today=today)
+        self.assertLess(add_business_days(11, from_datetime=cutoff).date(),
+                        today)
+        self.assertGreaterEqual(
+            add_business_days(
+                11, from_datetime=cutoff + datetime.timedelta(days=1)).date(),
+            today)
+
+    def test_business_days_between(self):
+        """Counting business days should undo add_business_days"""
+        start = datetime.date(2017, 12, 20)
+        end = add_business_days(11, from_datetime=start).date()
+        self.assertEqual(business_days_between(start, end), 11)
+        self.assertEqual(business_days_between(end, start), 0)
+
     def test_tz_aware_date(self):
         """Helper should convert naive dates to timezone-aware, leave aware
         ones unchanged"""
@@ -612,3 +886,1508 @@ class SyncCommandTestCase(TestCase):
         self.assertIn('Syncing "a@example.com"', out.getvalue())
         self.assertIn('Syncing "b@example.com"', out.getvalue())
         self.assertIn('Finished syncing recipient information', out.getvalue())
+
+
+class ImportCommandTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable post_save signals during this test case"""
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(ImportCommandTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable post_save signals after test case"""
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(ImportCommandTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.project = Project.objects.create(
+            name='Test project', description='Test', slug='test-project')
+        Recipient.objects.create(email='records@example.com', name='Records')
+
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as f:
+            f.write(
+                'sender,subject,sent,recipients,project,agency_id,notes\n'
+                'a@example.com,Old request,2017-01-03,'
+                'records@example.com;new@example.com,test-project,R-1,\n'
+                'a@example.com,Bad date,January,records@example.com,,,\n'
+                'b@example.com,Another,2017-02-01,new@example.com,,,Notes\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_import(self):
+        """Valid rows should become requests, without reminders going out
+        for ones that are long past due"""
+        out, err = StringIO(), StringIO()
+        call_command('importfoias', self.path, batch_size=1, stdout=out,
+                     stderr=err)
+
+        self.assertIn('Line 3', err.getvalue())
+        self.assertEqual(Foia.objects.count(), 2)
+        self.assertEqual(Sender.objects.count(), 2)
+
+        foia = Foia.objects.get(request_subject='Old request')
+        self.assertTrue(foia.notified)
+        self.assertEqual(foia.project, self.project)
+        self.assertEqual(foia.sent, datetime.date(2017, 1, 3))
+        self.assertEqual(foia.recipients.count(), 2)
+        self.assertEqual(foia.recipients_display,
+                         'new@example.com, Records')
+        self.assertIsNotNone(foia.search_vector)
+        self.assertIsNotNone(foia.reminder_set.get().sent_time)
+        self.assertEqual(ProjectStats.objects.get(
+            project=self.project).total, 1)
+
+        # Only the new recipient needs syncing
+        job = BackgroundJob.objects.get()
+        self.assertEqual(job.action, 'rolodex_sync')
+        self.assertEqual(job.object_ids, [
+            Recipient.objects.get(email='new@example.com').pk])
+
+    def test_dry_run(self):
+        """A dry run shouldn't leave anything behind"""
+        out = StringIO()
+        call_command('importfoias', self.path, dry_run=True, stdout=out,
+                     stderr=StringIO())
+
+        self.assertIn('Checked 2 requests', out.getvalue())
+        self.assertFalse(Foia.objects.exists())
+        self.assertFalse(InboundEmail.objects.exists())
+        self.assertFalse(BackgroundJob.objects.exists())
+
+    @patch('foiatracker.management.commands.importfoias.index_request',
+           side_effect=[None, RuntimeError('Lost the connection')])
+    def test_failed_batch(self, index_request):
+        """A failing batch shouldn't undo the batches before it"""
+        with self.assertRaises(RuntimeError):
+            call_command('importfoias', self.path, batch_size=1,
+                         stdout=StringIO(), stderr=StringIO())
+
+        self.assertEqual(
+            list(Foia.objects.values_list('request_subject', flat=True)),
+            ['Old request'])
+        self.assertEqual(ProjectStats.objects.get(
+            project=self.project).total, 1)
+        self.assertEqual(BackgroundJob.objects.get().action, 'rolodex_sync')
+
+    def write_mbox(self, directory, senders):
+        """Write a message from each of @senders to an mbox file in
+        @directory and return its path"""
+        path = os.path.join(directory, 'archive.mbox')
+        box = mailbox.mbox(path)
+        for number, sender in enumerate(senders):
+            box.add(
+                'From: %s\n'
+                'To: Records <records@example.com>, alice@dallasnews.com\n'
+                'Date: Fri, 26 Apr 2013 11:50:29 -0700\n'
+                'Subject: Request %s\n'
+                'Message-Id: <%s@example.com>\n\n'
+                'Please send the records.\n' % (sender, number, number))
+        box.close()
+        return path
+
+    @override_settings(FOIATRACKER_ALLOWED_DOMAINS=('dallasnews.com',))
+    def test_import_mail(self):
+        """Archived messages from staff should become unprocessed e-mails,
+        and running the import again shouldn't duplicate them"""
+        directory = tempfile.mkdtemp()
+        path = self.write_mbox(directory, ('bob@dallasnews.com',
+                                           'someone@example.com'))
+
+        try:
+            call_command('importmail', path, stdout=StringIO())
+            call_command('importmail', path, restart=True, stdout=StringIO())
+        finally:
+            shutil.rmtree(directory)
+
+        email = InboundEmail.objects.get()
+        self.assertEqual(email.subject, 'Request 0')
+        self.assertEqual(email.sender.email, 'bob@dallasnews.com')
+        self.assertEqual(email.text, 'Please send the records.\n')
+        self.assertFalse(email.processed)
+        self.assertEqual(
+            list(email.recipients.values_list('email', flat=True)),
+            ['records@example.com'])
+
+    @override_settings(FOIATRACKER_ALLOWED_DOMAINS=('dallasnews.com',))
+    def test_import_mail_resume(self):
+        """An import should pick up after the last batch its checkpoint
+        recorded"""
+        directory = tempfile.mkdtemp()
+        path = self.write_mbox(directory, ('bob@dallasnews.com',
+                                           'alice@dallasnews.com'))
+        checkpoint_path = path + '.checkpoint'
+        with open(checkpoint_path, 'w') as f:
+            json.dump({'path': path, 'position': 1}, f)
+
+        out = StringIO()
+        try:
+            call_command('importmail', path, batch_size=1, stdout=out)
+            with open(checkpoint_path) as f:
+                checkpoint = json.load(f)
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertIn('Resuming after message 1', out.getvalue())
+        self.assertEqual(
+            list(InboundEmail.objects.values_list('subject', flat=True)),
+            ['Request 1'])
+        self.assertEqual(checkpoint['position'], 2)
+
+    @override_settings(FOIATRACKER_ALLOWED_DOMAINS=('dallasnews.com',))
+    @patch('foiatracker.management.commands.importmail.get_recipients',
+           side_effect=RuntimeError('Lost the connection'))
+    @patch('foiatracker.management.commands.importmail.upload')
+    @patch('foiatracker.management.commands.importmail.message_contents',
+           return_value=('Text', '', ['attachment.pdf']))
+    def test_import_mail_discards_uploads(self, message_contents, upload,
+                                          get_recipients):
+        """Attachments uploaded for a batch that fails to insert should be
+        deleted"""
+        directory = tempfile.mkdtemp()
+        path = self.write_mbox(directory, ('bob@dallasnews.com',))
+        try:
+            with self.assertRaises(RuntimeError):
+                call_command('importmail', path, restart=True,
+                             stdout=StringIO())
+        finally:
+            shutil.rmtree(directory)
+
+        upload.return_value.stored_file.delete.assert_called_once_with(
+            save=False)
+        self.assertFalse(InboundEmail.objects.exists())
+
+    def test_get_recipients_ignores_case(self):
+        """Addresses should match existing recipients whatever their case,
+        and only unknown addresses should be created"""
+        existing = Recipient.objects.create(email='Clerk@Example.com')
+        recipients, created = ingest.get_recipients(
+            ['clerk@example.com', 'RECORDS@example.com', 'new@example.com'])
+
+        self.assertEqual(recipients['clerk@example.com'], existing)
+        self.assertEqual(recipients['records@example.com'].name, 'Records')
+        self.assertEqual([r.email for r in created], ['new@example.com'])
+        self.assertEqual(Recipient.objects.count(), 3)
+
+
+@override_settings(ROOT_URLCONF='foiatracker.urls')
+class FoiaSearchTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable post_save signals during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(FoiaSearchTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable post_save signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(FoiaSearchTestCase, cls).tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('reporter', 'a@example.com', 'pw')
+        cls.sender = Sender.objects.create(last_name='Last',
+                                           email='a@example.com')
+        cls.email = InboundEmail.objects.create(
+            sender=cls.sender, sent=timezone.now(), raw='', text='', html='',
+            subject='Re: Police overtime records')
+        for subject in ('Police overtime', 'Budget audit'):
+            Foia.objects.create(email=cls.email, sent=timezone.now(),
+                                request_subject=subject)
+
+    def test_login_required(self):
+        """Anonymous users should be redirected away from search results"""
+        resp = self.client.get('/request/search/', {'q': 'police'})
+        self.assertEqual(resp.status_code, 302)
+
+    def test_search_by_subject(self):
+        """Only requests with a matching subject should be returned, labeled
+        with the sender's last name"""
+        self.client.force_login(self.user)
+        resp = self.client.get('/request/search/', {'q': 'police'})
+        results = resp.json()['results']
+        self.assertEqual(len(results), 1)
+        self.assertEqual(results[0]['text'], 'Last: Police overtime')
+
+    def test_search_ranked_by_email(self):
+        """Passing an e-mail's UUID should put the best match first"""
+        self.client.force_login(self.user)
+        resp = self.client.get('/request/search/',
+                               {'email': str(self.email.uuid)})
+        results = resp.json()['results']
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['text'], 'Last: Police overtime')
+
+    def test_match_candidates(self):
+        """Only requests with similar subjects or from the e-mail's sender
+        should be ranked against it"""
+        other_email = InboundEmail.objects.create(
+            sender=Sender.objects.create(email='b@example.com'),
+            sent=timezone.now(), raw='', text='', html='')
+        similar = Foia.objects.create(
+            email=other_email, sent=timezone.now(),
+            request_subject='Police overtime logs')
+        unrelated = Foia.objects.create(
+            email=other_email, sent=timezone.now(),
+            request_subject='Water billing')
+
+        pks = [foia['pk'] for foia in search_foias(email=self.email)]
+        self.assertEqual(len(pks), 3)
+        self.assertIn(similar.pk, pks)
+        self.assertNotIn(unrelated.pk, pks)
+
+    def test_bulk_update(self):
+        """Bulk updates should add the same Event to every selected request
+        and update their stored status"""
+        self.client.force_login(self.user)
+        foias = list(Foia.objects.all())
+        resp = self.client.post('/request/bulk-update/', {
+            'foias': [foia.pk for foia in foias],
+            'status': Event.NO_RECORDS,
+            'update_date': 'Tuesday, Jan 09, 2018',
+            'email': self.email.pk,
+            'next': '/?status=pending',
+        })
+        self.assertRedirects(resp, '/?status=pending',
+                             fetch_redirect_response=False)
+
+        events = Event.objects.filter(foia__in=foias)
+        self.assertEqual(events.count(), 2)
+        self.assertTrue(all(e.email_id == self.email.pk for e in events))
+        self.assertEqual(
+            Foia.objects.filter(latest_status=Event.NO_RECORDS).count(), 2)
+        self.assertTrue(InboundEmail.objects.get(pk=self.email.pk).processed)
+
+    def test_bulk_filed_email_link(self):
+        """An e-mail filed on several requests at once should link to the
+        newest of its Events"""
+        self.client.force_login(self.user)
+        update = InboundEmail.objects.create(
+            sender=self.sender, sent=timezone.now(), raw='', text='',
+            html='', subject='Re: Police overtime records')
+        self.client.post('/request/bulk-update/', {
+            'foias': list(Foia.objects.values_list('pk', flat=True)),
+            'status': Event.KICKED,
+            'update_date': 'Tuesday, Jan 09, 2018',
+            'email': update.pk,
+            'next': '/',
+        })
+        self.assertEqual(Event.objects.filter(email=update).count(), 2)
+
+        resp = self.client.get('/event/from-email/%s/' % update.uuid)
+        newest = Event.objects.filter(email=update).order_by(
+            '-created_at', '-pk').first()
+        self.assertRedirects(resp, '/event/%s/' % newest.pk,
+                             fetch_redirect_response=False)
+
+
+@override_settings(ROOT_URLCONF='foiatracker.urls')
+class TriageTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(TriageTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(TriageTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.user = User.objects.create_user('reporter', 'a@example.com',
+                                             'pw')
+        sender = Sender.objects.create(email='a@example.com')
+        request_email = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='',
+            subject='Police overtime records')
+        self.foia = Foia.objects.create(email=request_email,
+                                        sent=timezone.now(),
+                                        request_subject='Police overtime')
+        self.reply = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='',
+            subject='Re: Police overtime records')
+        self.other_reply = InboundEmail.objects.create(
+            sender=Sender.objects.create(email='b@example.com'),
+            sent=timezone.now(), raw='', text='', html='',
+            subject='Re: Budget audit')
+
+    def test_processed(self):
+        """E-mails should be processed while a request or Event is made
+        from them"""
+        self.assertTrue(InboundEmail.objects.get(
+            pk=self.foia.email_id).processed)
+
+        event = Event.objects.create(foia=self.foia, email=self.reply,
+                                     status=Event.PENDING,
+                                     update_date=datetime.date.today())
+        self.assertTrue(InboundEmail.objects.get(pk=self.reply.pk).processed)
+
+        event.delete()
+        self.assertFalse(InboundEmail.objects.get(pk=self.reply.pk).processed)
+
+    def test_inbox(self):
+        """The inbox should list the user's own unprocessed e-mails with
+        their suggested requests"""
+        suggest_matches(self.reply)
+        self.client.force_login(self.user)
+        resp = self.client.get('/inbox/')
+
+        self.assertEqual(list(resp.context['emails']), [self.reply])
+        self.assertEqual(
+            [s.foia for s in resp.context['emails'][0].suggestions.all()],
+            [self.foia])
+
+    def test_suggest_matches(self):
+        """Only likely requests should be suggested, and nothing for an
+        e-mail unlike any request"""
+        suggest_matches(self.reply)
+        self.assertEqual(
+            [s.foia for s in MatchSuggestion.objects.filter(
+                email=self.reply)],
+            [self.foia])
+
+        suggest_matches(self.other_reply)
+        self.assertFalse(MatchSuggestion.objects.filter(
+            email=self.other_reply).exists())
+
+    def test_file_in_batch(self):
+        """Checked e-mails should be filed on the picked request"""
+        suggest_matches(self.reply)
+        self.client.force_login(self.user)
+        resp = self.client.post('/inbox/update/', {
+            'emails': [self.reply.pk, self.other_reply.pk],
+            'foia-%s' % self.reply.pk: self.foia.pk,
+            'foia-%s' % self.other_reply.pk: self.foia.pk,
+            'action': 'pair',
+        })
+        self.assertRedirects(resp, '/inbox/', fetch_redirect_response=False)
+
+        # Other users' e-mails are left alone
+        self.assertEqual(Event.objects.get().email, self.reply)
+        self.assertFalse(MatchSuggestion.objects.exists())
+        self.assertFalse(InboundEmail.objects.get(
+            pk=self.other_reply.pk).processed)
+
+
+class RecipientsChoiceFieldTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable pre_save signals during this test case"""
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        super(RecipientsChoiceFieldTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable pre_save signals after test case"""
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        super(RecipientsChoiceFieldTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.field = RecipientsChoiceField(
+            search_url='/recipient/search/',
+            queryset=Recipient.objects.all())
+
+    def test_clean_pks_and_emails(self):
+        """Existing PKs and e-mails should be matched and new e-mails should
+        be created as recipients"""
+        existing = Recipient.objects.create(email='a@example.com')
+        cleaned = self.field.clean(
+            [str(existing.pk), 'A@example.com', 'new@example.com'])
+        self.assertEqual(
+            sorted(r.email for r in cleaned),
+            ['a@example.com', 'new@example.com'])
+        self.assertEqual(Recipient.objects.count(), 2)
+
+    def test_clean_invalid_pk(self):
+        """PKs that don't match a recipient should fail validation"""
+        with self.assertRaises(ValidationError):
+            self.field.clean(['999'])
+
+    def test_limit_choices(self):
+        """Only the passed recipients should be rendered as options"""
+        recipient = Recipient.objects.create(email='a@example.com')
+        Recipient.objects.create(email='b@example.com')
+        self.field.limit_choices([recipient])
+        self.assertEqual(self.field.widget.choices,
+                         [(recipient.pk, 'a@example.com')])
+
+
+class AgencyTestCase(TestCase):
+    def test_link_agency(self):
+        """Recipients at the same Rolodex organization should share an
+        Agency that follows the organization's name"""
+        first = Recipient(email='a@example.com', organization='Dallas ISD',
+                          rolodex_organization_id=3)
+        first.link_agency()
+        second = Recipient(email='b@example.com',
+                           organization='Dallas Independent School District',
+                           rolodex_organization_id=3)
+        second.link_agency()
+
+        self.assertEqual(first.agency, second.agency)
+        self.assertEqual(Agency.objects.get().name,
+                         'Dallas Independent School District')
+
+        unmatched = Recipient(email='c@example.com', organization='Someone')
+        unmatched.link_agency()
+        self.assertIsNone(unmatched.agency)
+
+
+@override_settings(FOIATRACKER_DOMAIN_ALIASES={'citymail.gov': 'city.gov'})
+class RecipientDedupeTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(RecipientDedupeTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(RecipientDedupeTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.records = Recipient.objects.create(email='records@city.gov')
+        self.upper = Recipient.objects.create(email='Records@City.gov',
+                                              organization='City of Dallas')
+        self.alias = Recipient.objects.create(
+            email='records+foia@citymail.gov')
+        self.county = Recipient.objects.create(email='records@county.gov')
+        self.jane = Recipient.objects.create(email='jane@city.gov',
+                                             rolodex_contact_id=7)
+        self.jdoe = Recipient.objects.create(email='jdoe@city.gov',
+                                             rolodex_contact_id=7)
+
+        sender = Sender.objects.create(email='a@example.com')
+        email = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='')
+        email.recipients.add(self.alias)
+        self.foia = Foia.objects.create(email=email,
+                                        sent=datetime.date(2018, 1, 2),
+                                        request_subject='Subject line')
+        self.foia.recipients.add(self.records, self.upper)
+        self.other = Foia.objects.create(email=email,
+                                         sent=datetime.date(2018, 1, 2),
+                                         request_subject='Another')
+        self.other.recipients.add(self.records)
+
+    def test_find_duplicates(self):
+        """Variants of one address and addresses of one Rolodex contact
+        should be grouped, with the most-used recipient first"""
+        groups = find_recipient_duplicates()
+        self.assertEqual(
+            [[r['pk'] for r in group] for group in groups],
+            [[self.jane.pk, self.jdoe.pk],
+             [self.records.pk, self.upper.pk, self.alias.pk]])
+
+    def test_merge(self):
+        """Merging should leave each request and e-mail linked once to the
+        recipient kept, with details only a duplicate had"""
+        out = StringIO()
+        call_command('deduperecipients', merge=True, stdout=out)
+        self.assertIn('merged 3 recipients', out.getvalue())
+
+        self.assertFalse(Recipient.objects.filter(pk__in=[
+            self.upper.pk, self.alias.pk, self.jdoe.pk]).exists())
+        self.assertEqual(list(self.foia.recipients.all()), [self.records])
+        self.assertEqual(list(self.foia.email.recipients.all()),
+                         [self.records])
+
+        # Including requests that only ever had the recipient kept
+        for foia in (self.foia, self.other):
+            foia.refresh_from_db()
+            self.assertEqual(foia.recipients_display, 'City of Dallas')
+
+    def test_weak_matches_not_merged(self):
+        """Addresses of one Rolodex person at two agencies should be listed
+        but not merged"""
+        county = Recipient.objects.create(email='jsmith@county.gov',
+                                          rolodex_person_id=9)
+        state = Recipient.objects.create(email='john.smith@state.gov',
+                                         rolodex_person_id=9)
+        out = StringIO()
+        call_command('deduperecipients', merge=True, stdout=out)
+        self.assertIn('jsmith@county.gov <- john.smith@state.gov',
+                      out.getvalue())
+        self.assertIn('merged 3 recipients', out.getvalue())
+        self.assertEqual(Recipient.objects.filter(
+            pk__in=[county.pk, state.pk]).count(), 2)
+
+    def test_oversize_address_block(self):
+        """Variants of one address should be grouped even when there are
+        too many of them to compare pairwise"""
+        variants = [
+            Recipient.objects.create(email='records+%s@county.gov' % i)
+            for i in range(dedupe.MAX_BLOCK_SIZE)
+        ]
+        groups = find_recipient_duplicates()
+        county = [group for group in groups
+                  if self.county.pk in [r['pk'] for r in group]]
+        self.assertEqual(len(county), 1)
+        self.assertEqual(
+            sorted(r['pk'] for r in county[0]),
+            sorted([self.county.pk] + [r.pk for r in variants]))
+
+
+class BackgroundJobTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        super(BackgroundJobTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        super(BackgroundJobTestCase, cls).tearDownClass()
+
+    @patch('foiatracker.jobs.JOB_CHUNK_SIZE', 2)
+    def test_run_in_chunks(self):
+        """Jobs should run in chunks, recording progress and errors without
+        stopping"""
+        for i in range(3):
+            Recipient.objects.create(email='%s@example.com' % i)
+
+        def action(recipient):
+            if recipient.email == '1@example.com':
+                raise ValueError('Bad recipient')
+
+        with patch.dict(JOB_ACTIONS, {'test': (Recipient, action, 'Test')}):
+            job = start_job('test', Recipient.objects.order_by('email'))
+            self.assertEqual(job.status, BackgroundJob.PENDING)
+
+            self.assertEqual(run_chunk(job.pk, 0), 2)
+            job.refresh_from_db()
+            self.assertEqual(job.status, BackgroundJob.RUNNING)
+            self.assertEqual(job.processed, 2)
+
+            self.assertIsNone(run_chunk(job.pk, 2))
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, BackgroundJob.FINISHED)
+        self.assertEqual(job.processed, 3)
+        self.assertEqual(job.failed, 1)
+        self.assertEqual(job.errors, [[
+            Recipient.objects.get(email='1@example.com').pk,
+            'ValueError: Bad recipient',
+        ]])
+
+
+class FoiaFilterTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(FoiaFilterTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(FoiaFilterTestCase, cls).tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.sender = Sender.objects.create(email='a@example.com')
+        cls.email = InboundEmail.objects.create(
+            sender=cls.sender, sent=timezone.now(), raw='', html='',
+            text='Please send the overtime logs')
+        cls.foia = Foia.objects.create(email=cls.email, sent=timezone.now(),
+                                       request_subject='Payroll data')
+        cls.other_foia = Foia.objects.create(
+            email=InboundEmail.objects.create(
+                sender=cls.sender, sent=timezone.now(), raw='', html='',
+                text=''),
+            sent=timezone.now(), request_subject='Budget audit')
+
+    def search(self, term):
+        return FoiaFilter({'search': term}, queryset=Foia.objects.all()).qs
+
+    def test_search_stored_vector(self):
+        """Searches should match the request and its original e-mail"""
+        self.assertEqual(list(self.search('payroll')), [self.foia])
+        self.assertEqual(list(self.search('overtime')), [self.foia])
+
+    def test_sender_filter(self):
+        """Filtering by sender should use the sender copied from the
+        request's e-mail"""
+        self.assertEqual(Foia.objects.get(pk=self.foia.pk).sender,
+                         self.sender)
+        mine = FoiaFilter({'sender': 'a@example.com'},
+                          queryset=Foia.objects.all()).qs
+        self.assertEqual(set(mine), set([self.foia, self.other_foia]))
+        nobody = FoiaFilter({'sender': 'nobody@example.com'},
+                            queryset=Foia.objects.all()).qs
+        self.assertEqual(list(nobody), [])
+
+    def test_sender_follows_email(self):
+        """The copied sender should follow a request moved to another
+        e-mail and an e-mail whose sender is changed"""
+        other_sender = Sender.objects.create(email='b@example.com')
+        other_email = InboundEmail.objects.create(
+            sender=other_sender, sent=timezone.now(), raw='', html='',
+            text='')
+        self.foia.email = other_email
+        self.foia.save()
+        self.assertEqual(Foia.objects.get(pk=self.foia.pk).sender,
+                         other_sender)
+
+        other_email.sender = self.sender
+        other_email.save()
+        self.assertEqual(Foia.objects.get(pk=self.foia.pk).sender,
+                         self.sender)
+
+    def test_facet_counts(self):
+        """Facets should count every status and group by sender, even when
+        a status filter is active"""
+        cache.clear()
+        Event.objects.create(foia=self.foia, status=Event.DENIED,
+                             update_date=datetime.date.today())
+
+        facets = FoiaFilter({'status': 'pending'},
+                            queryset=Foia.objects.all()).facet_counts()
+        self.assertEqual(facets['total'], 2)
+        self.assertEqual(facets['pending'], 1)
+        self.assertEqual(facets['complete'], 1)
+        self.assertEqual(facets['senders'], [{
+            'email': 'a@example.com',
+            'name': 'a@example.com',
+            'count': 1,
+        }])
+
+    def test_search_vector_follows_recipients(self):
+        """Adding and renaming recipients should update search results
+        without duplicating rows"""
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.foia.recipients.add(recipient)
+        self.assertEqual(list(self.search('dallas')), [self.foia])
+
+        recipient.organization = 'Plano ISD'
+        recipient.save()
+        self.assertEqual(list(self.search('dallas')), [])
+        self.assertEqual(list(self.search('plano')), [self.foia])
+
+    def test_recipients_display(self):
+        """The stored recipients string should fall back to the e-mail's
+        recipients and follow edits to either list"""
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.email.recipients.add(recipient)
+        self.assertEqual(
+            Foia.objects.get(pk=self.foia.pk).recipients_str(), 'Dallas ISD')
+
+        other = Recipient.objects.create(email='o@example.com',
+                                         name='Jim')
+        self.foia.recipients.add(other)
+        self.assertEqual(
+            Foia.objects.get(pk=self.foia.pk).recipients_str(), 'Jim')
+
+        other.organization = 'Plano ISD'
+        other.save()
+        self.assertEqual(
+            Foia.objects.get(pk=self.foia.pk).recipients_str(),
+            'Plano ISD (Jim)')
+
+    def test_unchanged_recipient(self):
+        """Saving a recipient without changing what requests show of it
+        shouldn't touch them"""
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.foia.recipients.add(recipient)
+        version = Foia.objects.get(pk=self.foia.pk).version
+
+        recipient.save()
+        self.assertEqual(Foia.objects.get(pk=self.foia.pk).version, version)
+
+        recipient.name = 'Jim'
+        recipient.save()
+        foia = Foia.objects.get(pk=self.foia.pk)
+        self.assertGreater(foia.version, version)
+        self.assertEqual(foia.recipients_str(), 'Dallas ISD (Jim)')
+        self.assertEqual(list(self.search('jim')), [self.foia])
+
+    def test_agency_report(self):
+        """The report should measure business days to the first response
+        and resolution for each agency"""
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.foia.recipients.add(recipient)
+        self.foia.sent = datetime.date(2018, 1, 2)
+        self.foia.save()
+        Event.objects.create(foia=self.foia, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 4))
+        Event.objects.create(foia=self.foia, status=Event.RELEASED_BY_AGENCY,
+                             update_date=datetime.date(2018, 1, 9),
+                             amount_asked=10)
+
+        report = agency_report(request_rows(Foia.objects.all()))
+        self.assertEqual([a['name'] for a in report],
+                         ['Dallas ISD', UNKNOWN_AGENCY])
+        self.assertEqual(report[0]['first_response']['median'], 2)
+        self.assertEqual(report[0]['resolution']['median'], 5)
+        self.assertEqual(report[0]['amount_asked'], 10)
+        self.assertIsNone(report[1]['first_response'])
+
+    def test_cached_report_rows(self):
+        """Cached report rows should be rebuilt for the chunks of requests
+        that changed"""
+        cache.clear()
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.foia.recipients.add(recipient)
+        self.assertEqual(cached_request_rows()[self.foia.pk]['agencies'],
+                         ['Dallas ISD'])
+
+        Recipient.objects.filter(pk=recipient.pk).update(
+            organization='Plano ISD')
+        self.assertEqual(cached_request_rows()[self.foia.pk]['agencies'],
+                         ['Dallas ISD'])
+        refresh_requests([self.foia.pk])
+        rows = cached_request_rows()
+        self.assertEqual(rows[self.foia.pk]['agencies'], ['Plano ISD'])
+        self.assertIn(self.other_foia.pk, rows)
+
+    def test_export_rows(self):
+        """Exported rows should carry recipients and count business days
+        only until a request is resolved"""
+        recipient = Recipient.objects.create(email='r@example.com',
+                                             organization='Dallas ISD')
+        self.foia.recipients.add(recipient)
+        sent = Foia.objects.get(pk=self.foia.pk).sent
+        Event.objects.create(foia=self.foia, status=Event.DENIED,
+                             update_date=sent)
+
+        rows = dict((row['id'], row) for row in export_rows(
+            Foia.objects.all(),
+            today=sent + datetime.timedelta(days=30)))
+        self.assertEqual(rows[self.foia.pk]['recipients'], 'Dallas ISD')
+        self.assertEqual(rows[self.foia.pk]['business_days_elapsed'], 0)
+        self.assertEqual(rows[self.foia.pk]['status'],
+                         'Denied by attorney general')
+        self.assertGreater(rows[self.other_foia.pk]['business_days_elapsed'],
+                           0)
+
+
+@override_settings(ROOT_URLCONF='foiatracker.urls')
+class ChangeFeedTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(ChangeFeedTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(ChangeFeedTestCase, cls).tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('reporter')
+        sender = Sender.objects.create(email='a@example.com')
+        cls.foia = Foia.objects.create(
+            email=InboundEmail.objects.create(
+                sender=sender, sent=timezone.now(), raw='', html='',
+                text=''),
+            sent=timezone.now(), request_subject='Payroll data')
+
+    def setUp(self):
+        cache.clear()
+
+    def test_changes_since(self):
+        """Changes should come back in order after the number asked for"""
+        first = changes.publish(self.foia.pk, created=True)
+        second = changes.publish(self.foia.pk, deleted=True)
+
+        latest, found = changes.changes_since(0)
+        self.assertEqual(latest, second)
+        self.assertEqual([c['id'] for c in found], [first, second])
+        self.assertTrue(found[0]['created'])
+        self.assertTrue(found[1]['deleted'])
+        self.assertEqual(changes.changes_since(second), (second, []))
+
+    def test_row(self):
+        """The row endpoint should render one request, and 404 once it's
+        gone"""
+        self.client.force_login(self.user)
+        response = self.client.get('/request/%s/row/' % self.foia.pk)
+        self.assertContains(response, 'data-foia="%s"' % self.foia.pk)
+
+        response = self.client.get('/request/%s/row/' % (self.foia.pk + 1))
+        self.assertEqual(response.status_code, 404)
+
+    @patch('foiatracker.changes.STREAM_SECONDS', 0)
+    def test_stream(self):
+        """The stream should send changes after the browser's last event"""
+        seen = changes.publish(self.foia.pk)
+        changes.publish(self.foia.pk)
+
+        self.client.force_login(self.user)
+        response = self.client.get('/request/changes/',
+                                   HTTP_LAST_EVENT_ID=str(seen))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        body = ''.join(
+            chunk.decode('utf-8') for chunk in response.streaming_content)
+        self.assertIn('id: %s\nevent: change\n' % (seen + 1), body)
+        self.assertNotIn('id: %s\nevent: change\n' % seen, body)
+        self.assertIn('"foia": %s' % self.foia.pk, body)
+
+    @patch('foiatracker.changes.connection')
+    def test_stream_releases_connection(self, connection):
+        """Streams shouldn't hold a database connection while they're open"""
+        connection.in_atomic_block = False
+        next(changes.stream_changes(0))
+        connection.close.assert_called_once_with()
+
+
+class DuplicateRequestTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(DuplicateRequestTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(DuplicateRequestTestCase, cls).tearDownClass()
+
+    def create_foia(self, subject, text):
+        email = InboundEmail.objects.create(
+            sender=self.sender, sent=timezone.now(), raw=text, text=text,
+            html='', subject=subject)
+        return Foia.objects.create(email=email, sent=datetime.date.today(),
+                                   request_subject=subject)
+
+    def setUp(self):
+        self.sender = Sender.objects.create(email='a@example.com')
+        body = ('Under the Texas Public Information Act I request copies of '
+                'all use of force reports filed by officers of the police '
+                'department between January 1 and June 30, including any '
+                'supervisor reviews and attached incident narratives.')
+        self.original = self.create_foia('Use of force reports', body)
+        self.similar = self.create_foia(
+            'Use of force reports', body.replace('June 30', 'July 31'))
+        self.unrelated = self.create_foia(
+            'Restaurant inspections',
+            'Please send every restaurant inspection report completed by '
+            'the health department this year, with any violations noted.')
+
+    def test_signature_similarity(self):
+        """Signatures of the same text should match exactly and ones of
+        unrelated text hardly at all"""
+        signature = minhash(shingles('the quick brown fox jumps over'))
+        self.assertEqual(signature,
+                         minhash(shingles('The quick brown fox jumps over')))
+        self.assertLess(similarity(signature, minhash(shingles(
+            'an entirely different sentence about budgets'))), 0.2)
+        self.assertIsNone(minhash(shingles('')))
+
+    def test_find_duplicates(self):
+        """Saved requests should be indexed, and only near-identical ones
+        reported"""
+        self.assertEqual(RequestSignature.objects.count(), 3)
+
+        duplicates = find_duplicates(self.original)
+        self.assertEqual([foia for foia, score in duplicates],
+                         [self.similar])
+        self.assertGreater(duplicates[0][1], 0.6)
+        self.assertEqual(find_duplicates(self.unrelated), [])
+
+    @patch('foiatracker.signals.duplicates.index_request')
+    def test_reindex_on_text_change(self, index_request):
+        """Requests should only be re-signed when their subject or e-mail
+        text changes"""
+        self.original.notes = 'Followed up by phone'
+        self.original.save()
+        email = self.original.email
+        email.subject = 'Fwd: Use of force reports'
+        email.save()
+        self.assertFalse(index_request.called)
+
+        self.original.request_subject = 'Use of force and pursuit reports'
+        self.original.save()
+        self.assertEqual(index_request.call_count, 1)
+
+        email.text = email.text.replace('June 30', 'May 31')
+        email.save()
+        self.assertEqual(index_request.call_count, 2)
+
+    def test_threshold(self):
+        """Raising the threshold past a pair's similarity should hide it"""
+        with self.settings(FOIATRACKER_DUPLICATE_THRESHOLD=1.0):
+            self.assertEqual(find_duplicates(self.original), [])
+
+
+class FoiaStatusTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(FoiaStatusTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(FoiaStatusTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        sender = Sender.objects.create(email='a@example.com')
+        email = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='')
+        self.foia = Foia.objects.create(email=email,
+                                        sent=datetime.date(2018, 1, 2),
+                                        request_subject='Subject line')
+
+    def test_no_events(self):
+        """Requests without Events should be pending"""
+        self.assertEqual(self.foia.status(),
+                         (Event.PENDING, 'Awaiting agency response'))
+        self.assertFalse(self.foia.completed)
+
+    def test_event_writes(self):
+        """Saving and deleting Events should keep the request's stored
+        status in step with its latest Event"""
+        Event.objects.create(foia=self.foia, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 10))
+        released = Event.objects.create(
+            foia=self.foia, status=Event.RELEASED_BY_AGENCY,
+            update_date=datetime.date(2018, 2, 1))
+
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.latest_status, Event.RELEASED_BY_AGENCY)
+        self.assertEqual(self.foia.latest_update_date,
+                         datetime.date(2018, 2, 1))
+        self.assertTrue(self.foia.completed)
+
+        released.delete()
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.latest_status, Event.KICKED)
+        self.assertFalse(self.foia.completed)
+
+    def test_stale_save(self):
+        """Saving a copy of a request loaded before its status changed
+        shouldn't write the old status back"""
+        stale = Foia.objects.get(pk=self.foia.pk)
+        Event.objects.create(foia=self.foia,
+                             status=Event.RELEASED_BY_AGENCY,
+                             update_date=datetime.date(2018, 2, 1))
+        version = Foia.objects.get(pk=self.foia.pk).version
+
+        stale.notes = 'Called the records office'
+        stale.save()
+
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.notes, 'Called the records office')
+        self.assertEqual(self.foia.latest_status, Event.RELEASED_BY_AGENCY)
+        self.assertTrue(self.foia.completed)
+        self.assertIsNotNone(self.foia.resolution_days)
+        self.assertGreater(self.foia.version, version)
+        self.assertEqual(stale.latest_status, Event.RELEASED_BY_AGENCY)
+
+    def test_repair_status(self):
+        """Repairing a request's drifted status should refresh its response
+        times and cached row too"""
+        Event.objects.create(foia=self.foia,
+                             status=Event.RELEASED_BY_AGENCY,
+                             update_date=datetime.date(2018, 2, 1))
+        Foia.objects.filter(pk=self.foia.pk).update(
+            latest_status=Event.PENDING, completed=False,
+            resolution_days=None)
+        version = Foia.objects.get(pk=self.foia.pk).version
+
+        out = StringIO()
+        call_command('repairfoiastatus', stdout=out)
+        self.assertIn('for 1 requests', out.getvalue())
+
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.latest_status, Event.RELEASED_BY_AGENCY)
+        self.assertTrue(self.foia.completed)
+        self.assertIsNotNone(self.foia.resolution_days)
+        self.assertGreater(self.foia.version, version)
+
+    def test_response_times(self):
+        """Requests should store when and how many business days after
+        they were sent the agency first responded and resolved them"""
+        Event.objects.create(foia=self.foia, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 4))
+        Event.objects.create(foia=self.foia, status=Event.DENIED,
+                             update_date=datetime.date(2018, 1, 9))
+
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.first_response_date,
+                         datetime.date(2018, 1, 4))
+        self.assertEqual(self.foia.first_response_days, 2)
+        self.assertEqual(self.foia.resolved_date, datetime.date(2018, 1, 9))
+        self.assertEqual(self.foia.resolution_days, 5)
+
+        slow = FoiaFilter({'first_response_days': '3'},
+                          queryset=Foia.objects.all()).qs
+        self.assertEqual(list(slow), [])
+
+    def test_business_days_since_request(self):
+        """The edit page should count business days the same way as the
+        stored response times"""
+        # Sent on a Monday, answered the following Saturday
+        self.foia.sent = datetime.date(2018, 1, 8)
+        self.foia.save()
+        event = Event.objects.create(foia=self.foia, status=Event.KICKED,
+                                     update_date=datetime.date(2018, 1, 13))
+
+        self.foia.refresh_from_db()
+        self.assertEqual(self.foia.first_response_days, 4)
+        self.assertEqual(event.business_days_since_request.days, 4)
+
+    @override_settings(ROOT_URLCONF='foiatracker.urls')
+    def test_sort_by_response_time(self):
+        """The list should sort on stored response times when o= is one of
+        its choices, leaving out requests without one"""
+        slower = Foia.objects.create(email=self.foia.email,
+                                     sent=datetime.date(2018, 1, 2),
+                                     request_subject='Slower')
+        Foia.objects.create(email=self.foia.email,
+                            sent=datetime.date(2018, 1, 2),
+                            request_subject='No response')
+        Event.objects.create(foia=self.foia, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 4))
+        Event.objects.create(foia=slower, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 10))
+
+        self.client.force_login(User.objects.create_user('reporter'))
+        resp = self.client.get('/', {'o': '-first_response_days'})
+        self.assertEqual(list(resp.context['object_list']),
+                         [slower, self.foia])
+        resp = self.client.get('/', {'o': 'first_response_days'})
+        self.assertEqual(list(resp.context['object_list']),
+                         [self.foia, slower])
+
+        resp = self.client.get('/', {'o': 'request_subject'})
+        self.assertEqual(len(resp.context['object_list']), 3)
+
+    def test_status_filter(self):
+        """Requests without Events should show up as pending"""
+        pending = FoiaFilter({'status': 'pending'},
+                             queryset=Foia.objects.all()).qs
+        complete = FoiaFilter({'status': 'complete'},
+                              queryset=Foia.objects.all()).qs
+        self.assertEqual(list(pending), [self.foia])
+        self.assertEqual(list(complete), [])
+
+    def test_version(self):
+        """Changes to anything shown in a list row should bump the
+        request's version"""
+        versions = [Foia.objects.get(pk=self.foia.pk).version]
+
+        def assert_bumped():
+            version = Foia.objects.get(pk=self.foia.pk).version
+            self.assertGreater(version, versions[-1])
+            versions.append(version)
+
+        Event.objects.create(foia=self.foia, status=Event.KICKED,
+                             update_date=datetime.date(2018, 1, 10))
+        assert_bumped()
+
+        self.foia.request_subject = 'New subject line'
+        self.foia.save()
+        assert_bumped()
+
+        sender = self.foia.email.sender
+        sender.last_name = 'Smith'
+        sender.save()
+        assert_bumped()
+
+    def test_sender_search(self):
+        """Renaming a sender should make their requests searchable by the
+        new name, and saving them unchanged shouldn't touch the requests"""
+        sender = self.foia.email.sender
+        sender.last_name = 'Smith'
+        sender.save()
+        self.assertEqual(
+            list(FoiaFilter(data={'search': 'Smith'},
+                            queryset=Foia.objects.all()).qs),
+            [self.foia])
+
+        version = Foia.objects.get(pk=self.foia.pk).version
+        sender.save()
+        self.assertEqual(Foia.objects.get(pk=self.foia.pk).version, version)
+
+
+class ProjectStatsTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(ProjectStatsTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(ProjectStatsTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.project = Project.objects.create(name='Audits', description='')
+        sender = Sender.objects.create(email='a@example.com')
+        self.foias = []
+        for day in (2, 3):
+            email = InboundEmail.objects.create(
+                sender=sender, sent=timezone.now(), raw='', text='', html='')
+            self.foias.append(Foia.objects.create(
+                email=email, project=self.project,
+                sent=datetime.date(2018, 1, day),
+                request_subject='Audit %s' % day))
+
+    def stats(self):
+        return Project.objects.get(pk=self.project.pk).stats
+
+    def test_stats_follow_events(self):
+        """Stats should be refreshed as requests are resolved"""
+        self.assertEqual(self.stats().total, 2)
+        self.assertEqual(self.stats().pending, 2)
+
+        Event.objects.create(foia=self.foias[0], status=Event.NO_RECORDS,
+                             update_date=datetime.date(2018, 1, 9),
+                             amount_asked=25, amount_paid=20)
+        stats = self.stats()
+        self.assertEqual(stats.pending, 1)
+        self.assertEqual(stats.complete, 1)
+        self.assertEqual(stats.status_counts,
+                         {Event.PENDING: 1, Event.NO_RECORDS: 1})
+        self.assertEqual(stats.amount_asked, 25)
+        self.assertEqual(stats.amount_paid, 20)
+
+        # The median is recalculated in the background
+        ProjectStats.refresh_median(self.project.pk)
+        self.assertEqual(self.stats().median_days_to_resolution, 5)
+
+    def test_median_from_resolution_days(self):
+        """The median should count to when requests were first resolved,
+        like their stored resolution times"""
+        for foia, day in zip(self.foias, (9, 11)):
+            Event.objects.create(foia=foia, status=Event.NO_RECORDS,
+                                 update_date=datetime.date(2018, 1, day))
+        # A later release doesn't move when the first request was resolved
+        Event.objects.create(foia=self.foias[0],
+                             status=Event.RELEASED_BY_AGENCY,
+                             update_date=datetime.date(2018, 2, 1))
+
+        ProjectStats.refresh_median(self.project.pk)
+        self.assertEqual(self.stats().median_days_to_resolution, 5.5)
+
+    def test_stats_follow_fees(self):
+        """Editing and deleting Events should adjust the fee totals"""
+        event = Event.objects.create(
+            foia=self.foias[0], status=Event.KICKED,
+            update_date=datetime.date(2018, 1, 9), amount_asked=25)
+        event.amount_asked = 10
+        event.save()
+        self.assertEqual(self.stats().amount_asked, 10)
+
+        event.delete()
+        stats = self.stats()
+        self.assertEqual(stats.amount_asked, 0)
+        self.assertEqual(stats.status_counts, {Event.PENDING: 2})
+
+    def test_stats_match_refresh(self):
+        """Counts kept up incrementally should match a full
+        recalculation"""
+        Event.objects.create(foia=self.foias[0], status=Event.DENIED,
+                             update_date=datetime.date(2018, 1, 9))
+        self.foias[1].sent = datetime.date(2018, 1, 4)
+        self.foias[1].save()
+        fields = ('total', 'pending', 'complete', 'overdue', 'status_counts')
+        stats = self.stats()
+        incremental = [getattr(stats, field) for field in fields]
+
+        stats.refresh()
+        self.assertEqual([getattr(stats, field) for field in fields],
+                         incremental)
+
+    def test_save_with_unused_pk(self):
+        """Saving a request with a PK that isn't taken should create it"""
+        foia = Foia(pk=self.foias[1].pk + 100, email=self.foias[0].email,
+                    project=self.project, sent=datetime.date(2018, 1, 5),
+                    request_subject='Audit 5')
+        foia.save()
+        self.assertEqual(self.stats().total, 3)
+
+    def test_stats_follow_moves(self):
+        """Moving a request out of a project should drop it from the
+        project's stats"""
+        self.foias[0].project = None
+        self.foias[0].save()
+        self.assertEqual(self.stats().total, 1)
+
+        self.foias[1].delete()
+        self.assertEqual(self.stats().total, 0)
+
+
+class CursorPaginatorTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals that hit outside services during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia,
+                             dispatch_uid="foiatracker_slack")
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(CursorPaginatorTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia,
+                          dispatch_uid="foiatracker_slack")
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(CursorPaginatorTestCase, cls).tearDownClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        sender = Sender.objects.create(email='a@example.com')
+        email = InboundEmail.objects.create(
+            sender=sender, sent=timezone.now(), raw='', text='', html='')
+        # Two requests share a sent date to exercise the tie-breakers
+        for day in (1, 2, 2, 3, 4):
+            Foia.objects.create(email=email, sent=datetime.date(2018, 1, day),
+                                request_subject='Day %s' % day)
+        cls.ordering = ('-sent', '-created_at', 'id',)
+        cls.expected = list(Foia.objects.order_by(*cls.ordering))
+
+    def test_pages_forward_and_back(self):
+        """Following next and previous cursors should visit every request
+        exactly once, in order"""
+        paginator = CursorPaginator(Foia.objects.all(), self.ordering, 2)
+
+        first = paginator.page()
+        self.assertFalse(first.has_previous())
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        self.assertFalse(third.has_next())
+        self.assertEqual(
+            list(first) + list(second) + list(third), self.expected)
+
+        back = paginator.page(third.previous_cursor)
+        self.assertEqual(list(back), list(second))
+        self.assertEqual(list(paginator.page(back.previous_cursor)),
+                         list(first))
+
+    def test_search_pages_with_tied_ranks(self):
+        """Search results tied on rank across a page boundary should each be
+        shown exactly once"""
+        Foia.objects.update(request_subject='Police overtime')
+        for foia in Foia.objects.all():
+            foia.update_search_vector()
+        ordering = ('-rank', '-sent', '-created_at', 'id',)
+        results = FoiaFilter(data={'search': 'overtime'},
+                             queryset=Foia.objects.all()).qs
+        paginator = CursorPaginator(results, ordering, 2)
+
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        third = paginator.page(second.next_cursor)
+        self.assertFalse(third.has_next())
+        self.assertEqual(
+            list(first) + list(second) + list(third), self.expected)
+
+    def test_bad_cursor(self):
+        """Mangled cursors should fall back to the first page"""
+        paginator = CursorPaginator(Foia.objects.all(), self.ordering, 2)
+        self.assertEqual(list(paginator.page('not-a-cursor')),
+                         self.expected[:2])
+        tampered = encode_cursor(['2018-13-45', 'yesterday', 1])
+        self.assertEqual(list(paginator.page(tampered)), self.expected[:2])
+
+
+# foiatracker.urls leaves the admin to the host project, so the admin tests
+# route through this module
+urlpatterns = [
+    url(r'^admin/', admin.site.urls),
+]
+
+
+@override_settings(ROOT_URLCONF='foiatracker.tests')
+class AdminChangelistTestCase(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """Disable signals during this test case"""
+        post_save.disconnect(foia_to_slack, sender=Foia)
+        pre_save.disconnect(hydrate_from_rolodex,
+                            dispatch_uid="hydrate_from_rolodex",
+                            sender=Recipient)
+        pre_save.disconnect(hydrate_from_staff_api,
+                            dispatch_uid="hydrate_from_staff_api",
+                            sender=Sender)
+        super(AdminChangelistTestCase, cls).setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        """Re-enable signals after test case"""
+        post_save.connect(foia_to_slack, sender=Foia)
+        pre_save.connect(hydrate_from_rolodex,
+                         dispatch_uid="hydrate_from_rolodex",
+                         sender=Recipient)
+        pre_save.connect(hydrate_from_staff_api,
+                         dispatch_uid="hydrate_from_staff_api",
+                         sender=Sender)
+        super(AdminChangelistTestCase, cls).tearDownClass()
+
+    def setUp(self):
+        self.sender = Sender.objects.create(email='a@example.com')
+        self.project = Project.objects.create(
+            name='Test project', description='Test', slug='test-project')
+        self.client.force_login(User.objects.create_superuser(
+            'admin', 'admin@example.com', 'pw'))
+        self.add_rows(2)
+
+    def add_rows(self, count):
+        """Add @count requests, each with its own e-mail, recipient, agency
+        and Event"""
+        start = Recipient.objects.count()
+        for i in range(start, start + count):
+            agency = Agency.objects.create(name='Agency %s' % i)
+            recipient = Recipient.objects.create(
+                email='records%s@agency.gov' % i, agency=agency)
+            email = InboundEmail.objects.create(
+                sender=self.sender, sent=timezone.now(),
+                subject='Request %s' % i, raw='', text='', html='')
+            email.recipients.add(recipient)
+            foia = Foia.objects.create(email=email, project=self.project,
+                                       sent=datetime.date(2018, 1, 2),
+                                       request_subject='Request %s' % i)
+            foia.recipients.add(recipient)
+            Event.objects.create(foia=foia, email=email, status=Event.PENDING,
+                                 update_date=datetime.date(2018, 1, 4))
+
+    def assertChangelistQueriesFixed(self, model_name):
+        """The changelist for @model_name should run as many queries with
+        more rows as it did with fewer"""
+        url = '/admin/foiatracker/%s/' % model_name
+        with CaptureQueriesContext(connection) as queries:
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+
+        self.add_rows(5)
+        with self.assertNumQueries(len(queries)):
+            resp = self.client.get(url)
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(len(resp.context['cl'].result_list), 7)
+
+    def test_recipient_changelist(self):
+        self.assertChangelistQueriesFixed('recipient')
+
+    def test_inboundemail_changelist(self):
+        self.assertChangelistQueriesFixed('inboundemail')
+
+    def test_foia_changelist(self):
+        self.assertChangelistQueriesFixed('foia')
+
+    def test_event_changelist(self):
+        self.assertChangelistQueriesFixed('event')
@@ -1,28 +1,44 @@
 from django.conf.urls import url
 
 from foiatracker.views import (
+    agency_report,
     create_from_email,
     EventCreateView,
     EventDeleteView,
     EventUpdateView,
     FoiaDeleteView,
+    foia_bulk_update,
+    foia_changes,
+    foia_export,
+    foia_row,
     FoiaListView,
+    foia_search,
     FoiaUpdateView,
     inbound_mail,
     ProjectCreateView,
     ProjectDetailView,
     ProjectListView,
     ProjectUpdateView,
+    recipient_search,
+    triage_update,
+    TriageListView,
 )
 
 
 urlpatterns = [
     url(r'^mailhook/$', inbound_mail),
     url(r'^$', FoiaListView.as_view(), name='foia-list'),
+    url(r'^request/search/$', foia_search, name='foia-search'),
+    url(r'^request/export/$', foia_export, name='foia-export'),
+    url(r'^request/bulk-update/$', foia_bulk_update,
+        name='foia-bulk-update'),
+    url(r'^request/changes/$', foia_changes, name='foia-changes'),
     url(r'^request/(?P<pk>[0-9]+)/$', FoiaUpdateView.as_view(),
         name='foia-edit'),
     url(r'^request/(?P<pk>[0-9]+)/delete/$', FoiaDeleteView.as_view(),
         name='foia-delete'),
+    url(r'^request/(?P<pk>[0-9]+)/row/$', foia_row, name='foia-row'),
+    url(r'^recipient/search/$', recipient_search, name='recipient-search'),
     url(r'^event/add/$', EventCreateView.as_view(),
         name='event-add'),
     url(r'^event/(?P<pk>[0-9]+)/$', EventUpdateView.as_view(),
@@ -38,5 +54,8 @@ urlpatterns = [
         ProjectDetailView.as_view(), name='project-detail'),
     url(r'^project/(?P<pk>[0-9]+)/edit/$',
         ProjectUpdateView.as_view(), name='project-edit'),
-    url(r'^projects/$', ProjectListView.as_view(), name='project-list')
+    url(r'^projects/$', ProjectListView.as_view(), name='project-list'),
+    url(r'^reports/agencies/$', agency_report, name='agency-report'),
+    url(r'^inbox/$', TriageListView.as_view(), name='triage'),
+    url(r'^inbox/update/$', triage_update, name='triage-update'),
 ]
@@ -1,9 +1,12 @@
+from bisect import bisect_right
 from datetime import timedelta
 import hashlib
 import hmac
 
 from django.utils import timezone
 from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Case, IntegerField, Sum, When
 from django.utils.timezone import datetime
 
 import holidays
@@ -66,13 +69,78 @@ def add_business_days(days, from_datetime=datetime.now()):
     return from_datetime
 
 
+def overdue_cutoff(days, today=None):
+    """Return the latest date a request could have been sent and still be
+    due (@days business days later) before @today"""
+    if today is None:
+        today = datetime.now().date()
+
+    cutoff = today
+    while add_business_days(days, from_datetime=cutoff).date() >= today:
+        cutoff -= timedelta(days=1)
+    return cutoff
+
+
+def texas_holidays(first_year, last_year):
+    """A sorted list of the weekday holiday dates add_business_days skips,
+    for every year from @first_year through @last_year"""
+    tx_holidays = holidays.US(state='TX',
+                              years=range(first_year, last_year + 1))
+    return sorted(day for day in tx_holidays if day.weekday() < 5)
+
+
+def add_business_days_to_date(days, start, holiday_set):
+    """add_business_days() for a plain date, checking a set of dates from
+    texas_holidays() instead of rebuilding the holiday calendar"""
+    day = start
+    while days > 0:
+        day += timedelta(days=1)
+        if day.weekday() >= 5 or day in holiday_set:
+            continue
+        days -= 1
+    return day
+
+
+def business_days_between(start, end, holiday_dates=None):
+    """Count the business days after @start up to and including @end, the
+    inverse of add_business_days. Pass a sorted list from texas_holidays()
+    as @holiday_dates when counting many ranges."""
+    if end <= start:
+        return 0
+
+    weeks, extra_days = divmod((end - start).days, 7)
+    days = weeks * 5
+    for offset in range(1, extra_days + 1):
+        if (start.weekday() + offset) % 7 < 5:
+            days += 1
+
+    if holiday_dates is None:
+        holiday_dates = texas_holidays(start.year, end.year)
+    return days - (bisect_right(holiday_dates, end) -
+                   bisect_right(holiday_dates, start))
+
+
+def count_if(**conditions):
+    """Count the rows in an aggregate that meet @conditions"""
+    return Sum(Case(
+        When(then=1, **conditions),
+        default=0,
+        output_field=IntegerField(),
+    ))
+
+
 def get_model_by_email(ModelClass, email):
     """Return the instance of the @ModelClass that matches @email or create
     and return a new one if one doesn't exist"""
     try:
         model = ModelClass.objects.get(email__iexact=email)
     except ModelClass.DoesNotExist:
-        model = ModelClass.objects.create(email=email.lower())
+        try:
+            with transaction.atomic():
+                model = ModelClass.objects.create(email=email.lower())
+        except IntegrityError:
+            # Another thread or process created it in the meantime
+            model = ModelClass.objects.get(email__iexact=email)
 
     return model
 
@@ -1,17 +1,24 @@
-from email.utils import parseaddr, parsedate_tz, mktime_tz, getaddresses
-
-from django.conf import settings
 from django.contrib import messages
+from django.contrib.auth.decorators import login_required
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib.messages.views import SuccessMessageMixin
+from django.core.exceptions import ValidationError
+from django.contrib.postgres.search import TrigramSimilarity
+from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
+from django.db.models import Prefetch, Q
+from django.db.models.functions import Greatest
 from django.http import (
     HttpResponse,
     HttpResponseBadRequest,
     HttpResponseForbidden,
     HttpResponseRedirect,
+    JsonResponse,
+    StreamingHttpResponse,
 )
-from django.shortcuts import redirect, get_object_or_404
+from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse, reverse_lazy
+from django.utils.html import format_html, format_html_join
+from django.utils.http import is_safe_url
 from django.utils.timezone import datetime
 from django.views.decorators.csrf import csrf_exempt
 from django.views.decorators.http import require_GET, require_POST
@@ -20,39 +27,114 @@ from django.views.generic.edit import UpdateView, CreateView, DeleteView
 
 from django_filters.views import FilterView
 
+from foiatracker import changes
 from foiatracker.models import (
-    EmailAttachment,
     Foia,
-    Sender,
     InboundEmail,
+    MatchSuggestion,
     Project,
     Recipient,
+    Sender,
     Event
 )
+from foiatracker.duplicates import find_duplicates
+from foiatracker.export import stream_csv, stream_ndjson
 from foiatracker.filters import FoiaFilter
-from foiatracker.forms import (EventModelForm, ReminderFoiaFormSet,
-                               FoiaForm)
-from foiatracker.utils import (verify_mailgun_token, tz_aware_date,
-                               get_model_by_email)
-from foiatracker import tasks
+from foiatracker.forms import (BulkEventForm, EventModelForm,
+                               ReminderFoiaFormSet, FoiaForm)
+from foiatracker.ingest import (MissingFields, UnauthorizedSender,
+                                receive_mailgun_post)
+from foiatracker.matching import (foia_label, pair_email_with_foia,
+                                  search_foias)
+from foiatracker.pagination import CursorPaginator
+from foiatracker.reports import agency_report as build_agency_report
+from foiatracker.utils import verify_mailgun_token
+
+
+SEARCH_RESULTS_PER_PAGE = 20
+
+RECIPIENT_RESULTS = 20
+
+# Events shown under "Latest updates" on a project's page
+RECENT_UPDATES = 10
+
+# How long rendered request list rows are cached. Rows are keyed on
+# Foia.version, so edits invalidate them well before this.
+ROW_CACHE_TIMEOUT = 60 * 60 * 24
 
 
 class FoiaListView(LoginRequiredMixin, FilterView):
+    # Rows are rendered from the fragment cache most of the time, so related
+    # rows are only fetched for the ones that miss
     queryset = Foia.objects.all().\
-        select_related('email', 'email__sender', 'project').\
-        prefetch_related('event_set', 'recipients')
+        select_related('sender', 'project')
     filterset_class = FoiaFilter
     paginate_by = 15
 
+    # Keyset ordering; the trailing id makes every position unique
+    cursor_ordering = ('-sent', '-created_at', 'id',)
+    search_cursor_ordering = ('-rank', '-sent', '-created_at', 'id',)
+
+    # Orderings that can be picked with o=, each served by an index on the
+    # stored response times. Requests without the value are left out,
+    # since there's nothing to sort them on.
+    sort_choices = (
+        ('first_response_days', 'Fastest first response'),
+        ('-first_response_days', 'Slowest first response'),
+        ('resolution_days', 'Fastest resolution'),
+        ('-resolution_days', 'Slowest resolution'),
+    )
+
+    # Cap on the rows counted for the approximate total; set to None to skip
+    # counting entirely
+    count_limit = 500
+
+    def current_params(self):
+        """Our GET params, without the cursor, which only makes sense for
+        the current set of filters"""
+        url_params = self.request.GET.copy()
+        url_params.pop('cursor', None)
+        return url_params
+
     def drop_param(self, param):
         """Drop the named param from our existing list of GET params"""
-        url_params = self.request.GET.copy()
+        url_params = self.current_params()
         try:
             url_params.pop(param)
         except KeyError:
             pass
         return url_params
 
+    def current_sort(self):
+        """The o= param if it's one of sort_choices, otherwise None"""
+        sort = self.request.GET.get('o')
+        if sort in dict(self.sort_choices):
+            return sort
+        return None
+
+    def paginate_queryset(self, queryset, page_size):
+        """Page through requests with a cursor instead of an offset"""
+        sort = self.current_sort()
+        if sort is not None:
+            field = sort.lstrip('-')
+            queryset = queryset.filter(**{'%s__isnull' % field: False})
+            # The ID breaks ties in the same direction so the
+            # (field, id) index serves the whole ordering
+            ordering = (sort, '-id' if sort.startswith('-') else 'id')
+        elif self.filterset.data.get('search'):
+            ordering = self.search_cursor_ordering
+        else:
+            ordering = self.cursor_ordering
+
+        paginator = CursorPaginator(queryset, ordering, page_size)
+        page = paginator.page(self.request.GET.get('cursor'))
+        return paginator, page, page.object_list, page.has_other_pages()
+
+    def cursor_url(self, cursor):
+        url_params = self.current_params()
+        url_params['cursor'] = cursor
+        return self.build_url(url_params)
+
     def build_url(self, url_params):
         """Encode and attach the passed url_params to our current URL"""
         if url_params:
@@ -64,7 +146,7 @@ class FoiaListView(LoginRequiredMixin, FilterView):
 
     def filter_link(self, context, filter_, value):
         """Add links for manipulationg a filter to the passed context"""
-        url_params = self.request.GET.copy()
+        url_params = self.current_params()
         url_params[filter_] = value
         filter_name = 'filter_%s_%s' % (filter_, value,)
 
@@ -101,17 +183,67 @@ class FoiaListView(LoginRequiredMixin, FilterView):
     def get_context_data(self, **kwargs):
         context = super(FoiaListView, self).get_context_data(**kwargs)
         context['active_filters'] = self.filterset.data
-
-        # Get all the URL params except page= and pass them down so we can
-        # append them to our pagination, which will persist filters across
-        # pages
-        context['filter_params'] = self.drop_param('page').urlencode()
+        context['row_cache_timeout'] = ROW_CACHE_TIMEOUT
+        context['change_seq'] = changes.latest_change()
+
+        # Status update for the selected requests, filing the e-mail in
+        # email= with it if one was passed
+        bulk_initial = {'update_date': datetime.now()}
+        email_uuid = self.request.GET.get('email')
+        if email_uuid:
+            try:
+                email = InboundEmail.objects.filter(uuid=email_uuid).first()
+            except (ValueError, ValidationError):
+                email = None
+            if email is not None:
+                bulk_initial.update(email=email.pk,
+                                    update_date=email.sent.date())
+                context['bulk_email'] = email
+        context['bulk_form'] = BulkEventForm(initial=bulk_initial)
+
+        # Links to the pages on either side of this one, which persist
+        # filters across pages
+        page = context['page_obj']
+        if page.has_next():
+            context['next_page_url'] = self.cursor_url(page.next_cursor)
+        if page.has_previous():
+            context['previous_page_url'] = self.cursor_url(
+                page.previous_cursor)
+
+        # A total that stops counting at count_limit, so it stays cheap
+        # for big result sets
+        if self.count_limit is not None:
+            context['approximate_count'] = self.object_list.order_by()[
+                :self.count_limit + 1].count()
+            context['count_limit'] = self.count_limit
+
+        # Download links for everything matching the current filters
+        export_params = self.current_params()
+        context['export_csv_url'] = '?'.join((
+            reverse('foia-export'), export_params.urlencode()))
+        export_params['format'] = 'json'
+        context['export_json_url'] = '?'.join((
+            reverse('foia-export'), export_params.urlencode()))
+
+        # Links to sort by response times, and back to the default order
+        sort = self.current_sort()
+        context['sort_label'] = dict(self.sort_choices).get(sort)
+        context['sort_clear'] = self.build_url(self.drop_param('o'))
+        context['sort_links'] = []
+        for value, label in self.sort_choices:
+            url_params = self.current_params()
+            url_params['o'] = value
+            context['sort_links'].append({
+                'label': label,
+                'link': self.build_url(url_params),
+                'active': value == sort,
+            })
 
         # Generate a link to clear the search
         context['clear_search_url'] = self.build_url(self.drop_param('search'))
 
         # Links to set all/my requests filters
-        url_params = self.request.GET.copy()
+        url_params = self.current_params()
         url_params['sender'] = self.request.user.email
         context['filter_me'] = self.build_url(url_params)
 
@@ -125,6 +257,21 @@ class FoiaListView(LoginRequiredMixin, FilterView):
         self.filter_link(context, 'status', 'complete')
         self.filter_link(context, 'status', 'pending')
 
+        # Counts for the sidebar, with links to narrow the list to each
+        # project or sender
+        facets = self.filterset.facet_counts()
+        for project in facets['projects']:
+            url_params = self.current_params()
+            url_params['project'] = project['slug']
+            project['link'] = self.build_url(url_params)
+        for sender in facets['senders']:
+            url_params = self.current_params()
+            url_params['sender'] = sender['email']
+            sender['link'] = self.build_url(url_params)
+        context['facets'] = facets
+        context['filter_project_clear'] = self.build_url(
+            self.drop_param('project'))
+
         context['page_title'] = self.get_page_title(context)
 
         return context
@@ -246,7 +393,7 @@ class ProjectUpdateView(LoginRequiredMixin, UpdateView):
 
 
 class ProjectDetailView(LoginRequiredMixin, DetailView):
-    model = Project
+    queryset = Project.objects.select_related('stats')
 
     def get_context_data(self, **kwargs):
         context = super(
@@ -254,26 +401,246 @@ class ProjectDetailView(LoginRequiredMixin, DetailView):
 
         context['recent_updates'] = Event.objects.filter(
             foia__project__pk=context['project'].pk
-        ).select_related('foia')
-
-        context['pending_requests'] = Foia.objects.filter(
-            event__foia__project__pk=context['project'].pk
-        ).exclude(
-            event__status__in=Event.COMPLETE
-        ).distinct()
-        context['finished_requests'] = Foia.objects.filter(
-            event__status__in=Event.COMPLETE,
-            event__foia__project__pk=context['project'].pk
-        ).distinct()
+        ).select_related('foia')[:RECENT_UPDATES]
+
+        # One query for both lists
+        requests = context['project'].requests.only(
+            'pk', 'request_subject', 'completed')
+        context['pending_requests'] = []
+        context['finished_requests'] = []
+        for request in requests:
+            if request.completed:
+                context['finished_requests'].append(request)
+            else:
+                context['pending_requests'].append(request)
 
         return context
 
 
 class ProjectListView(LoginRequiredMixin, ListView):
-    model = Project
+    queryset = Project.objects.select_related('stats').prefetch_related(
+        'collaborators')
     paginate_by = 10
 
 
+class TriageListView(LoginRequiredMixin, ListView):
+    """The user's e-mails that haven't been filed as a request or an update
+    yet, with the requests each one most likely belongs to"""
+    template_name = 'foiatracker/triage.html'
+    context_object_name = 'emails'
+    paginate_by = 20
+
+    def get_queryset(self):
+        # Look the sender up first so the partial index on unprocessed
+        # e-mails covers the whole query
+        sender_id = Sender.objects.filter(
+            email__iexact=self.request.user.email).values_list(
+            'pk', flat=True).first()
+        return InboundEmail.objects.filter(
+            sender=sender_id, processed=False,
+        ).order_by('-sent').defer('raw', 'html').prefetch_related(
+            'recipients',
+            Prefetch('suggestions', queryset=MatchSuggestion.objects.
+                     select_related('foia__sender')),
+        )
+
+
+@login_required
+@require_POST
+def triage_update(request):
+    """File the checked e-mails in the triage inbox as updates on the
+    request picked for each, or dismiss them"""
+    emails = InboundEmail.objects.filter(
+        pk__in=request.POST.getlist('emails'),
+        sender__email__iexact=request.user.email,
+        processed=False,
+    ).defer('raw', 'html')
+
+    if request.POST.get('action') == 'dismiss':
+        email_ids = list(emails.values_list('pk', flat=True))
+        InboundEmail.objects.filter(pk__in=email_ids).update(processed=True)
+        MatchSuggestion.objects.filter(email__in=email_ids).delete()
+        messages.success(request, 'Dismissed %s e-mail%s.' % (
+            len(email_ids), '' if len(email_ids) == 1 else 's'))
+    else:
+        emails = list(emails)
+        chosen = {}
+        for email in emails:
+            try:
+                chosen[email.pk] = int(request.POST.get('foia-%s' % email.pk))
+            except (TypeError, ValueError):
+                continue
+        foias = Foia.objects.in_bulk(list(chosen.values()))
+
+        paired = 0
+        for email in emails:
+            foia = foias.get(chosen.get(email.pk))
+            if foia is not None:
+                # The new Event takes the e-mail out of the inbox
+                pair_email_with_foia(email, foia)
+                paired += 1
+
+        messages.success(request, 'Filed %s e-mail%s as updates.' % (
+            paired, '' if paired == 1 else 's'))
+        if paired < len(emails):
+            messages.warning(request, 'Pick a request for the other %s.' % (
+                len(emails) - paired))
+
+    next_url = request.POST.get('next')
+    if not is_safe_url(next_url, allowed_hosts={request.get_host()}):
+        next_url = reverse('triage')
+    return HttpResponseRedirect(next_url)
+
+
+@login_required
+@require_POST
+def foia_bulk_update(request):
+    """Record one status update on every request selected on the list"""
+    form = BulkEventForm(request.POST)
+    if form.is_valid():
+        events = form.save()
+        messages.success(request, 'Status updated for %s request%s.' % (
+            len(events), '' if len(events) == 1 else 's'))
+    else:
+        for errors in form.errors.values():
+            for error in errors:
+                messages.error(request, error)
+
+    next_url = request.POST.get('next')
+    if not is_safe_url(next_url, allowed_hosts={request.get_host()}):
+        next_url = reverse('foia-list')
+    return HttpResponseRedirect(next_url)
+
+
+@login_required
+@require_GET
+def agency_report(request):
+    """How long each agency takes to respond to and resolve requests"""
+    return render(request, 'foiatracker/agency_report.html', {
+        'agencies': build_agency_report(),
+    })
+
+
+@login_required
+@require_GET
+def foia_search(request):
+    """Return a page of requests matching the q= param as JSON for the FOIA
+    picker, ranked against the InboundEmail with the UUID in email= if one
+    is passed"""
+    email = None
+    email_uuid = request.GET.get('email')
+    if email_uuid:
+        try:
+            email = InboundEmail.objects.filter(uuid=email_uuid).first()
+        except (ValueError, ValidationError):
+            pass
+
+    foias = search_foias(request.GET.get('q', '').strip(), email=email)
+    paginator = Paginator(foias, SEARCH_RESULTS_PER_PAGE)
+
+    try:
+        page = paginator.page(request.GET.get('page', 1))
+    except PageNotAnInteger:
+        page = paginator.page(1)
+    except EmptyPage:
+        page = paginator.page(paginator.num_pages)
+
+    return JsonResponse({
+        'results': [
+            {'value': foia['pk'], 'text': foia_label(foia)} for foia in page
+        ],
+        'page': page.number,
+        'has_next': page.has_next(),
+    })
+
+
+@login_required
+@require_GET
+def recipient_search(request):
+    """Return the recipients that best match the q= param as JSON, using
+    prefix matches and trigram similarity on e-mail, name and
+    organization"""
+    query = request.GET.get('q', '').strip()
+    if not query:
+        return JsonResponse({'results': []})
+
+    recipients = Recipient.objects.filter(
+        Q(email__istartswith=query) |
+        Q(name__istartswith=query) |
+        Q(organization__istartswith=query) |
+        Q(email__trigram_similar=query) |
+        Q(name__trigram_similar=query) |
+        Q(organization__trigram_similar=query)
+    ).annotate(
+        similarity=Greatest(
+            TrigramSimilarity('email', query),
+            TrigramSimilarity('name', query),
+            TrigramSimilarity('organization', query),
+        )
+    ).order_by('-similarity', 'email')[:RECIPIENT_RESULTS]
+
+    return JsonResponse({
+        'results': [{'value': r.pk, 'text': str(r)} for r in recipients],
+    })
+
+
+@login_required
+@require_GET
+def foia_export(request):
+    """Stream every request matching the list view's filters as CSV, or as
+    newline-delimited JSON when format=json is passed"""
+    foias = FoiaFilter(request.GET, queryset=Foia.objects.all()).qs
+    if not request.GET.get('search'):
+        foias = foias.order_by(*FoiaListView.cursor_ordering)
+
+    if request.GET.get('format') == 'json':
+        response = StreamingHttpResponse(
+            stream_ndjson(foias), content_type='application/x-ndjson')
+        filename = 'foias.ndjson'
+    else:
+        response = StreamingHttpResponse(
+            stream_csv(foias), content_type='text/csv')
+        filename = 'foias.csv'
+
+    response['Content-Disposition'] = 'attachment; filename="%s"' % filename
+    return response
+
+
+@login_required
+@require_GET
+def foia_row(request, pk):
+    """Render one row of the request list, for pages updating a request
+    they were told changed. A 404 means the row should go."""
+    foia = get_object_or_404(
+        Foia.objects.select_related('sender', 'project'), pk=pk)
+    return render(request, 'foiatracker/foia_row.html', {
+        'foia': foia,
+        'row_cache_timeout': ROW_CACHE_TIMEOUT,
+    })
+
+
+@login_required
+@require_GET
+def foia_changes(request):
+    """Stream request changes to an open request list as server-sent
+    events, starting after the browser's Last-Event-ID, or since= when
+    it's first connecting. Needs a shared cache backend and async workers;
+    see foiatracker.changes."""
+    after = request.META.get('HTTP_LAST_EVENT_ID') or \
+        request.GET.get('since')
+    try:
+        after = int(after)
+    except (TypeError, ValueError):
+        after = changes.latest_change()
+
+    response = StreamingHttpResponse(
+        changes.stream_changes(after), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # Keep nginx from buffering events until the stream ends
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
 @require_GET
 def create_from_email(request, uuid=None, to_create=None):
     """A route to handle creating of Events/Foias based on a UUID of an
@@ -284,18 +651,17 @@ def create_from_email(request, uuid=None, to_create=None):
     email = get_object_or_404(InboundEmail.objects, uuid=uuid)
 
     # See if the e-mail has already been processed by looking for associated
-    # Foias/Events and redirect there
-    try:
-        existing_foia = Foia.objects.get(email=email)
+    # Foias/Events and redirect there. Bulk updates file one e-mail on
+    # several requests, so go to the newest.
+    existing_foia = Foia.objects.filter(email=email).order_by(
+        '-created_at', '-pk').first()
+    if existing_foia is not None:
         return redirect('foia-edit', pk=existing_foia.pk)
-    except Foia.DoesNotExist:
-        pass
 
-    try:
-        existing_event = Event.objects.get(email=email)
+    existing_event = Event.objects.filter(email=email).order_by(
+        '-created_at', '-pk').first()
+    if existing_event is not None:
         return redirect('event-edit', pk=existing_event.pk)
-    except Event.DoesNotExist:
-        pass
 
     # For FOIAs we'll go ahead and create the model and then send the user
     # straight to the model's edit page
@@ -313,6 +679,18 @@ def create_from_email(request, uuid=None, to_create=None):
             request,
             'We\'ve auto-created request "%s" from your e-mail.' % foia
         )
+
+        # Point out requests a colleague may have already filed
+        similar = find_duplicates(foia)
+        if similar:
+            links = format_html_join(
+                ', ', '<a href="{}">{}</a> ({}, {}% similar)', (
+                    (reverse('foia-edit', args=[other.pk]), other,
+                     other.sender, int(score * 100))
+                    for other, score in similar))
+            messages.warning(request, format_html(
+                'This looks a lot like {}. Check that it hasn\'t already '
+                'been filed.', links))
         return redirect('foia-edit', pk=foia.pk)
 
     # For event instances, we'll send them to an add page and pre-load the
@@ -334,82 +712,11 @@ def inbound_mail(request):
                                 request.POST.get('signature')):
             return HttpResponseForbidden('Failed Mailgun token validation.')
 
-    required_fields = ('sender', 'To', 'Date',)
-    missing_fields = [x for x in required_fields if x not in request.POST]
-
-    if missing_fields:
+    try:
+        receive_mailgun_post(request.POST, request.FILES)
+    except MissingFields:
         return HttpResponseBadRequest('Missing a requied field.')
-
-    # Parse the out sender/recipient fields
-    sender_address = parseaddr(request.POST.get('sender'))
-    recipient_addresses = getaddresses(request.POST.get('To').split(','))
-
-    if sender_address[1].split('@')[1] not in \
-            settings.FOIATRACKER_ALLOWED_DOMAINS:
-        msg = '"%s" is not authorized to use FOIAtracker.' % sender_address[1]
-        return HttpResponseForbidden(msg)
-
-    # Make a timezone-aware datetime from the Date field
-    date_field = request.POST.get('Date')
-    parsed_from_email = parsedate_tz(date_field)
-    if parsed_from_email is not None:
-        parsed_timestamp = mktime_tz(parsed_from_email)
-        parsed_datetime = datetime.fromtimestamp(parsed_timestamp)
-    else:
-        parsed_datetime = datetime.now()
-    sent = tz_aware_date(parsed_datetime)
-
-    # Create a model for the email
-    email = InboundEmail.objects.create(
-        raw=request.POST.get('body-plain', ''),
-        text=request.POST.get('stripped-text', ''),
-        html=request.POST.get('body-html', ''),
-        sent=sent,
-        sender=get_model_by_email(Sender, sender_address[1]),
-        subject=request.POST.get('subject', '')
-    )
-
-    # Setup M2M relationships for email recipeints
-    for address in recipient_addresses:
-        # For addresses that aren't e-mails, like 'undisclosed-recipients'
-        if '@' not in address[1]:
-            continue
-
-        if address[1].split('@')[1] in settings.FOIATRACKER_ALLOWED_DOMAINS:
-            continue
-
-        recipient = get_model_by_email(
-            Recipient,
-            address[1]
-        )
-        email.recipients.add(recipient)
-
-    email.save()
-
-    # Send a message to let the user know we're ready to classify
-    tasks.email_prompt(email.pk)
-
-    # Save file attachments to S3 and attach them to the message
-    attachment_count = request.POST.get('attachment-count')
-
-    if attachment_count is not None:
-        try:
-            num_attachments = int(attachment_count)
-
-            for attachment_num in range(1, num_attachments + 1):
-                attachment_key = 'attachment-%s' % attachment_num
-                attached_file = request.FILES.get(attachment_key)
-
-                if attached_file is None:
-                    continue
-
-                EmailAttachment.objects.create(
-                    email=email,
-                    stored_file=attached_file,
-                    content_type=attached_file.content_type,
-                    size=attached_file.size
-                )
-        except ValueError:
-            pass
+    except UnauthorizedSender as e:
+        return HttpResponseForbidden(str(e))
 
     return HttpResponse()